@@ -19,6 +19,7 @@ from .exceptions import (
     ClickUpAPIError,
     ClickUpError,
     ConfigurationError,
+    DeadlineExceededError,
     MCPError,
     MCPToolError,
     NetworkError,
@@ -49,6 +50,7 @@ __all__ = [
     "ConfigurationError",
     "NetworkError",
     "TimeoutError",
+    "DeadlineExceededError",
     "RetryExhaustedError",
     "MCPError",
     "MCPToolError",
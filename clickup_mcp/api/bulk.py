@@ -0,0 +1,146 @@
+"""
+Bounded-concurrency execution of many API calls.
+
+Resource managers use `run_bulk` to apply one call to many items (e.g., updating
+hundreds of tasks) while keeping a fixed number of requests in flight. All calls go
+through the same `ClickUpAPIClient`, so they share its HTTP pool and rate limiter;
+`max_in_flight` only bounds how many wait on it at once.
+
+Failure model:
+- Every item gets a `BulkItemResult` in input order; one failure never aborts the rest.
+- A call returning None/False counts as failed (the managers return those for non-2xx).
+- Rate-limited calls (HTTP 429) never reached ClickUp and are always retried.
+- Calls whose outcome is unknown (a transport failure the client did not or could not
+  retry) are retried only when `idempotent=True`. The client itself only retries a POST
+  that was never sent, so a bulk create never repeats a request that may have created
+  a task.
+- An item is not retried when its backoff would outlast the tool call's deadline; it
+  fails with the last error instead.
+- Once the deadline passes, items that have not started fail with
+  `DeadlineExceededError` without a request, and running ones are cancelled and fail
+  with it. The others keep their results, so a caller marked with
+  `partial_results_at_deadline` returns what finished.
+
+Progress and cancellation:
+- `on_progress(completed, total)` is awaited each time an item finishes, so callers can
+  report progress while the rest is still running.
+- Cancelling the caller cancels every running call (aborting its HTTP request) and every
+  queued one; nothing is retried after cancellation.
+
+Usage Examples:
+    # Python (async)
+    results = await run_bulk(task_ids, task_api.delete, max_in_flight=10, idempotent=True)
+    failed = [r.index for r in results if not r.ok]
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Optional, Sequence, TypeVar
+
+from clickup_mcp.deadline import item_deadline, remaining_time
+from clickup_mcp.exceptions import (
+    ClickUpAPIError,
+    DeadlineExceededError,
+    RateLimitError,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Awaited with (completed, total); total is None when it is not known up front
+ProgressCallback = Callable[[int, Optional[int]], Awaitable[None]]
+
+DEFAULT_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 1.0
+
+
+@dataclass
+class BulkItemResult(Generic[R]):
+    """Outcome of one item of a bulk call."""
+
+    index: int
+    ok: bool
+    value: Optional[R] = None
+    error: Optional[Exception] = None
+    attempts: int = 1
+
+
+def _is_retryable(exc: Exception, idempotent: bool) -> bool:
+    if isinstance(exc, RateLimitError):
+        return True
+    # The client raises a plain, status-less ClickUpAPIError when it gives up on a transport error
+    return idempotent and type(exc) is ClickUpAPIError and exc.status_code is None
+
+
+async def run_bulk(
+    items: Sequence[T],
+    call: Callable[[T], Awaitable[Any]],
+    *,
+    max_in_flight: int,
+    idempotent: bool,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    failure: str = "Request failed",
+    on_progress: Optional[ProgressCallback] = None,
+) -> list[BulkItemResult[Any]]:
+    """
+    Run `call(item)` for every item with at most `max_in_flight` calls at once.
+
+    Args:
+        items: Items to process
+        call: Coroutine function applied to each item
+        max_in_flight: Maximum number of concurrent calls (>= 1)
+        idempotent: Whether repeating a call is harmless; enables retries of unknown outcomes
+        max_attempts: Attempts per item, including the first
+        failure: Error message used when a call returns None/False
+        on_progress: Awaited with (completed, len(items)) after each item finishes
+
+    Returns:
+        list[BulkItemResult]: One result per item, in input order
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    slots = asyncio.Semaphore(max_in_flight)
+    completed = 0
+
+    async def run(index: int, item: T) -> BulkItemResult[Any]:
+        nonlocal completed
+        result = await call_with_retries(index, item)
+        completed += 1
+        if on_progress is not None:
+            await on_progress(completed, len(items))
+        return result
+
+    async def call_with_retries(index: int, item: T) -> BulkItemResult[Any]:
+        attempt = 0
+        while True:
+            attempt += 1
+            async with slots:
+                started = False
+                try:
+                    async with item_deadline():
+                        started = True
+                        value = await call(item)
+                except DeadlineExceededError as exc:
+                    # Out of time; there is nothing left to retry in
+                    return BulkItemResult(
+                        index=index, ok=False, error=exc, attempts=attempt if started else attempt - 1
+                    )
+                except Exception as exc:
+                    if attempt >= max_attempts or not _is_retryable(exc, idempotent):
+                        return BulkItemResult(index=index, ok=False, error=exc, attempts=attempt)
+                    delay = getattr(exc, "retry_after", None) or _RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                    remaining = remaining_time()
+                    if remaining is not None and remaining <= delay:
+                        return BulkItemResult(index=index, ok=False, error=exc, attempts=attempt)
+                    logger.debug("Bulk item %s failed (attempt %s), retrying: %s", index, attempt, exc)
+                else:
+                    if value is None or value is False:
+                        return BulkItemResult(index=index, ok=False, error=ClickUpAPIError(failure), attempts=attempt)
+                    return BulkItemResult(index=index, ok=True, value=value, attempts=attempt)
+            # Back off outside the slot so other items keep the pipeline full
+            await asyncio.sleep(delay)
+
+    return list(await asyncio.gather(*(run(index, item) for index, item in enumerate(items))))
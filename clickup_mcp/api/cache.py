@@ -0,0 +1,65 @@
+"""
+Small in-memory TTL cache for API responses.
+
+Resource managers keep recently fetched DTOs here so repeated lookups (e.g., the same
+task IDs requested by several tool calls) are answered without another request.
+Entries expire `ttl` seconds after they were stored; the least recently used entry is
+evicted once `maxsize` is reached. A `ttl` or `maxsize` of 0 disables the cache.
+
+The cache is not thread-safe; it is meant to be used from the event loop that owns
+the `ClickUpAPIClient`.
+
+Usage Examples:
+    # Python
+    cache: TTLCache[str, TaskResp] = TTLCache(ttl=30, maxsize=1024)
+    cache.set(task.id, task)
+    hit = cache.get(task.id)
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU mapping whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[K, tuple[float, V]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -7,11 +7,13 @@ It follows the Resource Manager pattern described in the project documentation.
 Capabilities:
 - Create tasks in a list (including subtasks)
 - Retrieve task by ID (with options for subtasks and custom task IDs)
+- Retrieve many tasks by ID, deduplicated and served from a short-lived cache
 - List tasks in a list with pagination and filters
 - Update task properties (non-custom-fields)
 - Set or clear custom field values
 - Add dependencies between tasks
 - Delete tasks
+- Create, update, assign or delete many tasks concurrently (`bulk_*`)
 
 Authentication:
 - All requests require the ClickUp API token in the `Authorization` header: `Authorization: pk_...`
@@ -40,11 +42,18 @@ Quick Examples:
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
+from clickup_mcp.config import get_settings
+from clickup_mcp.diagnostics import current_recorder
+from clickup_mcp.exceptions import ResourceNotFoundError
 from clickup_mcp.models.dto.task import TaskCreate, TaskListQuery, TaskResp, TaskUpdate
 from clickup_mcp.types import ClickUpListID, ClickUpTaskID
 
+from .bulk import BulkItemResult, ProgressCallback, run_bulk
+from .cache import TTLCache
+
 if TYPE_CHECKING:
     from clickup_mcp.client import ClickUpAPIClient
 
@@ -90,6 +99,11 @@ class TaskAPI:
             client: The ClickUpAPIClient instance to use for API requests.
         """
         self._client = client
+        settings = get_settings()
+        # Recently fetched tasks by ID, and custom task ID aliases keyed by (team_id, custom_id)
+        ttl, size = settings.clickup_task_cache_ttl, settings.clickup_task_cache_size
+        self._cache: TTLCache[str, TaskResp] = TTLCache(ttl, size)
+        self._custom_ids: TTLCache[tuple[Optional[str], str], str] = TTLCache(ttl, size)
 
     async def create(self, list_id: ClickUpListID, task_create: TaskCreate) -> Optional[TaskResp]:
         """
@@ -136,7 +150,7 @@ class TaskAPI:
         if response.data is None or not isinstance(response.data, dict):
             return None
 
-        return TaskResp(**response.data)
+        return self._remember(TaskResp(**response.data))
 
     async def get(
         self,
@@ -193,9 +207,90 @@ class TaskAPI:
             return None
 
         logger.debug(f"Task API response: {response.data}")
-        return TaskResp(**response.data)
+        return self._remember(TaskResp(**response.data), team_id=team_id)
+
+    async def get_many(
+        self,
+        task_ids: Sequence[ClickUpTaskID],
+        *,
+        custom_task_ids: bool = False,
+        team_id: str | None = None,
+        use_cache: bool = True,
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[BulkItemResult[TaskResp]]:
+        """
+        Get many tasks by ID.
+
+        API:
+            GET /task/{task_id} (once per distinct uncached ID)
+
+        Notes:
+            - Duplicate IDs are fetched once; every input position still gets a result.
+            - Tasks fetched within the last CLICKUP_TASK_CACHE_TTL seconds are served from
+              memory (`attempts == 0`) unless `use_cache=False`. Writes through this API
+              invalidate the affected tasks.
+            - With `custom_task_ids=True` every ID is resolved as a custom task ID in the
+              same concurrent pass; results are cached under both the custom and the
+              canonical ID.
+
+        Args:
+            task_ids: Task IDs (or custom task IDs) to retrieve
+            custom_task_ids: Whether the IDs are custom task IDs
+            team_id: Team ID (required when using custom_task_ids=True)
+            use_cache: Whether cached tasks may be returned
+            max_in_flight: Concurrent request limit (default: CLICKUP_BULK_MAX_IN_FLIGHT)
+            on_progress: Awaited with (resolved, distinct IDs) as fetches complete
+
+        Returns:
+            list[BulkItemResult[TaskResp]]: One result per input ID, in input order; missing
+            tasks fail with ResourceNotFoundError
+
+        Examples:
+            # Python (async)
+            results = await task_api.get_many(["abc123", "def456", "abc123"])
+            tasks = [r.value for r in results if r.ok]
+        """
+        by_id: dict[str, BulkItemResult[TaskResp]] = {}
+        pending: list[str] = []
+        for task_id in dict.fromkeys(task_ids):
+            cached = self._cached(task_id, custom_task_ids, team_id) if use_cache else None
+            if cached is not None:
+                by_id[task_id] = BulkItemResult(index=0, ok=True, value=cached, attempts=0)
+            else:
+                pending.append(task_id)
+
+        async def fetch(task_id: str) -> TaskResp:
+            task = await self.get(task_id, custom_task_ids=custom_task_ids, team_id=team_id)
+            if task is None:
+                raise ResourceNotFoundError(
+                    f"Task {task_id} not found", resource_type="task", resource_id=task_id, status_code=404
+                )
+            return task
+
+        hits = len(by_id)
+        recorder = current_recorder()
+        if recorder is not None and hits:
+            recorder.add(cache_hits=hits)
+
+        async def progress(completed: int, _total: Optional[int]) -> None:
+            if on_progress is not None:
+                await on_progress(hits + completed, hits + len(pending))
+
+        if pending:
+            fetched = await run_bulk(
+                pending,
+                fetch,
+                max_in_flight=self._max_in_flight(max_in_flight),
+                idempotent=True,
+                on_progress=progress,
+            )
+            by_id.update(zip(pending, fetched))
+        return [replace(by_id[task_id], index=index) for index, task_id in enumerate(task_ids)]
 
-    async def list_in_list(self, list_id: str, query: TaskListQuery) -> list[TaskResp]:
+    async def list_in_list(
+        self, list_id: str, query: TaskListQuery, *, on_progress: Optional[ProgressCallback] = None
+    ) -> list[TaskResp]:
         """
         Get all tasks in a list with pagination and filtering.
 
@@ -208,6 +303,7 @@ class TaskAPI:
         Args:
             list_id: The ID of the list
             query: TaskListQuery DTO with query parameters
+            on_progress: Awaited with (tasks fetched so far, None) after each page
 
         Returns:
             list[TaskResp]: Tasks in the list (aggregated across pages)
@@ -256,6 +352,8 @@ class TaskAPI:
             # Convert to TaskResp DTOs
             for task_data in tasks_data:
                 all_tasks.append(TaskResp(**task_data))
+            if on_progress is not None:
+                await on_progress(len(all_tasks), None)
 
             # Check if we have more pages
             if len(tasks_data) < current_query.limit:
@@ -303,6 +401,7 @@ class TaskAPI:
               --body-data='{"name":"New Name"}' \
               https://api.clickup.com/api/v2/task/abc123
         """
+        self._cache.pop(task_id)
         response = await self._client.put(f"/task/{task_id}", data=task_update.serialize())
 
         if not response.success or response.status_code != 200:
@@ -351,6 +450,7 @@ class TaskAPI:
               https://api.clickup.com/api/v2/task/abc123/field/fld_1
         """
         data = {"value": value}
+        self._cache.pop(task_id)
         response = await self._client.post(f"/task/{task_id}/field/{field_id}", data=data)
         return response.success and response.status_code in (200, 204)
 
@@ -381,6 +481,7 @@ class TaskAPI:
               --header="Authorization: pk_..." \
               https://api.clickup.com/api/v2/task/abc123/field/fld_1
         """
+        self._cache.pop(task_id)
         response = await self._client.delete(f"/task/{task_id}/field/{field_id}")
         return response.success and response.status_code in (200, 204)
 
@@ -418,6 +519,8 @@ class TaskAPI:
               https://api.clickup.com/api/v2/task/abc123/dependency
         """
         data = {"depends_on": depends_on, "dependency_type": dependency_type}
+        self._cache.pop(task_id)
+        self._cache.pop(depends_on)
         response = await self._client.post(f"/task/{task_id}/dependency", data=data)
         return response.success and response.status_code in (200, 204)
 
@@ -447,6 +550,7 @@ class TaskAPI:
               --header="Authorization: pk_..." \
               https://api.clickup.com/api/v2/task/abc123
         """
+        self._cache.pop(task_id)
         response = await self._client.delete(f"/task/{task_id}")
         return response.success and response.status_code in (200, 204)
 
@@ -477,6 +581,7 @@ class TaskAPI:
               --header="Authorization: pk_..." \
               https://api.clickup.com/api/v2/task/abc123/member/42
         """
+        self._cache.pop(task_id)
         response = await self._client.post(f"/task/{task_id}/member/{assignee_id}")
         return response.success and response.status_code in (200, 201, 204)
 
@@ -507,6 +612,7 @@ class TaskAPI:
               --header="Authorization: pk_..." \
               https://api.clickup.com/api/v2/task/abc123/member/42
         """
+        self._cache.pop(task_id)
         response = await self._client.delete(f"/task/{task_id}/member/{assignee_id}")
         return response.success and response.status_code in (200, 204)
 
@@ -542,3 +648,164 @@ class TaskAPI:
         if response.success and response.data:
             return TaskResp(**response.data)
         return None
+
+    async def bulk_create(
+        self,
+        items: Sequence[tuple[ClickUpListID, TaskCreate]],
+        *,
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[BulkItemResult[TaskResp]]:
+        """
+        Create many tasks concurrently.
+
+        API:
+            POST /list/{list_id}/task (once per item)
+
+        Notes:
+            - At most `max_in_flight` requests run at once; all share the client's rate limiter.
+            - Only rate-limited requests are retried: a create whose outcome is unknown is
+              reported as failed rather than risking a duplicate task.
+
+        Args:
+            items: (list_id, TaskCreate) pairs
+            max_in_flight: Concurrent request limit (default: CLICKUP_BULK_MAX_IN_FLIGHT)
+            on_progress: Awaited with (completed, total) as items finish
+
+        Returns:
+            list[BulkItemResult[TaskResp]]: One result per item, in input order
+
+        Examples:
+            # Python (async)
+            results = await task_api.bulk_create([("123", TaskCreate(name=f"Task {i}")) for i in range(200)])
+            created = [r.value.id for r in results if r.ok]
+        """
+        return await run_bulk(
+            items,
+            lambda item: self.create(*item),
+            max_in_flight=self._max_in_flight(max_in_flight),
+            idempotent=False,
+            failure="Task creation failed",
+            on_progress=on_progress,
+        )
+
+    async def bulk_update(
+        self,
+        items: Sequence[tuple[ClickUpTaskID, TaskUpdate]],
+        *,
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[BulkItemResult[TaskResp]]:
+        """
+        Update many tasks concurrently.
+
+        API:
+            PUT /task/{task_id} (once per item)
+
+        Notes:
+            - Updates set absolute values, so rate-limited and transport failures are retried.
+
+        Args:
+            items: (task_id, TaskUpdate) pairs
+            max_in_flight: Concurrent request limit (default: CLICKUP_BULK_MAX_IN_FLIGHT)
+            on_progress: Awaited with (completed, total) as items finish
+
+        Returns:
+            list[BulkItemResult[TaskResp]]: One result per item, in input order
+
+        Examples:
+            # Python (async)
+            results = await task_api.bulk_update([(tid, TaskUpdate(status="done")) for tid in task_ids])
+        """
+        return await run_bulk(
+            items,
+            lambda item: self.update(*item),
+            max_in_flight=self._max_in_flight(max_in_flight),
+            idempotent=True,
+            failure="Task update failed",
+            on_progress=on_progress,
+        )
+
+    async def bulk_add_assignee(
+        self,
+        items: Sequence[tuple[ClickUpTaskID, int | str]],
+        *,
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[BulkItemResult[bool]]:
+        """
+        Add assignees to many tasks concurrently.
+
+        API:
+            POST /task/{task_id}/member/{member_id} (once per item)
+
+        Args:
+            items: (task_id, assignee_id) pairs
+            max_in_flight: Concurrent request limit (default: CLICKUP_BULK_MAX_IN_FLIGHT)
+            on_progress: Awaited with (completed, total) as items finish
+
+        Returns:
+            list[BulkItemResult[bool]]: One result per item, in input order
+
+        Examples:
+            # Python (async)
+            results = await task_api.bulk_add_assignee([(tid, 42) for tid in task_ids])
+        """
+        return await run_bulk(
+            items,
+            lambda item: self.add_assignee(*item),
+            max_in_flight=self._max_in_flight(max_in_flight),
+            idempotent=True,
+            failure="Adding the assignee failed",
+            on_progress=on_progress,
+        )
+
+    async def bulk_delete(
+        self,
+        task_ids: Sequence[ClickUpTaskID],
+        *,
+        max_in_flight: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[BulkItemResult[bool]]:
+        """
+        Delete many tasks concurrently.
+
+        API:
+            DELETE /task/{task_id} (once per item)
+
+        Args:
+            task_ids: IDs of the tasks to delete
+            max_in_flight: Concurrent request limit (default: CLICKUP_BULK_MAX_IN_FLIGHT)
+            on_progress: Awaited with (completed, total) as items finish
+
+        Returns:
+            list[BulkItemResult[bool]]: One result per task ID, in input order
+
+        Examples:
+            # Python (async)
+            results = await task_api.bulk_delete(["abc123", "def456"], max_in_flight=5)
+        """
+        return await run_bulk(
+            task_ids,
+            self.delete,
+            max_in_flight=self._max_in_flight(max_in_flight),
+            idempotent=True,
+            failure="Task deletion failed",
+            on_progress=on_progress,
+        )
+
+    @staticmethod
+    def _max_in_flight(value: Optional[int]) -> int:
+        return value if value is not None else get_settings().clickup_bulk_max_in_flight
+
+    def _remember(self, task: TaskResp, *, team_id: Optional[str] = None) -> TaskResp:
+        self._cache.set(task.id, task)
+        if task.custom_id:
+            self._custom_ids.set((team_id, task.custom_id), task.id)
+        return task
+
+    def _cached(self, task_id: str, custom_task_ids: bool, team_id: Optional[str]) -> Optional[TaskResp]:
+        if custom_task_ids:
+            canonical = self._custom_ids.get((team_id, task_id))
+            return self._cache.get(canonical) if canonical is not None else None
+        return self._cache.get(task_id)
@@ -234,6 +234,10 @@ class WorkflowContextAPI:
         logger.info(f"Listing contexts for workflow {workflow_id} (page={page}, limit={limit})")
         response = await self._client.get(endpoint, params=query_params)
 
-        if response and "data" in response:
-            return WorkflowContextListResponse.deserialize(response["data"])
-        return None
+        if not response.success or response.status_code != 200:
+            return None
+
+        if response.data is None or not isinstance(response.data, dict):
+            return None
+
+        return WorkflowContextListResponse.deserialize(response.data)
@@ -10,6 +10,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+from functools import lru_cache
 from typing import Any, Generic, Type, TypeVar
 
 import httpx
@@ -31,11 +33,20 @@ from .api.time import TimeAPI
 from .api.workflow import WorkflowAPI
 from .api.workflow_context import WorkflowContextAPI
 from .config import get_settings
+from .deadline import check_deadline, remaining_time
+from .diagnostics import CallRecorder, current_recorder
 from .exceptions import (
     AuthenticationError,
     ClickUpAPIError,
     RateLimitError,
 )
+from .metrics import (
+    RATE_LIMIT_WAIT,
+    REQUEST_BYTES,
+    RESPONSE_BYTES,
+    UPSTREAM_DURATION,
+    UPSTREAM_RETRIES,
+)
 from .models.cli import ServerConfig
 from .models.dto.base import BaseResponseDTO
 from .types import ClickUpClientProtocol, ClickUpToken
@@ -46,6 +57,43 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 D = TypeVar("D", bound=BaseResponseDTO)
 
+# Fixed path segments of ClickUp API endpoints; every other segment is an ID
+_STATIC_SEGMENTS = frozenset(
+    {
+        "team",
+        "space",
+        "folder",
+        "list",
+        "task",
+        "goal",
+        "key_result",
+        "dependency",
+        "field",
+        "member",
+        "time_entries",
+        "time_tracking",
+        "start",
+        "stop",
+        "current",
+        "tag",
+        "comment",
+        "webhook",
+        "user",
+    }
+)
+
+# Repeating these may apply a change twice (e.g., create a second task)
+_NON_IDEMPOTENT_METHODS = frozenset({"POST", "PATCH"})
+# Transport errors raised before the request was sent; any other may have reached ClickUp
+_UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@lru_cache(maxsize=1024)
+def _endpoint_template(endpoint: str) -> str:
+    """Endpoint with IDs replaced by `{id}` (e.g., /task/{id}/dependency), used as a metrics label."""
+    path = endpoint.split("?", 1)[0]
+    return "/".join(seg if not seg or seg in _STATIC_SEGMENTS else "{id}" for seg in path.split("/"))
+
 
 class APIResponse(BaseModel, Generic[T]):
     """
@@ -267,6 +315,7 @@ class ClickUpAPIClient(ClickUpClientProtocol):
 
         # Track request times for rate limiting
         self._request_times: list[float] = []
+        self._rate_limit_lock = asyncio.Lock()
 
         # Prepare headers
         self._headers = {
@@ -276,11 +325,9 @@ class ClickUpAPIClient(ClickUpClientProtocol):
         }
 
         # Create httpx client
-        self._client = httpx.AsyncClient(
-            base_url=base_url,
-            timeout=timeout,
-            headers=self._headers,
-        )
+        self._client = self._new_http_client()
+        # Number of open `async with client` blocks sharing the HTTP pool
+        self._open_contexts = 0
 
         # Initialize API resource managers
         self.space = SpaceAPI(self)
@@ -298,34 +345,58 @@ class ClickUpAPIClient(ClickUpClientProtocol):
         self.bottleneck = BottleneckAPI(self)
         self.insights = InsightsAPI(self)
 
+    def _new_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=self._headers,
+        )
+
     async def __aenter__(self) -> "ClickUpAPIClient":
         """Async context manager entry."""
+        self._open_contexts += 1
         return self
 
     async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None) -> None:
-        """Async context manager exit."""
-        await self.close()
+        """
+        Async context manager exit.
+
+        Overlapping `async with` blocks (e.g., concurrent tool calls on the shared client)
+        share the HTTP pool; it is closed when the last one exits and reopened on the
+        next request.
+        """
+        self._open_contexts = max(0, self._open_contexts - 1)
+        if self._open_contexts == 0:
+            await self.close()
 
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._client.aclose()
 
     async def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting based on requests per minute."""
-        now = asyncio.get_event_loop().time()
+        """Enforce rate limiting based on requests per minute.
 
-        # Remove requests older than 1 minute
-        self._request_times = [req_time for req_time in self._request_times if now - req_time < 60]
+        Concurrent callers (e.g. bulk operations) queue on a lock, so a burst waits its
+        turn instead of every waiter waking up and exceeding the limit together. A wait
+        that would outlast the tool call's deadline fails fast instead of sleeping.
+        """
+        async with self._rate_limit_lock:
+            now = asyncio.get_event_loop().time()
 
-        # Check if we're at the rate limit
-        if len(self._request_times) >= self.rate_limit:
-            sleep_time = 60 - (now - self._request_times[0])
-            if sleep_time > 0:
-                logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
-                await asyncio.sleep(sleep_time)
+            # Remove requests older than 1 minute
+            self._request_times = [req_time for req_time in self._request_times if now - req_time < 60]
 
-        # Add current request time
-        self._request_times.append(now)
+            # Check if we're at the rate limit
+            if len(self._request_times) >= self.rate_limit:
+                sleep_time = 60 - (now - self._request_times[0])
+                if sleep_time > 0:
+                    check_deadline("waiting on the rate limiter", wait=sleep_time)
+                    logger.warning(f"Rate limit reached. Sleeping for {sleep_time:.2f} seconds")
+                    await asyncio.sleep(sleep_time)
+                    now += sleep_time
+
+            # Add current request time
+            self._request_times.append(now)
 
     async def _make_request(
         self,
@@ -345,6 +416,11 @@ class ClickUpAPIClient(ClickUpClientProtocol):
             data: Request body data
             headers: Additional headers
 
+        Notes:
+            - Transport errors are retried with exponential backoff, except that POST and
+              PATCH requests are only retried when they were never sent (connection
+              failures). A request that may have reached ClickUp is not repeated.
+
         Returns:
             APIResponse object containing the response data
 
@@ -352,8 +428,32 @@ class ClickUpAPIClient(ClickUpClientProtocol):
             ClickUpAPIError: For API-related errors
             RateLimitError: When rate limit is exceeded
             AuthenticationError: When authentication fails
+            DeadlineExceededError: When the tool call's deadline passes or a wait would pass it
         """
+        recorder = current_recorder()
+        if recorder is None:
+            return await self._send_with_retries(method, endpoint, params, data, headers, None)
+        recorder.add(upstream_calls=1)
+        with recorder.upstream():
+            return await self._send_with_retries(method, endpoint, params, data, headers, recorder)
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        recorder: CallRecorder | None,
+    ) -> APIResponse:
+        template = _endpoint_template(endpoint)
+        check_deadline("sending a request")
+        waited = time.perf_counter()
         await self._enforce_rate_limit()
+        wait = time.perf_counter() - waited
+        RATE_LIMIT_WAIT.observe(wait, method=method, endpoint=template)
+        if recorder is not None:
+            recorder.add(rate_limit_wait_s=wait)
 
         # Prepare request
         url = endpoint
@@ -362,16 +462,45 @@ class ClickUpAPIClient(ClickUpClientProtocol):
             request_headers.update(headers)
 
         json_data = json.dumps(data) if data else None
+        # json.dumps escapes non-ASCII, so characters are bytes
+        REQUEST_BYTES.observe(len(json_data) if json_data else 0, method=method, endpoint=template)
+
+        if self._client.is_closed:
+            self._client = self._new_http_client()
 
         # Retry logic
         last_exception = None
+        attempts = 0
         for attempt in range(self.max_retries + 1):
+            attempts = attempt + 1
             try:
                 logger.debug(f"Making {method} request to {url} (attempt {attempt + 1})")
 
-                response = await self._client.request(
-                    method=method, url=url, params=params, content=json_data, headers=request_headers
-                )
+                # No attempt may outlast the deadline
+                remaining = remaining_time()
+                timeout = self.timeout if remaining is None else max(0.0, min(self.timeout, remaining))
+                started = time.perf_counter()
+                try:
+                    response = await self._client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        content=json_data,
+                        headers=request_headers,
+                        timeout=timeout,
+                    )
+                except httpx.HTTPError:
+                    elapsed = time.perf_counter() - started
+                    UPSTREAM_DURATION.observe(elapsed, method=method, endpoint=template, status="error")
+                    if recorder is not None:
+                        recorder.add(http_s=elapsed)
+                    raise
+                elapsed = time.perf_counter() - started
+                UPSTREAM_DURATION.observe(elapsed, method=method, endpoint=template, status=str(response.status_code))
+                if recorder is not None:
+                    recorder.add(http_s=elapsed)
+                RESPONSE_BYTES.observe(len(response.content), method=method, endpoint=template)
+                UPSTREAM_RETRIES.observe(attempt, method=method, endpoint=template)
 
                 # Helper function to safely parse JSON
                 def safe_json_parse(response_obj: httpx.Response) -> dict[str, Any] | None:
@@ -394,8 +523,10 @@ class ClickUpAPIClient(ClickUpClientProtocol):
                         response_data=safe_json_parse(response),
                     )
                 elif response.status_code == 429:
+                    retry_after = str(response.headers.get("Retry-After", ""))
                     raise RateLimitError(
                         "Rate limit exceeded",
+                        retry_after=float(retry_after) if retry_after.isdigit() else None,
                         status_code=response.status_code,
                         response_data=safe_json_parse(response),
                     )
@@ -433,19 +564,29 @@ class ClickUpAPIClient(ClickUpClientProtocol):
                 last_exception = e
                 logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
 
+                if method.upper() in _NON_IDEMPOTENT_METHODS and not isinstance(e, _UNSENT_REQUEST_ERRORS):
+                    # The outcome is unknown; repeating the request could apply it twice
+                    break
                 if attempt < self.max_retries:
-                    await asyncio.sleep(self.retry_delay * (2**attempt))  # Exponential backoff
+                    backoff = self.retry_delay * (2**attempt)  # Exponential backoff
+                    check_deadline("retrying a failed request", wait=backoff)
+                    if recorder is not None:
+                        recorder.add(retries=1, retry_wait_s=backoff)
+                    await asyncio.sleep(backoff)
                 continue
 
+        # The last attempt may have been cut short by the deadline
+        check_deadline("waiting for a response")
         # If we've exhausted all retries, log at error level then raise
+        UPSTREAM_RETRIES.observe(attempts - 1, method=method, endpoint=template)
         logger.error(
             "Request failed after %s attempts for %s %s: %s",
-            self.max_retries + 1,
+            attempts,
             method,
             url,
             last_exception,
         )
-        raise ClickUpAPIError(f"Request failed after {self.max_retries + 1} attempts: {last_exception}")
+        raise ClickUpAPIError(f"Request failed after {attempts} attempts: {last_exception}")
 
     async def get(
         self, endpoint: str, params: dict[str, Any] | None = None, headers: dict[str, str] | None = None
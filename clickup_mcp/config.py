@@ -1,10 +1,25 @@
 from functools import lru_cache
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
-from pydantic import Field, SecretStr, field_validator
+from pydantic import Field, SecretStr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from clickup_mcp.types import EnvironmentFile, LogLevel
+from clickup_mcp.types import (
+    DurableQueueSynchronous,
+    EnvironmentFile,
+    LogLevel,
+    WebhookHandlerExecution,
+    WebhookPartitionKeyStrategy,
+)
+
+# Data file settings resolved against `clickup_mcp_data_dir` when relative
+_DATA_PATH_FIELDS = (
+    "clickup_webhook_dead_letter_path",
+    "clickup_webhook_event_log_dir",
+    "clickup_webhook_projection_checkpoint_dir",
+    "clickup_webhook_durable_queue_path",
+)
 
 
 class Settings(BaseSettings):
@@ -29,11 +44,173 @@ class Settings(BaseSettings):
             return v.lower()
         return v
 
+    # Data Directory Configuration
+    clickup_mcp_data_dir: str = Field(
+        default="~/.clickup-mcp",
+        description="Directory that relative webhook data paths (dead letters, event log, queue) are resolved against",
+    )
+
+    # Shutdown Configuration
+    shutdown_drain_timeout: float = Field(
+        default=25.0,
+        ge=0,
+        description="Seconds granted on shutdown to in-flight tool calls, webhook handlers and queue flushes",
+    )
+
+    # MCP Progress Configuration
+    mcp_progress_interval: float = Field(
+        default=0.5, ge=0, description="Minimum seconds between progress notifications sent by long-running tools"
+    )
+
+    # MCP Tool Result Cache Configuration
+    mcp_tool_cache_enabled: bool = Field(default=True, description="Serve repeated read-only tool calls from memory")
+    mcp_tool_cache_ttl: float = Field(
+        default=15.0, ge=0, description="Seconds read-only tool results are kept, for tools without their own TTL"
+    )
+    mcp_tool_cache_ttls: Dict[str, float] = Field(
+        default_factory=dict, description="Per-tool TTL overrides in seconds, keyed by tool name; 0 disables a tool"
+    )
+    mcp_tool_cache_size: int = Field(default=256, ge=0, description="Maximum number of results kept per tool")
+
+    # Metrics Configuration
+    mcp_metrics_enabled: bool = Field(
+        default=True, description="Expose tool and upstream request metrics at /metrics (Prometheus text format)"
+    )
+
+    # Tool Diagnostics Configuration
+    mcp_tool_diagnostics: bool = Field(
+        default=False, description="Attach a per-call timing breakdown (diagnostics) to every tool response"
+    )
+
+    # Tool Deadline Configuration
+    mcp_tool_timeout: float = Field(
+        default=120.0, ge=0, description="Seconds a tool call may take before it is aborted; 0 disables"
+    )
+    mcp_tool_timeouts: Dict[str, float] = Field(
+        default_factory=dict, description="Per-tool timeout overrides in seconds, keyed by tool name; 0 disables"
+    )
+
+    # Bulk Operations Configuration
+    clickup_bulk_max_in_flight: int = Field(
+        default=10, ge=1, description="Maximum concurrent ClickUp requests issued by one bulk task operation"
+    )
+
+    # Task Cache Configuration
+    clickup_task_cache_ttl: float = Field(
+        default=30.0, ge=0, description="Seconds fetched tasks may be served from memory by task.get_many; 0 disables"
+    )
+    clickup_task_cache_size: int = Field(default=1024, ge=0, description="Maximum number of tasks kept in memory")
+
     # Webhook Handler Configuration
     clickup_webhook_handler_modules: str = Field(
         default="", description="Comma-separated list of Python module paths to import for webhook handling"
     )
 
+    # Webhook Sync Handler Execution Configuration
+    clickup_webhook_sync_handler_execution: WebhookHandlerExecution = Field(
+        default="thread",
+        description="Where synchronous webhook handlers run by default (thread, inline, process)",
+    )
+    clickup_webhook_handler_thread_workers: int = Field(
+        default=8, ge=1, description="Maximum number of threads running synchronous webhook handlers"
+    )
+    clickup_webhook_handler_process_workers: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of processes for process-pool webhook handlers (default: CPUs)"
+    )
+
+    # Webhook Handler Retry Configuration
+    clickup_webhook_handler_max_attempts: int = Field(
+        default=5, ge=1, description="Attempts per webhook handler (including the first) before dead-lettering"
+    )
+    clickup_webhook_handler_retry_base_delay: float = Field(
+        default=1.0, ge=0, description="Delay (s) before the first retry of a failed webhook handler; doubles per retry"
+    )
+    clickup_webhook_handler_retry_max_delay: float = Field(
+        default=300.0, ge=0, description="Upper bound (s) of the delay between webhook handler retries"
+    )
+    clickup_webhook_dead_letter_path: str = Field(
+        default="clickup_webhook_dead_letters.jsonl",
+        description="File storing webhook events whose handlers failed permanently",
+    )
+
+    # Webhook Event Log Configuration
+    clickup_webhook_event_log_dir: Optional[str] = Field(
+        default=None, description="Directory of the append-only webhook event log; the log is disabled when unset"
+    )
+    clickup_webhook_event_log_segment_bytes: int = Field(
+        default=64 * 1024 * 1024, ge=1024, description="Size (bytes) after which a new event log segment is started"
+    )
+
+    # Webhook Projection Configuration
+    clickup_webhook_projections_enabled: bool = Field(
+        default=False, description="Maintain webhook-fed task projections queried by the projection.* MCP tools"
+    )
+    clickup_webhook_projection_checkpoint_dir: Optional[str] = Field(
+        default=None, description="Directory for projection checkpoints; checkpoints are disabled when unset"
+    )
+    clickup_webhook_projection_checkpoint_interval: float = Field(
+        default=30.0, ge=0, description="Minimum time (s) between periodic projection checkpoints"
+    )
+
+    # Webhook Workflow Engine Configuration
+    clickup_webhook_workflows_team_id: Optional[str] = Field(
+        default=None, description="Team whose active workflows run in-process on webhook events; disabled when unset"
+    )
+    clickup_webhook_workflow_action_concurrency: int = Field(
+        default=8, ge=1, description="Maximum number of workflow runs executing actions concurrently"
+    )
+    clickup_webhook_workflow_refresh_interval: float = Field(
+        default=300.0, ge=0, description="Time (s) between workflow reloads from ClickUp; 0 disables reloading"
+    )
+
+    # Webhook Ingress Configuration
+    clickup_webhook_ingress_filter: bool = Field(
+        default=True,
+        description="Acknowledge and drop locally dispatched webhook events whose type has no registered handler",
+    )
+
+    # Webhook Queue Publishing Configuration
+    clickup_webhook_queue_max_batch_size: int = Field(
+        default=100, ge=1, description="Maximum number of webhook events published to the queue in one batch"
+    )
+    clickup_webhook_queue_linger_ms: float = Field(
+        default=5.0, ge=0, description="Maximum time (ms) a buffered webhook event waits before its batch is flushed"
+    )
+    clickup_webhook_queue_max_batch_bytes: int = Field(
+        default=1_048_576,
+        ge=1,
+        description="Maximum size (bytes of webhook bodies) of one batch of queued webhook events",
+    )
+    clickup_webhook_header_allowlist: list[str] = Field(
+        default=["x-signature", "x-request-id", "content-type"],
+        description="Webhook request headers (case-insensitive) carried with events to sinks and handlers",
+    )
+    clickup_webhook_queue_partition_key: WebhookPartitionKeyStrategy = Field(
+        default="entity", description="How queued webhook events are keyed for partitioning (entity, container, topic)"
+    )
+
+    # Local Durable Queue Configuration (QUEUE_BACKEND=local-durable)
+    clickup_webhook_durable_queue_path: str = Field(
+        default="clickup_webhook_queue.db", description="SQLite database file of the local-durable queue backend"
+    )
+    clickup_webhook_durable_queue_synchronous: DurableQueueSynchronous = Field(
+        default="full", description="fsync every queue commit (full) or only at WAL checkpoints (normal)"
+    )
+    clickup_webhook_durable_queue_visibility_timeout: float = Field(
+        default=300.0, gt=0, description="Time (s) before an unacknowledged queued event is delivered again"
+    )
+    clickup_webhook_durable_queue_max_deliveries: int = Field(
+        default=5, ge=1, description="Deliveries after which a queued event is kept as dead instead of retried"
+    )
+
+    # Webhook Queue Consumer Configuration
+    clickup_webhook_consumer_concurrency: int = Field(
+        default=16, ge=1, description="Maximum number of queued webhook events handled concurrently per consumer"
+    )
+    clickup_webhook_consumer_batch_size: int = Field(
+        default=64, ge=1, description="Number of messages pulled per batch from backends that support batch pulls"
+    )
+
     # CORS Configuration
     cors_allow_origins: list[str] = Field(
         default=["*"], description="List of origins that are allowed to make cross-origin requests"
@@ -44,6 +221,17 @@ class Settings(BaseSettings):
     cors_allow_methods: list[str] = Field(default=["*"], description="List of allowed HTTP methods")
     cors_allow_headers: list[str] = Field(default=["*"], description="List of allowed HTTP headers")
 
+    @model_validator(mode="after")
+    def anchor_data_paths(self) -> "Settings":
+        """Resolve relative data paths against the data directory instead of the working directory."""
+        data_dir = Path(self.clickup_mcp_data_dir).expanduser()
+        for name in _DATA_PATH_FIELDS:
+            value = getattr(self, name)
+            if value:
+                path = Path(value).expanduser()
+                setattr(self, name, str(path if path.is_absolute() else data_dir / path))
+        return self
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore", case_sensitive=False)
 
 
@@ -0,0 +1,190 @@
+"""
+Time budgets for MCP tool calls.
+
+Design:
+- `handle_tool_errors` runs every tool call under `deadline_scope(seconds)`. The budget
+  comes from `MCP_TOOL_TIMEOUT`, per tool from `MCP_TOOL_TIMEOUTS`, or per call from the
+  request's `_meta.timeout`.
+- The deadline travels in a context variable. Code below the tool uses it to fail fast
+  instead of spending upstream budget on work that cannot finish in time:
+  `ClickUpAPIClient` checks it before each request, before sleeping on the rate limiter
+  or between retries, and caps the HTTP timeout of each attempt at the time left.
+  Bulk operations stop retrying items once the backoff would pass it.
+- Async scopes also cancel whatever is still running when the deadline passes, so a
+  call never outlives its budget, even while waiting on a lock or a slow response.
+- Tools that run many independent items (bulk task tools, `batch.execute`) are marked
+  with `partial_results_at_deadline`. Their scope does not cancel them as a whole; they
+  stop starting items once the deadline passes and bound each running item by it, so
+  what finished is returned and every other item reports DEADLINE_EXCEEDED.
+- Scopes nest: an inner scope (a tool run by `batch.execute`) can only shorten the
+  deadline, never extend it.
+- Running out of time raises `DeadlineExceededError`, which tools report as a
+  DEADLINE_EXCEEDED issue naming the operation that could not finish.
+
+Usage Examples:
+    from clickup_mcp.deadline import deadline_scope, check_deadline
+
+    async with deadline_scope(30):
+        check_deadline("retrying the request", wait=backoff)  # raises if backoff won't fit
+        await asyncio.sleep(backoff)
+
+Environment:
+- `MCP_TOOL_TIMEOUT`: seconds a tool call may take; 0 disables (default 120)
+- `MCP_TOOL_TIMEOUTS`: per-tool overrides as JSON, e.g. {"task.list_in_list": 300}
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, TypeVar
+
+from clickup_mcp.exceptions import DeadlineExceededError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_PARTIAL_RESULTS_ATTR = "__clickup_partial_results_at_deadline__"
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in time (`time.monotonic()`) a call must finish by, and the budget it was given."""
+
+    expires_at: float
+    budget: float
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def exceeded(self, operation: str) -> DeadlineExceededError:
+        return DeadlineExceededError(
+            f"Tool call ran out of its {self.budget:g}s time budget while {operation}",
+            operation=operation,
+            timeout_duration=self.budget,
+        )
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("clickup_mcp_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the tool call being handled, or None when it has none."""
+    return _current.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (may be negative), or None without a deadline."""
+    deadline = _current.get()
+    return None if deadline is None else deadline.remaining()
+
+
+def check_deadline(operation: str, wait: float = 0.0) -> None:
+    """
+    Raise `DeadlineExceededError` when the deadline has passed or `wait` seconds would pass it.
+
+    Args:
+        operation: What the caller is about to do, used in the error (e.g., "waiting on the rate limiter")
+        wait: Seconds the caller is about to sleep
+    """
+    deadline = _current.get()
+    if deadline is not None and deadline.remaining() <= wait:
+        raise deadline.exceeded(operation)
+
+
+def _narrowed(seconds: Optional[float]) -> Optional[Deadline]:
+    # New deadline for `seconds`, or None when there is none or an enclosing one ends first
+    if not seconds or seconds <= 0:
+        return None
+    expires_at = time.monotonic() + seconds
+    outer = _current.get()
+    if outer is not None and outer.expires_at <= expires_at:
+        return None
+    return Deadline(expires_at, seconds)
+
+
+@contextlib.asynccontextmanager
+async def deadline_scope(seconds: Optional[float], *, cancel: bool = True) -> AsyncIterator[Optional[Deadline]]:
+    """
+    Run the block under a deadline of `seconds` and cancel it when the deadline passes.
+
+    Args:
+        seconds: Time budget; None or 0 keeps the enclosing deadline, if any
+        cancel: False only sets the deadline for the block to check, as `sync_deadline_scope`
+            does; the block is then responsible for stopping in time
+
+    Yields:
+        The deadline in effect for the block
+    """
+    deadline = _narrowed(seconds)
+    if deadline is None:
+        yield _current.get()
+        return
+    token = _current.set(deadline)
+    try:
+        if not cancel:
+            yield deadline
+            return
+        async with asyncio.timeout(deadline.remaining()) as timeout:
+            yield deadline
+    except TimeoutError:
+        if timeout.expired():
+            raise deadline.exceeded("the call was running") from None
+        raise
+    finally:
+        _current.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def item_deadline() -> AsyncIterator[None]:
+    """
+    Bound one item of a multi-item call by the current deadline.
+
+    Raises `DeadlineExceededError` without running the block when the deadline has passed,
+    and cancels the block, raising the same error, when it passes while the block runs.
+    Only the item is cancelled; the caller goes on to report it with the others.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        yield
+        return
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        raise deadline.exceeded("waiting to start the item")
+    try:
+        async with asyncio.timeout(remaining) as timeout:
+            yield
+    except TimeoutError:
+        if timeout.expired():
+            raise deadline.exceeded("running the item") from None
+        raise
+
+
+def partial_results_at_deadline(func: F) -> F:
+    """
+    Mark a tool that reports partial results when it runs out of time.
+
+    `handle_tool_errors` runs such a tool under a deadline it checks but that does not
+    cancel it; the tool bounds its items with `item_deadline` and returns what finished.
+    """
+    setattr(func, _PARTIAL_RESULTS_ATTR, True)
+    return func
+
+
+def reports_partial_results(func: Callable[..., Any]) -> bool:
+    """Whether `func` was marked with `partial_results_at_deadline`."""
+    return getattr(func, _PARTIAL_RESULTS_ATTR, False)
+
+
+@contextlib.contextmanager
+def sync_deadline_scope(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Like `deadline_scope` for synchronous code; checks cooperate but nothing is cancelled."""
+    deadline = _narrowed(seconds)
+    if deadline is None:
+        yield _current.get()
+        return
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
@@ -0,0 +1,129 @@
+"""
+Per-call timing breakdown of MCP tool calls.
+
+Design:
+- `handle_tool_errors` opens a `CallRecorder` for each tool call when
+  `MCP_TOOL_DIAGNOSTICS` is enabled and attaches its summary to `ToolResponse.diagnostics`.
+- The recorder travels in a context variable, so code below the tool records into it
+  without any plumbing: `ClickUpAPIClient._make_request` (upstream calls, retries,
+  rate-limit wait, HTTP time, backoff) and the caches (hits). When diagnostics are
+  disabled the context variable is unset and recording costs one `ContextVar.get()`.
+- Tools called inside another tool (`batch.execute`) get their own recorder whose events
+  also count towards the enclosing one.
+- Upstream waits are also tracked as a wall-clock interval union ("busy" time), so the
+  time left for decoding, mapping and serializing stays meaningful when requests overlap.
+
+Usage Examples:
+    from clickup_mcp.diagnostics import current_recorder
+
+    recorder = current_recorder()
+    if recorder is not None:
+        recorder.add(cache_hits=1)
+
+Environment:
+- `MCP_TOOL_DIAGNOSTICS`: attach a diagnostics block to every tool response (default false)
+"""
+
+import contextlib
+import contextvars
+import time
+from typing import Iterator, Optional
+
+_current: contextvars.ContextVar[Optional["CallRecorder"]] = contextvars.ContextVar(
+    "clickup_mcp_call_recorder", default=None
+)
+
+
+class CallRecorder:
+    """Counters and timings of one tool call."""
+
+    __slots__ = (
+        "parent",
+        "started",
+        "upstream_calls",
+        "retries",
+        "cache_hits",
+        "http_s",
+        "rate_limit_wait_s",
+        "retry_wait_s",
+        "busy_s",
+        "_waiting",
+        "_busy_since",
+    )
+
+    def __init__(self, parent: Optional["CallRecorder"] = None) -> None:
+        self.parent = parent
+        self.started = time.perf_counter()
+        self.upstream_calls = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.http_s = 0.0
+        self.rate_limit_wait_s = 0.0
+        self.retry_wait_s = 0.0
+        # Wall time with at least one upstream request pending
+        self.busy_s = 0.0
+        self._waiting = 0
+        self._busy_since = 0.0
+
+    def _chain(self) -> Iterator["CallRecorder"]:
+        recorder: Optional[CallRecorder] = self
+        while recorder is not None:
+            yield recorder
+            recorder = recorder.parent
+
+    def add(
+        self,
+        *,
+        upstream_calls: int = 0,
+        retries: int = 0,
+        cache_hits: int = 0,
+        http_s: float = 0.0,
+        rate_limit_wait_s: float = 0.0,
+        retry_wait_s: float = 0.0,
+    ) -> None:
+        """Add to the counters of this call and of the calls enclosing it."""
+        for recorder in self._chain():
+            recorder.upstream_calls += upstream_calls
+            recorder.retries += retries
+            recorder.cache_hits += cache_hits
+            recorder.http_s += http_s
+            recorder.rate_limit_wait_s += rate_limit_wait_s
+            recorder.retry_wait_s += retry_wait_s
+
+    @contextlib.contextmanager
+    def upstream(self) -> Iterator[None]:
+        """Mark an upstream request (rate-limit wait, attempts and backoff) as pending."""
+        now = time.perf_counter()
+        chain = list(self._chain())
+        for recorder in chain:
+            if recorder._waiting == 0:
+                recorder._busy_since = now
+            recorder._waiting += 1
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            for recorder in chain:
+                recorder._waiting -= 1
+                if recorder._waiting == 0:
+                    recorder.busy_s += now - recorder._busy_since
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self.started
+
+
+def current_recorder() -> Optional[CallRecorder]:
+    """Return the recorder of the tool call being handled, or None when diagnostics are off."""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[CallRecorder]:
+    """Record the calls made in this context; nested inside another recording, events count for both."""
+    recorder = CallRecorder(_current.get())
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
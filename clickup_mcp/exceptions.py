@@ -175,6 +175,14 @@ class TimeoutError(NetworkError):
         return base_str
 
 
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when a tool call runs out of its time budget (see `clickup_mcp.deadline`)."""
+
+    def __init__(self, message: str, operation: str, timeout_duration: Optional[float] = None, **kwargs):
+        super().__init__(message, timeout_duration=timeout_duration, **kwargs)
+        self.operation = operation
+
+
 class RetryExhaustedError(ClickUpError):
     """Exception raised when all retry attempts have been exhausted."""
 
@@ -201,6 +209,10 @@ class RetryExhaustedError(ClickUpError):
         return " | ".join(parts)
 
 
+class ServerShuttingDownError(ClickUpError):
+    """Exception raised when new work arrives after a graceful shutdown has begun."""
+
+
 class MCPError(ClickUpError):
     """Exception raised for MCP-specific errors."""
 
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+"""
+Graceful shutdown coordination.
+
+Design:
+- `ShutdownCoordinator` tracks in-flight MCP tool calls (registered by
+  `handle_tool_errors`) and runs the shutdown steps of the web server under one shared
+  deadline.
+- Once `begin()` is called the coordinator is draining: new tool calls are rejected with
+  `ServerShuttingDownError` (mapped to a TRANSIENT issue, so clients retry elsewhere),
+  while calls already running are given until the deadline to finish.
+- Every lifespan that serves work `open()`s the coordinator on startup and `close()`s it
+  after its own shutdown steps. The last `close()` logs a `ShutdownReport` naming the
+  tool calls and steps that were abandoned at the deadline, then re-opens the coordinator
+  so an application created again in the same process (tests, embedded use) accepts work.
+- Shutdown steps are awaited with `asyncio.wait_for` against the remaining time, but never
+  less than a short grace period, so closing pools and flushing buffers is still attempted
+  after slow work used up the deadline. A step that times out is cancelled and reported;
+  the remaining steps still run.
+
+Usage Examples:
+    from clickup_mcp.lifecycle import get_shutdown_coordinator
+
+    shutdown = get_shutdown_coordinator()
+    shutdown.begin()                                  # stop accepting new tool calls
+    await shutdown.wait_for_tool_calls()              # drain in-flight calls
+    await shutdown.run_step("event sinks", shutdown_event_sinks)
+    report = shutdown.close()
+
+Environment:
+- `SHUTDOWN_DRAIN_TIMEOUT`: seconds granted to in-flight work and flushes on shutdown (default 25)
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from clickup_mcp.exceptions import ServerShuttingDownError
+
+logger = logging.getLogger(__name__)
+
+# Interval at which draining re-checks the in-flight tool calls
+_POLL_INTERVAL = 0.05
+# Time every shutdown step gets even when the deadline has passed
+_STEP_GRACE = 0.5
+
+
+@dataclass
+class ShutdownReport:
+    """Outcome of one graceful shutdown."""
+
+    drained_tool_calls: int = 0
+    abandoned_tool_calls: List[str] = field(default_factory=list)
+    rejected_tool_calls: int = 0
+    completed_steps: List[str] = field(default_factory=list)
+    abandoned_steps: List[str] = field(default_factory=list)
+    failed_steps: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def clean(self) -> bool:
+        """True when all in-flight work finished and every step completed."""
+        return not (self.abandoned_tool_calls or self.abandoned_steps or self.failed_steps)
+
+
+class ShutdownCoordinator:
+    """Tracks in-flight tool calls and runs shutdown steps under a shared deadline."""
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """
+        Args:
+            timeout: Drain deadline in seconds; defaults to `SHUTDOWN_DRAIN_TIMEOUT`
+        """
+        self._timeout = timeout
+        self._ids = itertools.count()
+        self._in_flight: Dict[int, str] = {}
+        self._scopes = 0
+        self._started: Optional[float] = None
+        self._deadline: Optional[float] = None
+        self._report: Optional[ShutdownReport] = None
+
+    @property
+    def draining(self) -> bool:
+        """True once shutdown has begun."""
+        return self._deadline is not None
+
+    @property
+    def in_flight(self) -> List[str]:
+        """Names of the tool calls currently running."""
+        return list(self._in_flight.values())
+
+    def remaining(self) -> float:
+        """Seconds left until the drain deadline (0 when not draining or expired)."""
+        if self._deadline is None:
+            return 0.0
+        return max(0.0, self._deadline - time.monotonic())
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> Iterator[None]:
+        """
+        Register a tool call for the duration of the block.
+
+        Raises:
+            ServerShuttingDownError: If shutdown has begun; the call must not start
+        """
+        if self._deadline is not None:
+            if self._report is not None:
+                self._report.rejected_tool_calls += 1
+            raise ServerShuttingDownError(f"Server is shutting down; '{name}' was not started")
+        call_id = next(self._ids)
+        self._in_flight[call_id] = name
+        try:
+            yield
+        finally:
+            del self._in_flight[call_id]
+
+    def open(self) -> None:
+        """Enter a serving lifespan; the first one resets a previous shutdown."""
+        if self._scopes == 0:
+            self._reset()
+        self._scopes += 1
+
+    def begin(self) -> None:
+        """Start draining: reject new tool calls and fix the deadline (idempotent)."""
+        if self._deadline is not None:
+            return
+        if self._timeout is None:
+            from clickup_mcp.config import get_settings
+
+            self._timeout = get_settings().shutdown_drain_timeout
+        self._started = time.monotonic()
+        self._deadline = self._started + self._timeout
+        self._report = ShutdownReport()
+        if self._in_flight:
+            logger.info("Shutting down; waiting up to %.1fs for %d tool call(s)", self._timeout, len(self._in_flight))
+
+    async def wait_for_tool_calls(self) -> List[str]:
+        """
+        Wait until in-flight tool calls finish or the deadline passes.
+
+        Returns:
+            Names of the tool calls still running at the deadline
+        """
+        self.begin()
+        report = self._report
+        assert report is not None
+        waiting = len(self._in_flight)
+        while self._in_flight and self.remaining() > 0:
+            await asyncio.sleep(min(_POLL_INTERVAL, self.remaining()))
+        abandoned = self.in_flight
+        report.drained_tool_calls += waiting - len(abandoned)
+        report.abandoned_tool_calls.extend(abandoned)
+        return abandoned
+
+    async def run_step(self, name: str, step: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Run one shutdown step within the remaining drain time (at least `_STEP_GRACE`).
+
+        Failures and timeouts are logged and recorded on the report, never raised, so
+        later steps still run.
+
+        Returns:
+            True if the step completed
+        """
+        self.begin()
+        report = self._report
+        assert report is not None
+        try:
+            await asyncio.wait_for(step(), timeout=max(self.remaining(), _STEP_GRACE))
+        except asyncio.TimeoutError:
+            logger.warning("Shutdown step '%s' did not finish before the drain deadline", name)
+            report.abandoned_steps.append(name)
+            return False
+        except Exception as exc:  # noqa: BLE001 - keep shutting down
+            logger.exception("Shutdown step '%s' failed", name)
+            report.failed_steps[name] = repr(exc)
+            return False
+        report.completed_steps.append(name)
+        return True
+
+    def close(self) -> Optional[ShutdownReport]:
+        """
+        Leave a serving lifespan; the last one logs and returns the shutdown report.
+
+        Returns:
+            The report when this was the last open lifespan, otherwise None
+        """
+        self._scopes = max(0, self._scopes - 1)
+        if self._scopes:
+            return None
+        report = self._report
+        if report is not None:
+            assert self._started is not None
+            report.elapsed = time.monotonic() - self._started
+            if report.clean:
+                logger.info(
+                    "Shutdown complete in %.2fs: %d tool call(s) drained, %d rejected",
+                    report.elapsed,
+                    report.drained_tool_calls,
+                    report.rejected_tool_calls,
+                )
+            else:
+                logger.warning(
+                    "Shutdown finished in %.2fs with abandoned work: tool calls %s, steps %s, failed steps %s",
+                    report.elapsed,
+                    report.abandoned_tool_calls,
+                    report.abandoned_steps,
+                    report.failed_steps,
+                )
+        self._reset()
+        return report
+
+    def _reset(self) -> None:
+        self._started = self._deadline = None
+        self._report = None
+
+
+_coordinator: Optional[ShutdownCoordinator] = None
+
+
+def get_shutdown_coordinator() -> ShutdownCoordinator:
+    """Return the process-wide shutdown coordinator."""
+    global _coordinator
+    if _coordinator is None:
+        _coordinator = ShutdownCoordinator()
+    return _coordinator
@@ -19,12 +19,14 @@ Usage Examples:
 
 # Import tool modules to register tools
 from . import analytics  # noqa: F401
+from . import batch  # noqa: F401
 from . import bottleneck  # noqa: F401
 from . import folder  # noqa: F401
 from . import goal  # noqa: F401
 from . import insights  # noqa: F401
 from . import key_result  # noqa: F401
 from . import list  # noqa: F401
+from . import projection  # noqa: F401
 from . import reporting  # noqa: F401
 from . import space  # noqa: F401
 from . import task  # noqa: F401
@@ -31,6 +31,7 @@ from clickup_mcp.models.dto.analytics import (
 from clickup_mcp.models.mapping.analytics_mapper import AnalyticsMapper
 
 from .app import mcp
+from .tool_cache import cached_tool
 
 
 @mcp.tool(
@@ -45,6 +46,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@cached_tool("analytics.get_task_analytics", scopes=("task", "time"), ttl=60)
 @handle_tool_errors
 async def analytics_get_task_analytics(input: TaskAnalyticsInput) -> TaskAnalyticsResult:
     """
@@ -96,6 +98,7 @@ async def analytics_get_task_analytics(input: TaskAnalyticsInput) -> TaskAnalyti
         "openWorldHint": True,
     },
 )
+@cached_tool("analytics.get_team_analytics", scopes=("task", "time"), ttl=60)
 @handle_tool_errors
 async def analytics_get_team_analytics(input: TeamAnalyticsInput) -> TeamAnalyticsResult:
     """
@@ -141,6 +144,7 @@ async def analytics_get_team_analytics(input: TeamAnalyticsInput) -> TeamAnalyti
         "openWorldHint": True,
     },
 )
+@cached_tool("analytics.get_list_analytics", scopes=("task", "time"), ttl=60)
 @handle_tool_errors
 async def analytics_get_list_analytics(input: ListAnalyticsInput) -> ListAnalyticsResult:
     """
@@ -186,6 +190,7 @@ async def analytics_get_list_analytics(input: ListAnalyticsInput) -> ListAnalyti
         "openWorldHint": True,
     },
 )
+@cached_tool("analytics.get_space_analytics", scopes=("task", "time"), ttl=60)
 @handle_tool_errors
 async def analytics_get_space_analytics(input: SpaceAnalyticsInput) -> SpaceAnalyticsResult:
     """
@@ -43,6 +43,10 @@ sequenceDiagram
     FA->>MCP: streamable_http_app() (init HTTP streaming)
     MCP->>MCP: session_manager.run()
     Note over MCP: Runs until FastAPI shutdown
+    FA->>Factory: shutdown
+    Factory->>Factory: drain in-flight tool calls (deadline)
+    Factory->>MCP: exit session_manager.run()
+    Factory->>Factory: close ClickUp API client, log shutdown report
 ```
 
 See also:
@@ -57,6 +61,7 @@ from fastapi import FastAPI
 from mcp.server import FastMCP
 
 from clickup_mcp._base import BaseServerFactory
+from clickup_mcp.lifecycle import get_shutdown_coordinator
 
 _MCP_SERVER_INSTANCE: FastMCP | None = None
 
@@ -134,6 +139,9 @@ class MCPServerFactory(BaseServerFactory[FastMCP]):
         - Initializes the SSE and HTTP streaming sub-apps to ensure the session
           manager is properly set up.
         - Runs the `session_manager` for the duration of the FastAPI app lifecycle.
+        - On shutdown, stops accepting tool calls and waits for in-flight ones (up to
+          `SHUTDOWN_DRAIN_TIMEOUT`) before the session manager cancels what is left,
+          then closes the ClickUp API client's HTTP pool. See `clickup_mcp.lifecycle`.
 
         Returns:
             Callable[..., contextlib._AsyncGeneratorContextManager]: A lifespan context
@@ -154,13 +162,31 @@ class MCPServerFactory(BaseServerFactory[FastMCP]):
             _mcp_server.sse_app()
             _mcp_server.streamable_http_app()
 
-            # Now we can safely access session_manager
-            async with _mcp_server.session_manager.run():
-                yield  # FastAPI would start to handle requests after yield
+            shutdown = get_shutdown_coordinator()
+            shutdown.open()
+            try:
+                # Now we can safely access session_manager
+                async with _mcp_server.session_manager.run():
+                    yield  # FastAPI would start to handle requests after yield
+                    # Drain while sessions are still running; leaving run() cancels them
+                    await shutdown.wait_for_tool_calls()
+                await shutdown.run_step("ClickUp API client", _close_api_client)
+            finally:
+                shutdown.close()
 
         return lifespan
 
 
+async def _close_api_client() -> None:
+    from clickup_mcp.client import ClickUpAPIClientFactory
+
+    try:
+        client = ClickUpAPIClientFactory.get()
+    except AssertionError:
+        return
+    await client.close()
+
+
 # Create a default MCP server instance for backward compatibility
 mcp_factory = MCPServerFactory
 mcp = mcp_factory.create()
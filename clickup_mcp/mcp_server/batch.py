@@ -0,0 +1,247 @@
+"""MCP tool for running many tool invocations in one call.
+
+Operations are executed through the registered FastMCP tools, so arguments are validated
+and errors are enveloped exactly as for a direct call. Independent operations run
+concurrently (bounded by `concurrency`) and share the ClickUp client and its rate
+limiter; operations that reference another's result wait for it. Progress is reported
+per finished operation; the nested tools' own progress notifications are muted. When the
+call runs out of time, operations still running are cancelled and the rest are not
+started; they report DEADLINE_EXCEEDED while finished operations keep their results.
+
+Tools:
+- batch.execute
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from clickup_mcp.deadline import item_deadline, partial_results_at_deadline
+from clickup_mcp.exceptions import DeadlineExceededError, ValidationError
+from clickup_mcp.mcp_server.errors import handle_tool_errors
+from clickup_mcp.mcp_server.errors.codes import IssueCode
+from clickup_mcp.mcp_server.errors.mapping import map_exception
+from clickup_mcp.mcp_server.errors.models import ToolIssue, ToolResponse
+from clickup_mcp.mcp_server.models.inputs.batch import BatchExecuteInput, BatchOperation
+from clickup_mcp.mcp_server.models.outputs.batch import (
+    BatchExecuteResult,
+    BatchOperationResult,
+)
+
+from .app import mcp
+from .progress import muted, tool_progress
+
+_REF = "$ref"
+_TOOL_NAME = "batch.execute"
+_MISSING = object()
+
+
+def _refs(value: Any) -> Set[str]:
+    """Operation IDs referenced anywhere inside `value`."""
+    if isinstance(value, dict):
+        if set(value) == {_REF} and isinstance(value[_REF], str):
+            return {value[_REF].split(".", 1)[0]}
+        return set().union(*(_refs(v) for v in value.values())) if value else set()
+    if isinstance(value, list):
+        return set().union(*(_refs(v) for v in value)) if value else set()
+    return set()
+
+
+def _lookup(value: Any, path: str) -> Any:
+    for part in path.split(".") if path else ():
+        if isinstance(value, dict):
+            value = value.get(part, _MISSING)
+        elif isinstance(value, list) and part.lstrip("-").isdigit() and -len(value) <= int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def _resolve(value: Any, results: Dict[str, Any]) -> Any:
+    """Replace `{"$ref": "<op id>.<path>"}` values with the referenced result values."""
+    if isinstance(value, dict):
+        if set(value) == {_REF} and isinstance(value[_REF], str):
+            op_id, _, path = value[_REF].partition(".")
+            resolved = _lookup(results[op_id], path)
+            if resolved is _MISSING:
+                raise ValidationError(f"Reference '{value[_REF]}' not found in the result of '{op_id}'")
+            return resolved
+        return {k: _resolve(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve(v, results) for v in value]
+    return value
+
+
+def _dependencies(operations: List[BatchOperation]) -> List[Set[str]]:
+    """Dependencies per operation; raises on unknown IDs, nested batches and cycles."""
+    known = {op.id for op in operations if op.id is not None}
+    deps: List[Set[str]] = []
+    for index, op in enumerate(operations):
+        if op.tool == _TOOL_NAME:
+            raise ValidationError(f"Operation {index}: {_TOOL_NAME} cannot be nested", field="operations")
+        needed = set(op.depends_on) | _refs(op.arguments)
+        unknown = needed - known
+        if unknown:
+            raise ValidationError(f"Operation {index} depends on unknown operation(s): {sorted(unknown)}")
+        if op.id in needed:
+            raise ValidationError(f"Operation '{op.id}' depends on itself")
+        deps.append(needed)
+
+    # Kahn's algorithm over operation IDs to reject cycles before anything runs
+    remaining = {op.id: deps[i] for i, op in enumerate(operations) if op.id is not None}
+    done: Set[str] = set()
+    while remaining:
+        ready = [op_id for op_id, needed in remaining.items() if needed <= done]
+        if not ready:
+            raise ValidationError(f"Dependency cycle between operations: {sorted(remaining)}")
+        for op_id in ready:
+            done.add(op_id)
+            del remaining[op_id]
+    return deps
+
+
+def _issue_response(code: IssueCode, message: str, hint: Optional[str] = None) -> ToolResponse[Any]:
+    return ToolResponse[Any](ok=False, issues=[ToolIssue(code=code, message=message, hint=hint)])
+
+
+def _registered_tool(name: str) -> Optional[Tool]:
+    # FastMCP only exposes `call_tool`, which renders results to content blocks and would
+    # lose the ToolResponse envelope. Its private tool manager has served lookups by name
+    # since mcp 1.10, the minimum version in pyproject.toml; keep the access in this one
+    # place so an mcp upgrade that moves it fails here, with a clear message.
+    manager = getattr(mcp, "_tool_manager", None)
+    if manager is None:
+        raise RuntimeError("This mcp version does not expose FastMCP's tool manager; batch.execute needs it")
+    return manager.get_tool(name)
+
+
+async def _call_tool(name: str, arguments: Dict[str, Any]) -> ToolResponse[Any]:
+    tool = _registered_tool(name)
+    if tool is None:
+        return _issue_response(IssueCode.VALIDATION_ERROR, f"Unknown tool: {name}")
+    try:
+        value = await tool.run(arguments)
+    except ToolError as exc:
+        cause = exc.__cause__ if isinstance(exc.__cause__, Exception) else exc
+        if isinstance(cause, PydanticValidationError):
+            return _issue_response(
+                IssueCode.VALIDATION_ERROR,
+                f"Invalid arguments for {name}: {cause.error_count()} validation error(s)",
+                hint=str(cause.errors(include_url=False)[0].get("msg")),
+            )
+        return ToolResponse[Any](ok=False, issues=[map_exception(cause)])
+    if isinstance(value, ToolResponse):
+        return value
+    return ToolResponse[Any](ok=True, result=value)
+
+
+@mcp.tool(
+    title="Execute Batch",
+    name=_TOOL_NAME,
+    description=(
+        "Run many tool calls in one request (1..200), e.g., update 30 tasks at once. Each operation is "
+        '{"id"?, "tool", "arguments", "depends_on"?}. Independent operations run concurrently (`concurrency`, '
+        'default 8). Use {"$ref": "<op id>.<path>"} in arguments to pass a result field of an earlier '
+        'operation, e.g., {"$ref": "list.id"}. Returns one ok/issues envelope per operation in request order; '
+        "operations whose dependency failed are skipped."
+    ),
+    annotations={
+        "destructiveHint": True,
+        "openWorldHint": True,
+    },
+)
+@handle_tool_errors
+@partial_results_at_deadline
+async def batch_execute(input: BatchExecuteInput) -> BatchExecuteResult:
+    """
+    Run many tool invocations with bounded concurrency and dependency ordering.
+
+    Args:
+        input: BatchExecuteInput with operations, concurrency and stop_on_error
+
+    Returns:
+        BatchExecuteResult: One `ToolResponse` per operation, in request order, plus counts
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Unknown references, dependency cycles and
+        nested batches fail the whole call with VALIDATION_ERROR before anything runs.
+        Failures of individual operations are reported in their own envelopes, including
+        DEADLINE_EXCEEDED for operations the call ran out of time for.
+
+    Examples:
+        # Python (async)
+        response = await batch_execute(BatchExecuteInput(operations=[
+            BatchOperation(id="list", tool="list.create", arguments={"input": {"folder_id": "F1", "name": "Q3"}}),
+            BatchOperation(tool="task.create", arguments={"input": {"list_id": {"$ref": "list.id"}, "name": "A"}}),
+        ]))
+        for item in response.result.results:
+            print(item.tool, item.response.ok)
+    """
+    operations = input.operations
+    deps = _dependencies(operations)
+    slots = asyncio.Semaphore(input.concurrency)
+    finished: Dict[str, asyncio.Future[bool]] = {
+        op.id: asyncio.get_running_loop().create_future() for op in operations if op.id is not None
+    }
+    results: Dict[str, Any] = {}
+    aborted = False
+    progress = tool_progress("operations finished")
+    done = 0
+
+    async def run(index: int, op: BatchOperation) -> BatchOperationResult:
+        nonlocal done
+        item = await run_operation(index, op)
+        done += 1
+        await progress(done, len(operations))
+        return item
+
+    async def run_operation(index: int, op: BatchOperation) -> BatchOperationResult:
+        nonlocal aborted
+        ok = False
+        try:
+            for dep in deps[index]:
+                if not await finished[dep]:
+                    response = _issue_response(
+                        IssueCode.CONFLICT, f"Not run: dependency '{dep}' did not succeed", hint="Fix it and retry"
+                    )
+                    return BatchOperationResult(index=index, id=op.id, tool=op.tool, skipped=True, response=response)
+            async with slots:
+                if aborted:
+                    response = _issue_response(IssueCode.CONFLICT, "Not run: an earlier operation failed")
+                    return BatchOperationResult(index=index, id=op.id, tool=op.tool, skipped=True, response=response)
+                try:
+                    arguments = _resolve(op.arguments, results)
+                except ValidationError as exc:
+                    response = ToolResponse[Any](ok=False, issues=[map_exception(exc)])
+                else:
+                    try:
+                        async with item_deadline():
+                            response = await _call_tool(op.tool, arguments)
+                    except DeadlineExceededError as exc:
+                        response = ToolResponse[Any](ok=False, issues=[map_exception(exc)])
+            ok = response.ok
+            if ok and op.id is not None:
+                result = response.result
+                results[op.id] = result.model_dump(mode="json") if isinstance(result, BaseModel) else result
+            if not ok and input.stop_on_error:
+                aborted = True
+            return BatchOperationResult(index=index, id=op.id, tool=op.tool, response=response)
+        finally:
+            if op.id is not None:
+                finished[op.id].set_result(ok)
+
+    with muted():
+        items = await asyncio.gather(*(run(i, op) for i, op in enumerate(operations)))
+    return BatchExecuteResult(
+        results=list(items),
+        succeeded=sum(1 for item in items if item.response.ok),
+        failed=sum(1 for item in items if not item.response.ok and not item.skipped),
+        skipped=sum(1 for item in items if item.skipped),
+    )
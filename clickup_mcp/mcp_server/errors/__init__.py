@@ -2,7 +2,7 @@
 
 Exports:
 - IssueCode: strict enum of canonical error codes
-- ToolIssue, ToolResponse[T]: response envelope models
+- ToolIssue, ToolResponse[T], CacheInfo, ToolDiagnostics: response envelope models
 - map_exception: exception → ToolIssue mapper
 - handle_tool_errors: decorator to wrap MCP tools
 """
@@ -10,10 +10,12 @@ Exports:
 from .codes import IssueCode
 from .handler import handle_tool_errors
 from .mapping import map_exception
-from .models import ToolIssue, ToolResponse
+from .models import CacheInfo, ToolDiagnostics, ToolIssue, ToolResponse
 
 __all__ = [
+    "CacheInfo",
     "IssueCode",
+    "ToolDiagnostics",
     "ToolIssue",
     "ToolResponse",
     "map_exception",
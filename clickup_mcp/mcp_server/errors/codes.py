@@ -11,6 +11,7 @@ Error Code Categories:
 - **Resource Errors**: Resource not found or conflicts (NOT_FOUND, CONFLICT)
 - **Rate Limiting**: API rate limit exceeded (RATE_LIMIT)
 - **Transient Errors**: Temporary failures that may succeed on retry (TRANSIENT)
+- **Deadline Errors**: The call ran out of its time budget (DEADLINE_EXCEEDED)
 - **Internal Errors**: Server-side errors (INTERNAL)
 
 Usage Examples:
@@ -56,6 +57,8 @@ class IssueCode(str, Enum):
         CONFLICT: Operation conflicts with existing state (e.g., duplicate, constraint violation)
         RATE_LIMIT: API rate limit exceeded, client should back off
         TRANSIENT: Temporary failure (network, timeout), client should retry
+        DEADLINE_EXCEEDED: The tool call ran out of its time budget; narrow the request or
+            allow more time (`_meta.timeout`) rather than retrying as is
         INTERNAL: Server-side error, client should report to support
 
     Usage Examples:
@@ -96,4 +99,5 @@ class IssueCode(str, Enum):
     CONFLICT = "CONFLICT"
     RATE_LIMIT = "RATE_LIMIT"
     TRANSIENT = "TRANSIENT"
+    DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
     INTERNAL = "INTERNAL"
@@ -56,6 +56,8 @@ Usage Examples:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import time
 from functools import wraps
 from typing import (
     Any,
@@ -69,8 +71,18 @@ from typing import (
 
 from pydantic import BaseModel
 
+from clickup_mcp.config import get_settings
+from clickup_mcp.deadline import (
+    deadline_scope,
+    reports_partial_results,
+    sync_deadline_scope,
+)
+from clickup_mcp.diagnostics import CallRecorder, recording
+from clickup_mcp.lifecycle import get_shutdown_coordinator
+from clickup_mcp.metrics import TOOL_DURATION, TOOL_ERRORS
+
 from .mapping import map_exception
-from .models import ToolResponse
+from .models import ToolDiagnostics, ToolResponse
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -84,6 +96,48 @@ def _wrap_result(value: Any) -> ToolResponse[Any]:
     return ToolResponse[Any](ok=True, result=value, issues=[])
 
 
+def _requested_timeout() -> float | None:
+    # Per-call budget from the MCP request's `_meta.timeout`, if any
+    from clickup_mcp.mcp_server.app import mcp
+
+    try:
+        meta = mcp.get_context().request_context.meta
+    except ValueError:  # not handling an MCP request (direct call)
+        return None
+    timeout = getattr(meta, "timeout", None) if meta is not None else None
+    return float(timeout) if isinstance(timeout, (int, float)) and timeout > 0 else None
+
+
+def _tool_timeout(name: str) -> float | None:
+    requested = _requested_timeout()
+    if requested is not None:
+        return requested
+    settings = get_settings()
+    # Overrides are keyed by tool name ("task.get"); tool functions are named after it ("task_get")
+    for tool, timeout in settings.mcp_tool_timeouts.items():
+        if tool.replace(".", "_") == name:
+            return timeout
+    return settings.mcp_tool_timeout
+
+
+def _recording() -> contextlib.AbstractContextManager[CallRecorder | None]:
+    return recording() if get_settings().mcp_tool_diagnostics else contextlib.nullcontext()
+
+
+def _with_diagnostics(response: ToolResponse[Any], recorder: CallRecorder | None) -> ToolResponse[Any]:
+    if recorder is None:
+        return response
+    return response.model_copy(update={"diagnostics": ToolDiagnostics.from_recorder(recorder)})
+
+
+def _record_call(tool: str, started: float, response: ToolResponse[Any] | None) -> None:
+    # No response means the call was cancelled (or raised a BaseException)
+    outcome = "cancelled" if response is None else "ok" if response.ok else "error"
+    TOOL_DURATION.observe(time.perf_counter() - started, tool=tool, outcome=outcome)
+    if response is not None and not response.ok:
+        TOOL_ERRORS.inc(tool=tool, code=response.issues[0].code.value if response.issues else "UNKNOWN")
+
+
 @overload
 def handle_tool_errors(
     func: Callable[P, TModel | ToolResponse[TModel] | None],
@@ -111,6 +165,16 @@ def handle_tool_errors(  # type: ignore[misc]
     - If it returns a bare result (pydantic model or other), it's wrapped with ok=True
     - If it raises an exception, it's converted to ok=False with mapped issues
     - Supports both sync and async functions transparently
+    - Registers each call with the shutdown coordinator, so graceful shutdown can drain
+      it; once shutdown has begun the call is rejected with a TRANSIENT issue
+    - Records the call's latency and outcome (and the issue code of failures) in the
+      process metrics, labelled with the function name
+    - With `MCP_TOOL_DIAGNOSTICS` on, records upstream calls, retries, cache hits and
+      timings of the call and attaches them as `ToolResponse.diagnostics`
+    - Runs the call under a deadline (`MCP_TOOL_TIMEOUT`, `MCP_TOOL_TIMEOUTS` or the
+      request's `_meta.timeout`); running out of time yields a DEADLINE_EXCEEDED issue.
+      Tools marked with `partial_results_at_deadline` are not cancelled; they stop on
+      their own and report DEADLINE_EXCEEDED for the items that did not finish
 
     Type Safety:
     - Uses ParamSpec to preserve function signatures
@@ -208,22 +272,43 @@ def handle_tool_errors(  # type: ignore[misc]
 
         @wraps(func)
         async def async_wrapper(*args: P.args, **kwargs: P.kwargs):
+            started = time.perf_counter()
+            response: ToolResponse[Any] | None = None
             try:
-                value = await func(*args, **kwargs)
-                return _wrap_result(value)
-            except Exception as exc:  # noqa: BLE001
-                issue = map_exception(exc)
-                return ToolResponse(ok=False, issues=[issue])
+                with _recording() as recorder:
+                    try:
+                        with get_shutdown_coordinator().track(func.__name__):
+                            cancel = not reports_partial_results(func)
+                            async with deadline_scope(_tool_timeout(func.__name__), cancel=cancel):
+                                value = await func(*args, **kwargs)
+                        response = _wrap_result(value)
+                    except Exception as exc:  # noqa: BLE001
+                        issue = map_exception(exc)
+                        response = ToolResponse(ok=False, issues=[issue])
+                    response = _with_diagnostics(response, recorder)
+                return response
+            finally:
+                _record_call(func.__name__, started, response)
 
         return async_wrapper
 
     @wraps(func)
     def sync_wrapper(*args: P.args, **kwargs: P.kwargs):
+        started = time.perf_counter()
+        response: ToolResponse[Any] | None = None
         try:
-            value = func(*args, **kwargs)
-            return _wrap_result(value)
-        except Exception as exc:  # noqa: BLE001
-            issue = map_exception(exc)
-            return ToolResponse(ok=False, issues=[issue])
+            with _recording() as recorder:
+                try:
+                    with get_shutdown_coordinator().track(func.__name__):
+                        with sync_deadline_scope(_tool_timeout(func.__name__)):
+                            value = func(*args, **kwargs)
+                    response = _wrap_result(value)
+                except Exception as exc:  # noqa: BLE001
+                    issue = map_exception(exc)
+                    response = ToolResponse(ok=False, issues=[issue])
+                response = _with_diagnostics(response, recorder)
+            return response
+        finally:
+            _record_call(func.__name__, started, response)
 
     return sync_wrapper
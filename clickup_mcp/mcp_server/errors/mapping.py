@@ -10,6 +10,7 @@ Mapping Strategy:
 - httpx timeouts → TRANSIENT with retry guidance
 - HTTPStatusError → based on status code (429, 401/403, 404, 409, 5xx)
 - ClickUp domain errors → mapped to appropriate IssueCode with hints
+- Tool call deadlines → DEADLINE_EXCEEDED naming the operation that ran out of time
 - Fallback → INTERNAL to avoid leaking internals
 
 Usage Examples:
@@ -41,8 +42,11 @@ from clickup_mcp.exceptions import (
     AuthorizationError,
     ClickUpAPIError,
     ClickUpError,
+    ConfigurationError,
+    DeadlineExceededError,
     RateLimitError,
     ResourceNotFoundError,
+    ServerShuttingDownError,
     ValidationError,
 )
 
@@ -140,9 +144,14 @@ def map_exception(exc: Exception) -> ToolIssue:
         return ToolIssue(code=IssueCode.INTERNAL, message="HTTP error")
 
     # ClickUp domain exceptions
+    if isinstance(exc, DeadlineExceededError):
+        return ToolIssue(
+            code=IssueCode.DEADLINE_EXCEEDED,
+            message=exc.message,
+            hint="Narrow the request (fewer pages or items) or allow more time with _meta.timeout",
+        )
     if isinstance(exc, RateLimitError):
-        assert exc.retry_after
-        ms = int(exc.retry_after * 1000) if getattr(exc, "retry_after", None) else None
+        ms = int(exc.retry_after * 1000) if exc.retry_after is not None else None
         return ToolIssue(
             code=IssueCode.RATE_LIMIT, message="Rate limit exceeded", hint="Back off and retry", retry_after_ms=ms
         )
@@ -157,6 +166,12 @@ def map_exception(exc: Exception) -> ToolIssue:
         if isinstance(status, int) and 500 <= status < 600:
             return ToolIssue(code=IssueCode.TRANSIENT, message="Upstream service error", hint="Retry later")
         return ToolIssue(code=IssueCode.INTERNAL, message="API error")
+    if isinstance(exc, ServerShuttingDownError):
+        return ToolIssue(
+            code=IssueCode.TRANSIENT, message="Server is shutting down", hint="Retry; the call was not started"
+        )
+    if isinstance(exc, ConfigurationError):
+        return ToolIssue(code=IssueCode.INTERNAL, message="Server configuration required", hint=str(exc))
     if isinstance(exc, ClickUpError):
         return ToolIssue(code=IssueCode.INTERNAL, message="Internal error")
 
@@ -49,11 +49,13 @@ Usage Examples:
 
 from __future__ import annotations
 
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 from pydantic.generics import GenericModel
 
+from clickup_mcp.diagnostics import CallRecorder
+
 from .codes import IssueCode
 
 
@@ -124,6 +126,81 @@ class ToolIssue(BaseModel):
     }
 
 
+class CacheInfo(BaseModel):
+    """
+    How a read-only tool's result was produced (see `clickup_mcp.mcp_server.tool_cache`).
+
+    Attributes:
+        status: "hit" when served from the tool result cache, "miss" when computed now
+        age_ms: Age of the cached result in milliseconds (hits only)
+        ttl_ms: How long results of this tool stay cached, in milliseconds
+    """
+
+    status: Literal["hit", "miss"] = Field(..., description="hit: served from cache; miss: freshly fetched")
+    age_ms: Optional[int] = Field(None, ge=0, description="Age of the cached result in ms (hits only)")
+    ttl_ms: int = Field(..., ge=0, description="Cache lifetime of this tool's results in ms")
+
+    model_config = {"json_schema_extra": {"examples": [{"status": "hit", "age_ms": 2300, "ttl_ms": 15000}]}}
+
+
+class ToolDiagnostics(BaseModel):
+    """
+    Where the time of one tool call went (see `clickup_mcp.diagnostics`).
+
+    Attributes:
+        upstream_calls: ClickUp API requests made (each page counts)
+        retries: Request attempts repeated after transport failures
+        cache_hits: Results served from memory instead of ClickUp
+        total_ms: Wall time of the call
+        http_ms: Time spent in HTTP attempts (summed over concurrent requests)
+        rate_limit_wait_ms: Time requests waited on the client-side rate limiter
+        retry_wait_ms: Backoff time between retries
+        serialization_ms: Wall time with no upstream request pending, i.e. decoding,
+            mapping and serializing
+    """
+
+    upstream_calls: int = Field(0, ge=0, description="ClickUp API requests made")
+    retries: int = Field(0, ge=0, description="Attempts repeated after transport failures")
+    cache_hits: int = Field(0, ge=0, description="Results served from memory")
+    total_ms: float = Field(..., ge=0, description="Wall time of the call in ms")
+    http_ms: float = Field(0.0, ge=0, description="Time in HTTP attempts in ms, summed over concurrent requests")
+    rate_limit_wait_ms: float = Field(0.0, ge=0, description="Time waiting on the client-side rate limiter in ms")
+    retry_wait_ms: float = Field(0.0, ge=0, description="Backoff between retries in ms")
+    serialization_ms: float = Field(0.0, ge=0, description="Wall time outside upstream requests in ms")
+
+    @classmethod
+    def from_recorder(cls, recorder: CallRecorder) -> "ToolDiagnostics":
+        """Summarize a call recorded so far."""
+        total = recorder.elapsed_s
+        return cls(
+            upstream_calls=recorder.upstream_calls,
+            retries=recorder.retries,
+            cache_hits=recorder.cache_hits,
+            total_ms=round(total * 1000, 3),
+            http_ms=round(recorder.http_s * 1000, 3),
+            rate_limit_wait_ms=round(recorder.rate_limit_wait_s * 1000, 3),
+            retry_wait_ms=round(recorder.retry_wait_s * 1000, 3),
+            serialization_ms=round(max(0.0, total - recorder.busy_s) * 1000, 3),
+        )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "upstream_calls": 3,
+                    "retries": 0,
+                    "cache_hits": 0,
+                    "total_ms": 412.5,
+                    "http_ms": 380.1,
+                    "rate_limit_wait_ms": 0.0,
+                    "retry_wait_ms": 0.0,
+                    "serialization_ms": 31.2,
+                }
+            ]
+        }
+    }
+
+
 T = TypeVar("T")
 
 
@@ -147,6 +224,8 @@ class ToolResponse(GenericModel, Generic[T]):
         ok: True if the operation succeeded, False if it failed
         result: Result payload when ok=true, null when ok=false
         issues: List of ToolIssue objects describing any errors or warnings
+        cache: CacheInfo for tools with a result cache (hit/miss, age), otherwise null
+        diagnostics: ToolDiagnostics timing breakdown when `MCP_TOOL_DIAGNOSTICS` is on, otherwise null
 
     Key Design:
     - Always returns a ToolResponse, never raises exceptions
@@ -210,6 +289,8 @@ class ToolResponse(GenericModel, Generic[T]):
     ok: bool = Field(..., description="True if the operation succeeded")
     result: Optional[T] = Field(None, description="Result payload when ok=true")
     issues: List[ToolIssue] = Field(default_factory=list, description="Business-level issues")
+    cache: Optional[CacheInfo] = Field(None, description="Result cache status; set only by tools that cache results")
+    diagnostics: Optional[ToolDiagnostics] = Field(None, description="Timing breakdown of this call, when enabled")
 
     model_config = {
         "json_schema_extra": {
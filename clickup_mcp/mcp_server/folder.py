@@ -26,6 +26,7 @@ from clickup_mcp.mcp_server.models.outputs.folder import (
 from clickup_mcp.models.mapping.folder_mapper import FolderMapper
 
 from .app import mcp
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -40,6 +41,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@invalidates("folder")
 @handle_tool_errors
 async def folder_create(input: FolderCreateInput) -> FolderResult | None:
     """
@@ -86,6 +88,7 @@ async def folder_create(input: FolderCreateInput) -> FolderResult | None:
         "openWorldHint": True,
     },
 )
+@cached_tool("folder.get", scopes=("folder",))
 @handle_tool_errors
 async def folder_get(input: FolderGetInput) -> FolderResult | None:
     """
@@ -128,6 +131,7 @@ async def folder_get(input: FolderGetInput) -> FolderResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("folder")
 @handle_tool_errors
 async def folder_update(input: FolderUpdateInput) -> FolderResult | None:
     """
@@ -172,6 +176,7 @@ async def folder_update(input: FolderUpdateInput) -> FolderResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("folder", "list", "task")
 @handle_tool_errors
 async def folder_delete(input: FolderDeleteInput) -> DeletionResult:
     """
@@ -210,6 +215,7 @@ async def folder_delete(input: FolderDeleteInput) -> DeletionResult:
         "openWorldHint": True,
     },
 )
+@cached_tool("folder.list_in_space", scopes=("folder",))
 @handle_tool_errors
 async def folder_list_in_space(input: FolderListInSpaceInput) -> FolderListResult:
     """
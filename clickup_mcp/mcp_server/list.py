@@ -31,6 +31,7 @@ from clickup_mcp.mcp_server.models.outputs.list import (
 from clickup_mcp.models.mapping.list_mapper import ListMapper
 
 from .app import mcp
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -45,6 +46,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@invalidates("list")
 @handle_tool_errors
 async def list_create(input: ListCreateInput) -> ListResult | None:
     """
@@ -92,6 +94,7 @@ async def list_create(input: ListCreateInput) -> ListResult | None:
         "openWorldHint": True,
     },
 )
+@cached_tool("list.get", scopes=("list",))
 @handle_tool_errors
 async def list_get(input: ListGetInput) -> ListResult | None:
     """
@@ -121,8 +124,7 @@ async def list_get(input: ListGetInput) -> ListResult | None:
         resp = await client.list.get(input.list_id)
     if not resp:
         return None
-    d = ListMapper.to_domain(resp)
-    return ListMapper.to_list_result_output(d)
+    return ListMapper.resp_to_list_result_output(resp)
 
 
 @mcp.tool(
@@ -134,6 +136,7 @@ async def list_get(input: ListGetInput) -> ListResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("list")
 @handle_tool_errors
 async def list_update(input: ListUpdateInput) -> ListResult | None:
     """
@@ -178,6 +181,7 @@ async def list_update(input: ListUpdateInput) -> ListResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("list", "task")
 @handle_tool_errors
 async def list_delete(input: ListDeleteInput) -> DeletionResult:
     """
@@ -216,6 +220,7 @@ async def list_delete(input: ListDeleteInput) -> DeletionResult:
         "openWorldHint": True,
     },
 )
+@cached_tool("list.list_in_folder", scopes=("list",))
 @handle_tool_errors
 async def list_list_in_folder(input: ListListInFolderInput) -> ListListResult:
     """
@@ -244,10 +249,7 @@ async def list_list_in_folder(input: ListListInFolderInput) -> ListListResult:
     client = ClickUpAPIClientFactory.get()
     async with client:
         lists = await client.list.get_all_in_folder(input.folder_id)
-    items: List[ListListItem] = []
-    for l in lists:
-        d = ListMapper.to_domain(l)
-        items.append(ListMapper.to_list_list_item_output(d))
+    items: List[ListListItem] = [ListMapper.resp_to_list_list_item_output(l) for l in lists]
     return ListListResult(items=items)
 
 
@@ -260,6 +262,7 @@ async def list_list_in_folder(input: ListListInFolderInput) -> ListListResult:
         "openWorldHint": True,
     },
 )
+@cached_tool("list.list_in_space_folderless", scopes=("list",))
 @handle_tool_errors
 async def list_list_in_space_folderless(input: ListListInSpaceFolderlessInput) -> ListListResult:
     """
@@ -288,10 +291,7 @@ async def list_list_in_space_folderless(input: ListListInSpaceFolderlessInput) -
     client = ClickUpAPIClientFactory.get()
     async with client:
         lists = await client.list.get_all_folderless(input.space_id)
-    items: List[ListListItem] = []
-    for l in lists:
-        d = ListMapper.to_domain(l)
-        items.append(ListMapper.to_list_list_item_output(d))
+    items: List[ListListItem] = [ListMapper.resp_to_list_list_item_output(l) for l in lists]
     return ListListResult(items=items)
 
 
@@ -304,6 +304,7 @@ async def list_list_in_space_folderless(input: ListListInSpaceFolderlessInput) -
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def list_add_task(input: ListAddTaskInput) -> OperationResult:
     """
@@ -342,6 +343,7 @@ async def list_add_task(input: ListAddTaskInput) -> OperationResult:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def list_remove_task(input: ListRemoveTaskInput) -> OperationResult:
     """
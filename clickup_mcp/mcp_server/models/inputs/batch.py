@@ -0,0 +1,106 @@
+"""MCP input models for batched tool execution.
+
+These inputs are LLM-friendly contracts used by the `batch.execute` FastMCP tool to run
+many tool invocations in one MCP round trip.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class BatchOperation(BaseModel):
+    """
+    One tool invocation inside a batch.
+
+    References: any value in `arguments` may be `{"$ref": "<op id>.<path>"}`. It is replaced
+    by the value at `<path>` (dot-separated keys or list indexes) of the referenced
+    operation's `result`, and makes this operation wait for that one.
+
+    Attributes:
+        id: Operation ID, unique within the batch; required to be referenced
+        tool: Name of the MCP tool to call (e.g., "task.update")
+        arguments: Tool arguments exactly as an MCP client would send them
+        depends_on: IDs of operations that must succeed before this one runs
+
+    Examples:
+        BatchOperation(id="list", tool="list.create", arguments={"input": {"folder_id": "F1", "name": "Q3"}})
+        BatchOperation(tool="task.create", arguments={"input": {"list_id": {"$ref": "list.id"}, "name": "Kickoff"}})
+    """
+
+    id: Optional[str] = Field(
+        default=None, min_length=1, description="Operation ID, unique within the batch.", examples=["list"]
+    )
+    tool: str = Field(..., min_length=1, description="MCP tool name.", examples=["task.update", "task.create"])
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description='Tool arguments as sent to the tool; values may be {"$ref": "<op id>.<path>"}.',
+        examples=[{"input": {"task_id": "tsk_1", "status": "done"}}],
+    )
+    depends_on: List[str] = Field(
+        default_factory=list, description="Operation IDs that must succeed first.", examples=[["list"]]
+    )
+
+
+class BatchExecuteInput(BaseModel):
+    """
+    Run many tool invocations in one call.
+
+    When to use: Updating or creating many items at once, or a short chain of calls where
+    later calls need IDs created by earlier ones.
+
+    Constraints:
+        - 1..200 operations; `batch.execute` cannot be nested
+        - Operations without dependencies run concurrently, up to `concurrency` at a time,
+          sharing the ClickUp client's rate limiter
+        - An operation whose dependency failed is skipped
+
+    Attributes:
+        operations: Operations to run
+        concurrency: Maximum operations running at once
+        stop_on_error: Skip every operation not yet started after the first failure
+
+    Examples:
+        BatchExecuteInput(operations=[
+            BatchOperation(tool="task.update", arguments={"input": {"task_id": "t1", "status": "done"}}),
+            BatchOperation(tool="task.update", arguments={"input": {"task_id": "t2", "status": "done"}}),
+        ])
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "operations": [
+                        {
+                            "id": "list",
+                            "tool": "list.create",
+                            "arguments": {"input": {"folder_id": "F1", "name": "Q3"}},
+                        },
+                        {
+                            "tool": "task.create",
+                            "arguments": {"input": {"list_id": {"$ref": "list.id"}, "name": "Kickoff"}},
+                        },
+                    ],
+                    "concurrency": 8,
+                }
+            ]
+        }
+    )
+
+    operations: List[BatchOperation] = Field(
+        ..., min_length=1, max_length=200, description="Operations to run (1..200)."
+    )
+    concurrency: int = Field(default=8, ge=1, le=32, description="Maximum operations running at once (1..32).")
+    stop_on_error: bool = Field(default=False, description="Skip operations not yet started after a failure.")
+
+    @model_validator(mode="after")
+    def _unique_ids(self) -> "BatchExecuteInput":
+        seen: set[str] = set()
+        for operation in self.operations:
+            if operation.id is None:
+                continue
+            if operation.id in seen:
+                raise ValueError(f"Duplicate operation id: {operation.id}")
+            seen.add(operation.id)
+        return self
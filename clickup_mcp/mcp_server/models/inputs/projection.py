@@ -0,0 +1,56 @@
+"""MCP input models for webhook-fed projection queries.
+
+These inputs are LLM-friendly contracts used by FastMCP tools that read locally
+maintained projections instead of calling the ClickUp API.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TaskStatusCountsInput(BaseModel):
+    """
+    Count tasks per status in a list from the webhook-fed projection.
+
+    When to use: Quick status breakdown of a list without listing its tasks.
+
+    Constraints:
+        - Requires webhook projections to be enabled on the server
+        - Only reflects tasks seen through webhooks (or restored checkpoints)
+
+    Attributes:
+        list_id: List ID
+
+    Examples:
+        TaskStatusCountsInput(list_id="list_1")
+    """
+
+    model_config = ConfigDict(json_schema_extra={"examples": [{"list_id": "list_1"}]})
+
+    list_id: str = Field(..., min_length=1, description="List ID.", examples=["list_1", "901234567"])
+
+
+class AssigneeWorkloadInput(BaseModel):
+    """
+    Open tasks per assignee from the webhook-fed projection.
+
+    When to use: Check how many open tasks a user (or every user) currently has.
+
+    Constraints:
+        - Requires webhook projections to be enabled on the server
+        - Tasks in a closed/done status are not counted
+
+    Attributes:
+        assignee_id: Optional user ID; omit to return every assignee
+
+    Examples:
+        AssigneeWorkloadInput(assignee_id="183")
+        AssigneeWorkloadInput()
+    """
+
+    model_config = ConfigDict(json_schema_extra={"examples": [{"assignee_id": "183"}, {}]})
+
+    assignee_id: Optional[str] = Field(
+        default=None, min_length=1, description="User ID; omit for all assignees.", examples=["183"]
+    )
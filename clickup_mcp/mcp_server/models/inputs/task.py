@@ -6,7 +6,13 @@ Domain entities first, then DTOs for ClickUp wire format.
 
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Sparse fieldsets: names of the output fields a read tool may be asked to return
+TaskResultField = Literal[
+    "id", "name", "status", "priority", "list_id", "assignee_ids", "due_date_ms", "url", "parent_id"
+]
+TaskListItemField = Literal["id", "name", "status", "list_id", "url"]
 
 
 class TaskCreateInput(BaseModel):
@@ -159,9 +165,11 @@ class TaskGetInput(BaseModel):
         subtasks: Include subtasks
         custom_task_ids: Whether using custom task IDs
         team_id: Workspace/team ID (required when custom_task_ids=true)
+        fields: Task fields to return (default: all)
 
     Examples:
         TaskGetInput(task_id="task_123")
+        TaskGetInput(task_id="task_123", fields=["status"])
         TaskGetInput(task_id="CU-123", custom_task_ids=True, team_id="team_1")
     """
 
@@ -182,6 +190,71 @@ class TaskGetInput(BaseModel):
         description="Team ID (required when custom_task_ids=true).",
         examples=["team_1", "9018752317"],
     )
+    fields: Optional[List[TaskResultField]] = Field(
+        None,
+        description="Return only these task fields (`id` is always included); omit for all fields.",
+        examples=[["name", "status"]],
+    )
+
+
+class TaskGetManyInput(BaseModel):
+    """
+    Get many tasks by ID. HTTP: GET /task/{task_id} per distinct uncached ID
+
+    When to use: You have several task IDs (e.g., from a search or a dependency list) and
+    need their details; prefer this over repeated `task.get` calls.
+
+    Constraints:
+        - 1..500 IDs; duplicates are fetched once
+        - Recently fetched tasks are served from memory unless `fresh=true`
+        - With `custom_task_ids=true` every ID is a custom task ID and `team_id` is required
+
+    Attributes:
+        task_ids: Task IDs to retrieve
+        custom_task_ids: Whether the IDs are custom task IDs
+        team_id: Workspace/team ID (required when custom_task_ids=true)
+        fresh: Skip the cache and fetch every task
+        max_in_flight: Concurrent request limit
+        fields: Task fields to return (default: all)
+
+    Examples:
+        TaskGetManyInput(task_ids=["task_123", "task_456"])
+        TaskGetManyInput(task_ids=["CU-1", "CU-2"], custom_task_ids=True, team_id="team_1")
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {"task_ids": ["task_123", "task_456"]},
+                {"task_ids": ["CU-1", "CU-2"], "custom_task_ids": True, "team_id": "team_1"},
+            ]
+        }
+    )
+
+    task_ids: List[str] = Field(
+        ..., min_length=1, max_length=500, description="Task IDs (1..500).", examples=[["task_123", "task_456"]]
+    )
+    custom_task_ids: bool = Field(False, description="Whether the IDs are custom task IDs.", examples=[True, False])
+    team_id: Optional[str] = Field(
+        None,
+        description="Team ID (required when custom_task_ids=true).",
+        examples=["team_1", "9018752317"],
+    )
+    fresh: bool = Field(False, description="Bypass cached tasks and fetch all from ClickUp.", examples=[False])
+    max_in_flight: Optional[int] = Field(
+        None, ge=1, le=50, description="Concurrent requests to ClickUp (1..50).", examples=[10]
+    )
+    fields: Optional[List[TaskResultField]] = Field(
+        None,
+        description="Return only these task fields (`id` is always included); omit for all fields.",
+        examples=[["name", "status"]],
+    )
+
+    @model_validator(mode="after")
+    def _team_for_custom_ids(self) -> "TaskGetManyInput":
+        if self.custom_task_ids and not self.team_id:
+            raise ValueError("team_id is required when custom_task_ids is true")
+        return self
 
 
 class TaskListInListInput(BaseModel):
@@ -198,6 +271,7 @@ class TaskListInListInput(BaseModel):
         list_id: List ID
         page: Page number (0-indexed)
         limit: Page size (cap 100)
+        fields: Item fields to return (default: all)
         include_closed: Include closed tasks
         include_timl: Include tasks from other lists (TIML)
         statuses: Optional status filters
@@ -227,6 +301,11 @@ class TaskListInListInput(BaseModel):
     assignees: Optional[List[int | str]] = Field(
         None, description="Filter by assignee user IDs.", examples=[[42], ["usr_abc"]]
     )
+    fields: Optional[List[TaskListItemField]] = Field(
+        None,
+        description="Return only these item fields (`id` is always included); omit for all fields.",
+        examples=[["name", "status"]],
+    )
 
 
 class TaskSetCustomFieldInput(BaseModel):
@@ -387,6 +466,7 @@ class TaskSearchInput(BaseModel):
         due_date_to: Filter by due date range end (epoch ms)
         page: Page number (0-indexed)
         limit: Page size (cap 100)
+        fields: Item fields to return (default: all)
 
     Examples:
         TaskSearchInput(query="urgent bugs", priorities=[1, 2], limit=50)
@@ -434,3 +514,123 @@ class TaskSearchInput(BaseModel):
     )
     page: int = Field(0, ge=0, description="Page number (0-indexed).", examples=[0, 1, 2])
     limit: int = Field(100, ge=1, le=100, description="Page size (cap 100 by API).", examples=[25, 50, 100])
+    fields: Optional[List[TaskListItemField]] = Field(
+        None,
+        description="Return only these item fields (`id` is always included); omit for all fields.",
+        examples=[["name", "status"]],
+    )
+
+
+_BULK_MAX_ITEMS = 500
+_BULK_IN_FLIGHT_DESCRIPTION = "Concurrent requests to ClickUp (1..50); defaults to CLICKUP_BULK_MAX_IN_FLIGHT."
+
+
+class TaskBulkCreateInput(BaseModel):
+    """
+    Create many tasks in one call. HTTP: POST /list/{list_id}/task per item
+
+    When to use: Creating more than a handful of tasks (e.g., importing a backlog).
+
+    Constraints:
+        - 1..500 items; each item is a `task.create` input
+        - At most `max_in_flight` requests run at once, sharing the rate limiter
+        - Rate-limited items are retried; other failures are reported per item. A failed
+          create may still have reached ClickUp if its issue is TRANSIENT, so check before
+          resubmitting it
+
+    Attributes:
+        items: Tasks to create
+        max_in_flight: Concurrent request limit
+
+    Examples:
+        TaskBulkCreateInput(items=[TaskCreateInput(list_id="L1", name=name) for name in ("A", "B")])
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {"items": [{"list_id": "L1", "name": "A"}, {"list_id": "L1", "name": "B"}], "max_in_flight": 10}
+            ]
+        }
+    )
+
+    items: List[TaskCreateInput] = Field(..., min_length=1, max_length=_BULK_MAX_ITEMS, description="Tasks (1..500).")
+    max_in_flight: Optional[int] = Field(None, ge=1, le=50, description=_BULK_IN_FLIGHT_DESCRIPTION, examples=[10])
+
+
+class TaskBulkUpdateInput(BaseModel):
+    """
+    Update many tasks in one call. HTTP: PUT /task/{task_id} per item
+
+    When to use: Applying changes to many tasks, e.g., closing every task of a sprint.
+
+    Constraints:
+        - 1..500 items; each item is a `task.update` input
+        - Updates are idempotent: failed items can be resubmitted as they are
+
+    Attributes:
+        items: Updates to apply
+        max_in_flight: Concurrent request limit
+
+    Examples:
+        TaskBulkUpdateInput(items=[TaskUpdateInput(task_id=tid, status="done") for tid in ("t1", "t2")])
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [{"items": [{"task_id": "t1", "status": "done"}, {"task_id": "t2", "status": "done"}]}]
+        }
+    )
+
+    items: List[TaskUpdateInput] = Field(..., min_length=1, max_length=_BULK_MAX_ITEMS, description="Updates (1..500).")
+    max_in_flight: Optional[int] = Field(None, ge=1, le=50, description=_BULK_IN_FLIGHT_DESCRIPTION, examples=[10])
+
+
+class TaskBulkAddAssigneeInput(BaseModel):
+    """
+    Add assignees to many tasks in one call. HTTP: POST /task/{task_id}/member/{member_id} per item
+
+    When to use: Assigning one or more users across many tasks.
+
+    Constraints:
+        - 1..500 (task_id, assignee_id) items; failed items can be resubmitted as they are
+
+    Attributes:
+        items: Assignments to add
+        max_in_flight: Concurrent request limit
+
+    Examples:
+        TaskBulkAddAssigneeInput(items=[TaskAddAssigneeInput(task_id="t1", assignee_id=42)])
+    """
+
+    model_config = ConfigDict(json_schema_extra={"examples": [{"items": [{"task_id": "t1", "assignee_id": 42}]}]})
+
+    items: List[TaskAddAssigneeInput] = Field(
+        ..., min_length=1, max_length=_BULK_MAX_ITEMS, description="Assignments (1..500)."
+    )
+    max_in_flight: Optional[int] = Field(None, ge=1, le=50, description=_BULK_IN_FLIGHT_DESCRIPTION, examples=[10])
+
+
+class TaskBulkDeleteInput(BaseModel):
+    """
+    Delete many tasks in one call. HTTP: DELETE /task/{task_id} per item
+
+    When to use: Removing many tasks at once. Irreversible.
+
+    Constraints:
+        - 1..500 task IDs; failed items can be resubmitted as they are
+
+    Attributes:
+        task_ids: Tasks to delete
+        max_in_flight: Concurrent request limit
+
+    Examples:
+        TaskBulkDeleteInput(task_ids=["t1", "t2"])
+    """
+
+    model_config = ConfigDict(json_schema_extra={"examples": [{"task_ids": ["t1", "t2"], "max_in_flight": 5}]})
+
+    task_ids: List[str] = Field(
+        ..., min_length=1, max_length=_BULK_MAX_ITEMS, description="Task IDs (1..500).", examples=[["t1", "t2"]]
+    )
+    max_in_flight: Optional[int] = Field(None, ge=1, le=50, description=_BULK_IN_FLIGHT_DESCRIPTION, examples=[10])
@@ -3,10 +3,13 @@
 High-signal schemas for FastMCP with constraints and examples.
 """
 
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Sparse fieldsets: names of the list item fields `time_entry.list` may be asked to return
+TimeEntryListItemField = Literal["id", "task_id", "description", "duration"]
+
 
 class TimeEntryCreateInput(BaseModel):
     """
@@ -144,6 +147,7 @@ class TimeEntryListInput(BaseModel):
         end_date: Filter by end date (epoch ms)
         page: Page number (0-indexed)
         limit: Page size (cap 100)
+        fields: Item fields to return (default: all)
 
     Examples:
         TimeEntryListInput(team_id="team_1", task_id="task_123", limit=50)
@@ -160,6 +164,11 @@ class TimeEntryListInput(BaseModel):
     end_date: Optional[int] = Field(None, description="Filter by end date (epoch ms).", examples=[1702166400000])
     page: int = Field(0, ge=0, description="Page number (0-indexed).", examples=[0, 1, 2])
     limit: int = Field(100, ge=1, le=100, description="Page size (cap 100).", examples=[25, 50, 100])
+    fields: Optional[List[TimeEntryListItemField]] = Field(
+        None,
+        description="Return only these item fields (`id` is always included); omit for all fields.",
+        examples=[["duration"]],
+    )
 
 
 class TimeTrackingGetInput(BaseModel):
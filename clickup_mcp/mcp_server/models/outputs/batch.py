@@ -0,0 +1,30 @@
+"""MCP output models for batched tool execution.
+
+These models define the structure of `batch.execute` results: one `ToolResponse`
+envelope per operation, in the order the operations were given.
+"""
+
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+from clickup_mcp.mcp_server.errors.models import ToolResponse
+
+
+class BatchOperationResult(BaseModel):
+    """Outcome of one operation of a batch."""
+
+    index: int = Field(description="Position of the operation in the request")
+    id: Optional[str] = Field(default=None, description="Operation ID, if one was given")
+    tool: str = Field(description="MCP tool name")
+    skipped: bool = Field(default=False, description="True if the operation did not run")
+    response: ToolResponse[Any] = Field(description="The tool's response envelope")
+
+
+class BatchExecuteResult(BaseModel):
+    """Per-operation results of `batch.execute`."""
+
+    results: List[BatchOperationResult] = Field(default_factory=list, description="Results in request order")
+    succeeded: int = Field(default=0, description="Operations that returned ok=true")
+    failed: int = Field(default=0, description="Operations that ran and returned ok=false")
+    skipped: int = Field(default=0, description="Operations not run (failed dependency or stop_on_error)")
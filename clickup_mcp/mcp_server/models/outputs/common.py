@@ -1,6 +1,8 @@
 """Common result models for MCP tools."""
 
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar, Collection, Optional, Self
+
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, model_serializer
 
 
 class OperationResult(BaseModel):
@@ -17,3 +19,58 @@ class DeletionResult(BaseModel):
     deleted: bool = Field(..., description="True if the resource was deleted", examples=[True])
 
     model_config = {"json_schema_extra": {"examples": [{"deleted": True}]}}
+
+
+def selected_fields(fields: Optional[Collection[str]]) -> Optional[frozenset[str]]:
+    """Normalize a requested sparse fieldset; `id` is always included, None means all fields."""
+    if fields is None:
+        return None
+    return frozenset(fields) | {"id"}
+
+
+class SparseModel(BaseModel):
+    """
+    Sparse counterpart of a read tool's output model, returned when the tool is given `fields`.
+
+    A subclass names its full model in `full_model` and declares the same fields with only
+    `id` required; both are checked when the subclass is defined. Mappers compute just the
+    requested values and build the instance with `select(...)`. It serializes only those
+    fields, and the others read as None. Tools declare `Full | SparseFull`, so the
+    advertised output schema keeps the full model's required fields and still accepts a
+    sparse result.
+    """
+
+    full_model: ClassVar[type[BaseModel]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        mismatch = set(cls.model_fields).symmetric_difference(cls.full_model.model_fields)
+        if mismatch:
+            raise TypeError(
+                f"{cls.__name__} does not match the fields of {cls.full_model.__name__}: {sorted(mismatch)}"
+            )
+        required = [name for name, field in cls.model_fields.items() if field.is_required()]
+        if required != ["id"]:
+            raise TypeError(f"{cls.__name__} must require only `id`, not {required}")
+        _SPARSE_MODELS[cls.full_model] = cls
+
+    @classmethod
+    def select(cls, **values: Any) -> Self:
+        """Build an instance holding only `values`; the fields left out are not serialized."""
+        # Validating a few already mapped values is cheaper than `model_construct`
+        return cls.model_validate(values)
+
+    # No return annotation: an annotated wrap serializer would replace the model's JSON schema
+    @model_serializer(mode="wrap")
+    def _serialize_selected(self, handler: SerializerFunctionWrapHandler):
+        data = handler(self)
+        return {name: value for name, value in data.items() if name in self.model_fields_set}
+
+
+_SPARSE_MODELS: dict[type[BaseModel], type[SparseModel]] = {}
+
+
+def sparse_model(model: type[BaseModel]) -> Optional[type[SparseModel]]:
+    """Return the sparse counterpart of an output model, or None if it has none."""
+    return _SPARSE_MODELS.get(model)
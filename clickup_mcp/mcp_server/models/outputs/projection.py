@@ -0,0 +1,40 @@
+"""MCP output models for webhook-fed projection queries.
+
+These models define the structure for projection results returned by MCP tools.
+"""
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProjectionFreshness(BaseModel):
+    """How current a projection is."""
+
+    events_applied: int = Field(description="Webhook events folded into the projection")
+    as_of: Optional[int] = Field(
+        default=None, description="Receive time (epoch ms) of the newest event applied; null if none yet"
+    )
+
+
+class TaskStatusCountsResult(BaseModel):
+    """Task counts per status for one list."""
+
+    list_id: str = Field(description="List ID")
+    counts: Dict[str, int] = Field(default_factory=dict, description="Number of tasks per status name")
+    total: int = Field(description="Total tasks in the list")
+    freshness: ProjectionFreshness = Field(description="Projection freshness")
+
+
+class AssigneeWorkload(BaseModel):
+    """Open tasks of one assignee."""
+
+    assignee_id: str = Field(description="User ID")
+    open_tasks: int = Field(description="Number of open tasks assigned")
+
+
+class AssigneeWorkloadResult(BaseModel):
+    """Open tasks per assignee."""
+
+    items: List[AssigneeWorkload] = Field(default_factory=list, description="Workload per assignee")
+    freshness: ProjectionFreshness = Field(description="Projection freshness")
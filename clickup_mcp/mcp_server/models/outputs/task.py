@@ -23,6 +23,9 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from clickup_mcp.mcp_server.errors.models import ToolIssue
+from clickup_mcp.mcp_server.models.outputs.common import SparseModel
+
 
 class PriorityInfo(BaseModel):
     """Structured priority for clarity: numeric value and label."""
@@ -32,7 +35,7 @@ class PriorityInfo(BaseModel):
 
 
 class TaskResult(BaseModel):
-    """Concise task detail; normalized units."""
+    """Concise task detail; normalized units. Tools given `fields` return a `SparseTaskResult`."""
 
     id: str = Field(..., description="Task ID", examples=["t1", "task_123"])
     name: str = Field(..., description="Task title", examples=["Ship v1.2", "Fix login bug"])
@@ -70,10 +73,28 @@ class TaskResult(BaseModel):
     }
 
 
+class SparseTaskResult(SparseModel):
+    """`TaskResult` holding only the fields a tool was asked for (`id` always included)."""
+
+    full_model = TaskResult
+
+    id: str = Field(..., description="Task ID", examples=["t1"])
+    name: Optional[str] = Field(None, description="Task title", examples=["Ship v1.2"])
+    status: Optional[str] = Field(None, description="Workflow status name", examples=["in progress"])
+    priority: Optional[PriorityInfo] = Field(None, description="Priority details with both numeric value and label.")
+    list_id: Optional[str] = Field(None, description="Home list ID", examples=["L1"])
+    assignee_ids: Optional[List[int | str]] = Field(None, description="Assigned user IDs", examples=[[42]])
+    due_date_ms: Optional[int] = Field(None, ge=0, description="Due timestamp in epoch milliseconds")
+    url: Optional[str] = Field(None, description="Canonical task URL", examples=["https://app.clickup.com/t/t1"])
+    parent_id: Optional[str] = Field(None, description="Parent task ID for subtasks", examples=["task_parent"])
+
+
 class TaskListItem(BaseModel):
     """
     Item shape for task summaries returned by MCP tools.
 
+    Tools given `fields` return `SparseTaskListItem`s instead.
+
     Attributes:
         id: Task ID
         name: Task title
@@ -89,10 +110,22 @@ class TaskListItem(BaseModel):
     url: Optional[str] = Field(None, description="Canonical URL", examples=["https://app.clickup.com/t/t1"])
 
 
+class SparseTaskListItem(SparseModel):
+    """`TaskListItem` holding only the fields a tool was asked for (`id` always included)."""
+
+    full_model = TaskListItem
+
+    id: str = Field(..., description="Task ID", examples=["t1"])
+    name: Optional[str] = Field(None, description="Task title", examples=["Backfill analytics"])
+    status: Optional[str] = Field(None, description="Workflow status", examples=["open"])
+    list_id: Optional[str] = Field(None, description="Home list ID", examples=["L1"])
+    url: Optional[str] = Field(None, description="Canonical URL", examples=["https://app.clickup.com/t/t1"])
+
+
 class TaskListResult(BaseModel):
     """Paged listing, capped to API limit; includes cursor."""
 
-    items: List[TaskListItem] = Field(
+    items: List[TaskListItem | SparseTaskListItem] = Field(
         default_factory=list,
         examples=[[{"id": "t1", "name": "Backfill analytics"}, {"id": "t2", "name": "Fix webhook retry"}]],
     )
@@ -113,3 +146,30 @@ class TaskListResult(BaseModel):
             ]
         }
     }
+
+
+class TaskBulkItem(BaseModel):
+    """Outcome of one item of a bulk task operation."""
+
+    index: int = Field(..., description="Position of the item in the request", examples=[0])
+    ok: bool = Field(..., description="True if the item succeeded", examples=[True])
+    task_id: Optional[str] = Field(None, description="Affected task ID (created ID for creates)", examples=["t1"])
+    task: Optional[TaskResult | SparseTaskResult] = Field(None, description="Resulting task for creates and updates")
+    issue: Optional[ToolIssue] = Field(None, description="Why the item failed")
+    attempts: int = Field(
+        1, ge=0, description="Requests made for the item, including retries; 0 when served from cache", examples=[1]
+    )
+
+
+class TaskBulkResult(BaseModel):
+    """Per-item results of a bulk task operation, in request order."""
+
+    items: List[TaskBulkItem] = Field(default_factory=list, description="Results in request order")
+    succeeded: int = Field(0, description="Items that succeeded", examples=[48])
+    failed: int = Field(0, description="Items that failed; resubmit only these", examples=[2])
+
+
+class TaskGetManyResult(TaskBulkResult):
+    """Tasks of `task.get_many`, one item per requested ID in request order."""
+
+    cached: int = Field(0, description="Items served from the in-memory cache", examples=[3])
@@ -25,6 +25,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from clickup_mcp.mcp_server.models.outputs.common import SparseModel
+
 
 class TimeEntryResult(BaseModel):
     """Concise time entry detail; normalized units."""
@@ -62,6 +64,8 @@ class TimeEntryListItem(BaseModel):
     """
     Item shape for time entry summaries returned by MCP tools.
 
+    `time_entry.list` given `fields` returns `SparseTimeEntryListItem`s instead.
+
     Attributes:
         id: Time entry ID
         task_id: Task ID this time entry belongs to
@@ -77,10 +81,21 @@ class TimeEntryListItem(BaseModel):
     duration: Optional[int] = Field(None, ge=0, description="Duration in milliseconds", examples=[3600000])
 
 
+class SparseTimeEntryListItem(SparseModel):
+    """`TimeEntryListItem` holding only the fields a tool was asked for (`id` always included)."""
+
+    full_model = TimeEntryListItem
+
+    id: str = Field(..., description="Time entry ID", examples=["entry_1"])
+    task_id: Optional[str] = Field(None, description="Task ID this time entry belongs to", examples=["task_123"])
+    description: Optional[str] = Field(None, description="Description of the work done")
+    duration: Optional[int] = Field(None, ge=0, description="Duration in milliseconds", examples=[3600000])
+
+
 class TimeEntryListResult(BaseModel):
     """Paged listing, capped to API limit; includes cursor."""
 
-    items: List[TimeEntryListItem] = Field(
+    items: List[TimeEntryListItem | SparseTimeEntryListItem] = Field(
         default_factory=list,
         examples=[
             [
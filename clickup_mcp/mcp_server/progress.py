@@ -0,0 +1,109 @@
+"""
+MCP progress notifications for long-running tools.
+
+Design:
+- `tool_progress()` returns a `ToolProgress` bound to the current MCP request. It is a
+  `ProgressCallback`, so tools hand it straight to the resource managers (e.g.,
+  `task_api.bulk_update(..., on_progress=progress)`), which await it as pages or items
+  complete.
+- Notifications are sent only when the client asked for them (the request carries a
+  `progressToken`); otherwise, and outside an MCP request (direct calls, tests), the
+  reporter does nothing.
+- Updates are throttled to one per `MCP_PROGRESS_INTERVAL` seconds; the final update
+  (`completed == total`) is always sent.
+- Tools running inside `batch.execute` share the batch's request and progress token, so
+  their reporters are muted while the batch reports completed operations instead.
+- A failure to deliver a notification is logged and never fails the tool.
+
+Cancellation:
+    When the client sends `notifications/cancelled`, the MCP session cancels the task
+    running the tool. The cancellation propagates through `handle_tool_errors` (it is not
+    an error) into the resource managers, aborting in-flight HTTP requests and any
+    queued bulk items.
+
+Usage Examples:
+    from clickup_mcp.mcp_server.progress import tool_progress
+
+    progress = tool_progress("tasks updated")
+    results = await client.task.bulk_update(items, on_progress=progress)
+
+Environment:
+- `MCP_PROGRESS_INTERVAL`: minimum seconds between progress notifications (default 0.5)
+"""
+
+import contextlib
+import contextvars
+import logging
+import time
+from typing import Iterator, Optional
+
+from mcp.server.fastmcp import Context
+
+from clickup_mcp.config import get_settings
+
+from .app import mcp
+
+logger = logging.getLogger(__name__)
+
+# Set while a tool reports progress for its whole request (batch.execute)
+_muted: contextvars.ContextVar[bool] = contextvars.ContextVar("clickup_mcp_progress_muted", default=False)
+
+
+def _request_context() -> Optional[Context]:
+    if _muted.get():
+        return None
+    ctx = mcp.get_context()
+    try:
+        meta = ctx.request_context.meta
+    except ValueError:
+        return None
+    if meta is None or meta.progressToken is None:
+        return None
+    return ctx
+
+
+class ToolProgress:
+    """Throttled progress reporter for the current MCP request."""
+
+    def __init__(self, unit: str = "items", interval: Optional[float] = None) -> None:
+        """
+        Args:
+            unit: Noun used in the progress message (e.g., "tasks fetched")
+            interval: Minimum seconds between notifications; defaults to `MCP_PROGRESS_INTERVAL`
+        """
+        self.unit = unit
+        self.interval = get_settings().mcp_progress_interval if interval is None else interval
+        self._ctx = _request_context()
+        self._last_sent = float("-inf")
+
+    @property
+    def enabled(self) -> bool:
+        return self._ctx is not None
+
+    async def __call__(self, completed: int, total: Optional[int] = None) -> None:
+        if self._ctx is None:
+            return
+        now = time.monotonic()
+        if completed != total and now - self._last_sent < self.interval:
+            return
+        self._last_sent = now
+        message = f"{completed}/{total} {self.unit}" if total is not None else f"{completed} {self.unit}"
+        try:
+            await self._ctx.report_progress(completed, total, message)
+        except Exception as exc:  # noqa: BLE001 - progress is best effort
+            logger.debug("Could not send progress notification: %s", exc)
+
+
+def tool_progress(unit: str = "items") -> ToolProgress:
+    """Create a progress reporter for the MCP request being handled."""
+    return ToolProgress(unit)
+
+
+@contextlib.contextmanager
+def muted() -> Iterator[None]:
+    """Silence reporters created in this context (used for tools nested in a batch)."""
+    token = _muted.set(True)
+    try:
+        yield
+    finally:
+        _muted.reset(token)
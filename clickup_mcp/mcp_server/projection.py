@@ -0,0 +1,129 @@
+"""MCP tools for webhook-fed projections.
+
+These tools answer from projections maintained in-process from ClickUp webhooks
+and published through `clickup_mcp.projections`, so they make no ClickUp API calls
+and cost one lookup per key.
+
+Tools:
+- projection.task_status_counts
+- projection.assignee_workload
+"""
+
+from clickup_mcp.exceptions import ConfigurationError
+from clickup_mcp.mcp_server.errors import handle_tool_errors
+from clickup_mcp.mcp_server.models.inputs.projection import (
+    AssigneeWorkloadInput,
+    TaskStatusCountsInput,
+)
+from clickup_mcp.mcp_server.models.outputs.projection import (
+    AssigneeWorkload,
+    AssigneeWorkloadResult,
+    ProjectionFreshness,
+    TaskStatusCountsResult,
+)
+from clickup_mcp.projections import (
+    TASK_PROJECTION,
+    TaskCountsReader,
+    get_projection_store,
+)
+
+from .app import mcp
+
+
+def _task_projection() -> tuple[TaskCountsReader, ProjectionFreshness]:
+    store = get_projection_store()
+    if store is None:
+        raise ConfigurationError(
+            "Webhook projections are not maintained by this server: they are disabled, or a queue "
+            "backend is configured and the webhook consumer process maintains them",
+            config_key="CLICKUP_WEBHOOK_PROJECTIONS_ENABLED",
+        )
+    projection: TaskCountsReader = store.get(TASK_PROJECTION)
+    status = store.status(TASK_PROJECTION)
+    return projection, ProjectionFreshness(events_applied=status.events_applied, as_of=status.last_event_ms)
+
+
+@mcp.tool(
+    title="Task Status Counts (Projection)",
+    name="projection.task_status_counts",
+    description=(
+        "Count tasks per status in a list from the webhook-fed projection. "
+        "No ClickUp API call; reflects tasks seen through webhooks."
+    ),
+    annotations={
+        "readOnlyHint": True,
+        "openWorldHint": False,
+    },
+)
+@handle_tool_errors
+async def projection_task_status_counts(input: TaskStatusCountsInput) -> TaskStatusCountsResult:
+    """
+    Count tasks per status in a list.
+
+    Args:
+        input: TaskStatusCountsInput with list_id
+
+    Returns:
+        TaskStatusCountsResult: Counts per status, total and projection freshness
+
+    Error Handling:
+        Decorated with `@handle_tool_errors` and returns a ToolResponse at runtime. When
+        projections are disabled, or maintained by the queue consumer process instead of
+        this server, `ok=False` with an INTERNAL issue naming the setting.
+
+    Examples:
+        # Python (async)
+        response = await projection_task_status_counts(TaskStatusCountsInput(list_id="list_1"))
+        if response.ok:
+            print(response.result.counts)
+    """
+    projection, freshness = _task_projection()
+    counts = projection.status_counts(input.list_id)
+    return TaskStatusCountsResult(list_id=input.list_id, counts=counts, total=sum(counts.values()), freshness=freshness)
+
+
+@mcp.tool(
+    title="Assignee Workload (Projection)",
+    name="projection.assignee_workload",
+    description=(
+        "Open tasks per assignee from the webhook-fed projection; pass assignee_id for one user. "
+        "No ClickUp API call; closed/done tasks are not counted."
+    ),
+    annotations={
+        "readOnlyHint": True,
+        "openWorldHint": False,
+    },
+)
+@handle_tool_errors
+async def projection_assignee_workload(input: AssigneeWorkloadInput) -> AssigneeWorkloadResult:
+    """
+    Open tasks per assignee.
+
+    Args:
+        input: AssigneeWorkloadInput with optional assignee_id
+
+    Returns:
+        AssigneeWorkloadResult: Items sorted by open tasks (descending) and projection freshness
+
+    Error Handling:
+        Decorated with `@handle_tool_errors` and returns a ToolResponse at runtime. When
+        projections are disabled, or maintained by the queue consumer process instead of
+        this server, `ok=False` with an INTERNAL issue naming the setting.
+
+    Examples:
+        # Python (async)
+        response = await projection_assignee_workload(AssigneeWorkloadInput(assignee_id="183"))
+        if response.ok:
+            print(response.result.items[0].open_tasks)
+    """
+    projection, freshness = _task_projection()
+    if input.assignee_id is not None:
+        items = [
+            AssigneeWorkload(assignee_id=input.assignee_id, open_tasks=projection.open_tasks_for(input.assignee_id))
+        ]
+    else:
+        items = [
+            AssigneeWorkload(assignee_id=user, open_tasks=count)
+            for user, count in sorted(projection.workloads().items(), key=lambda kv: (-kv[1], kv[0]))
+        ]
+    return AssigneeWorkloadResult(items=items, freshness=freshness)
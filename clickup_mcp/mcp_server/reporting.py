@@ -67,7 +67,7 @@ async def report_create(input: TimeReportCreateInput) -> TimeReportListResult:
         resp = await client.reporting.create(input.team_id, dto)
     if not resp:
         raise ClickUpAPIError("Create time report failed")
-    items = [ReportingMapper.to_time_report_list_item_output(ReportingMapper.to_domain(entry)) for entry in resp.items]
+    items = [ReportingMapper.resp_to_time_report_list_item_output(entry) for entry in resp.items]
     return TimeReportListResult(items=items, next_cursor=resp.next_page, truncated=False)
 
 
@@ -121,5 +121,5 @@ async def report_list(input: TimeReportListInput) -> TimeReportListResult:
         resp = await client.reporting.list(input.team_id, query)
     if not resp:
         raise ClickUpAPIError("List time reports failed")
-    items = [ReportingMapper.to_time_report_list_item_output(ReportingMapper.to_domain(entry)) for entry in resp.items]
+    items = [ReportingMapper.resp_to_time_report_list_item_output(entry) for entry in resp.items]
     return TimeReportListResult(items=items, next_cursor=resp.next_page, truncated=False)
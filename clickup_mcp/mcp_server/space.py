@@ -24,6 +24,7 @@ from clickup_mcp.mcp_server.models.outputs.space import (
 from clickup_mcp.models.mapping.space_mapper import SpaceMapper
 
 from .app import mcp
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -80,6 +81,7 @@ async def get_space(space_id: str = "") -> dict[str, object] | None:
         "openWorldHint": True,
     },
 )
+@cached_tool("space.get", scopes=("space",))
 @handle_tool_errors
 async def space_get(input: SpaceGetInput) -> SpaceResult | None:
     """
@@ -111,8 +113,7 @@ async def space_get(input: SpaceGetInput) -> SpaceResult | None:
         resp = await client.space.get(input.space_id)
     if not resp:
         raise ResourceNotFoundError("Space not found")
-    d = SpaceMapper.to_domain(resp)
-    return SpaceMapper.to_space_result_output(d)
+    return SpaceMapper.resp_to_space_result_output(resp)
 
 
 @mcp.tool(
@@ -127,6 +128,7 @@ async def space_get(input: SpaceGetInput) -> SpaceResult | None:
         "openWorldHint": True,
     },
 )
+@cached_tool("space.list", scopes=("space",))
 @handle_tool_errors
 async def space_list(input: SpaceListInput) -> SpaceListResult:
     """
@@ -155,10 +157,7 @@ async def space_list(input: SpaceListInput) -> SpaceListResult:
     client = ClickUpAPIClientFactory.get()
     async with client:
         spaces = await client.team.get_spaces(input.team_id)
-    items = []
-    for s in spaces:
-        d = SpaceMapper.to_domain(s)
-        items.append(SpaceMapper.to_space_list_item_output(d))
+    items = [SpaceMapper.resp_to_space_list_item_output(s) for s in spaces]
     return SpaceListResult(items=items)
 
 
@@ -174,6 +173,7 @@ async def space_list(input: SpaceListInput) -> SpaceListResult:
         "openWorldHint": True,
     },
 )
+@invalidates("space")
 @handle_tool_errors
 async def space_create(input: SpaceCreateInput) -> SpaceResult | None:
     """
@@ -222,6 +222,7 @@ async def space_create(input: SpaceCreateInput) -> SpaceResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("space")
 @handle_tool_errors
 async def space_update(input: SpaceUpdateInput) -> SpaceResult | None:
     """
@@ -270,6 +271,7 @@ async def space_update(input: SpaceUpdateInput) -> SpaceResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("space", "folder", "list", "task")
 @handle_tool_errors
 async def space_delete(input: SpaceDeleteInput) -> DeletionResult:
     """
@@ -2,22 +2,34 @@
 
 Tools:
 - task.create|get|update|delete
+- task.get_many
 - task.list_in_list
 - task.set_custom_field / task.clear_custom_field
 - task.add_dependency
 - task.add_assignee / task.remove_assignee
 - task.search
+- task.bulk_create|bulk_update|bulk_add_assignee|bulk_delete
 """
 
+from typing import Any, List, Optional, Sequence
+
+from clickup_mcp.api.bulk import BulkItemResult
 from clickup_mcp.client import ClickUpAPIClientFactory
+from clickup_mcp.deadline import partial_results_at_deadline
 from clickup_mcp.exceptions import ClickUpAPIError, ResourceNotFoundError
 from clickup_mcp.mcp_server.errors import handle_tool_errors
+from clickup_mcp.mcp_server.errors.mapping import map_exception
 from clickup_mcp.mcp_server.models.inputs.task import (
     TaskAddAssigneeInput,
     TaskAddDependencyInput,
+    TaskBulkAddAssigneeInput,
+    TaskBulkCreateInput,
+    TaskBulkDeleteInput,
+    TaskBulkUpdateInput,
     TaskClearCustomFieldInput,
     TaskCreateInput,
     TaskGetInput,
+    TaskGetManyInput,
     TaskListInListInput,
     TaskRemoveAssigneeInput,
     TaskSearchInput,
@@ -26,6 +38,11 @@ from clickup_mcp.mcp_server.models.inputs.task import (
 )
 from clickup_mcp.mcp_server.models.outputs.common import DeletionResult, OperationResult
 from clickup_mcp.mcp_server.models.outputs.task import (
+    SparseTaskListItem,
+    SparseTaskResult,
+    TaskBulkItem,
+    TaskBulkResult,
+    TaskGetManyResult,
     TaskListItem,
     TaskListResult,
     TaskResult,
@@ -34,6 +51,8 @@ from clickup_mcp.models.dto.task import TaskListQuery, TaskResp, TaskSearchQuery
 from clickup_mcp.models.mapping.task_mapper import TaskMapper
 
 from .app import mcp
+from .progress import tool_progress
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -50,6 +69,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_create(input: TaskCreateInput) -> TaskResult | None:
     """
@@ -84,7 +104,7 @@ async def task_create(input: TaskCreateInput) -> TaskResult | None:
         resp = await client.task.create(input.list_id, dto)
     if not resp:
         raise ClickUpAPIError("Create task failed")
-    return _taskresp_to_result(resp)
+    return TaskMapper.resp_to_task_result_output(resp)
 
 
 @mcp.tool(
@@ -92,15 +112,16 @@ async def task_create(input: TaskCreateInput) -> TaskResult | None:
     name="task.get",
     description=(
         "Get a task by ID. For custom task IDs, set `custom_task_ids=true` and include `team_id`. "
-        "HTTP: GET /task/{task_id}."
+        "Pass `fields` (e.g., ['status', 'due_date_ms']) to return only those fields. HTTP: GET /task/{task_id}."
     ),
     annotations={
         "readOnlyHint": True,
         "openWorldHint": True,
     },
 )
+@cached_tool("task.get", scopes=("task",))
 @handle_tool_errors
-async def task_get(input: TaskGetInput) -> TaskResult | None:
+async def task_get(input: TaskGetInput) -> TaskResult | SparseTaskResult | None:
     """
     Get a task by ID.
 
@@ -134,7 +155,61 @@ async def task_get(input: TaskGetInput) -> TaskResult | None:
         )
     if not resp:
         raise ResourceNotFoundError("Task not found")
-    return _taskresp_to_result(resp)
+    return _taskresp_to_result(resp, fields=input.fields)
+
+
+@mcp.tool(
+    title="Get Many Tasks",
+    name="task.get_many",
+    description=(
+        "Get up to 500 tasks by ID in one call, e.g., the IDs from a search or a dependency list. "
+        "Duplicates are fetched once, recently fetched tasks come from memory (`fresh=true` bypasses), "
+        "the rest are fetched concurrently. For custom task IDs set `custom_task_ids=true` and `team_id`. "
+        "Returns per-ID ok/task/issue in request order; `fields` limits the task fields returned. "
+        "HTTP: GET /task/{task_id} per ID."
+    ),
+    annotations={
+        "readOnlyHint": True,
+        "openWorldHint": True,
+    },
+)
+@handle_tool_errors
+@partial_results_at_deadline
+async def task_get_many(input: TaskGetManyInput) -> TaskGetManyResult:
+    """
+    Get many tasks by ID.
+
+    API:
+        GET /task/{task_id} (per distinct uncached ID)
+
+    Args:
+        input: TaskGetManyInput with `task_ids` and optional custom ID, cache and concurrency settings
+
+    Returns:
+        TaskGetManyResult: One item per requested ID in request order; missing tasks have a NOT_FOUND issue
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Item failures do not fail the call; they are
+        reported in each item's `issue`, with DEADLINE_EXCEEDED for items cut off by the deadline.
+
+    Examples:
+        # Python (async)
+        response = await task_get_many(TaskGetManyInput(task_ids=["tsk_1", "tsk_2"]))
+        names = [item.task.name for item in response.result.items if item.ok]
+    """
+    client = ClickUpAPIClientFactory.get()
+    async with client:
+        results = await client.task.get_many(
+            input.task_ids,
+            custom_task_ids=input.custom_task_ids,
+            team_id=input.team_id,
+            use_cache=not input.fresh,
+            max_in_flight=input.max_in_flight,
+            on_progress=tool_progress("tasks resolved"),
+        )
+    bulk = _bulk_result(results, input.task_ids, fields=input.fields)
+    cached = sum(1 for result in results if result.ok and result.attempts == 0)
+    return TaskGetManyResult(items=bulk.items, succeeded=bulk.succeeded, failed=bulk.failed, cached=cached)
 
 
 @mcp.tool(
@@ -143,13 +218,14 @@ async def task_get(input: TaskGetInput) -> TaskResult | None:
     description=(
         "List tasks in a list with pagination and filters. Constraints: `limit` ≤ 100; set `include_timl` to include multi-list tasks. "
         "If you don’t know `list_id`, discover via `workspace.list` → `space.list` → `list.list_in_*`. "
-        "HTTP: GET /list/{list_id}/task."
+        "Pass `fields` (e.g., ['name', 'status']) to return only those item fields. HTTP: GET /list/{list_id}/task."
     ),
     annotations={
         "readOnlyHint": True,
         "openWorldHint": True,
     },
 )
+@cached_tool("task.list_in_list", scopes=("task",))
 @handle_tool_errors
 async def task_list_in_list(input: TaskListInListInput) -> TaskListResult:
     """
@@ -186,11 +262,11 @@ async def task_list_in_list(input: TaskListInListInput) -> TaskListResult:
         assignees=input.assignees,
     )
     async with client:
-        tasks = await client.task.list_in_list(input.list_id, query)
+        tasks = await client.task.list_in_list(input.list_id, query, on_progress=tool_progress("tasks fetched"))
     # Cap to requested page size. Our client currently fetches all pages, so we
     # cannot reliably expose a server-side cursor; we mark truncated when we trim.
     page_items = tasks[: input.limit]
-    items = [_taskresp_to_list_item(t) for t in page_items]
+    items = [_taskresp_to_list_item(t, fields=input.fields) for t in page_items]
     truncated = len(tasks) > len(page_items)
     return TaskListResult(items=items, next_cursor=None, truncated=truncated)
 
@@ -207,6 +283,7 @@ async def task_list_in_list(input: TaskListInListInput) -> TaskListResult:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_update(input: TaskUpdateInput) -> TaskResult | None:
     """
@@ -241,7 +318,7 @@ async def task_update(input: TaskUpdateInput) -> TaskResult | None:
         resp = await client.task.update(input.task_id, dto)
     if not resp:
         return None
-    return _taskresp_to_result(resp)
+    return TaskMapper.resp_to_task_result_output(resp)
 
 
 @mcp.tool(
@@ -256,6 +333,7 @@ async def task_update(input: TaskUpdateInput) -> TaskResult | None:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_set_custom_field(input: TaskSetCustomFieldInput) -> OperationResult:
     """
@@ -294,6 +372,7 @@ async def task_set_custom_field(input: TaskSetCustomFieldInput) -> OperationResu
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_clear_custom_field(input: TaskClearCustomFieldInput) -> OperationResult:
     """
@@ -332,6 +411,7 @@ async def task_clear_custom_field(input: TaskClearCustomFieldInput) -> Operation
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_add_dependency(input: TaskAddDependencyInput) -> OperationResult:
     """
@@ -370,6 +450,7 @@ async def task_add_dependency(input: TaskAddDependencyInput) -> OperationResult:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_delete(task_id: str) -> DeletionResult:
     """
@@ -401,16 +482,13 @@ async def task_delete(task_id: str) -> DeletionResult:
     return DeletionResult(deleted=bool(ok))
 
 
-def _taskresp_to_result(resp: TaskResp) -> TaskResult:
-    # DTO -> Domain
-    dom = TaskMapper.to_domain(resp)
-    # Domain -> Output (pass url from DTO)
-    return TaskMapper.to_task_result_output(dom, url=resp.url)
+def _taskresp_to_result(resp: TaskResp, fields: Optional[Sequence[str]] = None) -> TaskResult | SparseTaskResult:
+    # DTO -> Output directly; equivalent to the domain path, without validating twice
+    return TaskMapper.resp_to_task_result_output(resp, fields=fields)
 
 
-def _taskresp_to_list_item(resp: TaskResp) -> TaskListItem:
-    dom = TaskMapper.to_domain(resp)
-    return TaskMapper.to_task_list_item_output(dom, url=resp.url)
+def _taskresp_to_list_item(resp: TaskResp, fields: Optional[Sequence[str]] = None) -> TaskListItem | SparseTaskListItem:
+    return TaskMapper.resp_to_task_list_item_output(resp, fields=fields)
 
 
 @mcp.tool(
@@ -425,6 +503,7 @@ def _taskresp_to_list_item(resp: TaskResp) -> TaskListItem:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_add_assignee(input: TaskAddAssigneeInput) -> OperationResult:
     """
@@ -466,6 +545,7 @@ async def task_add_assignee(input: TaskAddAssigneeInput) -> OperationResult:
         "openWorldHint": True,
     },
 )
+@invalidates("task")
 @handle_tool_errors
 async def task_remove_assignee(input: TaskRemoveAssigneeInput) -> OperationResult:
     """
@@ -501,13 +581,14 @@ async def task_remove_assignee(input: TaskRemoveAssigneeInput) -> OperationResul
     description=(
         "Search tasks with natural language query and filters. "
         "Supports text search combined with status, priority, assignee, and date filters. "
-        "HTTP: GET /team/{team_id}/task with query parameters."
+        "Pass `fields` to return only some item fields. HTTP: GET /team/{team_id}/task with query parameters."
     ),
     annotations={
         "readOnlyHint": True,
         "openWorldHint": True,
     },
 )
+@cached_tool("task.search", scopes=("task",))
 @handle_tool_errors
 async def task_search(input: TaskSearchInput) -> TaskListResult:
     """
@@ -530,7 +611,7 @@ async def task_search(input: TaskSearchInput) -> TaskListResult:
         # Python (async)
         response = await task_search(TaskSearchInput(query="urgent bugs", team_id="team_123", priorities=[1, 2]))
         if response.ok and response.result:
-            for task in response.result.tasks:
+            for task in response.result.items:
                 print(task.name)
     """
     client = ClickUpAPIClientFactory.get()
@@ -554,10 +635,217 @@ async def task_search(input: TaskSearchInput) -> TaskListResult:
     if not resp:
         raise ClickUpAPIError("Search tasks failed")
     # DTO -> Domain -> Output
-    tasks = []
+    items = []
     if hasattr(resp, "tasks") and resp.tasks:
         for task_dto in resp.tasks:
-            domain = TaskMapper.to_domain(task_dto)
-            output = TaskMapper.to_task_result_output(domain, url=task_dto.url if hasattr(task_dto, "url") else None)
-            tasks.append(output)
-    return TaskListResult(tasks=tasks)
+            items.append(_taskresp_to_list_item(task_dto, fields=input.fields))
+    return TaskListResult(items=items)
+
+
+def _bulk_result(
+    results: Sequence[BulkItemResult[Any]],
+    task_ids: Sequence[Optional[str]],
+    fields: Optional[Sequence[str]] = None,
+) -> TaskBulkResult:
+    items: List[TaskBulkItem] = []
+    for result, task_id in zip(results, task_ids):
+        item = TaskBulkItem(index=result.index, ok=result.ok, task_id=task_id, attempts=result.attempts)
+        if isinstance(result.value, TaskResp):
+            item.task = _taskresp_to_result(result.value, fields=fields)
+            item.task_id = item.task.id
+        if result.error is not None:
+            item.issue = map_exception(result.error)
+        items.append(item)
+    succeeded = sum(1 for item in items if item.ok)
+    return TaskBulkResult(items=items, succeeded=succeeded, failed=len(items) - succeeded)
+
+
+@mcp.tool(
+    title="Bulk Create Tasks",
+    name="task.bulk_create",
+    description=(
+        "Create up to 500 tasks in one call; each item is a `task.create` input. Requests run concurrently "
+        "(`max_in_flight`) under the shared rate limit. Returns per-item ok/task/issue in request order; "
+        "rate-limited items are retried automatically. A TRANSIENT failure may still have created the task, "
+        "so check before resubmitting it. HTTP: POST /list/{list_id}/task per item."
+    ),
+    annotations={
+        "destructiveHint": False,
+        "openWorldHint": True,
+    },
+)
+@invalidates("task")
+@handle_tool_errors
+@partial_results_at_deadline
+async def task_bulk_create(input: TaskBulkCreateInput) -> TaskBulkResult:
+    """
+    Create many tasks concurrently.
+
+    API:
+        POST /list/{list_id}/task (per item)
+
+    Args:
+        input: TaskBulkCreateInput with items and optional max_in_flight
+
+    Returns:
+        TaskBulkResult: Per-item results in request order, with succeeded/failed counts
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Item failures do not fail the call; they are
+        reported in each item's `issue`, with DEADLINE_EXCEEDED for items cut off by the deadline.
+
+    Examples:
+        # Python (async)
+        response = await task_bulk_create(TaskBulkCreateInput(items=[TaskCreateInput(list_id="L1", name="A")]))
+        print(response.result.succeeded)
+    """
+    client = ClickUpAPIClientFactory.get()
+    pairs = [(item.list_id, TaskMapper.to_create_dto(TaskMapper.from_create_input(item))) for item in input.items]
+    async with client:
+        results = await client.task.bulk_create(
+            pairs, max_in_flight=input.max_in_flight, on_progress=tool_progress("tasks created")
+        )
+    return _bulk_result(results, [None] * len(results))
+
+
+@mcp.tool(
+    title="Bulk Update Tasks",
+    name="task.bulk_update",
+    description=(
+        "Update up to 500 tasks in one call; each item is a `task.update` input. Requests run concurrently "
+        "(`max_in_flight`) under the shared rate limit. Returns per-item ok/task/issue in request order; "
+        "failed items can be resubmitted unchanged. HTTP: PUT /task/{task_id} per item."
+    ),
+    annotations={
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True,
+    },
+)
+@invalidates("task")
+@handle_tool_errors
+@partial_results_at_deadline
+async def task_bulk_update(input: TaskBulkUpdateInput) -> TaskBulkResult:
+    """
+    Update many tasks concurrently.
+
+    API:
+        PUT /task/{task_id} (per item)
+
+    Args:
+        input: TaskBulkUpdateInput with items and optional max_in_flight
+
+    Returns:
+        TaskBulkResult: Per-item results in request order, with succeeded/failed counts
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Item failures are reported in each item's `issue`;
+        items cut off by the tool's deadline report DEADLINE_EXCEEDED.
+
+    Examples:
+        # Python (async)
+        response = await task_bulk_update(TaskBulkUpdateInput(items=[TaskUpdateInput(task_id="t1", status="done")]))
+        retry = [item.index for item in response.result.items if not item.ok]
+    """
+    client = ClickUpAPIClientFactory.get()
+    pairs = [(item.task_id, TaskMapper.to_update_dto(TaskMapper.from_update_input(item))) for item in input.items]
+    async with client:
+        results = await client.task.bulk_update(
+            pairs, max_in_flight=input.max_in_flight, on_progress=tool_progress("tasks updated")
+        )
+    return _bulk_result(results, [item.task_id for item in input.items])
+
+
+@mcp.tool(
+    title="Bulk Add Task Assignees",
+    name="task.bulk_add_assignee",
+    description=(
+        "Add assignees to up to 500 tasks in one call; each item is {task_id, assignee_id}. Requests run "
+        "concurrently (`max_in_flight`) under the shared rate limit. Returns per-item ok/issue in request "
+        "order. HTTP: POST /task/{task_id}/member/{member_id} per item."
+    ),
+    annotations={
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": True,
+    },
+)
+@invalidates("task")
+@handle_tool_errors
+@partial_results_at_deadline
+async def task_bulk_add_assignee(input: TaskBulkAddAssigneeInput) -> TaskBulkResult:
+    """
+    Add assignees to many tasks concurrently.
+
+    API:
+        POST /task/{task_id}/member/{member_id} (per item)
+
+    Args:
+        input: TaskBulkAddAssigneeInput with items and optional max_in_flight
+
+    Returns:
+        TaskBulkResult: Per-item results in request order, with succeeded/failed counts
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Item failures are reported in each item's `issue`;
+        items cut off by the tool's deadline report DEADLINE_EXCEEDED.
+
+    Examples:
+        # Python (async)
+        items = [TaskAddAssigneeInput(task_id=tid, assignee_id=42) for tid in ("t1", "t2")]
+        response = await task_bulk_add_assignee(TaskBulkAddAssigneeInput(items=items))
+    """
+    client = ClickUpAPIClientFactory.get()
+    pairs = [(item.task_id, item.assignee_id) for item in input.items]
+    async with client:
+        results = await client.task.bulk_add_assignee(
+            pairs, max_in_flight=input.max_in_flight, on_progress=tool_progress("tasks assigned")
+        )
+    return _bulk_result(results, [item.task_id for item in input.items])
+
+
+@mcp.tool(
+    title="Bulk Delete Tasks",
+    name="task.bulk_delete",
+    description=(
+        "Delete up to 500 tasks by ID in one call. Irreversible and permission-scoped. Requests run "
+        "concurrently (`max_in_flight`) under the shared rate limit. Returns per-item ok/issue in request "
+        "order. HTTP: DELETE /task/{task_id} per item."
+    ),
+    annotations={
+        "destructiveHint": True,
+        "idempotentHint": True,
+        "openWorldHint": True,
+    },
+)
+@invalidates("task")
+@handle_tool_errors
+@partial_results_at_deadline
+async def task_bulk_delete(input: TaskBulkDeleteInput) -> TaskBulkResult:
+    """
+    Delete many tasks concurrently.
+
+    API:
+        DELETE /task/{task_id} (per item)
+
+    Args:
+        input: TaskBulkDeleteInput with task_ids and optional max_in_flight
+
+    Returns:
+        TaskBulkResult: Per-item results in request order, with succeeded/failed counts
+
+    Error Handling:
+        Decorated with `@handle_tool_errors`. Item failures are reported in each item's `issue`;
+        items cut off by the tool's deadline report DEADLINE_EXCEEDED.
+
+    Examples:
+        # Python (async)
+        response = await task_bulk_delete(TaskBulkDeleteInput(task_ids=["t1", "t2"]))
+        print(response.result.failed)
+    """
+    client = ClickUpAPIClientFactory.get()
+    async with client:
+        results = await client.task.bulk_delete(
+            input.task_ids, max_in_flight=input.max_in_flight, on_progress=tool_progress("tasks deleted")
+        )
+    return _bulk_result(results, input.task_ids)
@@ -29,6 +29,7 @@ from clickup_mcp.models.dto.time import TimeEntryListQuery
 from clickup_mcp.models.mapping.time_mapper import TimeMapper
 
 from .app import mcp
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -43,6 +44,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@invalidates("time", "task")
 @handle_tool_errors
 async def time_entry_create(input: TimeEntryCreateInput) -> TimeEntryResult | None:
     """
@@ -88,6 +90,7 @@ async def time_entry_create(input: TimeEntryCreateInput) -> TimeEntryResult | No
         "openWorldHint": True,
     },
 )
+@cached_tool("time_entry.get", scopes=("time",))
 @handle_tool_errors
 async def time_entry_get(input: TimeEntryGetInput) -> TimeEntryResult | None:
     """
@@ -117,20 +120,22 @@ async def time_entry_get(input: TimeEntryGetInput) -> TimeEntryResult | None:
         resp = await client.time.get(input.team_id, input.time_entry_id)
     if not resp:
         raise ResourceNotFoundError("Time entry not found")
-    return TimeEntryResult(**TimeMapper.to_time_entry_result_output(TimeMapper.to_domain(resp)))
+    return TimeMapper.resp_to_time_entry_result_output(resp)
 
 
 @mcp.tool(
     title="List Time Entries",
     name="time_entry.list",
     description=(
-        "List time entries with filters. Constraints: `limit` ≤ 100. " "HTTP: GET /team/{team_id}/time_entries."
+        "List time entries with filters. Constraints: `limit` ≤ 100. Pass `fields` (e.g., ['duration']) to "
+        "return only some item fields. HTTP: GET /team/{team_id}/time_entries."
     ),
     annotations={
         "readOnlyHint": True,
         "openWorldHint": True,
     },
 )
+@cached_tool("time_entry.list", scopes=("time",))
 @handle_tool_errors
 async def time_entry_list(input: TimeEntryListInput) -> TimeEntryListResult:
     """
@@ -169,7 +174,7 @@ async def time_entry_list(input: TimeEntryListInput) -> TimeEntryListResult:
         resp = await client.time.list(input.team_id, query)
     if not resp:
         raise ClickUpAPIError("List time entries failed")
-    items = [TimeMapper.to_time_entry_list_item_output(TimeMapper.to_domain(entry)) for entry in resp.items]
+    items = [TimeMapper.resp_to_time_entry_list_item_output(e, input.fields) for e in resp.items]
     return TimeEntryListResult(items=items, next_cursor=resp.next_page, truncated=False)
 
 
@@ -185,6 +190,7 @@ async def time_entry_list(input: TimeEntryListInput) -> TimeEntryListResult:
         "openWorldHint": True,
     },
 )
+@invalidates("time", "task")
 @handle_tool_errors
 async def time_entry_update(input: TimeEntryUpdateInput) -> TimeEntryResult | None:
     """
@@ -216,7 +222,7 @@ async def time_entry_update(input: TimeEntryUpdateInput) -> TimeEntryResult | No
         resp = await client.time.update(input.team_id, input.time_entry_id, dto)
     if not resp:
         raise ResourceNotFoundError("Time entry not found")
-    return TimeEntryResult(**TimeMapper.to_time_entry_result_output(TimeMapper.to_domain(resp)))
+    return TimeMapper.resp_to_time_entry_result_output(resp)
 
 
 @mcp.tool(
@@ -228,6 +234,7 @@ async def time_entry_update(input: TimeEntryUpdateInput) -> TimeEntryResult | No
         "openWorldHint": True,
     },
 )
+@invalidates("time", "task")
 @handle_tool_errors
 async def time_entry_delete(input: TimeEntryDeleteInput) -> DeletionResult:
     """
@@ -269,6 +276,7 @@ async def time_entry_delete(input: TimeEntryDeleteInput) -> DeletionResult:
         "openWorldHint": True,
     },
 )
+@invalidates("time", "task")
 @handle_tool_errors
 async def time_tracking_start(input: TimeTrackingStartInput) -> OperationResult:
     """
@@ -313,6 +321,7 @@ async def time_tracking_start(input: TimeTrackingStartInput) -> OperationResult:
         "openWorldHint": True,
     },
 )
+@invalidates("time", "task")
 @handle_tool_errors
 async def time_tracking_stop(input: TimeTrackingStopInput) -> OperationResult:
     """
@@ -0,0 +1,248 @@
+"""
+Result cache for read-only MCP tools.
+
+Design:
+- `@cached_tool(name, scopes, ttl=...)` sits between `@mcp.tool` and `@handle_tool_errors`.
+  Successful envelopes are kept per tool in a `TTLCache`, keyed by the canonical JSON of
+  the bound arguments. Pydantic inputs are dumped with their defaults, so
+  `{"list_id": "1"}` and `{"list_id": "1", "page": 0}` share an entry. Failures are
+  never cached.
+- Every cached tool names the resource scopes its results depend on ("task", "list", ...).
+  `@invalidates(*scopes)` on write tools drops all cached results in those scopes when
+  the write finishes, whether or not it succeeded. A read that was running across a
+  write is not stored, so a write is never shadowed by an older read.
+- Webhook events invalidate their scopes as well: the web server adds
+  `invalidate_for_event` as an ingress observer, which sees every delivery this process
+  receives, whether it is dispatched locally or queued. It is not a handler, so it does
+  not subscribe this process to any event type.
+- Responses of cached tools carry `cache` (`CacheInfo`): "miss" when computed now, "hit"
+  with the result's age when served from memory.
+
+Usage Examples:
+    @mcp.tool(name="space.list", annotations={"readOnlyHint": True})
+    @cached_tool("space.list", scopes=("space",), ttl=120)
+    @handle_tool_errors
+    async def space_list(input: SpaceListInput) -> SpaceListResult: ...
+
+    @mcp.tool(name="space.delete")
+    @invalidates("space", "folder", "list", "task")
+    @handle_tool_errors
+    async def space_delete(input: SpaceDeleteInput) -> DeletionResult: ...
+
+Environment:
+- `MCP_TOOL_CACHE_ENABLED`: turn the cache off entirely (default true)
+- `MCP_TOOL_CACHE_TTL`: seconds results are kept, for tools without their own TTL (default 15)
+- `MCP_TOOL_CACHE_TTLS`: per-tool TTL overrides as JSON, e.g. {"task.get": 5, "workspace.list": 0}
+- `MCP_TOOL_CACHE_SIZE`: entries kept per tool (default 256)
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from clickup_mcp.api.cache import TTLCache
+from clickup_mcp.config import get_settings
+from clickup_mcp.diagnostics import recording
+
+from .errors.models import CacheInfo, ToolDiagnostics, ToolResponse
+
+logger = logging.getLogger(__name__)
+
+SCOPES = frozenset({"workspace", "space", "folder", "list", "task", "time"})
+
+F = TypeVar("F", bound=Callable[..., Awaitable[ToolResponse[Any]]])
+
+
+def _check_scopes(scopes: Iterable[str]) -> Tuple[str, ...]:
+    scopes = tuple(scopes)
+    unknown = set(scopes) - SCOPES
+    if not scopes or unknown:
+        raise ValueError(f"Cache scopes must be a non-empty subset of {sorted(SCOPES)}, got {list(scopes)}")
+    return scopes
+
+
+class _ToolEntries:
+    """Cached results of one tool."""
+
+    def __init__(self, name: str, scopes: Tuple[str, ...], ttl: float, maxsize: int) -> None:
+        self.name = name
+        self.scopes = scopes
+        self.ttl = ttl
+        # key -> (stored at, envelope)
+        self.entries: TTLCache[str, Tuple[float, ToolResponse[Any]]] = TTLCache(ttl, maxsize)
+
+
+class ToolResultCache:
+    """Process-wide store of read-only tool results, invalidated by scope."""
+
+    def __init__(self) -> None:
+        self._tools: Dict[str, _ToolEntries] = {}
+        self._declared: Dict[str, Tuple[Tuple[str, ...], Optional[float]]] = {}
+        self._generations: Dict[str, int] = dict.fromkeys(SCOPES, 0)
+
+    def declare(self, name: str, scopes: Tuple[str, ...], ttl: Optional[float]) -> None:
+        self._declared[name] = (scopes, ttl)
+
+    def _tool(self, name: str) -> _ToolEntries:
+        tool = self._tools.get(name)
+        if tool is None:
+            # Built on first use, so settings changed after import (tests, CLI) apply
+            settings = get_settings()
+            scopes, ttl = self._declared[name]
+            ttl = settings.mcp_tool_cache_ttls.get(name, settings.mcp_tool_cache_ttl if ttl is None else ttl)
+            if not settings.mcp_tool_cache_enabled:
+                ttl = 0
+            tool = self._tools[name] = _ToolEntries(name, scopes, ttl, settings.mcp_tool_cache_size)
+        return tool
+
+    def generation(self, scopes: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._generations[scope] for scope in scopes)
+
+    async def call(self, name: str, key: str, compute: Callable[[], Awaitable[ToolResponse[Any]]]) -> ToolResponse[Any]:
+        tool = self._tool(name)
+        if not tool.entries.enabled:
+            return await compute()
+        ttl_ms = int(tool.ttl * 1000)
+        cached = tool.entries.get(key)
+        if cached is not None:
+            stored_at, response = cached
+            age_ms = int((time.monotonic() - stored_at) * 1000)
+            # Stored diagnostics describe the call that computed the result, not this one
+            diagnostics = None
+            if get_settings().mcp_tool_diagnostics:
+                with recording() as recorder:
+                    recorder.add(cache_hits=1)
+                diagnostics = ToolDiagnostics.from_recorder(recorder)
+            cache = CacheInfo(status="hit", age_ms=age_ms, ttl_ms=ttl_ms)
+            return response.model_copy(update={"cache": cache, "diagnostics": diagnostics})
+        before = self.generation(tool.scopes)
+        response = await compute()
+        if response.ok and self.generation(tool.scopes) == before:
+            tool.entries.set(key, (time.monotonic(), response))
+        return response.model_copy(update={"cache": CacheInfo(status="miss", ttl_ms=ttl_ms)})
+
+    def invalidate(self, *scopes: str) -> None:
+        """Drop every cached result that depends on any of `scopes`."""
+        for scope in scopes:
+            self._generations[scope] += 1
+        for tool in self._tools.values():
+            if len(tool.entries) and not set(tool.scopes).isdisjoint(scopes):
+                logger.debug("Invalidating %d cached %s result(s)", len(tool.entries), tool.name)
+                tool.entries.clear()
+
+    def clear(self) -> None:
+        """Drop all cached results and re-read the settings on next use."""
+        self._tools.clear()
+
+
+_cache = ToolResultCache()
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache."""
+    return _cache
+
+
+def _canonical_key(signature: inspect.Signature, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    values = {
+        name: value.model_dump(mode="json") if isinstance(value, BaseModel) else to_jsonable_python(value)
+        for name, value in bound.arguments.items()
+    }
+    return json.dumps(values, sort_keys=True, separators=(",", ":"))
+
+
+def cached_tool(name: str, scopes: Iterable[str], ttl: Optional[float] = None) -> Callable[[F], F]:
+    """
+    Cache successful results of a read-only tool.
+
+    Args:
+        name: Tool name, used for per-tool TTL overrides (`MCP_TOOL_CACHE_TTLS`)
+        scopes: Resource scopes the results depend on; writes to them invalidate the cache
+        ttl: Seconds results are kept; defaults to `MCP_TOOL_CACHE_TTL`
+
+    Returns:
+        Decorator for an async tool already wrapped by `handle_tool_errors`
+    """
+    checked = _check_scopes(scopes)
+
+    def decorator(func: F) -> F:
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError("cached_tool only supports async tools")
+        signature = inspect.signature(func)
+        _cache.declare(name, checked, ttl)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> ToolResponse[Any]:
+            key = _canonical_key(signature, args, kwargs)
+            return await _cache.call(name, key, lambda: func(*args, **kwargs))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates(*scopes: str) -> Callable[[F], F]:
+    """
+    Invalidate cached read results in `scopes` after the decorated write tool runs.
+
+    Args:
+        *scopes: Resource scopes the tool modifies
+
+    Returns:
+        Decorator for an async tool already wrapped by `handle_tool_errors`
+    """
+    checked = _check_scopes(scopes)
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> ToolResponse[Any]:
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _cache.invalidate(*checked)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Webhook event type prefix -> scopes it changes; deletions also drop what the resource contained
+_EVENT_SCOPES: Dict[str, Tuple[str, ...]] = {
+    "task": ("task",),
+    "list": ("list",),
+    "folder": ("folder",),
+    "space": ("space",),
+}
+_DELETE_CASCADE: Dict[str, Tuple[str, ...]] = {
+    "list": ("list", "task"),
+    "folder": ("folder", "list", "task"),
+    "space": ("space", "folder", "list", "task"),
+}
+
+
+def event_scopes(event_type: str) -> Tuple[str, ...]:
+    """Cache scopes affected by a ClickUp webhook event type (e.g., "taskUpdated")."""
+    for prefix, scopes in _EVENT_SCOPES.items():
+        if event_type.startswith(prefix):
+            if event_type.endswith("Deleted"):
+                return _DELETE_CASCADE.get(prefix, scopes)
+            if event_type == "taskTimeTrackedUpdated":
+                return ("task", "time")
+            return scopes
+    return ()
+
+
+def invalidate_for_event(event_type: str) -> None:
+    """Drop cached results in the scopes a webhook event of `event_type` changes."""
+    scopes = event_scopes(event_type)
+    if scopes:
+        _cache.invalidate(*scopes)
@@ -22,6 +22,7 @@ from clickup_mcp.models.mapping.team_mapper import TeamMapper
 from clickup_mcp.models.mapping.workspace_mapper import WorkspaceMapper
 
 from .app import mcp
+from .tool_cache import cached_tool, invalidates
 
 
 @mcp.tool(
@@ -36,6 +37,7 @@ from .app import mcp
         "openWorldHint": True,
     },
 )
+@cached_tool("workspace.list", scopes=("workspace",), ttl=300)
 @handle_tool_errors
 async def workspace_list() -> WorkspaceListResult:
     """
@@ -80,6 +82,7 @@ async def workspace_list() -> WorkspaceListResult:
         "openWorldHint": False,
     },
 )
+@invalidates("workspace", "space", "folder", "list", "task", "time")
 @handle_tool_errors
 async def workspace_create(input: WorkspaceCreateInput) -> WorkspaceResult:
     """
@@ -135,6 +138,7 @@ async def workspace_create(input: WorkspaceCreateInput) -> WorkspaceResult:
         "openWorldHint": True,
     },
 )
+@cached_tool("workspace.get", scopes=("workspace",), ttl=300)
 @handle_tool_errors
 async def workspace_get(input: WorkspaceGetInput) -> WorkspaceResult:
     """
@@ -185,6 +189,7 @@ async def workspace_get(input: WorkspaceGetInput) -> WorkspaceResult:
         "openWorldHint": False,
     },
 )
+@invalidates("workspace", "space", "folder", "list", "task", "time")
 @handle_tool_errors
 async def workspace_update(input: WorkspaceUpdateInput) -> WorkspaceResult:
     """
@@ -240,6 +245,7 @@ async def workspace_update(input: WorkspaceUpdateInput) -> WorkspaceResult:
         "openWorldHint": False,
     },
 )
+@invalidates("workspace", "space", "folder", "list", "task", "time")
 @handle_tool_errors
 async def workspace_delete(input: WorkspaceDeleteInput) -> DeletionResult:
     """
@@ -0,0 +1,318 @@
+"""
+Process-wide metrics in Prometheus text format.
+
+Design:
+- A small in-process registry of counters and histograms, rendered in the Prometheus
+  text exposition format (0.0.4) by the web server's `/metrics` endpoint. No client
+  library is required; recording is a dict lookup, a bisect and a few additions.
+- Series are keyed by label values. Callers keep label values bounded: tool function
+  names, HTTP methods, endpoint templates (`/task/{id}`, not `/task/86a1b2c`) and status
+  codes.
+- The metrics below are recorded by `handle_tool_errors` (tool calls),
+  `ClickUpAPIClient._make_request` (upstream requests), the webhook ingress, the
+  `QueueEventSink` publisher and the `ClickUpWebhookConsumer`. Tool latency minus upstream
+  latency and rate-limit wait is the time spent mapping and serializing.
+
+Metrics:
+- `clickup_mcp_tool_duration_seconds{tool,outcome}`: tool call latency; outcome is
+  ok, error or cancelled. Its `_count` is the call throughput.
+- `clickup_mcp_tool_errors_total{tool,code}`: failed tool calls by issue code
+- `clickup_upstream_request_duration_seconds{method,endpoint,status}`: one HTTP attempt
+  against ClickUp; status is "error" when no response arrived
+- `clickup_upstream_request_retries{method,endpoint}`: retries needed per request
+- `clickup_upstream_rate_limit_wait_seconds{method,endpoint}`: time a request waited
+  on the client-side rate limiter
+- `clickup_upstream_request_bytes{method,endpoint}` /
+  `clickup_upstream_response_bytes{method,endpoint}`: payload sizes
+- `clickup_webhook_received_total{event_type}`: webhook deliveries that passed validation
+- `clickup_webhook_accepted_total{event_type}`: deliveries forwarded to the event sink
+- `clickup_webhook_dropped_total{event_type}`: deliveries acknowledged without forwarding
+  because no handler subscribes to the type
+- `clickup_webhook_queue_publish_duration_seconds{backend}`: one batch publish
+- `clickup_webhook_queue_batch_events{backend}` / `clickup_webhook_queue_batch_bytes{backend}`:
+  size of published batches
+- `clickup_webhook_queue_publish_failures_total{backend}`: batches whose publish raised
+- `clickup_webhook_consumer_received_total{group}`: messages pulled from the queue
+- `clickup_webhook_consumer_handled_total{group,outcome}`: finished messages; outcome is
+  processed or failed (undecodable, or dispatch raised)
+- `clickup_webhook_consumer_in_flight_messages{group}`: messages running when one is submitted
+
+Usage Examples:
+    from clickup_mcp.metrics import get_metrics_registry, TOOL_DURATION
+
+    TOOL_DURATION.observe(0.042, tool="task_get", outcome="ok")
+    text = get_metrics_registry().render()
+
+Environment:
+- `MCP_METRICS_ENABLED`: expose `/metrics` on the web server (default true)
+"""
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+BATCH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+IN_FLIGHT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def samples(self) -> List[str]:  # pragma: no cover - interface
+        """Return the sample lines of every series."""
+
+    @abstractmethod
+    def reset(self) -> None:  # pragma: no cover - interface
+        """Drop all recorded series."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _Series:
+    __slots__ = ("buckets", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """Bucketed observations per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], _Series] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        # Bucket upper bounds are inclusive (`le`)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets) + 1)
+            series.buckets[index] += 1
+            series.sum += value
+            series.count += 1
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def sum(self, **labels: str) -> float:
+        series = self._series.get(self._key(labels))
+        return series.sum if series else 0.0
+
+    def samples(self) -> List[str]:
+        lines: List[str] = []
+        with self._lock:
+            snapshot = sorted((key, list(s.buckets), s.sum, s.count) for key, s in self._series.items())
+        for key, buckets, total, count in snapshot:
+            cumulative = 0
+            for bound, hits in zip(self.buckets + (math.inf,), buckets):
+                cumulative += hits
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Named metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded series."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+    return _registry
+
+
+TOOL_DURATION = _registry.histogram(
+    "clickup_mcp_tool_duration_seconds", "MCP tool call latency in seconds", ("tool", "outcome")
+)
+TOOL_ERRORS = _registry.counter(
+    "clickup_mcp_tool_errors_total", "Failed MCP tool calls by issue code", ("tool", "code")
+)
+UPSTREAM_DURATION = _registry.histogram(
+    "clickup_upstream_request_duration_seconds",
+    "Latency of one HTTP attempt against the ClickUp API in seconds",
+    ("method", "endpoint", "status"),
+)
+UPSTREAM_RETRIES = _registry.histogram(
+    "clickup_upstream_request_retries",
+    "Retries needed per ClickUp API request",
+    ("method", "endpoint"),
+    buckets=COUNT_BUCKETS,
+)
+RATE_LIMIT_WAIT = _registry.histogram(
+    "clickup_upstream_rate_limit_wait_seconds",
+    "Time a ClickUp API request waited on the client-side rate limiter in seconds",
+    ("method", "endpoint"),
+)
+REQUEST_BYTES = _registry.histogram(
+    "clickup_upstream_request_bytes", "ClickUp API request body size in bytes", ("method", "endpoint"), BYTES_BUCKETS
+)
+RESPONSE_BYTES = _registry.histogram(
+    "clickup_upstream_response_bytes",
+    "ClickUp API response body size in bytes",
+    ("method", "endpoint"),
+    BYTES_BUCKETS,
+)
+WEBHOOK_RECEIVED = _registry.counter(
+    "clickup_webhook_received_total", "ClickUp webhook deliveries that passed validation", ("event_type",)
+)
+WEBHOOK_ACCEPTED = _registry.counter(
+    "clickup_webhook_accepted_total", "ClickUp webhook deliveries forwarded to the event sink", ("event_type",)
+)
+WEBHOOK_DROPPED = _registry.counter(
+    "clickup_webhook_dropped_total",
+    "ClickUp webhook deliveries acknowledged without forwarding (no subscribed handler)",
+    ("event_type",),
+)
+QUEUE_PUBLISH_DURATION = _registry.histogram(
+    "clickup_webhook_queue_publish_duration_seconds",
+    "Latency of one webhook event batch publish to the queue backend in seconds",
+    ("backend",),
+)
+QUEUE_BATCH_EVENTS = _registry.histogram(
+    "clickup_webhook_queue_batch_events", "Webhook events per published queue batch", ("backend",), BATCH_BUCKETS
+)
+QUEUE_BATCH_BYTES = _registry.histogram(
+    "clickup_webhook_queue_batch_bytes", "Webhook event bytes per published queue batch", ("backend",), BYTES_BUCKETS
+)
+QUEUE_PUBLISH_FAILURES = _registry.counter(
+    "clickup_webhook_queue_publish_failures_total", "Webhook event batches whose publish raised", ("backend",)
+)
+CONSUMER_RECEIVED = _registry.counter(
+    "clickup_webhook_consumer_received_total", "Queued webhook messages pulled by the consumer", ("group",)
+)
+CONSUMER_HANDLED = _registry.counter(
+    "clickup_webhook_consumer_handled_total",
+    "Queued webhook messages the consumer finished, by outcome",
+    ("group", "outcome"),
+)
+CONSUMER_IN_FLIGHT = _registry.histogram(
+    "clickup_webhook_consumer_in_flight_messages",
+    "Messages running in the webhook consumer when one is submitted",
+    ("group",),
+    IN_FLIGHT_BUCKETS,
+)
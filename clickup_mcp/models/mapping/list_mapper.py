@@ -38,13 +38,44 @@ from typing import TYPE_CHECKING
 
 from clickup_mcp.models.domain.list import ClickUpList, ListStatus
 from clickup_mcp.models.dto.list import ListCreate, ListResp, ListUpdate
+from clickup_mcp.models.mapping.projection import OutputProjection
 
 if TYPE_CHECKING:
     from clickup_mcp.mcp_server.models.inputs.list_ import (
         ListCreateInput,
         ListUpdateInput,
     )
-    from clickup_mcp.mcp_server.models.outputs.list import ListListItem, ListResult
+    from clickup_mcp.mcp_server.models.outputs.list import (
+        ListListItem,
+        ListResult,
+        ListStatusOutput,
+    )
+
+# Read-only ListResp -> output projections; must agree with to_domain + the *_output mappers
+_LIST_STATUS_PROJECTION: OutputProjection[ListResp.ListStatusDTO, "ListStatusOutput"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.list.ListStatusOutput",
+    {
+        "name": lambda status: status.name,
+        "type": lambda status: status.type,
+        "color": lambda status: status.color,
+        "orderindex": lambda status: status.orderindex,
+    },
+)
+_LIST_RESULT_PROJECTION: OutputProjection[ListResp, "ListResult"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.list.ListResult",
+    {
+        "id": lambda resp: resp.id,
+        "name": lambda resp: resp.name,
+        "status": lambda resp: resp.status,
+        "folder_id": lambda resp: resp.folder.id if resp.folder and resp.folder.id else None,
+        "space_id": lambda resp: resp.space.id if resp.space and resp.space.id else None,
+        "statuses": lambda resp: [_LIST_STATUS_PROJECTION(s) for s in resp.statuses] if resp.statuses else None,
+    },
+)
+_LIST_LIST_ITEM_PROJECTION: OutputProjection[ListResp, "ListListItem"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.list.ListListItem",
+    {"id": lambda resp: resp.id, "name": lambda resp: resp.name},
+)
 
 
 class ListMapper:
@@ -411,3 +442,37 @@ class ListMapper:
         from clickup_mcp.mcp_server.models.outputs.list import ListListItem
 
         return ListListItem(id=lst.id, name=lst.name)
+
+    @staticmethod
+    def resp_to_list_result_output(resp: ListResp) -> "ListResult":
+        """
+        Map a list response straight to the MCP ListResult, skipping the domain entity.
+
+        Args:
+            resp: ListResp DTO from the ClickUp API
+
+        Returns:
+            ListResult MCP output model
+
+        Usage Examples:
+            # Python
+            result = ListMapper.resp_to_list_result_output(resp)
+        """
+        return _LIST_RESULT_PROJECTION(resp)
+
+    @staticmethod
+    def resp_to_list_list_item_output(resp: ListResp) -> "ListListItem":
+        """
+        Map a list response straight to the MCP ListListItem, skipping the domain entity.
+
+        Args:
+            resp: ListResp DTO from the ClickUp API
+
+        Returns:
+            ListListItem MCP output model
+
+        Usage Examples:
+            # Python
+            items = [ListMapper.resp_to_list_list_item_output(l) for l in lists]
+        """
+        return _LIST_LIST_ITEM_PROJECTION(resp)
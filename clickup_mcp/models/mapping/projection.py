@@ -0,0 +1,118 @@
+"""
+Read-only projections from response DTOs straight to MCP output models.
+
+Read tools map every returned item. Going DTO → domain → output validates each item twice
+even though nothing is changed on the way. An `OutputProjection` is a table of per-field
+getters over the DTO, compiled against one output model (unrelated to the webhook event
+`Projection` of `clickup_mcp.web_server.event.projections`):
+
+- On first use it resolves the model and checks that the getters produce exactly the
+  model's fields, so a field added to an output model fails loudly instead of going missing.
+- Each call evaluates the getters and validates the output model from their values. That
+  is one cheap validation of already mapped values, faster here than `model_construct`.
+  With `fields`, only those getters run and the model's sparse counterpart is built
+  instead (see `SparseModel`).
+
+Projections are for outputs only; writes still go through the domain entities. Every
+projection is tested for equivalence with its mapper's DTO → domain → output path.
+
+Usage Examples:
+    # Python
+    TASK_NAME: OutputProjection[TaskResp, TaskListItem, SparseTaskListItem] = OutputProjection(
+        "clickup_mcp.mcp_server.models.outputs.task.TaskListItem",
+        {"id": lambda r: r.id, "name": lambda r: r.name, ...},
+    )
+    item = TASK_NAME(task_resp)
+    sparse = TASK_NAME(task_resp, fields=["name"])   # SparseTaskListItem
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Generic,
+    Mapping,
+    Never,
+    Optional,
+    TypeVar,
+    cast,
+    overload,
+)
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from clickup_mcp.mcp_server.models.outputs.common import SparseModel
+
+S = TypeVar("S")
+M = TypeVar("M", bound=BaseModel)
+# Sparse counterpart of M; models without one leave it out and never return it
+P = TypeVar("P", bound="SparseModel", default=Never)
+
+
+class OutputProjection(Generic[S, M, P]):
+    """Compiled DTO → output model mapping; `P` is the sparse counterpart of `M`, if it has one."""
+
+    def __init__(self, model: str, getters: Mapping[str, Callable[[S], Any]]) -> None:
+        """
+        Args:
+            model: Dotted path of the output model; imported on first use, since output
+                models live in the MCP server package, which imports the mappers
+            getters: Output field name -> function computing it from the DTO
+        """
+        self._path = model
+        self._getters = tuple(getters.items())
+        self._model: Optional[type[M]] = None
+        self._sparse: Optional[type[P]] = None
+
+    @property
+    def model(self) -> type[M]:
+        return self._model or self._compile()
+
+    def _compile(self) -> type[M]:
+        from clickup_mcp.mcp_server.models.outputs.common import sparse_model
+
+        module, _, name = self._path.rpartition(".")
+        model: type[M] = getattr(importlib.import_module(module), name)
+        fields = list(model.model_fields)
+        mismatch = set(fields).symmetric_difference(name for name, _ in self._getters)
+        if mismatch:
+            raise TypeError(f"Projection for {model.__name__} does not match its fields: {sorted(mismatch)}")
+        # Same key order as a validated instance, so dumps compare and serialize identically
+        self._getters = tuple(sorted(self._getters, key=lambda item: fields.index(item[0])))
+        self._sparse = cast(Optional[type[P]], sparse_model(model))
+        self._model = model
+        return model
+
+    @overload
+    def __call__(self, source: S, fields: None = None) -> M: ...
+
+    @overload
+    def __call__(self, source: S, fields: Collection[str]) -> P: ...
+
+    @overload
+    def __call__(self, source: S, fields: Optional[Collection[str]]) -> M | P: ...
+
+    def __call__(self, source: S, fields: Optional[Collection[str]] = None) -> M | P:
+        """
+        Build the output model for `source`.
+
+        Args:
+            source: Response DTO
+            fields: Sparse fieldset; None builds every field. `id` is always included.
+
+        Returns:
+            The output model instance, or its sparse counterpart when `fields` is given
+        """
+        model = self._model or self._compile()
+        if fields is not None:
+            if self._sparse is None:
+                raise TypeError(f"{model.__name__} has no sparse counterpart")
+            return self._sparse.select(
+                **{name: get(source) for name, get in self._getters if name == "id" or name in fields}
+            )
+        return model.model_validate({name: get(source) for name, get in self._getters})
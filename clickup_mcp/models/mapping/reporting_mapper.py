@@ -33,11 +33,25 @@ from typing import TYPE_CHECKING
 
 from clickup_mcp.models.domain.reporting import TimeReport
 from clickup_mcp.models.dto.reporting import TimeReportCreate, TimeReportResponse
+from clickup_mcp.models.mapping.projection import OutputProjection
 
 if TYPE_CHECKING:  # type hints only; avoid importing mcp_server package at runtime
     from clickup_mcp.mcp_server.models.inputs.reporting import (
         TimeReportCreateInput,
     )
+    from clickup_mcp.mcp_server.models.outputs.reporting import TimeReportListItem
+
+# Read-only TimeReportResponse -> list item projection; must agree with to_domain + to_time_report_list_item_output
+_TIME_REPORT_LIST_ITEM_PROJECTION: OutputProjection[TimeReportResponse, "TimeReportListItem"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.reporting.TimeReportListItem",
+    {
+        "id": lambda resp: resp.id,
+        "team_id": lambda resp: resp.team_id,
+        "start_date": lambda resp: resp.start_date,
+        "end_date": lambda resp: resp.end_date,
+        "total_duration": lambda resp: resp.total_duration,
+    },
+)
 
 
 class ReportingMapper:
@@ -329,3 +343,20 @@ class ReportingMapper:
             "end_date": report.end_date,
             "total_duration": report.total_duration,
         }
+
+    @staticmethod
+    def resp_to_time_report_list_item_output(resp: TimeReportResponse) -> "TimeReportListItem":
+        """
+        Map a time report response straight to the MCP TimeReportListItem, skipping the domain entity.
+
+        Args:
+            resp: TimeReportResponse DTO from the ClickUp API
+
+        Returns:
+            TimeReportListItem MCP output model
+
+        Usage Examples:
+            # Python
+            items = [ReportingMapper.resp_to_time_report_list_item_output(r) for r in resp.items]
+        """
+        return _TIME_REPORT_LIST_ITEM_PROJECTION(resp)
@@ -39,6 +39,7 @@ from typing import TYPE_CHECKING
 
 from clickup_mcp.models.domain.space import ClickUpSpace
 from clickup_mcp.models.dto.space import SpaceCreate, SpaceResp, SpaceUpdate
+from clickup_mcp.models.mapping.projection import OutputProjection
 
 if TYPE_CHECKING:
     from clickup_mcp.mcp_server.models.inputs.space import (
@@ -47,6 +48,21 @@ if TYPE_CHECKING:
     )
     from clickup_mcp.mcp_server.models.outputs.space import SpaceListItem, SpaceResult
 
+# Read-only SpaceResp -> output projections; must agree with to_domain + the *_output mappers
+_SPACE_RESULT_PROJECTION: OutputProjection[SpaceResp, "SpaceResult"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.space.SpaceResult",
+    {
+        "id": lambda resp: resp.id,
+        "name": lambda resp: resp.name,
+        "private": lambda resp: resp.private,
+        "team_id": lambda resp: resp.team_id,
+    },
+)
+_SPACE_LIST_ITEM_PROJECTION: OutputProjection[SpaceResp, "SpaceListItem"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.space.SpaceListItem",
+    {"id": lambda resp: resp.id, "name": lambda resp: resp.name},
+)
+
 
 class SpaceMapper:
     """
@@ -400,3 +416,37 @@ class SpaceMapper:
         from clickup_mcp.mcp_server.models.outputs.space import SpaceListItem
 
         return SpaceListItem(id=space.id, name=space.name)
+
+    @staticmethod
+    def resp_to_space_result_output(resp: SpaceResp) -> "SpaceResult":
+        """
+        Map a space response straight to the MCP SpaceResult, skipping the domain entity.
+
+        Args:
+            resp: SpaceResp DTO from the ClickUp API
+
+        Returns:
+            SpaceResult MCP output model
+
+        Usage Examples:
+            # Python
+            result = SpaceMapper.resp_to_space_result_output(resp)
+        """
+        return _SPACE_RESULT_PROJECTION(resp)
+
+    @staticmethod
+    def resp_to_space_list_item_output(resp: SpaceResp) -> "SpaceListItem":
+        """
+        Map a space response straight to the MCP SpaceListItem, skipping the domain entity.
+
+        Args:
+            resp: SpaceResp DTO from the ClickUp API
+
+        Returns:
+            SpaceListItem MCP output model
+
+        Usage Examples:
+            # Python
+            items = [SpaceMapper.resp_to_space_list_item_output(s) for s in spaces]
+        """
+        return _SPACE_LIST_ITEM_PROJECTION(resp)
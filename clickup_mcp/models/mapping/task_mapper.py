@@ -36,7 +36,7 @@ Usage Examples:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Collection, overload
 
 from clickup_mcp.models.domain.task import ClickUpTask
 from clickup_mcp.models.dto.task import TaskCreate, TaskResp, TaskUpdate
@@ -44,10 +44,17 @@ from clickup_mcp.models.mapping.priority import (
     normalize_priority_input,
     parse_priority_obj,
 )
+from clickup_mcp.models.mapping.projection import OutputProjection
 
 if TYPE_CHECKING:  # type hints only; avoid importing mcp_server package at runtime
     from clickup_mcp.mcp_server.models.inputs.task import TaskCreateInput, TaskUpdateInput
-    from clickup_mcp.mcp_server.models.outputs.task import TaskListItem, TaskResult
+    from clickup_mcp.mcp_server.models.outputs.task import (
+        PriorityInfo,
+        SparseTaskListItem,
+        SparseTaskResult,
+        TaskListItem,
+        TaskResult,
+    )
 
 from clickup_mcp.models.domain.task_priority import (
     domain_priority_label,
@@ -57,6 +64,65 @@ from clickup_mcp.models.domain.task_priority import (
 logger = logging.getLogger(__name__)
 
 
+def _priority_payload(priority: int | None, task_id: str | None) -> "PriorityInfo | None":
+    from clickup_mcp.mcp_server.models.outputs.task import PriorityInfo
+
+    if priority is None:
+        return None
+    try:
+        d = int_to_domain_priority(priority)
+        return PriorityInfo(value=priority, label=domain_priority_label(d))
+    except Exception as e:
+        logger.error(
+            "Failed to map priority to domain label",
+            extra={
+                "task_id": task_id,
+                "priority": priority,
+                "error": str(e),
+            },
+        )
+        return None
+
+
+# Output field -> value getter; sparse fieldsets evaluate only the requested getters
+_TASK_RESULT_FIELDS: dict[str, Callable[[ClickUpTask, str | None], Any]] = {
+    "id": lambda task, url: task.id,
+    "name": lambda task, url: task.name,
+    "status": lambda task, url: task.status,
+    "priority": lambda task, url: _priority_payload(task.priority, task.id),
+    "list_id": lambda task, url: task.list_id,
+    "assignee_ids": lambda task, url: list(task.assignee_ids),
+    "due_date_ms": lambda task, url: task.due_date,
+    "url": lambda task, url: url,
+    "parent_id": lambda task, url: task.parent_id,
+}
+_TASK_LIST_ITEM_FIELDS: dict[str, Callable[[ClickUpTask, str | None], Any]] = {
+    name: _TASK_RESULT_FIELDS[name] for name in ("id", "name", "status", "list_id", "url")
+}
+
+# Read-only TaskResp -> output projections; must agree with to_domain + the getters above
+_TASK_RESP_FIELDS: dict[str, Callable[[TaskResp], Any]] = {
+    "id": lambda resp: resp.id,
+    "name": lambda resp: resp.name,
+    "status": lambda resp: resp.status.status if resp.status and resp.status.status else None,
+    "priority": lambda resp: (
+        _priority_payload(parse_priority_obj(resp.priority), resp.id) if resp.priority is not None else None
+    ),
+    "list_id": lambda resp: resp.list.id if resp.list and resp.list.id else None,
+    "assignee_ids": lambda resp: [u.id for u in resp.assignees if u.id is not None],
+    "due_date_ms": lambda resp: resp.due_date,
+    "url": lambda resp: resp.url,
+    "parent_id": lambda resp: resp.parent,
+}
+_TASK_RESULT_PROJECTION: OutputProjection[TaskResp, "TaskResult", "SparseTaskResult"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.task.TaskResult", _TASK_RESP_FIELDS
+)
+_TASK_LIST_ITEM_PROJECTION: OutputProjection[TaskResp, "TaskListItem", "SparseTaskListItem"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.task.TaskListItem",
+    {name: _TASK_RESP_FIELDS[name] for name in ("id", "name", "status", "list_id", "url")},
+)
+
+
 class TaskMapper:
     """
     Static mapper for converting between Task DTOs and domain entity.
@@ -427,7 +493,9 @@ class TaskMapper:
         )
 
     @staticmethod
-    def to_task_result_output(task: ClickUpTask, url: str | None = None) -> "TaskResult":
+    def to_task_result_output(
+        task: ClickUpTask, url: str | None = None, fields: Collection[str] | None = None
+    ) -> "TaskResult | SparseTaskResult":
         """
         Map Task domain entity to MCP TaskResult output.
 
@@ -439,13 +507,16 @@ class TaskMapper:
         - Converts priority integer to priority payload with label
         - Handles priority mapping errors gracefully with logging
         - Includes optional URL for task access
+        - With `fields`, only those fields (plus `id`) are computed and serialized;
+          e.g., the priority label lookup is skipped unless `priority` is requested
 
         Args:
             task: ClickUpTask domain entity to convert
             url: Optional URL to the task (e.g., ClickUp task URL)
+            fields: Optional sparse fieldset; None returns every field
 
         Returns:
-            TaskResult MCP output model with:
+            TaskResult MCP output model (a SparseTaskResult when `fields` is given) with:
                 - id: From task.id
                 - name: From task.name
                 - status: From task.status
@@ -482,51 +553,38 @@ class TaskMapper:
             # Python - Return from MCP tool
             return mcp_output
         """
-        from clickup_mcp.mcp_server.models.outputs.task import TaskResult
-
-        prio_payload = None
-        if task.priority is not None:
-            try:
-                d = int_to_domain_priority(task.priority)
-                prio_payload = {"value": task.priority, "label": domain_priority_label(d)}
-            except Exception as e:
-                logger.error(
-                    "Failed to map priority to domain label",
-                    extra={
-                        "task_id": getattr(task, "id", None),
-                        "priority": task.priority,
-                        "error": str(e),
-                    },
-                )
-                prio_payload = None
-
-        return TaskResult(
-            id=task.id,
-            name=task.name,
-            status=task.status,
-            priority=prio_payload,
-            list_id=task.list_id,
-            assignee_ids=list(task.assignee_ids),
-            due_date_ms=task.due_date,
-            url=url,
-            parent_id=task.parent_id,
+        from clickup_mcp.mcp_server.models.outputs.common import selected_fields
+        from clickup_mcp.mcp_server.models.outputs.task import (
+            SparseTaskResult,
+            TaskResult,
+        )
+
+        selected = selected_fields(fields)
+        if selected is None:
+            return TaskResult(**{name: get(task, url) for name, get in _TASK_RESULT_FIELDS.items()})
+        return SparseTaskResult.select(
+            **{name: get(task, url) for name, get in _TASK_RESULT_FIELDS.items() if name in selected}
         )
 
     @staticmethod
-    def to_task_list_item_output(task: ClickUpTask, url: str | None = None) -> "TaskListItem":
+    def to_task_list_item_output(
+        task: ClickUpTask, url: str | None = None, fields: Collection[str] | None = None
+    ) -> "TaskListItem | SparseTaskListItem":
         """
         Map Task domain entity to MCP TaskListItem output.
 
         Converts a domain entity to the MCP output format for list responses.
         This is a lightweight representation used when returning multiple tasks
-        in a list (get_all operation).
+        in a list (get_all operation). With `fields`, only those fields (plus `id`)
+        are computed and serialized.
 
         Args:
             task: ClickUpTask domain entity to convert
             url: Optional URL to the task (e.g., ClickUp task URL)
+            fields: Optional sparse fieldset; None returns every field
 
         Returns:
-            TaskListItem MCP output model with:
+            TaskListItem MCP output model (a SparseTaskListItem when `fields` is given) with:
                 - id: From task.id
                 - name: From task.name
                 - status: From task.status
@@ -557,12 +615,68 @@ class TaskMapper:
             tasks = [TaskMapper.to_task_list_item_output(t) for t in domain_tasks]
             return tasks
         """
-        from clickup_mcp.mcp_server.models.outputs.task import TaskListItem
+        from clickup_mcp.mcp_server.models.outputs.common import selected_fields
+        from clickup_mcp.mcp_server.models.outputs.task import (
+            SparseTaskListItem,
+            TaskListItem,
+        )
 
-        return TaskListItem(
-            id=task.id,
-            name=task.name,
-            status=task.status,
-            list_id=task.list_id,
-            url=url,
+        selected = selected_fields(fields)
+        if selected is None:
+            return TaskListItem(**{name: get(task, url) for name, get in _TASK_LIST_ITEM_FIELDS.items()})
+        return SparseTaskListItem.select(
+            **{name: get(task, url) for name, get in _TASK_LIST_ITEM_FIELDS.items() if name in selected}
         )
+
+    @overload
+    @staticmethod
+    def resp_to_task_result_output(resp: TaskResp, fields: None = None) -> "TaskResult": ...
+
+    @overload
+    @staticmethod
+    def resp_to_task_result_output(
+        resp: TaskResp, fields: Collection[str] | None
+    ) -> "TaskResult | SparseTaskResult": ...
+
+    @staticmethod
+    def resp_to_task_result_output(
+        resp: TaskResp, fields: Collection[str] | None = None
+    ) -> "TaskResult | SparseTaskResult":
+        """
+        Map a task response straight to the MCP TaskResult, skipping the domain entity.
+
+        Produces the same output as `to_task_result_output(to_domain(resp), url=resp.url)`
+        without validating the task twice; use it for read paths.
+
+        Args:
+            resp: TaskResp DTO from the ClickUp API
+            fields: Optional sparse fieldset (`id` is always included)
+
+        Returns:
+            TaskResult MCP output model, or a SparseTaskResult when `fields` is given
+
+        Usage Examples:
+            # Python - Map a fetched task for a read tool
+            result = TaskMapper.resp_to_task_result_output(task_resp, fields=["name", "status"])
+        """
+        return _TASK_RESULT_PROJECTION(resp, fields)
+
+    @staticmethod
+    def resp_to_task_list_item_output(
+        resp: TaskResp, fields: Collection[str] | None = None
+    ) -> "TaskListItem | SparseTaskListItem":
+        """
+        Map a task response straight to the MCP TaskListItem, skipping the domain entity.
+
+        Args:
+            resp: TaskResp DTO from the ClickUp API
+            fields: Optional sparse fieldset (`id` is always included)
+
+        Returns:
+            TaskListItem MCP output model, or a SparseTaskListItem when `fields` is given
+
+        Usage Examples:
+            # Python - Map a page of tasks for task.list_in_list
+            items = [TaskMapper.resp_to_task_list_item_output(t) for t in tasks]
+        """
+        return _TASK_LIST_ITEM_PROJECTION(resp, fields)
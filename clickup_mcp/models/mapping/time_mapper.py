@@ -29,7 +29,7 @@ Usage Examples:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Collection
 
 from clickup_mcp.models.domain.time import TimeEntry
 from clickup_mcp.models.dto.time import (
@@ -37,12 +37,48 @@ from clickup_mcp.models.dto.time import (
     TimeEntryResponse,
     TimeEntryUpdate,
 )
+from clickup_mcp.models.mapping.projection import OutputProjection
 
 if TYPE_CHECKING:  # type hints only; avoid importing mcp_server package at runtime
     from clickup_mcp.mcp_server.models.inputs.time import (
         TimeEntryCreateInput,
         TimeEntryUpdateInput,
     )
+    from clickup_mcp.mcp_server.models.outputs.time import (
+        SparseTimeEntryListItem,
+        TimeEntryListItem,
+        TimeEntryResult,
+    )
+
+# List item field -> value getter; sparse fieldsets evaluate only the requested getters
+_TIME_ENTRY_LIST_ITEM_FIELDS: dict[str, Callable[[TimeEntry], Any]] = {
+    "id": lambda entry: entry.entry_id,
+    "task_id": lambda entry: entry.task_id,
+    "description": lambda entry: entry.description,
+    "duration": lambda entry: entry.duration,
+}
+
+# Read-only TimeEntryResponse -> output projections; must agree with to_domain + the outputs below
+_TIME_ENTRY_RESP_FIELDS: dict[str, Callable[[TimeEntryResponse], Any]] = {
+    "id": lambda resp: resp.id,
+    "task_id": lambda resp: resp.task_id,
+    "user_id": lambda resp: str(resp.user_id),
+    "team_id": lambda resp: resp.team_id,
+    "description": lambda resp: resp.description,
+    "start": lambda resp: resp.start,
+    "end": lambda resp: resp.end,
+    "duration": lambda resp: resp.duration,
+    "billable": lambda resp: resp.billable,
+}
+_TIME_ENTRY_RESULT_PROJECTION: OutputProjection[TimeEntryResponse, "TimeEntryResult"] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.time.TimeEntryResult", _TIME_ENTRY_RESP_FIELDS
+)
+_TIME_ENTRY_LIST_ITEM_PROJECTION: OutputProjection[
+    TimeEntryResponse, "TimeEntryListItem", "SparseTimeEntryListItem"
+] = OutputProjection(
+    "clickup_mcp.mcp_server.models.outputs.time.TimeEntryListItem",
+    {name: _TIME_ENTRY_RESP_FIELDS[name] for name in _TIME_ENTRY_LIST_ITEM_FIELDS},
+)
 
 
 class TimeMapper:
@@ -412,16 +448,17 @@ class TimeMapper:
         }
 
     @staticmethod
-    def to_time_entry_list_item_output(time_entry: TimeEntry) -> dict:
+    def to_time_entry_list_item_output(time_entry: TimeEntry, fields: Collection[str] | None = None) -> dict:
         """
         Map TimeEntry domain entity to MCP time entry list item output.
 
         Converts a domain entity to the MCP output format for list responses.
         This is a lightweight representation used when returning multiple time entries
-        in a list.
+        in a list. With `fields`, only those keys (plus `id`) are included.
 
         Args:
             time_entry: TimeEntry domain entity to convert
+            fields: Optional sparse fieldset; None returns every field
 
         Returns:
             Dictionary with time entry list item data:
@@ -450,9 +487,52 @@ class TimeMapper:
             entries = [TimeMapper.to_time_entry_list_item_output(t) for t in domain_entries]
             return entries
         """
+        if fields is not None:
+            return {
+                name: get(time_entry)
+                for name, get in _TIME_ENTRY_LIST_ITEM_FIELDS.items()
+                if name == "id" or name in fields
+            }
         return {
             "id": time_entry.entry_id,
             "task_id": time_entry.task_id,
             "description": time_entry.description,
             "duration": time_entry.duration,
         }
+
+    @staticmethod
+    def resp_to_time_entry_result_output(resp: TimeEntryResponse) -> "TimeEntryResult":
+        """
+        Map a time entry response straight to the MCP TimeEntryResult, skipping the domain entity.
+
+        Args:
+            resp: TimeEntryResponse DTO from the ClickUp API
+
+        Returns:
+            TimeEntryResult MCP output model
+
+        Usage Examples:
+            # Python
+            result = TimeMapper.resp_to_time_entry_result_output(resp)
+        """
+        return _TIME_ENTRY_RESULT_PROJECTION(resp)
+
+    @staticmethod
+    def resp_to_time_entry_list_item_output(
+        resp: TimeEntryResponse, fields: Collection[str] | None = None
+    ) -> "TimeEntryListItem | SparseTimeEntryListItem":
+        """
+        Map a time entry response straight to the MCP TimeEntryListItem, skipping the domain entity.
+
+        Args:
+            resp: TimeEntryResponse DTO from the ClickUp API
+            fields: Optional sparse fieldset (`id` is always included)
+
+        Returns:
+            TimeEntryListItem MCP output model, or a SparseTimeEntryListItem when `fields` is given
+
+        Usage Examples:
+            # Python
+            items = [TimeMapper.resp_to_time_entry_list_item_output(e) for e in resp.items]
+        """
+        return _TIME_ENTRY_LIST_ITEM_PROJECTION(resp, fields)
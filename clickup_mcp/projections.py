@@ -0,0 +1,71 @@
+"""
+Query side of the webhook-fed projections.
+
+Design:
+- The web server maintains projections from webhook events
+  (`clickup_mcp.web_server.event.projections`) and publishes its store here once they
+  are installed. The `projection.*` MCP tools read the store from here, so the MCP server
+  does not import the web server's event package.
+- The store is only seen through two small protocols: `ProjectionStore` (lookup by name
+  and freshness counters) and `TaskCountsReader` (the queries of the task projection).
+
+Usage Examples:
+    from clickup_mcp.projections import TASK_PROJECTION, get_projection_store
+
+    store = get_projection_store()
+    if store is not None:
+        store.get(TASK_PROJECTION).status_counts("list_1")   # {"to do": 3}
+        store.status(TASK_PROJECTION).events_applied
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Protocol
+
+# Name of the built-in task projection
+TASK_PROJECTION = "tasks"
+
+
+@dataclass
+class ProjectionStatus:
+    """
+    Freshness of a projection.
+
+    Attributes:
+        events_applied: Events folded in since start (checkpoint restore included)
+        last_event_ms: Receive time (epoch ms) of the newest event applied, if any
+    """
+
+    events_applied: int = 0
+    last_event_ms: Optional[int] = None
+
+
+class TaskCountsReader(Protocol):
+    """Queries answered by the task projection."""
+
+    def status_counts(self, list_id: str) -> Dict[str, int]: ...
+
+    def open_tasks_for(self, assignee_id: str) -> int: ...
+
+    def workloads(self) -> Dict[str, int]: ...
+
+
+class ProjectionStore(Protocol):
+    """Projections by name, with their freshness."""
+
+    def get(self, name: str) -> Any: ...
+
+    def status(self, name: str) -> ProjectionStatus: ...
+
+
+_store: Optional[ProjectionStore] = None
+
+
+def publish_projection_store(store: Optional[ProjectionStore]) -> None:
+    """Make `store` the process-wide projection store; None withdraws it."""
+    global _store
+    _store = store
+
+
+def get_projection_store() -> Optional[ProjectionStore]:
+    """Return the published projection store, or None when projections are disabled."""
+    return _store
@@ -198,6 +198,15 @@ type QueueBackend = Literal["kafka", "rabbitmq", "redis", "sqs"]
 type EventDeliveryStatus = Literal["pending", "delivered", "failed", "retry"]
 """Event delivery status."""
 
+type WebhookPartitionKeyStrategy = Literal["entity", "container", "topic"]
+"""Strategy used to derive message-queue partition keys from webhook events."""
+
+type WebhookHandlerExecution = Literal["thread", "inline", "process"]
+"""Where synchronous webhook handlers run: thread pool, event loop, or process pool."""
+
+type DurableQueueSynchronous = Literal["full", "normal"]
+"""SQLite synchronous level of the local-durable queue: fsync every commit, or only at checkpoints."""
+
 # ============================================================================
 # Configuration Types
 # ============================================================================
@@ -696,6 +705,9 @@ __all__ = [
     "EventSinkType",
     "QueueBackend",
     "EventDeliveryStatus",
+    "WebhookPartitionKeyStrategy",
+    "WebhookHandlerExecution",
+    "DurableQueueSynchronous",
     # Configuration Types
     "ServerHost",
     "ServerPort",
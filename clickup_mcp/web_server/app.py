@@ -51,15 +51,21 @@ from typing import Optional
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from clickup_mcp._base import BaseServerFactory
 from clickup_mcp.client import ClickUpAPIClientFactory, get_api_token
 from clickup_mcp.config import get_settings
 from clickup_mcp.mcp_server.app import mcp_factory
+from clickup_mcp.mcp_server.tool_cache import invalidate_for_event
+from clickup_mcp.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from clickup_mcp.metrics import get_metrics_registry
 from clickup_mcp.models.cli import MCPTransportType, ServerConfig
 from clickup_mcp.models.dto.health_check import HealthyCheckResponseDto
 from clickup_mcp.web_server.event.bootstrap import import_handler_modules_from_env
+from clickup_mcp.web_server.event.projections import install_projections
+from clickup_mcp.web_server.event.sink import dispatches_locally
+from clickup_mcp.web_server.event.webhook import add_ingress_observer
 from clickup_mcp.web_server.event.webhook import router as clickup_webhook_router
 
 _WEB_SERVER_INSTANCE: Optional[FastAPI] = None
@@ -311,6 +317,17 @@ def create_app(
     # Import user handler modules from env if provided
     import_handler_modules_from_env(server_config.env_file if server_config else None)
 
+    # Feed webhook projections (queried by projection.* MCP tools) when enabled. With a
+    # queue backend the consumer process dispatches events and maintains them instead
+    settings = get_settings(server_config.env_file if server_config else None)
+    if settings.clickup_webhook_projections_enabled and dispatches_locally():
+        install_projections()
+
+    # Drop cached read-only tool results when webhooks report changes; an observer rather
+    # than a handler, so it also works when events are queued and subscribes to nothing
+    if settings.mcp_tool_cache_enabled:
+        add_ingress_observer(invalidate_for_event)
+
     # Root endpoint for health checks
     @web.get("/health", response_class=JSONResponse)
     async def root() -> HealthyCheckResponseDto:
@@ -338,4 +355,17 @@ def create_app(
         """
         return HealthyCheckResponseDto()
 
+    if settings.mcp_metrics_enabled:
+
+        @web.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+        async def metrics() -> PlainTextResponse:
+            """
+            Tool and upstream request metrics in the Prometheus text format.
+
+            Usage Examples:
+                # curl - Scrape metrics
+                curl http://localhost:8000/metrics
+            """
+            return PlainTextResponse(get_metrics_registry().render(), media_type=METRICS_CONTENT_TYPE)
+
     return web
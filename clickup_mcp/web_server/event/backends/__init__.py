@@ -0,0 +1,31 @@
+"""
+Built-in message-queue backends for the ClickUp webhook pipeline.
+
+Provides:
+- `InMemoryQueueBackend`: process-local backend compatible with the `abe`
+  `MessageQueueBackend` protocol, used by tests and single-process setups.
+- `LocalDurableQueueBackend`: SQLite (WAL) backend with group commit and at-least-once
+  delivery, selected with `QUEUE_BACKEND=local-durable`.
+
+Usage:
+    from clickup_mcp.web_server.event.backends import InMemoryQueueBackend
+
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend)
+"""
+
+from .durable import DurableMessage, DurableQueueStats, LocalDurableQueueBackend
+from .memory import InMemoryQueueBackend
+
+# Backends shipped with this package, usable as QUEUE_BACKEND without an abe plugin
+BUILTIN_BACKENDS = {
+    "local-durable": LocalDurableQueueBackend,
+}
+
+__all__ = [
+    "BUILTIN_BACKENDS",
+    "DurableMessage",
+    "DurableQueueStats",
+    "InMemoryQueueBackend",
+    "LocalDurableQueueBackend",
+]
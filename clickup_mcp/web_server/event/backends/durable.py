@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+"""
+Disk-backed local message-queue backend (`QUEUE_BACKEND=local-durable`).
+
+Design:
+- Implements the `abe` `MessageQueueBackend` protocol (`publish`, `consume`, `from_env`)
+  plus the optional `publish_batch`, `consume_batch`, `ack` and `nack` extensions used by
+  `QueueEventSink` and `ClickUpWebhookConsumer`, on top of one SQLite database in WAL mode.
+  Single-node deployments get durable buffering without running a broker: the web server
+  publishes, `clickup-webhook-consumer --queue-backend local-durable` consumes.
+- Group commit: every database call runs on one writer thread. Batches published while a
+  commit is in progress are queued and written together in the next transaction, so one
+  fsync (`synchronous=FULL`) covers all of them. `publish_batch` returns once its messages
+  are on disk; the event loop never blocks on the disk.
+- Payloads are stored as the tagged bytes of `codec.pack_envelope` (MessagePack when
+  installed) and unpacked by the consumer path.
+- Delivery is at-least-once. Consuming claims messages by setting a visibility deadline;
+  `ack` deletes them and `nack` makes them visible again after `nack_delay`. Messages not
+  acknowledged before `visibility_timeout` (consumer crashed) are delivered again.
+  Acknowledgements are applied in bulk with the next database call; a lost acknowledgement
+  only causes a redelivery. Messages delivered `max_deliveries` times are no longer handed
+  out and stay in the database as dead (see `stats()`).
+- There is a single implicit consumer group. Claims are atomic, so several consumer
+  processes can share the database, but per-entity order is only kept with one consumer
+  process.
+
+Usage Examples:
+    from clickup_mcp.web_server.event.backends import LocalDurableQueueBackend
+
+    backend = LocalDurableQueueBackend("var/clickup-webhooks.db")
+    await backend.publish_batch([("task:abc", envelope)])
+
+    async for batch in backend.consume_batch(max_messages=64):
+        for message in batch:
+            ...
+            await backend.ack(message)
+
+Environment:
+- `CLICKUP_WEBHOOK_DURABLE_QUEUE_PATH`: database file (default `clickup_webhook_queue.db`)
+- `CLICKUP_WEBHOOK_DURABLE_QUEUE_SYNCHRONOUS`: `full` (fsync per commit, default) or
+  `normal` (survives process crashes, may lose the last commits on power loss)
+- `CLICKUP_WEBHOOK_DURABLE_QUEUE_VISIBILITY_TIMEOUT`: seconds before an unacknowledged
+  message is delivered again (default 300)
+- `CLICKUP_WEBHOOK_DURABLE_QUEUE_MAX_DELIVERIES`: deliveries before a message is dead (default 5)
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from clickup_mcp.types import DurableQueueSynchronous
+
+from ..codec import pack_envelope, unpack_envelope
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    enqueued_ms INTEGER NOT NULL,
+    deliveries INTEGER NOT NULL DEFAULT 0,
+    visible_ms INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS messages_visible ON messages (visible_ms, id);
+"""
+
+_CLAIM = """
+UPDATE messages SET deliveries = deliveries + 1, visible_ms = ?
+WHERE id IN (
+    SELECT id FROM messages WHERE visible_ms <= ? AND deliveries < ? ORDER BY id LIMIT ?
+)
+RETURNING id, key, payload
+"""
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class DurableMessage(dict):
+    """A consumed message payload that remembers its queue position for `ack`/`nack`."""
+
+    __slots__ = ("message_id", "key")
+
+    def __init__(self, message_id: int, key: str, payload: Mapping[str, Any]) -> None:
+        super().__init__(payload)
+        self.message_id = message_id
+        self.key = key
+
+
+@dataclass
+class DurableQueueStats:
+    """
+    Message counts of a `LocalDurableQueueBackend` database.
+
+    Attributes:
+        ready: Messages waiting to be delivered
+        in_flight: Messages delivered and not yet acknowledged
+        dead: Messages delivered `max_deliveries` times without an acknowledgement
+        commits: Publish transactions written by this instance (one fsync each)
+        published: Messages written by this instance
+    """
+
+    ready: int = 0
+    in_flight: int = 0
+    dead: int = 0
+    commits: int = 0
+    published: int = 0
+
+
+class LocalDurableQueueBackend:
+    """
+    SQLite-backed queue with group commit and at-least-once delivery.
+
+    Args:
+        path: Database file (parent directories are created)
+        synchronous: SQLite `synchronous` level, `full` or `normal`
+        visibility_timeout: Seconds a delivered message stays hidden before redelivery
+        max_deliveries: Deliveries after which a message is no longer handed out
+        nack_delay: Seconds before a nacked message is visible again
+        poll_interval: Seconds between checks for messages published by other processes
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        synchronous: DurableQueueSynchronous = "full",
+        visibility_timeout: float = 300.0,
+        max_deliveries: int = 5,
+        nack_delay: float = 1.0,
+        poll_interval: float = 0.2,
+    ) -> None:
+        if max_deliveries < 1:
+            raise ValueError("max_deliveries must be at least 1")
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._visibility_ms = int(visibility_timeout * 1000)
+        self._max_deliveries = max_deliveries
+        self._nack_delay_ms = int(nack_delay * 1000)
+        self._poll_interval = poll_interval
+        # All database work runs on this thread; it is also what serializes commits
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clickup-durable-queue")
+        self._conn = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[List[Tuple[str, Mapping[str, Any]]], asyncio.Future[None]]] = []
+        self._committing = False
+        self._acked: List[int] = []
+        self._nacked: List[int] = []
+        self._wakeup: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+        self._closed = False
+        self._commits = 0
+        self._published = 0
+
+    @classmethod
+    def from_env(cls) -> "LocalDurableQueueBackend":
+        """Create a backend configured by the `CLICKUP_WEBHOOK_DURABLE_QUEUE_*` settings."""
+        from clickup_mcp.config import get_settings
+
+        settings = get_settings()
+        return cls(
+            settings.clickup_webhook_durable_queue_path,
+            synchronous=settings.clickup_webhook_durable_queue_synchronous,
+            visibility_timeout=settings.clickup_webhook_durable_queue_visibility_timeout,
+            max_deliveries=settings.clickup_webhook_durable_queue_max_deliveries,
+        )
+
+    async def publish(self, key: str, payload: Dict[str, Any]) -> None:
+        """Durably enqueue a single message."""
+        await self.publish_batch([(key, payload)])
+
+    async def publish_batch(self, messages: Sequence[Tuple[str, Mapping[str, Any]]]) -> None:
+        """
+        Durably enqueue several `(key, payload)` messages.
+
+        Returns once the transaction holding them is committed. Batches published
+        concurrently share one transaction.
+        """
+        if self._closed:
+            raise RuntimeError("Durable queue backend is closed")
+        loop = asyncio.get_running_loop()
+        done: asyncio.Future[None] = loop.create_future()
+        with self._lock:
+            self._pending.append((list(messages), done))
+            start = not self._committing
+            self._committing = True
+        if start:
+            self._executor.submit(self._commit_pending)
+        await done
+        wakeup = self._wakeup
+        if wakeup is not None and wakeup[0] is loop:
+            wakeup[1].set()
+
+    async def consume(self, *, group: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield messages in publish order until `close()` is called.
+
+        Args:
+            group: Ignored; the backend has a single implicit group
+        """
+        async for batch in self.consume_batch(group=group, max_messages=1):
+            for message in batch:
+                yield message
+
+    async def consume_batch(
+        self, *, group: Optional[str] = None, max_messages: int = 64
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield batches of up to `max_messages` messages until `close()` is called.
+
+        Args:
+            group: Ignored; the backend has a single implicit group
+            max_messages: Upper bound of messages claimed per batch
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        self._wakeup = (loop, event)
+        while not self._closed:
+            event.clear()
+            try:
+                batch = await loop.run_in_executor(self._executor, self._claim, max_messages)
+            except RuntimeError:
+                if self._closed:  # executor shut down while claiming
+                    return
+                raise
+            if batch:
+                yield batch
+                continue
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def ack(self, message: DurableMessage) -> None:
+        """Mark a consumed message done; it is deleted with the next database call."""
+        with self._lock:
+            self._acked.append(message.message_id)
+
+    async def nack(self, message: DurableMessage) -> None:
+        """Return a consumed message to the queue after `nack_delay`."""
+        with self._lock:
+            self._nacked.append(message.message_id)
+
+    async def stats(self) -> DurableQueueStats:
+        """Count ready, in-flight and dead messages."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._stats)
+
+    def close(self) -> None:
+        """Stop consumers, apply outstanding acknowledgements and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        wakeup = self._wakeup
+        if wakeup is not None:
+            wakeup[0].call_soon_threadsafe(wakeup[1].set)
+        self._executor.submit(self._shutdown)
+        self._executor.shutdown(wait=True)
+
+    # Writer thread ---------------------------------------------------------------
+
+    def _commit_pending(self) -> None:
+        while True:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                if not pending:
+                    self._committing = False
+                    return
+            error: Optional[BaseException] = None
+            try:
+                now = _now_ms()
+                rows = [(key, pack_envelope(payload), now) for messages, _ in pending for key, payload in messages]
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._settle(now)
+                    self._conn.executemany("INSERT INTO messages (key, payload, enqueued_ms) VALUES (?, ?, ?)", rows)
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+                self._commits += 1
+                self._published += len(rows)
+            except BaseException as exc:  # noqa: BLE001 - reported to every waiting publisher
+                error = exc
+            for _, done in pending:
+                done.get_loop().call_soon_threadsafe(_resolve, done, error)
+
+    def _claim(self, max_messages: int) -> List[Dict[str, Any]]:
+        now = _now_ms()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._settle(now)
+            params = (now + self._visibility_ms, now, self._max_deliveries, max_messages)
+            rows = self._conn.execute(_CLAIM, params).fetchall()
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        messages: List[Dict[str, Any]] = []
+        for message_id, key, payload in sorted(rows):
+            try:
+                messages.append(DurableMessage(message_id, key, unpack_envelope(payload)))
+            except Exception:  # noqa: BLE001 - keep the row for inspection, deliver the rest
+                logger.exception("Undecodable message %d in durable webhook queue %s", message_id, self._path)
+        return messages
+
+    def _settle(self, now: int) -> None:
+        """Apply buffered acks and nacks inside the caller's transaction."""
+        with self._lock:
+            acked, self._acked = self._acked, []
+            nacked, self._nacked = self._nacked, []
+        if acked:
+            self._conn.executemany("DELETE FROM messages WHERE id = ?", [(i,) for i in acked])
+        if nacked:
+            visible = now + self._nack_delay_ms
+            self._conn.executemany("UPDATE messages SET visible_ms = ? WHERE id = ?", [(visible, i) for i in nacked])
+
+    def _stats(self) -> DurableQueueStats:
+        now = _now_ms()
+        ready, in_flight, dead = self._conn.execute(
+            """
+            SELECT
+                COALESCE(SUM(deliveries < :max AND visible_ms <= :now), 0),
+                COALESCE(SUM(visible_ms > :now), 0),
+                COALESCE(SUM(deliveries >= :max AND visible_ms <= :now), 0)
+            FROM messages
+            """,
+            {"max": self._max_deliveries, "now": now},
+        ).fetchone()
+        return DurableQueueStats(
+            ready=ready, in_flight=in_flight, dead=dead, commits=self._commits, published=self._published
+        )
+
+    def _shutdown(self) -> None:
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._settle(_now_ms())
+            self._conn.execute("COMMIT")
+        finally:
+            self._conn.close()
+
+
+def _resolve(done: asyncio.Future[None], error: Optional[BaseException]) -> None:
+    if done.cancelled():
+        return
+    if error is None:
+        done.set_result(None)
+    else:
+        done.set_exception(error)
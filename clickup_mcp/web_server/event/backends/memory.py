@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+"""
+In-memory message-queue backend for the ClickUp webhook pipeline.
+
+Design:
+- Implements the `abe` `MessageQueueBackend` protocol (`publish`, `consume`, `from_env`)
+  plus the optional `publish_batch` extension used by `QueueEventSink`.
+- Unlike `abe`'s `MemoryBackend`, each instance owns its own queue, keeps a record of
+  every publish call and can be closed so `consume()` terminates. This makes it suitable
+  for deterministic tests of the producer and consumer paths.
+
+Usage Examples:
+    backend = InMemoryQueueBackend()
+    await backend.publish(key="clickup.webhooks", payload={"type": "taskCreated"})
+    backend.close()
+
+    async for message in backend.consume(group="clickup.webhooks"):
+        ...
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+_CLOSED = object()
+
+
+class InMemoryQueueBackend:
+    """
+    Process-local queue backend that records what was published.
+
+    Attributes:
+        published: `(key, payload)` tuples in publish order
+        publish_calls: Number of broker round trips (one per `publish`/`publish_batch` call)
+    """
+
+    def __init__(self) -> None:
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.published: List[Tuple[str, Dict[str, Any]]] = []
+        self.publish_calls: int = 0
+
+    @classmethod
+    def from_env(cls) -> "InMemoryQueueBackend":
+        """Create a backend instance; no environment configuration is required."""
+        return cls()
+
+    async def publish(self, key: str, payload: Dict[str, Any]) -> None:
+        """Enqueue a single message."""
+        self.publish_calls += 1
+        self._put(key, payload)
+
+    async def publish_batch(self, messages: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """Enqueue several `(key, payload)` messages in one round trip."""
+        self.publish_calls += 1
+        for key, payload in messages:
+            self._put(key, payload)
+
+    async def consume(self, *, group: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield payloads in publish order until `close()` is called.
+
+        Args:
+            group: Ignored; the in-memory backend has a single implicit group
+        """
+        while True:
+            item = await self._queue.get()
+            if item is _CLOSED:
+                return
+            yield item[1]
+
+    def close(self) -> None:
+        """Stop consumers once the already-published messages are drained."""
+        self._queue.put_nowait(_CLOSED)
+
+    def _put(self, key: str, payload: Dict[str, Any]) -> None:
+        self.published.append((key, payload))
+        self._queue.put_nowait((key, payload))
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+"""
+Compact, versioned wire format for queued ClickUp webhook events.
+
+Design:
+- Version 2 envelope (`to_wire` / `from_wire`) is a flat dict with short keys:
+  `{"v": 2, "t": <event type>, "ts": <epoch ms>, "id": <delivery id>, "h": {...}, "b": <body>}`.
+  Compared with the version 1 dict it keeps one copy of the body (no `raw`), an integer
+  timestamp instead of an ISO string, and only allowlisted headers.
+- `encode_event` / `decode_event` pack the same envelope into bytes for byte-oriented
+  backends. MessagePack is used when the optional `msgpack` package is installed
+  (`pip install clickup-mcp-server[queue]`); otherwise compact JSON is used. The first
+  byte tags the format so readers decode either one.
+- `from_wire` still accepts version 1 messages so producers and consumers can be
+  upgraded independently.
+
+Usage Examples:
+    from clickup_mcp.web_server.event.codec import decode_event, encode_event
+
+    data = encode_event(event)          # bytes
+    restored = decode_event(data)       # ClickUpWebhookEvent
+
+See also:
+- `clickup_mcp.web_server.event.mq.serialize_event` – dict payload handed to `abe` backends
+- `scripts/benchmarks/webhook_codec.py` – size and speed comparison with version 1
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .models import ClickUpWebhookEvent, ClickUpWebhookEventType
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without the optional extra
+    msgpack = None
+
+WIRE_VERSION = 2
+
+# Headers worth carrying to consumers (signature verification and tracing)
+DEFAULT_HEADER_ALLOWLIST: frozenset[str] = frozenset({"x-signature", "x-request-id", "content-type"})
+
+_MSGPACK_TAG = b"\x01"
+_JSON_TAG = b"\x02"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS = timedelta(milliseconds=1)
+
+
+def filter_headers(headers: Mapping[str, str], allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST) -> Dict[str, str]:
+    """
+    Keep only allowlisted headers, with lower-cased names.
+
+    Args:
+        headers: Incoming header mapping (any case)
+        allowlist: Lower-case header names to keep
+
+    Returns:
+        Dict of the kept headers
+    """
+    allowed = allowlist if isinstance(allowlist, (set, frozenset)) else frozenset(allowlist)
+    kept: Dict[str, str] = {}
+    for name, value in headers.items():
+        lowered = name.lower()
+        if lowered in allowed:
+            kept[lowered] = value
+    return kept
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    # Ingress timestamps are naive UTC; treat them as such rather than as local time
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MS
+
+
+def _from_epoch_ms(value: int) -> datetime:
+    # Naive UTC, matching what the webhook ingress produces
+    return (_EPOCH + value * _MS).replace(tzinfo=None)
+
+
+def to_wire(event: ClickUpWebhookEvent, header_allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST) -> Dict[str, Any]:
+    """
+    Build the version 2 envelope for an event.
+
+    Args:
+        event: Normalized webhook event
+        header_allowlist: Lower-case header names to carry
+
+    Returns:
+        Dict envelope with primitives only
+    """
+    return {
+        "v": WIRE_VERSION,
+        "t": event.type.value,
+        "ts": _to_epoch_ms(event.received_at),
+        "id": event.delivery_id,
+        "h": filter_headers(event.headers, header_allowlist),
+        "b": event.body,
+    }
+
+
+def from_wire(message: Mapping[str, Any]) -> ClickUpWebhookEvent:
+    """
+    Rebuild an event from a version 2 envelope or a legacy version 1 dict.
+
+    Args:
+        message: Envelope produced by `to_wire` (or the version 1 `serialize_event`)
+
+    Returns:
+        ClickUpWebhookEvent whose `raw` is the same object as `body`
+
+    Raises:
+        ValueError: If the envelope version is unsupported
+    """
+    version = message.get("v", 1)
+    if version == WIRE_VERSION:
+        body = message["b"]
+        return ClickUpWebhookEvent(
+            type=ClickUpWebhookEventType(message["t"]),
+            body=body,
+            raw=body,
+            headers=message.get("h") or {},
+            received_at=_from_epoch_ms(message["ts"]),
+            delivery_id=message.get("id"),
+        )
+    if version == 1:
+        body = message["body"]
+        return ClickUpWebhookEvent(
+            type=ClickUpWebhookEventType(message["type"]),
+            body=body,
+            raw=body,
+            headers=message.get("headers") or {},
+            received_at=datetime.fromisoformat(message["received_at"]),
+            delivery_id=message.get("delivery_id"),
+        )
+    raise ValueError(f"Unsupported ClickUp webhook wire version: {version!r}")
+
+
+def encode_event(
+    event: ClickUpWebhookEvent,
+    header_allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST,
+    *,
+    use_msgpack: Optional[bool] = None,
+) -> bytes:
+    """
+    Pack an event into bytes.
+
+    Args:
+        event: Normalized webhook event
+        header_allowlist: Lower-case header names to carry
+        use_msgpack: Force (True) or disable (False) MessagePack; default uses it when installed
+
+    Returns:
+        Tagged bytes readable by `decode_event`
+    """
+    return pack_envelope(to_wire(event, header_allowlist), use_msgpack=use_msgpack)
+
+
+def pack_envelope(envelope: Mapping[str, Any], *, use_msgpack: Optional[bool] = None) -> bytes:
+    """
+    Pack an envelope built by `to_wire` into tagged bytes.
+
+    Args:
+        envelope: Version 2 envelope
+        use_msgpack: Force (True) or disable (False) MessagePack; default uses it when installed
+
+    Returns:
+        Tagged bytes readable by `decode_event`
+    """
+    if use_msgpack is None:
+        use_msgpack = msgpack is not None
+    if use_msgpack:
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed; install the 'queue' extra")
+        return _MSGPACK_TAG + msgpack.packb(envelope, use_bin_type=True, default=str)
+    return _JSON_TAG + json.dumps(envelope, separators=(",", ":"), default=str).encode()
+
+
+def decode_event(data: bytes) -> ClickUpWebhookEvent:
+    """
+    Unpack bytes produced by `encode_event`.
+
+    Raises:
+        ValueError: If the format tag is unknown
+    """
+    return from_wire(unpack_envelope(data))
+
+
+def unpack_envelope(data: bytes) -> Dict[str, Any]:
+    """
+    Unpack bytes produced by `pack_envelope` (or `encode_event`) into the envelope dict.
+
+    Raises:
+        ValueError: If the format tag is unknown
+    """
+    tag, payload = data[:1], memoryview(data)[1:]
+    if tag == _MSGPACK_TAG:
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed; install the 'queue' extra")
+        return msgpack.unpackb(payload, raw=False)
+    if tag == _JSON_TAG:
+        return json.loads(bytes(payload))
+    raise ValueError(f"Unknown ClickUp webhook wire format tag: {tag!r}")
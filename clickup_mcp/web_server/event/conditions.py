@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+"""
+Compiled condition expressions for `WorkflowContext.conditions`.
+
+Design:
+- Conditions are small boolean expressions with Python-like syntax, e.g.
+  `status == 'done' and vars.team in ('a', 'b')`. A condition is parsed with `ast` once,
+  checked against a whitelist of node types, and compiled into nested closures. The
+  compiled form is cached by source text, so the thousands of contexts that share a
+  condition string also share one compiled function.
+- Nothing is passed to `eval`. Names resolve only against the bindings described below,
+  and calls are limited to the functions in `_FUNCTIONS`. Attribute access walks mappings
+  only and never reaches Python attributes.
+- Event bindings (`event_bindings`) are computed once per event. A compiled condition
+  takes `(bindings, variables)`, so evaluating one more context costs the condition
+  closures and no per-context allocation.
+- An expression that fails at runtime (e.g. `len(x)` when `x` is missing) evaluates to
+  False. Ordering comparisons between incompatible types (`'3' < 4`) are also False.
+  Syntax errors are raised at compile time as `ConditionSyntaxError`.
+
+Grammar:
+- Literals: strings, numbers, `True`/`False`/`None`, and tuples/lists/sets of them
+- Operators: `and`, `or`, `not`, `==`, `!=`, `<`, `<=`, `>`, `>=`, `in`, `not in`,
+  unary `-`, chained comparisons
+- Names: bare names resolve against the event bindings first, then the context
+  variables; `vars.<name>` reads a context variable only; `event.<path>` walks the raw
+  webhook body. A missing name or key evaluates to None.
+- Calls: `lower(x)`, `upper(x)`, `len(x)`, `int(x)`, `float(x)`, `str(x)`
+
+Event bindings:
+- `event_type`, `task_id`, `list_id`, `folder_id`, `space_id`, `user_id`
+- `fields`: set of `history_items` fields changed by the event
+- `status` / `previous_status`: new and old status names of a `status` change
+- `priority`: new priority of a `priority` change
+- `assignees_added` / `assignees_removed`: sets of user ids (as strings)
+- `event`: the raw webhook body
+
+Usage Examples:
+    from clickup_mcp.web_server.event.conditions import compile_context, event_bindings
+
+    compiled = compile_context(context)          # WorkflowContext
+    bindings = event_bindings(event)             # once per event
+    compiled.matches(bindings)                   # all conditions hold
+"""
+
+import ast
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from clickup_mcp.models.domain.workflow_context import WorkflowContext
+
+from .handler.scope import EventFacets
+from .models import ClickUpWebhookEvent
+
+_MAX_SOURCE_LENGTH = 1000
+_MISSING = object()
+
+Bindings = Mapping[str, Any]
+Evaluator = Callable[[Bindings, Mapping[str, Any]], Any]
+
+_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "lower": lambda value: str(value).lower() if value is not None else None,
+    "upper": lambda value: str(value).upper() if value is not None else None,
+    "len": len,
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+_COMPARE: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: lambda a, b: a == b,
+    ast.NotEq: lambda a, b: a != b,
+    ast.Lt: lambda a, b: a < b,
+    ast.LtE: lambda a, b: a <= b,
+    ast.Gt: lambda a, b: a > b,
+    ast.GtE: lambda a, b: a >= b,
+    ast.In: lambda a, b: b is not None and a in b,
+    ast.NotIn: lambda a, b: b is None or a not in b,
+}
+_ORDERING = (ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+
+class ConditionSyntaxError(ValueError):
+    """Raised when a condition uses syntax outside the supported grammar."""
+
+
+def _walk(value: Any, path: Tuple[Any, ...]) -> Any:
+    for key in path:
+        if isinstance(value, Mapping):
+            value = value.get(key)
+        elif isinstance(value, (list, tuple)) and isinstance(key, int) and -len(value) <= key < len(value):
+            value = value[key]
+        else:
+            return None
+    return value
+
+
+def _constant(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant) and (node.value is None or isinstance(node.value, (str, int, float, bool))):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        value = _constant(node.operand)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return -value
+    raise ConditionSyntaxError(f"expected a literal, got {type(node).__name__}")
+
+
+def _path(node: ast.AST) -> Tuple[str, Tuple[Any, ...]]:
+    """Flatten `a.b['c'].d` into ("a", ("b", "c", "d"))."""
+    keys: list[Any] = []
+    while True:
+        if isinstance(node, ast.Attribute):
+            if node.attr.startswith("_"):
+                raise ConditionSyntaxError(f"unsupported name: {node.attr}")
+            keys.append(node.attr)
+            node = node.value
+        elif isinstance(node, ast.Subscript):
+            keys.append(_constant(node.slice))
+            node = node.value
+        elif isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise ConditionSyntaxError(f"unsupported name: {node.id}")
+            return node.id, tuple(reversed(keys))
+        else:
+            raise ConditionSyntaxError(f"unsupported expression in a name path: {type(node).__name__}")
+
+
+def _compile_name(root: str, path: Tuple[Any, ...]) -> Evaluator:
+    if root == "vars":
+        if not path:
+            raise ConditionSyntaxError("'vars' needs a variable name, e.g. vars.team")
+        name, rest = path[0], path[1:]
+        return lambda bindings, variables: _walk(variables.get(name), rest)
+    if root == "event":
+        return lambda bindings, variables: _walk(bindings.get("event"), path)
+
+    def lookup(bindings: Bindings, variables: Mapping[str, Any]) -> Any:
+        value = bindings.get(root, _MISSING)
+        if value is _MISSING:
+            value = variables.get(root)
+        return _walk(value, path) if path else value
+
+    return lookup
+
+
+def _compile_node(node: ast.AST) -> Evaluator:
+    if isinstance(node, ast.Constant):
+        value = _constant(node)
+        return lambda bindings, variables: value
+
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        value = frozenset(_constant(elt) for elt in node.elts)
+        return lambda bindings, variables: value
+
+    if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+        return _compile_name(*_path(node))
+
+    if isinstance(node, ast.BoolOp):
+        parts = tuple(_compile_node(v) for v in node.values)
+        if isinstance(node.op, ast.And):
+
+            def all_of(bindings: Bindings, variables: Mapping[str, Any]) -> bool:
+                for part in parts:
+                    if not part(bindings, variables):
+                        return False
+                return True
+
+            return all_of
+
+        def any_of(bindings: Bindings, variables: Mapping[str, Any]) -> bool:
+            for part in parts:
+                if part(bindings, variables):
+                    return True
+            return False
+
+        return any_of
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand)
+        if isinstance(node.op, ast.Not):
+            return lambda bindings, variables: not operand(bindings, variables)
+        if isinstance(node.op, ast.USub):
+            return lambda bindings, variables: -operand(bindings, variables)
+        raise ConditionSyntaxError(f"unsupported operator: {type(node.op).__name__}")
+
+    if isinstance(node, ast.Compare):
+        operands = (_compile_node(node.left),) + tuple(_compile_node(c) for c in node.comparators)
+        ops = []
+        for op in node.ops:
+            compare = _COMPARE.get(type(op))
+            if compare is None:
+                raise ConditionSyntaxError(f"unsupported comparison: {type(op).__name__}")
+            ops.append((compare, isinstance(op, _ORDERING)))
+        if len(ops) == 1:
+            (compare, ordering), (left, right) = ops[0], operands
+            if not ordering:
+                return lambda bindings, variables: compare(left(bindings, variables), right(bindings, variables))
+
+        def chain(bindings: Bindings, variables: Mapping[str, Any]) -> bool:
+            left_value = operands[0](bindings, variables)
+            for (compare, ordering), right in zip(ops, operands[1:]):
+                right_value = right(bindings, variables)
+                if ordering and (left_value is None or right_value is None):
+                    return False
+                try:
+                    if not compare(left_value, right_value):
+                        return False
+                except TypeError:
+                    return False
+                left_value = right_value
+            return True
+
+        return chain
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS or node.keywords:
+            raise ConditionSyntaxError(f"unsupported call; allowed functions: {', '.join(sorted(_FUNCTIONS))}")
+        fn = _FUNCTIONS[node.func.id]
+        args = tuple(_compile_node(a) for a in node.args)
+        return lambda bindings, variables: fn(*(a(bindings, variables) for a in args))
+
+    raise ConditionSyntaxError(f"unsupported syntax: {type(node).__name__}")
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    """A condition compiled to a function of `(bindings, variables)`."""
+
+    source: str
+    evaluate: Evaluator
+
+    def __call__(self, bindings: Bindings, variables: Optional[Mapping[str, Any]] = None) -> bool:
+        """Evaluate to a bool; runtime errors evaluate to False."""
+        try:
+            return bool(self.evaluate(bindings, variables or {}))
+        except Exception:  # noqa: BLE001 - a bad value must not break event handling
+            return False
+
+
+@lru_cache(maxsize=4096)
+def compile_condition(source: str) -> CompiledCondition:
+    """
+    Parse and compile a condition; results are cached by source text.
+
+    Raises:
+        ConditionSyntaxError: If the text is not a valid condition
+    """
+    if len(source) > _MAX_SOURCE_LENGTH:
+        raise ConditionSyntaxError(f"condition longer than {_MAX_SOURCE_LENGTH} characters")
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except (SyntaxError, RecursionError, ValueError) as exc:
+        raise ConditionSyntaxError(f"invalid condition {source!r}: {exc}") from exc
+    return CompiledCondition(source=source, evaluate=_compile_node(tree.body))
+
+
+@dataclass(frozen=True)
+class CompiledContext:
+    """
+    A `WorkflowContext` prepared for evaluation.
+
+    Attributes:
+        context_id: Source context id
+        variables: Copy of the context variables
+        conditions: Compiled conditions; all must hold
+    """
+
+    context_id: str
+    variables: Mapping[str, Any]
+    conditions: Tuple[CompiledCondition, ...]
+
+    def matches(self, bindings: Bindings) -> bool:
+        """Return True when every condition holds for the event bindings."""
+        variables = self.variables
+        for condition in self.conditions:
+            try:
+                if not condition.evaluate(bindings, variables):
+                    return False
+            except Exception:  # noqa: BLE001 - see CompiledCondition.__call__
+                return False
+        return True
+
+
+def compile_context(context: WorkflowContext) -> CompiledContext:
+    """
+    Compile every condition of a context.
+
+    Raises:
+        ConditionSyntaxError: If any condition is invalid (the message names it)
+    """
+    return CompiledContext(
+        context_id=context.context_id,
+        variables=dict(context.variables),
+        conditions=tuple(compile_condition(str(c)) for c in context.conditions),
+    )
+
+
+def _ids(values: Any) -> FrozenSet[str]:
+    return frozenset(str(v.get("id") if isinstance(v, Mapping) else v) for v in values if v is not None)
+
+
+def event_bindings(event: ClickUpWebhookEvent, facets: Optional[EventFacets] = None) -> Dict[str, Any]:
+    """Build the name bindings conditions see for an event (compute once per event)."""
+    body = event.body
+    facets = facets or EventFacets.of(event)
+    bindings: Dict[str, Any] = {
+        "event": body,
+        "event_type": event.type.value,
+        "task_id": body.get("task_id"),
+        "list_id": next(iter(sorted(facets.list_ids)), None),
+        "folder_id": next(iter(facets.folder_ids), None),
+        "space_id": next(iter(facets.space_ids), None),
+        "fields": facets.fields,
+        "status": None,
+        "previous_status": None,
+        "priority": None,
+        "user_id": None,
+    }
+    added: list[Any] = []
+    removed: list[Any] = []
+    for item in body.get("history_items") or ():
+        if not isinstance(item, Mapping):
+            continue
+        user = item.get("user")
+        if bindings["user_id"] is None and isinstance(user, Mapping) and user.get("id") is not None:
+            bindings["user_id"] = str(user["id"])
+        before, after = item.get("before"), item.get("after")
+        field_name = item.get("field")
+        if field_name == "status":
+            bindings["status"] = after.get("status") if isinstance(after, Mapping) else after
+            bindings["previous_status"] = before.get("status") if isinstance(before, Mapping) else before
+        elif field_name == "priority":
+            bindings["priority"] = after.get("priority") if isinstance(after, Mapping) else after
+        elif field_name == "assignee_add":
+            added.append(after)
+        elif field_name == "assignee_rem":
+            removed.append(before)
+    bindings["assignees_added"] = _ids(added)
+    bindings["assignees_removed"] = _ids(removed)
+    return bindings
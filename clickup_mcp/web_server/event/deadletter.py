@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+"""
+Dead-letter store for ClickUp webhook events whose handlers failed permanently.
+
+Design:
+- `RetryingDispatcher` (see `event.retry`) writes a `DeadLetterRecord` once a handler has
+  exhausted its retries, raised `PermanentHandlerError`, or still had a retry pending at
+  shutdown. One record is kept per (event, handler) pair, so replaying a record re-runs
+  only the handler that failed.
+- Scheduled retries are journalled here too, as `pending` records: written before the
+  retry is scheduled, removed when the handler recovers and replaced by a final record
+  when it gives up. A pending record left behind means the process stopped without
+  shutting down while the retry waited; replay it once that process is gone.
+- `FileDeadLetterStore` keeps records as JSON lines in a local file (append on write,
+  atomic rewrite on removal). Events are stored in the compact wire envelope from
+  `event.codec`.
+- The `clickup-webhook-dlq` CLI lists, replays and purges records. Replay imports the
+  handler modules from `CLICKUP_WEBHOOK_HANDLER_MODULES`, runs each record's handler
+  once, and removes the records that succeed. Pending records are only replayed with
+  `--include-pending`.
+
+Usage Examples:
+    # Python
+    from clickup_mcp.web_server.event.deadletter import FileDeadLetterStore
+
+    store = FileDeadLetterStore("clickup_webhook_dead_letters.jsonl")
+    for record in store.list():
+        print(record.id, record.handler, record.error)
+
+    # CLI
+    clickup-webhook-dlq list
+    clickup-webhook-dlq replay --id 3f2a... --id 9b1c...
+    clickup-webhook-dlq replay --all --include-pending   # after a crash
+    clickup-webhook-dlq purge --all
+
+Environment:
+- `CLICKUP_WEBHOOK_DEAD_LETTER_PATH`: file used by the default store and the CLI, relative
+  to `CLICKUP_MCP_DATA_DIR` unless absolute
+"""
+
+import asyncio
+import json
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .codec import from_wire
+from .handler import ClickUpEventRegistry
+from .handler.registry import AsyncHandler
+from .models import ClickUpWebhookEvent
+
+
+@dataclass
+class DeadLetterRecord:
+    """
+    A webhook event that one handler could not process.
+
+    Attributes:
+        handler: Qualified name of the failed handler (`module.qualname`)
+        event: Event in the wire envelope produced by `codec.to_wire`
+        error: Representation of the last exception
+        attempts: Number of attempts made before giving up
+        id: Unique record id
+        failed_at: ISO-8601 UTC timestamp of the last failure
+        pending: True while a retry of the handler is still scheduled
+    """
+
+    handler: str
+    event: Dict[str, Any]
+    error: str
+    attempts: int
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    failed_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    pending: bool = False
+
+    def to_event(self) -> ClickUpWebhookEvent:
+        """Rebuild the webhook event carried by this record."""
+        return from_wire(self.event)
+
+
+class DeadLetterStore(ABC):
+    """Storage for dead-lettered webhook events."""
+
+    @abstractmethod
+    def add(self, record: DeadLetterRecord) -> None:  # pragma: no cover - interface
+        """Persist a record."""
+
+    @abstractmethod
+    def list(self) -> List[DeadLetterRecord]:  # pragma: no cover - interface
+        """Return all records, oldest first."""
+
+    @abstractmethod
+    def remove(self, ids: Iterable[str]) -> int:  # pragma: no cover - interface
+        """Delete records by id and return how many were removed."""
+
+
+class FileDeadLetterStore(DeadLetterStore):
+    """
+    JSON-lines file store.
+
+    Safe to use from several threads of one process; not meant to be shared by
+    concurrently writing processes.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def add(self, record: DeadLetterRecord) -> None:
+        line = json.dumps(asdict(record), separators=(",", ":"), default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+    def list(self) -> List[DeadLetterRecord]:
+        with self._lock:
+            return self._read()
+
+    def remove(self, ids: Iterable[str]) -> int:
+        wanted = set(ids)
+        with self._lock:
+            records = self._read()
+            kept = [r for r in records if r.id not in wanted]
+            removed = len(records) - len(kept)
+            if removed:
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                with tmp.open("w", encoding="utf-8") as fh:
+                    for record in kept:
+                        fh.write(json.dumps(asdict(record), separators=(",", ":"), default=str) + "\n")
+                os.replace(tmp, self.path)
+            return removed
+
+    def _read(self) -> List[DeadLetterRecord]:
+        if not self.path.exists():
+            return []
+        with self.path.open(encoding="utf-8") as fh:
+            return [DeadLetterRecord(**json.loads(line)) for line in fh if line.strip()]
+
+
+def handler_name(handler: Any) -> str:
+    """Return the qualified name used to identify a handler in dead-letter records."""
+    func = getattr(handler, "__func__", handler)
+    module = getattr(func, "__module__", None) or type(handler).__module__
+    qualname = getattr(func, "__qualname__", None) or type(handler).__qualname__
+    return f"{module}.{qualname}"
+
+
+def _find_handler(registry: ClickUpEventRegistry, event: ClickUpWebhookEvent, name: str) -> Optional[AsyncHandler]:
+    for handler in registry.handlers_for(event.type):
+        if handler_name(handler) == name:
+            return handler
+    return None
+
+
+@dataclass
+class ReplayResult:
+    """Outcome of `replay_dead_letters`, as lists of record ids."""
+
+    succeeded: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    missing_handler: List[str] = field(default_factory=list)
+
+
+async def replay_dead_letters(
+    store: DeadLetterStore,
+    registry: ClickUpEventRegistry,
+    ids: Optional[Iterable[str]] = None,
+    include_pending: bool = False,
+) -> ReplayResult:
+    """
+    Run each selected record's handler once and remove the records that succeed.
+
+    Args:
+        store: Dead-letter store to read from and prune
+        registry: Registry holding the handlers named in the records
+        ids: Record ids to replay (default: all records)
+        include_pending: Also replay records whose retry was still scheduled; only safe
+            once the process that scheduled it has stopped
+
+    Returns:
+        ReplayResult with record ids grouped by outcome
+    """
+    wanted = set(ids) if ids is not None else None
+    result = ReplayResult()
+    for record in store.list():
+        if (wanted is not None and record.id not in wanted) or (record.pending and not include_pending):
+            continue
+        event = record.to_event()
+        handler = _find_handler(registry, event, record.handler)
+        if handler is None:
+            result.missing_handler.append(record.id)
+            continue
+        try:
+            await handler(event)
+        except Exception:  # noqa: BLE001 - keep the record for a later replay
+            result.failed.append(record.id)
+        else:
+            result.succeeded.append(record.id)
+    if result.succeeded:
+        store.remove(result.succeeded)
+    return result
+
+
+def get_dead_letter_store(path: Optional[str] = None) -> FileDeadLetterStore:
+    """
+    Build the file store at `path`, defaulting to `CLICKUP_WEBHOOK_DEAD_LETTER_PATH`.
+    """
+    from clickup_mcp.config import get_settings
+
+    return FileDeadLetterStore(path or get_settings().clickup_webhook_dead_letter_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    from .bootstrap import import_handler_modules_from_env
+    from .handler import get_registry
+
+    parser = argparse.ArgumentParser(description="Inspect and replay dead-lettered ClickUp webhook events")
+    parser.add_argument("--path", default=None, help="Dead-letter file (default from CLICKUP_WEBHOOK_DEAD_LETTER_PATH)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List dead-lettered events")
+    for name, help_text in (("replay", "Re-run failed handlers"), ("purge", "Delete records")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--id", dest="ids", action="append", default=None, help="Record id (repeatable)")
+        cmd.add_argument("--all", action="store_true", help="Select every record")
+        if name == "replay":
+            cmd.add_argument(
+                "--include-pending",
+                action="store_true",
+                help="Also replay records whose retry was scheduled when their process stopped",
+            )
+    args = parser.parse_args(argv)
+
+    store = get_dead_letter_store(args.path)
+
+    if args.command == "list":
+        for record in store.list():
+            print(
+                f"{record.id}  {record.failed_at}  {record.event.get('t', record.event.get('type'))}  "
+                f"{record.handler}  attempts={record.attempts}{'  pending' if record.pending else ''}  {record.error}"
+            )
+        return 0
+
+    if not args.ids and not args.all:
+        parser.error(f"{args.command} requires --id or --all")
+    ids = None if args.all else args.ids
+
+    if args.command == "purge":
+        removed = store.remove(ids if ids is not None else [r.id for r in store.list()])
+        print(f"Removed {removed} record(s)")
+        return 0
+
+    import_handler_modules_from_env()
+    result = asyncio.run(replay_dead_letters(store, get_registry(), ids, include_pending=args.include_pending))
+    print(
+        f"Replayed {len(result.succeeded)} record(s); "
+        f"{len(result.failed)} failed again; {len(result.missing_handler)} without a registered handler"
+    )
+    return 1 if result.failed or result.missing_handler else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,645 @@
+from __future__ import annotations
+
+"""
+Durable, append-only log of received ClickUp webhook events.
+
+Design:
+- The log is a directory of segment files named after the offset of their first record
+  (`00000000000000000000.log`, ...). Only the newest segment is appended to. A new one is
+  started once it exceeds `segment_bytes`; older segments are sealed and never modified,
+  except by compaction.
+- Each record is a fixed header followed by the entity key and the event payload:
+  `<payload length u32><crc32 u32><offset u64><received at, epoch ms i64><key length u16>`.
+  The payload is the tagged bytes of `codec.encode_event` (MessagePack when available),
+  carrying the configured `CLICKUP_WEBHOOK_HEADER_ALLOWLIST` headers. A torn record at
+  the end of the newest segment (crash mid-write) is skipped on open and truncated before
+  the next append.
+- On open, the segment headers are scanned once through `mmap` to build a sparse index
+  per segment: its time range and the (position, timestamp) of one record every
+  `_INDEX_INTERVAL` bytes. Memory stays proportional to the log size divided by the
+  interval, whatever the number of records or entities. Time-range reads skip whole
+  segments outside the range and start from the nearest index entry; entity reads
+  (`partitioning.entity_partition_key`, e.g. `task:abc`) walk the record headers and only
+  decode records whose key matches.
+- Replay reads segments through `mmap`, so events are served from the page cache without
+  copying whole files into the process.
+- `compact()` rewrites sealed segments keeping only the newest record per entity.
+  Records without an entity key are kept. Offsets of kept records are unchanged.
+  Webhook events are deltas (an assignee added, a status changed), not snapshots, so a
+  compacted range is no longer a replay source for state built from events, such as
+  projections. Compaction records a watermark (`compacted_through_ms`, kept in
+  `<directory>/.compacted`): records received at or before it may be gone.
+  `ProjectionManager.catch_up` refuses to read from before it.
+- The appending process holds an exclusive lock on `<directory>/.lock` (POSIX `flock`)
+  from its first append until `close()`. Compaction takes the same lock, so it refuses to
+  run (`EventLogLockedError`) while a web server writes the log. Reads take no lock.
+- `EventLogSink` writes every event reaching the sink, then forwards it to the real sink.
+  Appends run on a dedicated writer thread, so the event loop never waits on the disk.
+  Events dropped by the ingress filter (`CLICKUP_WEBHOOK_INGRESS_FILTER`) never reach the
+  sink, so they are not logged.
+- One process writes a log directory. Run one directory per web server process.
+
+Usage Examples:
+    # Python
+    from clickup_mcp.web_server.event.eventlog import EventLog
+
+    log = EventLog("var/webhook-log")
+    offset = log.append(event)
+    for stored in log.read(since=datetime(2025, 1, 1), entity="task:abc"):
+        ...
+    log.close()
+
+    # CLI
+    clickup-webhook-log replay --since 2025-01-01T00:00:00 --until 2025-01-02T00:00:00
+    clickup-webhook-log compact   # fails while a web server is writing the log
+    clickup-webhook-log stats
+
+Environment:
+- `CLICKUP_WEBHOOK_EVENT_LOG_DIR`: enables the log on the sink path when set
+- `CLICKUP_WEBHOOK_EVENT_LOG_SEGMENT_BYTES`: segment roll size (default 64 MiB)
+"""
+
+import asyncio
+import bisect
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .codec import DEFAULT_HEADER_ALLOWLIST, decode_event, pack_envelope, to_wire
+from .models import ClickUpWebhookEvent
+from .partitioning import entity_partition_key
+from .sink import EventSink
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: the log directory is not locked
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<IIQqH")
+_SEGMENT_SUFFIX = ".log"
+_LOCK_FILE = ".lock"
+_WATERMARK_FILE = ".compacted"
+# Bytes of records between two entries of a segment's sparse index
+_INDEX_INTERVAL = 4096
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MS = timedelta(milliseconds=1)
+
+
+def _epoch_ms(value: datetime) -> int:
+    # Naive datetimes are UTC, as produced by the webhook ingress
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MS
+
+
+class EventLogLockedError(RuntimeError):
+    """Raised when another process holds the event log lock (a web server is writing the log)."""
+
+
+class EventLogCompactedError(RuntimeError):
+    """Raised when rebuilding state would replay a compacted range of the event log."""
+
+
+@dataclass
+class _Segment:
+    base_offset: int
+    path: Path
+    size: int = 0
+    record_count: int = 0
+    next_offset: int = 0
+    min_ts: Optional[int] = None
+    max_ts: Optional[int] = None
+    # Sparse index: position and timestamp of one record every _INDEX_INTERVAL bytes (parallel lists)
+    index_positions: List[int] = field(default_factory=list)
+    index_timestamps: List[int] = field(default_factory=list)
+    monotonic: bool = True
+    last_ts: Optional[int] = None
+
+    def track(self, position: int, offset: int, ts: int) -> None:
+        if self.last_ts is not None and ts < self.last_ts:
+            self.monotonic = False
+        self.last_ts = ts
+        if not self.index_positions or position - self.index_positions[-1] >= _INDEX_INTERVAL:
+            self.index_positions.append(position)
+            self.index_timestamps.append(ts)
+        self.record_count += 1
+        self.next_offset = offset + 1
+        self.min_ts = ts if self.min_ts is None else min(self.min_ts, ts)
+        self.max_ts = ts if self.max_ts is None else max(self.max_ts, ts)
+
+    def overlaps(self, since: Optional[int], until: Optional[int]) -> bool:
+        if self.min_ts is None or self.max_ts is None:
+            return False
+        if since is not None and self.max_ts < since:
+            return False
+        if until is not None and self.min_ts >= until:
+            return False
+        return True
+
+    def start_position(self, since: Optional[int]) -> int:
+        """Position from which every record at or after `since` is found."""
+        if since is None or not self.monotonic:
+            return 0
+        # Last indexed record strictly before `since`; equal timestamps may precede an entry
+        index = bisect.bisect_left(self.index_timestamps, since) - 1
+        return self.index_positions[index] if index >= 0 else 0
+
+
+@dataclass(frozen=True)
+class LogRecord:
+    """A decoded log entry."""
+
+    offset: int
+    received_at_ms: int
+    key: Optional[str]
+    event: ClickUpWebhookEvent
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of `EventLog.compact`."""
+
+    segments_rewritten: int = 0
+    records_removed: int = 0
+    bytes_reclaimed: int = 0
+
+
+def _headers(mm: mmap.mmap, start: int, end: int) -> Iterator[Tuple[int, int, int, int, int]]:
+    """Yield (position, payload length, offset, timestamp, key length) of the records in [start, end)."""
+    position = start
+    while position < end:
+        length, _, offset, ts, key_len = _HEADER.unpack_from(mm, position)
+        yield position, length, offset, ts, key_len
+        position += _HEADER.size + key_len + length
+
+
+class EventLog:
+    """
+    Segment-based append-only event log with sparse time indexes.
+
+    Safe to share between threads: appends, closing and compaction are serialized, and
+    reads see the records appended before they started.
+
+    Args:
+        directory: Log directory (created if missing)
+        segment_bytes: Size after which the active segment is sealed and a new one started
+        header_allowlist: Lower-case header names stored with each event
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        segment_bytes: int = 64 * 1024 * 1024,
+        header_allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST,
+    ) -> None:
+        if segment_bytes < _HEADER.size:
+            raise ValueError("segment_bytes is too small")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._header_allowlist = frozenset(h.lower() for h in header_allowlist)
+        self._segments: List[_Segment] = []
+        self._writer: Optional[BinaryIO] = None
+        self._lock_file: Optional[TextIO] = None
+        self._mutex = threading.RLock()
+        self._load()
+
+    # ----- Writing -----
+
+    @property
+    def next_offset(self) -> int:
+        """Offset the next appended record will get."""
+        return self._segments[-1].next_offset if self._segments else 0
+
+    def append(self, event: ClickUpWebhookEvent) -> int:
+        """
+        Append an event and return its offset.
+
+        The record is handed to the OS before returning; `sync()` forces it to disk.
+
+        Raises:
+            EventLogLockedError: If another process writes or compacts the log
+        """
+        envelope = to_wire(event, self._header_allowlist)
+        payload = pack_envelope(envelope)
+        key = entity_partition_key(event)
+        key_bytes = key.encode() if key else b""
+        ts = envelope["ts"]
+
+        with self._mutex:
+            segment = self._active_segment()
+            if segment.size >= self._segment_bytes:
+                segment = self._roll()
+            offset = segment.next_offset
+            header = _HEADER.pack(len(payload), zlib.crc32(payload, zlib.crc32(key_bytes)), offset, ts, len(key_bytes))
+            writer = self._open_writer()
+            position = segment.size
+            writer.write(header + key_bytes + payload)
+            writer.flush()
+            segment.size += _HEADER.size + len(key_bytes) + len(payload)
+            segment.track(position, offset, ts)
+        return offset
+
+    def sync(self) -> None:
+        """Flush and fsync the active segment."""
+        with self._mutex:
+            if self._writer is not None:
+                self._writer.flush()
+                os.fsync(self._writer.fileno())
+
+    def close(self) -> None:
+        """Sync and close the active segment and release the log lock."""
+        with self._mutex:
+            self._close_writer()
+            self._unlock()
+
+    # ----- Reading -----
+
+    def read(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        entity: Optional[str] = None,
+    ) -> Iterator[LogRecord]:
+        """
+        Iterate records in offset order.
+
+        Args:
+            since: Only records received at or after this time
+            until: Only records received before this time
+            entity: Only records of this entity key (e.g. "task:abc")
+        """
+        since_ms = _epoch_ms(since) if since is not None else None
+        until_ms = _epoch_ms(until) if until is not None else None
+        key = entity.encode() if entity is not None else None
+        for segment, size in self._snapshot():
+            if segment.overlaps(since_ms, until_ms):
+                yield from self._read_segment(segment, size, since_ms, until_ms, key)
+
+    def entities(self) -> List[str]:
+        """Entity keys present in the log (scans the record headers)."""
+        return list(self._latest_positions())
+
+    def stats(self) -> Dict[str, int]:
+        """Segment, record, byte and entity counts."""
+        segments = [segment for segment, _ in self._snapshot()]
+        return {
+            "segments": len(segments),
+            "records": sum(s.record_count for s in segments),
+            "bytes": sum(s.size for s in segments),
+            "entities": len(self._latest_positions()),
+            "next_offset": self.next_offset,
+        }
+
+    # ----- Compaction -----
+
+    @property
+    def compacted_through_ms(self) -> Optional[int]:
+        """Receive time (epoch ms) up to which compaction may have removed records; None if never compacted."""
+        path = self.directory / _WATERMARK_FILE
+        return int(path.read_text(encoding="utf-8")) if path.exists() else None
+
+    def compact(self) -> CompactionResult:
+        """
+        Keep only the newest record per entity in sealed segments.
+
+        The active segment is left untouched; a record in a sealed segment is removed
+        when a newer record of the same entity exists anywhere in the log. Events are
+        deltas, so the compacted range can no longer rebuild state; the newest receive
+        time of the sealed segments becomes the `compacted_through_ms` watermark.
+
+        Raises:
+            EventLogLockedError: If another process writes the log
+        """
+        result = CompactionResult()
+        with self._mutex:
+            held = self._lock_file is not None
+            self._lock()
+            try:
+                sealed = self._segments[:-1]
+                if not sealed:
+                    return result
+                latest = self._latest_positions()
+                for segment in sealed:
+                    self._compact_segment(segment, latest, result)
+                if result.segments_rewritten:
+                    self._write_watermark(max(s.max_ts for s in sealed if s.max_ts is not None))
+                    self._load()
+            finally:
+                if not held:
+                    self._unlock()
+        return result
+
+    def _compact_segment(self, segment: _Segment, latest: Dict[str, Tuple[int, int]], result: CompactionResult) -> None:
+        if not segment.size:
+            return
+        kept: List[bytes] = []
+        removed = 0
+        with self._map(segment) as mm:
+            for position, length, _, _, key_len in _headers(mm, 0, segment.size):
+                start = position + _HEADER.size
+                key = bytes(mm[start : start + key_len]).decode() or None
+                if key is not None and latest.get(key) != (segment.base_offset, position):
+                    removed += 1
+                    continue
+                kept.append(bytes(mm[position : start + key_len + length]))
+        if not removed:
+            return
+        tmp = segment.path.with_name(segment.path.name + ".compact")
+        with tmp.open("wb") as fh:
+            for chunk in kept:
+                fh.write(chunk)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, segment.path)
+        result.segments_rewritten += 1
+        result.records_removed += removed
+        result.bytes_reclaimed += segment.size - sum(len(c) for c in kept)
+
+    def _write_watermark(self, through_ms: int) -> None:
+        current = self.compacted_through_ms
+        if current is not None and current >= through_ms:
+            return
+        path = self.directory / _WATERMARK_FILE
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(str(through_ms), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # ----- Internals -----
+
+    def _load(self) -> None:
+        self._close_writer()
+        segments: List[_Segment] = []
+        paths = sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"), key=lambda p: int(p.stem))
+        for index, path in enumerate(paths):
+            segment = _Segment(base_offset=int(path.stem), path=path, next_offset=int(path.stem))
+            self._scan(segment, is_last=index == len(paths) - 1)
+            segments.append(segment)
+        self._segments = segments
+
+    def _scan(self, segment: _Segment, *, is_last: bool) -> None:
+        file_size = segment.path.stat().st_size
+        position = 0
+        if file_size:
+            with self._map(segment) as mm:
+                while position + _HEADER.size <= file_size:
+                    length, crc, offset, ts, key_len = _HEADER.unpack_from(mm, position)
+                    end = position + _HEADER.size + key_len + length
+                    if end > file_size:
+                        break
+                    key_bytes = mm[position + _HEADER.size : position + _HEADER.size + key_len]
+                    payload = mm[position + _HEADER.size + key_len : end]
+                    if zlib.crc32(payload, zlib.crc32(key_bytes)) != crc:
+                        break
+                    segment.track(position, offset, ts)
+                    position = end
+        if position != file_size:
+            if not is_last:
+                raise ValueError(f"Corrupt sealed segment {segment.path} at byte {position}")
+            # Truncated by the next writer (`_open_writer`); the file may belong to a live one
+            logger.warning("Skipping torn record at byte %d of %s", position, segment.path)
+        segment.size = position
+
+    def _snapshot(self) -> List[Tuple[_Segment, int]]:
+        # Segments with the size each had when the read started
+        with self._mutex:
+            if self._writer is not None:
+                self._writer.flush()
+            return [(segment, segment.size) for segment in self._segments]
+
+    def _latest_positions(self) -> Dict[str, Tuple[int, int]]:
+        """Entity key -> (segment base offset, position) of its newest record."""
+        latest: Dict[str, Tuple[int, int]] = {}
+        for segment, size in self._snapshot():
+            if not size:
+                continue
+            with self._map(segment) as mm:
+                for position, _, _, _, key_len in _headers(mm, 0, size):
+                    if key_len:
+                        start = position + _HEADER.size
+                        latest[bytes(mm[start : start + key_len]).decode()] = (segment.base_offset, position)
+        return latest
+
+    def _active_segment(self) -> _Segment:
+        if not self._segments:
+            path = self.directory / f"{0:020d}{_SEGMENT_SUFFIX}"
+            path.touch()
+            self._segments.append(_Segment(base_offset=0, path=path))
+        return self._segments[-1]
+
+    def _roll(self) -> _Segment:
+        self._close_writer()
+        base = self.next_offset
+        path = self.directory / f"{base:020d}{_SEGMENT_SUFFIX}"
+        path.touch()
+        segment = _Segment(base_offset=base, path=path, next_offset=base)
+        self._segments.append(segment)
+        return segment
+
+    def _open_writer(self) -> BinaryIO:
+        if self._writer is None:
+            self._lock()
+            segment = self._segments[-1]
+            writer = segment.path.open("ab")
+            if writer.tell() != segment.size:
+                # Drop a torn record left by a crashed writer before appending after it
+                writer.truncate(segment.size)
+            self._writer = writer
+        return self._writer
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._writer.close()
+            self._writer = None
+
+    def _lock(self) -> None:
+        if self._lock_file is not None or fcntl is None:
+            return
+        lock_file = (self.directory / _LOCK_FILE).open("a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise EventLogLockedError(f"Event log {self.directory} is in use by another process") from None
+        self._lock_file = lock_file
+
+    def _unlock(self) -> None:
+        if self._lock_file is not None:
+            # Closing the file releases the flock
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _map(self, segment: _Segment) -> mmap.mmap:
+        with segment.path.open("rb") as fh:
+            return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_segment(
+        self,
+        segment: _Segment,
+        size: int,
+        since_ms: Optional[int],
+        until_ms: Optional[int],
+        key: Optional[bytes],
+    ) -> Iterator[LogRecord]:
+        if size == 0:
+            return
+        with self._map(segment) as mm:
+            for position, length, offset, ts, key_len in _headers(mm, segment.start_position(since_ms), size):
+                if until_ms is not None and ts >= until_ms:
+                    if segment.monotonic:
+                        break
+                    continue
+                if since_ms is not None and ts < since_ms:
+                    continue
+                start = position + _HEADER.size
+                if key is not None and (key_len != len(key) or mm[start : start + key_len] != key):
+                    continue
+                record_key = mm[start : start + key_len].decode() if key_len else None
+                event = decode_event(mm[start + key_len : start + key_len + length])
+                yield LogRecord(offset=offset, received_at_ms=ts, key=record_key, event=event)
+
+
+class EventLogSink(EventSink):
+    """
+    Sink decorator that appends every event to an `EventLog` before forwarding it.
+
+    Appends run one at a time, in arrival order, on a dedicated writer thread.
+
+    Examples:
+        sink = EventLogSink(LocalEventSink(), EventLog("var/webhook-log"))
+    """
+
+    def __init__(self, inner: EventSink, log: EventLog) -> None:
+        self.inner = inner
+        self.log = log
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="clickup-event-log")
+
+    async def handle(self, event: ClickUpWebhookEvent) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._writer, self.log.append, event)
+        await self.inner.handle(event)
+
+    async def flush(self) -> None:
+        """Sync the log to disk and flush the wrapped sink."""
+        await asyncio.get_running_loop().run_in_executor(self._writer, self.log.sync)
+        await self.inner.flush()
+
+    async def aclose(self) -> None:
+        """Close the wrapped sink, then the log."""
+        try:
+            await self.inner.aclose()
+        finally:
+            await asyncio.get_running_loop().run_in_executor(self._writer, self.log.close)
+            self._writer.shutdown(wait=False)
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+async def replay_event_log(
+    log: EventLog,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    entity: Optional[str] = None,
+) -> int:
+    """
+    Dispatch logged events through the handler registry, in log order.
+
+    Handlers run with the same retry and dead-letter handling as live events.
+
+    Returns:
+        Number of events dispatched
+    """
+    from .retry import get_dispatcher
+
+    dispatcher = get_dispatcher()
+    count = 0
+    for record in log.read(since=since, until=until, entity=entity):
+        await dispatcher.dispatch(record.event)
+        count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import asyncio
+    import time
+
+    from clickup_mcp.config import get_settings
+
+    from .bootstrap import import_handler_modules_from_env
+    from .retry import shutdown_dispatcher
+
+    parser = argparse.ArgumentParser(description="Replay, compact and inspect the ClickUp webhook event log")
+    parser.add_argument("--log-dir", default=None, help="Log directory (default from CLICKUP_WEBHOOK_EVENT_LOG_DIR)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    replay = sub.add_parser("replay", help="Dispatch logged events to the registered handlers")
+    replay.add_argument("--since", type=_parse_time, default=None, help="ISO-8601 start time (inclusive, UTC if naive)")
+    replay.add_argument("--until", type=_parse_time, default=None, help="ISO-8601 end time (exclusive, UTC if naive)")
+    replay.add_argument("--entity", default=None, help="Only this entity key, e.g. task:abc123")
+    sub.add_parser(
+        "compact",
+        help=(
+            "Keep only the newest record per entity in sealed segments. Events are deltas, so the "
+            "compacted range is no longer a replay source for projections"
+        ),
+    )
+    sub.add_parser("stats", help="Print segment and record counts")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    log_dir = args.log_dir or settings.clickup_webhook_event_log_dir
+    if not log_dir:
+        parser.error("--log-dir or CLICKUP_WEBHOOK_EVENT_LOG_DIR is required")
+    log = EventLog(log_dir, segment_bytes=settings.clickup_webhook_event_log_segment_bytes)
+
+    try:
+        if args.command == "stats":
+            for name, value in log.stats().items():
+                print(f"{name}: {value}")
+        elif args.command == "compact":
+            try:
+                result = log.compact()
+            except EventLogLockedError as exc:
+                print(f"{exc}; stop the web server before compacting")
+                return 1
+            print(
+                f"Rewrote {result.segments_rewritten} segment(s), removed {result.records_removed} record(s), "
+                f"reclaimed {result.bytes_reclaimed} bytes"
+            )
+        else:
+            import_handler_modules_from_env()
+
+            async def _replay() -> int:
+                try:
+                    return await replay_event_log(log, since=args.since, until=args.until, entity=args.entity)
+                finally:
+                    await shutdown_dispatcher()
+
+            started = time.perf_counter()
+            count = asyncio.run(_replay())
+            elapsed = time.perf_counter() - started
+            print(f"Replayed {count} event(s) in {elapsed:.2f}s ({count / elapsed if elapsed else 0:.0f} events/s)")
+    finally:
+        log.close()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -5,6 +5,8 @@ Provides:
 - `clickup_event`: Decorator facade with enum and alias-based registration
 - `BaseClickUpWebhookHandler`: OOP base that auto-registers `on_*` overrides
 - `get_registry` / `ClickUpEventRegistry`: In-process async handler registry
+- `handler_execution`: Choose where a sync handler runs (thread pool, inline, process pool)
+- `HandlerScope`: Narrow a handler to lists/folders/spaces or changed fields
 
 Usage:
     from clickup_mcp.web_server.event.handler import clickup_event, BaseClickUpWebhookHandler
@@ -20,12 +22,17 @@ Usage:
 """
 
 from .decorators import clickup_event
+from .executor import handler_execution, shutdown_handler_executors
 from .oop import BaseClickUpWebhookHandler
 from .registry import ClickUpEventRegistry, get_registry
+from .scope import HandlerScope
 
 __all__ = [
     "get_registry",
     "ClickUpEventRegistry",
     "clickup_event",
     "BaseClickUpWebhookHandler",
+    "handler_execution",
+    "HandlerScope",
+    "shutdown_handler_executors",
 ]
@@ -17,20 +17,31 @@ Usage Examples:
 
     @clickup_event.task_created
     def on_task_created(event: ClickUpWebhookEvent) -> None:
-        # sync functions are auto-wrapped with ensure_async()
+        # sync functions are auto-wrapped with ensure_async() and run in a thread pool
+        pass
+
+    @clickup_event(ClickUpWebhookEventType.TASK_DELETED, execution="inline")
+    def on_task_deleted(event: ClickUpWebhookEvent) -> None:
+        # trivial sync handler kept on the event loop
+        pass
+
+    @clickup_event(ClickUpWebhookEventType.TASK_UPDATED, list_id=["901", "902"], field="status")
+    async def on_team_status_change(event: ClickUpWebhookEvent) -> None:
+        # only called for status changes in lists 901/902 (see handler.scope)
         pass
 """
 
-import inspect
-from typing import Awaitable, Callable, Protocol
+from typing import Awaitable, Callable, Optional
 
-from clickup_mcp.types import EventHandlerDecoratorProtocol
+from clickup_mcp.types import EventHandlerDecoratorProtocol, WebhookHandlerExecution
 from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEvent,
     ClickUpWebhookEventType,
 )
 
+from .executor import ensure_async
 from .registry import get_registry
+from .scope import HandlerScope, ScopeValues
 
 # Type aliases for clarity (human-friendly)
 EventReturn = object
@@ -39,32 +50,6 @@ AsyncHandler = Callable[[ClickUpWebhookEvent], Awaitable[EventReturn]]
 Handler = Callable[[ClickUpWebhookEvent], EventReturn | Awaitable[EventReturn]]
 
 
-class _HandlerFn(Protocol):
-    def __call__(self, event: ClickUpWebhookEvent, /) -> EventReturn | Awaitable[EventReturn]: ...
-
-
-def ensure_async(fn: _HandlerFn) -> AsyncHandler:
-    """
-    Wrap a sync handler into an async function if needed.
-
-    Args:
-        fn: A function that accepts `ClickUpWebhookEvent` and may be sync or async
-
-    Returns:
-        AsyncHandler: An awaitable version of the handler
-
-    Notes:
-        If `fn` is already async, it is returned unchanged.
-    """
-    if inspect.iscoroutinefunction(fn):
-        return fn
-
-    async def wrapper(event: ClickUpWebhookEvent) -> None:
-        fn(event)
-
-    return wrapper
-
-
 class ClickUpEventDecorator(EventHandlerDecoratorProtocol):
     """
     Decorator facade for registering webhook handlers.
@@ -76,18 +61,33 @@ class ClickUpEventDecorator(EventHandlerDecoratorProtocol):
       after registering the async-wrapped version in the registry
     """
 
-    def __call__(self, event_type: ClickUpWebhookEventType):
+    def __call__(
+        self,
+        event_type: ClickUpWebhookEventType,
+        *,
+        execution: Optional[WebhookHandlerExecution] = None,
+        list_id: ScopeValues = None,
+        folder_id: ScopeValues = None,
+        space_id: ScopeValues = None,
+        field: ScopeValues = None,
+    ):
         """
         Enum-based usage:
 
             @clickup_event(ClickUpWebhookEventType.TASK_STATUS_UPDATED)
             async def handler(event: ClickUpWebhookEvent) -> None:
                 ...
+
+        `execution` selects where a sync handler runs ("thread", "inline", "process");
+        see `handler.executor`. `list_id`, `folder_id`, `space_id` and `field` (a changed
+        `history_items` field) take one value or an iterable and narrow the handler to
+        matching events; see `handler.scope`.
         """
+        scope = HandlerScope.of(list_id=list_id, folder_id=folder_id, space_id=space_id, field=field)
 
         def decorator(func: Handler):
-            async_fn = ensure_async(func)
-            get_registry().register(event_type, async_fn)  # type: ignore[arg-type]
+            async_fn = ensure_async(func, execution=execution)
+            get_registry().register(event_type, async_fn, scope=scope)
             # Return original function to preserve user function identity
             return func
 
@@ -0,0 +1,163 @@
+"""
+Execution of synchronous ClickUp webhook handlers.
+
+Design:
+- Registry dispatch is async; synchronous (`def`) handlers are adapted by `ensure_async`.
+- By default a sync handler runs in a bounded, process-wide thread pool so blocking work
+  (database writes, HTTP calls) does not stall the event loop shared with MCP traffic.
+- A handler can opt out (`"inline"`: called directly on the event loop, for trivial
+  handlers) or move CPU-heavy work to a process pool (`"process"`: the handler and the
+  event are pickled, so the handler must be importable at module level).
+- The default mode comes from `CLICKUP_WEBHOOK_SYNC_HANDLER_EXECUTION`; a handler marked
+  with `@handler_execution(...)` overrides it. Async handlers are never wrapped.
+
+Usage Examples:
+    from clickup_mcp.web_server.event.handler import clickup_event, handler_execution
+
+    @clickup_event.task_updated
+    def write_audit_row(event):           # runs in the thread pool
+        db.insert(event.body)
+
+    @clickup_event.task_created
+    @handler_execution("inline")
+    def count(event):                     # cheap, stays on the event loop
+        counters["created"] += 1
+
+Environment:
+- `CLICKUP_WEBHOOK_SYNC_HANDLER_EXECUTION`: default mode ("thread", "inline", "process")
+- `CLICKUP_WEBHOOK_HANDLER_THREAD_WORKERS`: thread pool size (default 8)
+- `CLICKUP_WEBHOOK_HANDLER_PROCESS_WORKERS`: process pool size (default: CPU count)
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, TypeVar, get_args
+
+from clickup_mcp.config import get_settings
+from clickup_mcp.types import WebhookHandlerExecution
+from clickup_mcp.web_server.event.models import ClickUpWebhookEvent
+
+_EXECUTION_ATTR = "__clickup_handler_execution__"
+_MODES = frozenset(get_args(WebhookHandlerExecution.__value__))
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def handler_execution(mode: WebhookHandlerExecution) -> Callable[[_F], _F]:
+    """
+    Mark a synchronous handler with the execution mode it should use.
+
+    Args:
+        mode: "thread", "inline" or "process"
+
+    Returns:
+        Decorator returning the same function, tagged with the mode
+
+    Raises:
+        ValueError: If `mode` is not a known execution mode
+    """
+    if mode not in _MODES:
+        raise ValueError(f"Unknown handler execution mode: {mode!r} (expected one of {sorted(_MODES)})")
+
+    def decorator(fn: _F) -> _F:
+        # Bound methods do not accept attributes; tag the underlying function instead
+        setattr(getattr(fn, "__func__", fn), _EXECUTION_ATTR, mode)
+        return fn
+
+    return decorator
+
+
+def _thread_executor() -> ThreadPoolExecutor:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=get_settings().clickup_webhook_handler_thread_workers,
+            thread_name_prefix="clickup-webhook-handler",
+        )
+    return _thread_pool
+
+
+def _process_executor() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=get_settings().clickup_webhook_handler_process_workers)
+    return _process_pool
+
+
+def _call_discarding_result(fn: Callable[[ClickUpWebhookEvent], object], event: ClickUpWebhookEvent) -> None:
+    # Module-level so it pickles; handler return values are not sent back across processes
+    fn(event)
+
+
+def ensure_async(
+    fn: Callable[[ClickUpWebhookEvent], object],
+    *,
+    execution: Optional[WebhookHandlerExecution] = None,
+) -> Callable[[ClickUpWebhookEvent], Awaitable[None]]:
+    """
+    Wrap a sync handler into an async function if needed.
+
+    Args:
+        fn: A function that accepts `ClickUpWebhookEvent` and may be sync or async
+        execution: Execution mode for a sync `fn`; defaults to the mode set with
+            `handler_execution`, then to `CLICKUP_WEBHOOK_SYNC_HANDLER_EXECUTION`
+
+    Returns:
+        AsyncHandler: An awaitable version of the handler
+
+    Notes:
+        If `fn` is already async, it is returned unchanged. Wrappers keep the name of
+        `fn` so retries and dead letters identify the original handler.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return fn
+
+    mode = execution or getattr(fn, _EXECUTION_ATTR, None) or get_settings().clickup_webhook_sync_handler_execution
+
+    if mode == "inline":
+
+        @functools.wraps(fn)
+        async def inline_wrapper(event: ClickUpWebhookEvent) -> None:
+            fn(event)
+
+        return inline_wrapper
+
+    if mode == "process":
+
+        @functools.wraps(fn)
+        async def process_wrapper(event: ClickUpWebhookEvent) -> None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_process_executor(), _call_discarding_result, fn, event)
+
+        return process_wrapper
+
+    @functools.wraps(fn)
+    async def thread_wrapper(event: ClickUpWebhookEvent) -> None:
+        loop = asyncio.get_running_loop()
+        # Propagate contextvars (e.g. logging/tracing context) into the worker thread
+        call = functools.partial(contextvars.copy_context().run, fn, event)
+        await loop.run_in_executor(_thread_executor(), call)
+
+    return thread_wrapper
+
+
+def shutdown_handler_executors(wait: bool = True) -> None:
+    """
+    Shut down the handler thread and process pools.
+
+    Pools are recreated lazily if handlers run again afterwards.
+
+    Args:
+        wait: Block until running handlers finish
+    """
+    global _thread_pool, _process_pool
+    pools: list[Executor] = [p for p in (_thread_pool, _process_pool) if p is not None]
+    _thread_pool = _process_pool = None
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -5,6 +5,8 @@ Design:
 - Subclass `BaseClickUpWebhookHandler` and override `on_*` methods for events you care about.
 - The base class auto-registers overridden methods into the central registry on instantiation.
 - Instances are callable and route incoming events to the appropriate overridden method.
+- `on_*` overrides may be sync (`def`); like decorator-registered handlers they run in the
+  handler thread pool unless marked with `@handler_execution(...)` (see `handler.executor`).
 
 Registration semantics:
 - During `__init__`, the base inspects overridden methods and registers them with `get_registry()`.
@@ -12,6 +14,7 @@ Registration semantics:
 
 Usage Example:
     from clickup_mcp.web_server.event.handler.oop import BaseClickUpWebhookHandler
+    from clickup_mcp.web_server.event.handler.scope import HandlerScope
     from clickup_mcp.web_server.event.models import ClickUpWebhookEvent
 
     class TaskStatusHandler(BaseClickUpWebhookHandler):
@@ -20,10 +23,17 @@ Usage Example:
 
     # Instantiate to register handlers
     _ = TaskStatusHandler()
+
+    class TeamAHandler(BaseClickUpWebhookHandler):
+        # every overridden on_* method only receives events inside this scope
+        scope = HandlerScope.of(list_id="901")
+
+        async def on_task_created(self, event: ClickUpWebhookEvent) -> None:
+            ...
 """
 
 from abc import ABC
-from typing import Optional
+from typing import ClassVar, Optional
 
 from clickup_mcp.types import EventHandlerProtocol
 from clickup_mcp.web_server.event.models import (
@@ -31,7 +41,9 @@ from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEventType,
 )
 
+from .executor import ensure_async
 from .registry import AsyncHandler, get_registry
+from .scope import HandlerScope
 
 
 class BaseClickUpWebhookHandler(ABC, EventHandlerProtocol):
@@ -45,15 +57,18 @@ class BaseClickUpWebhookHandler(ABC, EventHandlerProtocol):
     Notes:
     - Creating an instance triggers registration.
     - The instance is also callable and will dispatch events to the resolved method.
+    - Set the `scope` class attribute to a `HandlerScope` to register every override with it.
     """
 
+    scope: ClassVar[Optional[HandlerScope]] = None
+
     def __init__(self) -> None:
         self._register_overridden_handlers()
 
     async def __call__(self, event: ClickUpWebhookEvent) -> None:
         handler = self._resolve_handler(event.type)
         if handler is not None:
-            await handler(event)
+            await ensure_async(handler)(event)
 
     # ----- Hooks to be optionally overridden by subclasses -----
 
@@ -207,4 +222,4 @@ class BaseClickUpWebhookHandler(ABC, EventHandlerProtocol):
             if base_method is not None and func is base_method:
                 # Not overridden on subclass
                 continue
-            registry.register(event_type, handler)
+            registry.register(event_type, ensure_async(handler), scope=self.scope)
@@ -4,7 +4,18 @@ ClickUp webhook event handler registry.
 Design:
 - Central in-process registry keyed by `ClickUpWebhookEventType` → list of async handlers.
 - Used by decorator API and OOP base class to register handlers.
-- `dispatch()` awaits all handlers registered for the event type.
+- Registrations may carry a `HandlerScope` (list/folder/space ids, changed fields). Per event
+  type the registry keeps the unscoped handlers plus a routing index
+  `dimension -> value -> handlers`, keyed on each scope's first constrained dimension.
+  `handlers_for_event()` extracts the event's facets once, looks up only the index buckets
+  for the values it carries, re-checks the remaining dimensions of multi-dimension scopes,
+  and returns the result in registration order. Types without scoped handlers skip facet
+  extraction entirely.
+- `dispatch()` awaits the handlers matching the event; the first failure propagates.
+  `event.retry.RetryingDispatcher` isolates and retries failures per handler.
+- `subscribed_types` is a precomputed frozenset of event types with at least one handler,
+  refreshed on every registration, so the webhook ingress can drop unsubscribed events
+  with a single set lookup.
 
 Usage Example:
     from clickup_mcp.web_server.event.handler.registry import get_registry
@@ -15,46 +26,136 @@ Usage Example:
 
     reg = get_registry()
     reg.register(ClickUpWebhookEventType.TASK_UPDATED, handle_task_updated)
+    reg.register(
+        ClickUpWebhookEventType.TASK_UPDATED,
+        handle_task_updated,
+        scope=HandlerScope.of(list_id="901", field="status"),
+    )
 """
 
-from collections import defaultdict
-from typing import Awaitable, Callable, Dict, List
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional
 
 from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEvent,
     ClickUpWebhookEventType,
 )
 
+from .scope import SCOPE_DIMENSIONS as _DIMENSIONS
+from .scope import EventFacets, HandlerScope
+
 AsyncHandler = Callable[[ClickUpWebhookEvent], Awaitable[None]]
 
 
+@dataclass(frozen=True)
+class _Route:
+    seq: int
+    handler: AsyncHandler
+    scope: Optional[HandlerScope]
+    # Scopes constraining more than the indexed dimension must be re-checked on lookup
+    recheck: bool
+
+
+@dataclass
+class _TypeRoutes:
+    routes: List[_Route] = field(default_factory=list)
+    unscoped: List[_Route] = field(default_factory=list)
+    index: Dict[str, Dict[str, List[_Route]]] = field(default_factory=dict)
+
+
 class ClickUpEventRegistry:
     """
     Central registry of event handlers.
 
-    Handlers are grouped by `ClickUpWebhookEventType` and stored as async callables.
+    Handlers are grouped by `ClickUpWebhookEventType` and stored as async callables,
+    optionally narrowed by a `HandlerScope`.
     """
 
     def __init__(self) -> None:
-        self._handlers: Dict[ClickUpWebhookEventType, List[AsyncHandler]] = defaultdict(list)
+        self._routes: Dict[ClickUpWebhookEventType, _TypeRoutes] = {}
+        self._seq = 0
+        self._subscribed: FrozenSet[ClickUpWebhookEventType] = frozenset()
+
+    @property
+    def subscribed_types(self) -> FrozenSet[ClickUpWebhookEventType]:
+        """Event types that have at least one registered handler."""
+        return self._subscribed
+
+    def is_subscribed(self, event_type: ClickUpWebhookEventType) -> bool:
+        """Return True when at least one handler is registered for `event_type`."""
+        return event_type in self._subscribed
+
+    def register(
+        self,
+        event_type: ClickUpWebhookEventType,
+        handler: AsyncHandler,
+        scope: Optional[HandlerScope] = None,
+    ) -> None:
+        """
+        Register an async handler for an event type.
 
-    def register(self, event_type: ClickUpWebhookEventType, handler: AsyncHandler) -> None:
-        """Register an async handler for an event type."""
-        self._handlers[event_type].append(handler)
+        Args:
+            event_type: Event type the handler subscribes to
+            handler: Async callable receiving the event
+            scope: Optional `HandlerScope`; the handler only receives events inside it
+        """
+        if scope is not None and scope.is_empty:
+            scope = None
+        dimension = scope.index_dimension() if scope is not None else None
+        recheck = scope is not None and sum(getattr(scope, d) is not None for d in _DIMENSIONS) > 1
+        route = _Route(seq=self._seq, handler=handler, scope=scope, recheck=recheck)
+        self._seq += 1
+
+        table = self._routes.setdefault(event_type, _TypeRoutes())
+        table.routes.append(route)
+        if scope is None or dimension is None:
+            table.unscoped.append(route)
+        else:
+            buckets = table.index.setdefault(dimension, {})
+            for value in getattr(scope, dimension):
+                buckets.setdefault(value, []).append(route)
+        if event_type not in self._subscribed:
+            self._subscribed = self._subscribed | {event_type}
+
+    def handlers_for(self, event_type: ClickUpWebhookEventType) -> List[AsyncHandler]:
+        """Return every handler registered for an event type (scoped or not), in registration order."""
+        table = self._routes.get(event_type)
+        return [r.handler for r in table.routes] if table is not None else []
+
+    def handlers_for_event(self, event: ClickUpWebhookEvent) -> List[AsyncHandler]:
+        """Return the handlers whose scope matches the event, in registration order."""
+        table = self._routes.get(event.type)
+        if table is None:
+            return []
+        if not table.index:
+            return [r.handler for r in table.unscoped]
+
+        facets = EventFacets.of(event)
+        matched: Dict[int, _Route] = {r.seq: r for r in table.unscoped}
+        for dimension, buckets in table.index.items():
+            for value in getattr(facets, dimension):
+                for route in buckets.get(value, ()):
+                    if route.seq in matched:
+                        continue
+                    if route.recheck and not route.scope.matches_facets(facets):  # type: ignore[union-attr]
+                        continue
+                    matched[route.seq] = route
+        return [matched[seq].handler for seq in sorted(matched)]
 
     async def dispatch(self, event: ClickUpWebhookEvent) -> None:
         """
-        Dispatch an event to all registered handlers for its type.
+        Dispatch an event to the handlers registered for its type whose scope matches.
 
         Handlers are awaited sequentially.
         """
-        handlers = self._handlers.get(event.type, [])
-        for handler in handlers:
+        for handler in self.handlers_for_event(event):
             await handler(event)
 
     def clear(self) -> None:
         """Helper for tests to reset the registry."""
-        self._handlers.clear()
+        self._routes.clear()
+        self._seq = 0
+        self._subscribed = frozenset()
 
 
 _registry = ClickUpEventRegistry()
@@ -0,0 +1,165 @@
+"""
+Declarative handler scopes for ClickUp webhook routing.
+
+Design:
+- A `HandlerScope` narrows a handler to events about particular lists, folders, spaces, or
+  to events whose `history_items` change particular fields. Dimensions are ANDed; the
+  values inside one dimension are ORed. An empty scope matches every event.
+- `EventFacets` holds the routing values extracted from an event. The registry extracts
+  them once per dispatch and uses them to look up the matching handlers in its routing
+  index, so scoped handlers that cannot match are never called.
+
+Where the values come from:
+- list: `body["list_id"]`, plus `history_items[].parent_id` for task events (ClickUp sends
+  the task's list there) and the `before`/`after` list ids of `section_moved` items.
+- folder / space: `body["folder_id"]` / `body["space_id"]`. ClickUp task payloads do not
+  carry these, so folder- and space-scoped handlers see container events (list/folder/space
+  webhooks) or bodies that a forwarding layer enriched.
+- field: `history_items[].field` (e.g. `status`, `assignee_add`, `due_date`).
+
+Usage Examples:
+    from clickup_mcp.web_server.event.handler import clickup_event
+    from clickup_mcp.web_server.event.handler.scope import HandlerScope
+
+    @clickup_event.task_updated
+    async def any_list(event): ...
+
+    @clickup_event(ClickUpWebhookEventType.TASK_UPDATED, list_id="901", field=("status", "priority"))
+    async def team_a_triage(event): ...
+
+    HandlerScope.of(space_id=["s1", "s2"]).matches(event)
+"""
+
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, Optional, Tuple, Union
+
+from clickup_mcp.web_server.event.models import ClickUpWebhookEvent
+
+ScopeValues = Union[str, int, Iterable[Union[str, int]], None]
+
+# Dimension order is also the index preference: the first constrained dimension of a scope
+# becomes its index key, so the most selective one should come first.
+SCOPE_DIMENSIONS: Tuple[str, ...] = ("list_ids", "folder_ids", "space_ids", "fields")
+
+
+def _values(raw: ScopeValues) -> Optional[FrozenSet[str]]:
+    if raw is None:
+        return None
+    if isinstance(raw, (str, int)):
+        return frozenset({str(raw)})
+    values = frozenset(str(v) for v in raw)
+    if not values:
+        raise ValueError("A handler scope dimension needs at least one value; omit it to match everything")
+    return values
+
+
+def _as_id(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get("id")
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+@dataclass(frozen=True)
+class EventFacets:
+    """Routing values of one event, one frozenset per scope dimension."""
+
+    list_ids: FrozenSet[str] = frozenset()
+    folder_ids: FrozenSet[str] = frozenset()
+    space_ids: FrozenSet[str] = frozenset()
+    fields: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def of(cls, event: ClickUpWebhookEvent) -> "EventFacets":
+        """Extract routing values from an event body."""
+        body = event.body
+        lists: set[str] = set()
+        fields: set[str] = set()
+        list_id = _as_id(body.get("list_id"))
+        if list_id is not None:
+            lists.add(list_id)
+        task_event = body.get("task_id") is not None
+        items = body.get("history_items") or ()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            field_name = item.get("field")
+            if field_name:
+                fields.add(str(field_name))
+            if task_event:
+                parent = _as_id(item.get("parent_id"))
+                if parent is not None:
+                    lists.add(parent)
+                if field_name == "section_moved":
+                    for side in ("before", "after"):
+                        moved = _as_id(item.get(side))
+                        if moved is not None:
+                            lists.add(moved)
+        folder_id = _as_id(body.get("folder_id"))
+        space_id = _as_id(body.get("space_id"))
+        return cls(
+            list_ids=frozenset(lists),
+            folder_ids=frozenset({folder_id}) if folder_id is not None else frozenset(),
+            space_ids=frozenset({space_id}) if space_id is not None else frozenset(),
+            fields=frozenset(fields),
+        )
+
+
+@dataclass(frozen=True)
+class HandlerScope:
+    """
+    Declarative filter attached to a handler registration.
+
+    Attributes:
+        list_ids: Lists the event must reference (any of), or None for all
+        folder_ids: Folders the event must reference (any of), or None for all
+        space_ids: Spaces the event must reference (any of), or None for all
+        fields: `history_items` fields of which at least one must change, or None for all
+    """
+
+    list_ids: Optional[FrozenSet[str]] = None
+    folder_ids: Optional[FrozenSet[str]] = None
+    space_ids: Optional[FrozenSet[str]] = None
+    fields: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def of(
+        cls,
+        *,
+        list_id: ScopeValues = None,
+        folder_id: ScopeValues = None,
+        space_id: ScopeValues = None,
+        field: ScopeValues = None,
+    ) -> "HandlerScope":
+        """Build a scope from single values or iterables; ids are compared as strings."""
+        return cls(
+            list_ids=_values(list_id),
+            folder_ids=_values(folder_id),
+            space_ids=_values(space_id),
+            fields=_values(field),
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """True when no dimension is constrained (the scope matches every event)."""
+        return all(getattr(self, dim) is None for dim in SCOPE_DIMENSIONS)
+
+    def index_dimension(self) -> Optional[str]:
+        """The dimension the registry indexes this scope under, or None if unscoped."""
+        for dim in SCOPE_DIMENSIONS:
+            if getattr(self, dim) is not None:
+                return dim
+        return None
+
+    def matches_facets(self, facets: EventFacets) -> bool:
+        """Return True when every constrained dimension intersects the event's values."""
+        for dim in SCOPE_DIMENSIONS:
+            wanted = getattr(self, dim)
+            if wanted is not None and wanted.isdisjoint(getattr(facets, dim)):
+                return False
+        return True
+
+    def matches(self, event: ClickUpWebhookEvent) -> bool:
+        """Return True when the event falls inside this scope."""
+        return self.is_empty or self.matches_facets(EventFacets.of(event))
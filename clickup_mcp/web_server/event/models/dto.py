@@ -32,6 +32,8 @@ class ClickUpWebhookHistoryUser(BaseModel):
     id: str | int
     username: Optional[str] = None
 
+    model_config = {"extra": "allow"}
+
 
 class ClickUpWebhookHistoryItem(BaseModel):
     """Change record describing what changed in an entity.
@@ -54,6 +56,9 @@ class ClickUpWebhookHistoryItem(BaseModel):
     before: Any = None
     after: Any = None
 
+    # Keep undeclared keys such as `parent_id` and `data`
+    model_config = {"extra": "allow"}
+
 
 class ClickUpWebhookRequest(BaseModel):
     """Top-level ClickUp webhook body.
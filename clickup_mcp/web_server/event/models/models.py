@@ -32,8 +32,10 @@ Examples:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Mapping, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional
 
+from .dto import ClickUpWebhookHistoryItem
 from .enums import ClickUpWebhookEventType
 
 
@@ -49,10 +51,13 @@ class ClickUpWebhookEvent:
         headers: Request headers captured at ingress
         received_at: UTC timestamp when the server received the webhook
         delivery_id: Optional delivery-request identifier (e.g., X-Request-Id)
+        body_size: Size in bytes of the request body as received (0 when unknown)
 
     Notes:
     - Dataclass is intentionally lightweight for fast serialization to MQ sinks.
     - See `event.mq.serialize_event` for wire representation.
+    - `body` is the parsed request JSON as received; `history` validates its
+      `history_items` into DTOs only when first accessed.
 
     Examples:
         ClickUpWebhookEvent(
@@ -70,6 +75,12 @@ class ClickUpWebhookEvent:
     headers: Mapping[str, str]
     received_at: datetime
     delivery_id: Optional[str] = None
+    body_size: int = 0
+
+    @cached_property
+    def history(self) -> List[ClickUpWebhookHistoryItem]:
+        """`body["history_items"]` validated into DTOs on first access (then cached)."""
+        return [ClickUpWebhookHistoryItem.model_validate(item) for item in self.body.get("history_items") or ()]
 
 
 @dataclass
@@ -4,20 +4,32 @@ from __future__ import annotations
 Message queue integration for ClickUp webhook events.
 
 Design:
-- Provides a queue-backed `EventSink` implementation (`QueueEventSink`) that publishes
-  normalized webhook events to a topic (default: `clickup.webhooks`).
-- Includes a simple consumer loop (`run_clickup_webhook_consumer`) that reads messages
-  and dispatches them to the in-process registry.
+- Provides a queue-backed `EventSink` implementation (`QueueEventSink`) that buffers
+  normalized webhook events and publishes them in batches to a topic (default: `clickup.webhooks`).
+  Each `handle()` call waits for its batch to be published, so a failed publish fails the
+  webhook request and ClickUp redelivers the event.
+- Includes a concurrent consumer (`ClickUpWebhookConsumer`, run by `run_clickup_webhook_consumer`)
+  that reads messages and dispatches them to the in-process registry with bounded in-flight
+  concurrency, ordered per entity, acknowledging only after successful handling.
 
 Environment & configuration:
-- Uses `QUEUE_BACKEND` to select a concrete message-queue backend via `abe` loader.
+- Uses `QUEUE_BACKEND` to select a concrete message-queue backend via `abe` loader, or
+  the built-in `local-durable` SQLite backend (see `backends.durable`).
 - Topic name is `_TOPIC_NAME` ("clickup.webhooks").
+- Batching is tuned with `CLICKUP_WEBHOOK_QUEUE_MAX_BATCH_SIZE`, `CLICKUP_WEBHOOK_QUEUE_LINGER_MS`
+  and `CLICKUP_WEBHOOK_QUEUE_MAX_BATCH_BYTES` (see `clickup_mcp.config.Settings`).
+- Messages are keyed per entity; `CLICKUP_WEBHOOK_QUEUE_PARTITION_KEY` selects the strategy.
+- Payloads use the compact version 2 envelope from `codec`; only headers listed in
+  `CLICKUP_WEBHOOK_HEADER_ALLOWLIST` are carried.
+- Consumer concurrency and batch pulls are tuned with `CLICKUP_WEBHOOK_CONSUMER_CONCURRENCY`
+  and `CLICKUP_WEBHOOK_CONSUMER_BATCH_SIZE`; `clickup-webhook-consumer --workers N` runs N processes.
 
 Usage Examples:
     # Producer path
     from clickup_mcp.web_server.event.mq import QueueEventSink
     sink = QueueEventSink(backend_name="kafka")
-    await sink.handle(event)  # publishes serialized event to MQ
+    await sink.handle(event)  # returns once the batch holding the event is published
+    await sink.aclose()       # flush on shutdown
 
     # Consumer path
     import asyncio
@@ -26,21 +38,58 @@ Usage Examples:
 
 See also:
 - `clickup_mcp.web_server.event.handler.get_registry` – in-process registry used by consumer
+- `clickup_mcp.web_server.event.retry.get_dispatcher` – per-handler retry and dead-lettering
 - `clickup_mcp.web_server.event.bootstrap.import_handler_modules_from_env` – discover handlers
 """
 
 import asyncio
+import json
+import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+    cast,
+    runtime_checkable,
+)
 
 from abe.backends.message_queue.base.protocol import MessageQueueBackend
 from abe.backends.message_queue.loader import load_backend
 
+from clickup_mcp.client import ClickUpAPIClient, ClickUpAPIClientFactory, get_api_token
+from clickup_mcp.config import get_settings
+from clickup_mcp.metrics import (
+    CONSUMER_HANDLED,
+    CONSUMER_IN_FLIGHT,
+    CONSUMER_RECEIVED,
+    QUEUE_BATCH_BYTES,
+    QUEUE_BATCH_EVENTS,
+    QUEUE_PUBLISH_DURATION,
+    QUEUE_PUBLISH_FAILURES,
+)
+from clickup_mcp.types import WebhookPartitionKeyStrategy
+
 from .bootstrap import import_handler_modules_from_env
-from .handler import get_registry
-from .models import ClickUpWebhookEvent, ClickUpWebhookEventType
+from .codec import DEFAULT_HEADER_ALLOWLIST, from_wire, to_wire
+from .handler import ClickUpEventRegistry, shutdown_handler_executors
+from .models import ClickUpWebhookEvent
+from .partitioning import PartitionKeyStrategy, get_partition_key_strategy
+from .projections import install_projections, shutdown_projections
+from .retry import RetryingDispatcher, get_dispatcher, shutdown_dispatcher
 from .sink import EventSink
+from .workflows import shutdown_workflow_engine, start_workflow_engine
+
+logger = logging.getLogger(__name__)
 
 _TOPIC_NAME = "clickup.webhooks"
 
@@ -48,53 +97,50 @@ _TOPIC_NAME = "clickup.webhooks"
 _queue_backend: Optional[MessageQueueBackend] = None
 
 
-def serialize_event(event: ClickUpWebhookEvent) -> Dict[str, Any]:
+def serialize_event(
+    event: ClickUpWebhookEvent, header_allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST
+) -> Dict[str, Any]:
     """
     Convert a `ClickUpWebhookEvent` into a transport-friendly dict.
 
+    Produces the compact version 2 envelope (see `codec.to_wire`): one copy of the
+    body, an epoch-ms timestamp and only allowlisted headers.
+
     Args:
         event: Normalized webhook event
+        header_allowlist: Lower-case header names to carry
 
     Returns:
         Dict with primitives suitable for MQ payloads
     """
-    return {
-        "type": event.type.value,
-        "body": event.body,
-        "headers": dict(event.headers),
-        "received_at": event.received_at.isoformat(),
-        "delivery_id": event.delivery_id,
-    }
+    return to_wire(event, header_allowlist)
 
 
 def deserialize_event(message: Dict[str, Any]) -> ClickUpWebhookEvent:
     """
     Convert a MQ message payload into a `ClickUpWebhookEvent`.
 
+    Accepts both the version 2 envelope and legacy version 1 payloads.
+
     Args:
         message: Dict payload previously produced by `serialize_event`
 
     Returns:
         ClickUpWebhookEvent: normalized event object
     """
-    return ClickUpWebhookEvent(
-        type=ClickUpWebhookEventType(message["type"]),
-        body=message["body"],
-        raw=message.get("body", {}),
-        headers=message.get("headers") or {},
-        received_at=datetime.fromisoformat(message["received_at"]),
-        delivery_id=message.get("delivery_id"),
-    )
+    return from_wire(message)
 
 
 def _load_backend_selected(backend_name: str) -> MessageQueueBackend:
     """
     Get or initialize the global queue backend.
 
-    Sets `QUEUE_BACKEND` then lazily loads a single global backend instance.
+    Sets `QUEUE_BACKEND` then lazily loads a single global backend instance. Backends
+    shipped with this package (`backends.BUILTIN_BACKENDS`, e.g. `local-durable`) are
+    created directly; any other name is resolved by the `abe` loader.
 
     Args:
-        backend_name: Backend identifier (e.g., "kafka", "redis")
+        backend_name: Backend identifier (e.g., "kafka", "redis", "local-durable")
 
     Returns:
         MessageQueueBackend: Global backend instance
@@ -103,28 +149,103 @@ def _load_backend_selected(backend_name: str) -> MessageQueueBackend:
 
     global _queue_backend
     if _queue_backend is None:
-        _queue_backend = load_backend()
+        from .backends import BUILTIN_BACKENDS
+
+        builtin = BUILTIN_BACKENDS.get(backend_name)
+        _queue_backend = builtin.from_env() if builtin is not None else load_backend()
     return _queue_backend
 
 
+def _resolve_partition_key(strategy: WebhookPartitionKeyStrategy | PartitionKeyStrategy) -> PartitionKeyStrategy:
+    """Accept either a strategy name or a custom key function."""
+    if isinstance(strategy, str):
+        return get_partition_key_strategy(strategy)
+    return strategy
+
+
+class _Batch:
+    """Events buffered for one publish and the future their `handle()` calls wait on."""
+
+    __slots__ = ("messages", "nbytes", "published")
+
+    def __init__(self) -> None:
+        self.messages: List[Tuple[str, Dict[str, Any]]] = []
+        self.nbytes = 0
+        self.published: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        # Waiters may all have been cancelled; don't warn about an unretrieved failure
+        self.published.add_done_callback(_retrieve_exception)
+
+
+def _retrieve_exception(future: asyncio.Future[None]) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+def _estimated_size(event: ClickUpWebhookEvent, payload: Dict[str, Any]) -> int:
+    # The ingress records the request body size; the envelope adds little to it
+    if event.body_size:
+        return event.body_size
+    return len(json.dumps(payload, separators=(",", ":"), default=str))
+
+
 class QueueEventSink(EventSink):
     """
-    MQ-backed event sink that publishes webhook events to a topic.
+    MQ-backed event sink that buffers webhook events and publishes them in batches.
+
+    A batch is flushed when any of these limits is reached:
+    - `max_batch_size` buffered events
+    - `max_batch_bytes` bytes (the request body sizes recorded at ingress)
+    - `linger_ms` milliseconds since the first event of the batch was buffered
+
+    `handle()` returns once the batch holding its event has been published and raises
+    if that publish failed, so the webhook response reflects whether the event reached
+    the queue (ClickUp redelivers on an error status). Batches are published one at a
+    time, in order.
+
+    Backends exposing `publish_batch(messages)` receive the whole batch in one call;
+    otherwise every message of the batch is published concurrently via `publish()`.
+    Call `aclose()` on shutdown to flush whatever is still buffered.
+
+    Messages are keyed by the event's entity (see `partitioning`) so partitioned brokers
+    spread events across partitions while keeping per-entity order. Events without an
+    entity id, or every event under the `topic` strategy, are keyed by the topic name.
 
     Attributes:
         _backend_name: Backend name resolved by `abe` loader
         _backend: Cached backend instance
-        _topic: Topic name (defaults to `clickup.webhooks`)
+        _topic: Topic name (defaults to `clickup.webhooks`), also the fallback partition key
 
     Examples:
-        sink = QueueEventSink(backend_name="kafka")
-        await sink.handle(event)
+        sink = QueueEventSink(backend_name="kafka", max_batch_size=50, linger_ms=10, partition_key="entity")
+        await sink.handle(event)  # returns once the event's batch is published
+        await sink.aclose()
     """
 
-    def __init__(self, backend_name: str) -> None:
+    def __init__(
+        self,
+        backend_name: str,
+        *,
+        max_batch_size: int = 100,
+        linger_ms: float = 5.0,
+        max_batch_bytes: int = 1_048_576,
+        partition_key: WebhookPartitionKeyStrategy | PartitionKeyStrategy = "entity",
+        header_allowlist: Iterable[str] = DEFAULT_HEADER_ALLOWLIST,
+        backend: Optional[MessageQueueBackend] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
         self._backend_name: str = backend_name
-        self._backend: Optional[MessageQueueBackend] = None
+        self._backend: Optional[MessageQueueBackend] = backend
         self._topic: str = _TOPIC_NAME
+        self._max_batch_size = max_batch_size
+        self._linger_s = max(linger_ms, 0.0) / 1000.0
+        self._max_batch_bytes = max_batch_bytes
+        self._partition_key = _resolve_partition_key(partition_key)
+        self._header_allowlist = frozenset(h.lower() for h in header_allowlist)
+        self._batch: Optional[_Batch] = None
+        self._linger_task: Optional[asyncio.Task[None]] = None
+        self._publishing: Set[asyncio.Task[None]] = set()
+        self._publish_lock = asyncio.Lock()
 
     def _ensure_backend(self) -> MessageQueueBackend:
         """Lazily load and cache the queue backend instance."""
@@ -135,40 +256,366 @@ class QueueEventSink(EventSink):
 
     async def handle(self, event: ClickUpWebhookEvent) -> None:
         """
-        Publish the event to the configured MQ backend.
+        Buffer the event and wait until its batch is published to the configured MQ backend.
+
+        The batch is sealed when it reaches its size or byte limit, or by a linger timer.
+
+        Raises:
+            Exception: Whatever the backend raised while publishing the event's batch
+        """
+        payload = serialize_event(event, self._header_allowlist)
+        nbytes = _estimated_size(event, payload)
+        batch = self._batch
+        if batch is not None and batch.nbytes + nbytes > self._max_batch_bytes:
+            self._seal()
+            batch = None
+        if batch is None:
+            batch = self._batch = _Batch()
+            self._linger_task = asyncio.create_task(self._linger_then_seal())
+        batch.messages.append((self._partition_key(event) or self._topic, payload))
+        batch.nbytes += nbytes
+        if len(batch.messages) >= self._max_batch_size or batch.nbytes >= self._max_batch_bytes:
+            self._seal()
+        # Shielded: a cancelled request must not cancel the publish other requests wait on
+        await asyncio.shield(batch.published)
+
+    async def flush(self) -> None:
+        """
+        Publish everything currently buffered and wait for every pending publish.
 
-        Awaits if the backend returns a coroutine.
+        Raises:
+            Exception: Whatever the backend raised while publishing the buffered batch
         """
+        batch = self._seal()
+        if self._publishing:
+            await asyncio.wait(set(self._publishing))
+        if batch is not None:
+            batch.published.result()
+
+    async def aclose(self) -> None:
+        """Flush buffered events; call on shutdown."""
+        await self.flush()
+
+    def _seal(self) -> Optional[_Batch]:
+        # Hand the current batch to a publish task; later events start a new batch
+        batch, self._batch = self._batch, None
+        if self._linger_task is not None and self._linger_task is not asyncio.current_task():
+            self._linger_task.cancel()
+        self._linger_task = None
+        if batch is None:
+            return None
+        task = asyncio.create_task(self._publish(batch))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+        return batch
+
+    async def _linger_then_seal(self) -> None:
+        await asyncio.sleep(self._linger_s)
+        self._seal()
+
+    async def _publish(self, batch: _Batch) -> None:
+        async with self._publish_lock:
+            try:
+                await self._publish_batch(batch.messages, batch.nbytes)
+            except Exception as exc:  # noqa: BLE001 - reported to every handle() waiting on the batch
+                logger.warning(
+                    "Failed to publish %d webhook events to queue backend '%s': %s",
+                    len(batch.messages),
+                    self._backend_name,
+                    exc,
+                )
+                batch.published.set_exception(exc)
+            else:
+                batch.published.set_result(None)
+
+    async def _publish_batch(self, batch: List[Tuple[str, Dict[str, Any]]], nbytes: int) -> None:
         backend = self._ensure_backend()
-        payload = serialize_event(event)
-        result = backend.publish(key=self._topic, payload=payload)
-        if asyncio.iscoroutine(result):
-            await result
+        started = time.perf_counter()
+        try:
+            publish_batch = getattr(backend, "publish_batch", None)
+            if publish_batch is not None:
+                result = publish_batch(batch)
+                if asyncio.iscoroutine(result):
+                    await result
+            else:
+                pending = [backend.publish(key=key, payload=payload) for key, payload in batch]
+                await asyncio.gather(*(r for r in pending if asyncio.iscoroutine(r)))
+        except Exception:
+            QUEUE_PUBLISH_FAILURES.inc(backend=self._backend_name)
+            raise
+        QUEUE_PUBLISH_DURATION.observe(time.perf_counter() - started, backend=self._backend_name)
+        QUEUE_BATCH_EVENTS.observe(len(batch), backend=self._backend_name)
+        QUEUE_BATCH_BYTES.observe(nbytes, backend=self._backend_name)
+
+
+@runtime_checkable
+class AcknowledgingBackend(Protocol):
+    """
+    Optional backend extension (beyond the `abe` protocol) for per-message settlement.
+
+    `ack` removes a handled message; `nack` hands it back for redelivery. Messages may be
+    settled in any order (e.g., `LocalDurableQueueBackend`).
+    """
 
+    def ack(self, message: Any) -> Any: ...
+
+    def nack(self, message: Any) -> Any: ...
+
+
+@runtime_checkable
+class CommittingBackend(Protocol):
+    """
+    Optional backend extension for offset-based brokers.
 
-async def run_clickup_webhook_consumer(backend_name: str) -> None:
+    `commit(message)` marks the message and everything consumed before it as done, so
+    the consumer commits only the contiguous prefix of completed messages.
+    """
+
+    def commit(self, message: Any) -> Any: ...
+
+
+class _Delivery:
+    __slots__ = ("message", "done")
+
+    def __init__(self, message: Dict[str, Any]) -> None:
+        self.message = message
+        self.done = False
+
+
+class ConsumerStoppedError(RuntimeError):
+    """Raised by `ClickUpWebhookConsumer.run` when it stops early to keep a failed message uncommitted."""
+
+
+class ClickUpWebhookConsumer:
+    """
+    Concurrent consumer that dispatches queued webhook events to the registry.
+
+    Behavior:
+    - Up to `concurrency` messages are handled at once; pulling pauses while all slots are busy.
+    - Messages sharing a partition key (by default the entity id, see `partitioning`) run strictly
+      in arrival order; messages with different keys run concurrently. Events without an entity
+      key share the topic key, mirroring how `QueueEventSink` partitions them.
+    - Backends exposing `consume_batch(group=..., max_messages=...)` are pulled in batches of
+      `batch_size`; otherwise the plain `consume(group=...)` iterator is used.
+    - Settlement uses the optional backend extensions; backends with neither are not told.
+      `AcknowledgingBackend`: a message is acked once dispatched and nacked, for redelivery,
+      when dispatch raises.
+      `CommittingBackend`: messages complete out of order across keys, so only the contiguous
+      prefix of completed messages (in arrival order) is committed. When dispatch raises, the
+      consumer stops pulling, drains, commits what it can and raises `ConsumerStoppedError`;
+      the broker redelivers from the last committed message.
+    - Undecodable messages can never succeed, so redelivering them cannot help: they are
+      logged, counted as failed and settled as handled (acked, or committed past).
+
+    Examples:
+        consumer = ClickUpWebhookConsumer(backend, get_registry(), concurrency=32)
+        await consumer.run()
+    """
+
+    def __init__(
+        self,
+        backend: MessageQueueBackend,
+        registry: ClickUpEventRegistry | RetryingDispatcher,
+        *,
+        concurrency: int = 16,
+        batch_size: int = 64,
+        group: str = _TOPIC_NAME,
+        partition_key: WebhookPartitionKeyStrategy | PartitionKeyStrategy = "entity",
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._backend = backend
+        self._registry = registry
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._group = group
+        self._partition_key = _resolve_partition_key(partition_key)
+        self._slots = asyncio.Semaphore(concurrency)
+        self._in_flight: Set[asyncio.Task[None]] = set()
+        self._tails: Dict[str, asyncio.Task[None]] = {}
+        self._committing = not isinstance(backend, AcknowledgingBackend) and isinstance(backend, CommittingBackend)
+        self._uncommitted: Deque[_Delivery] = deque()
+        self._commit_lock = asyncio.Lock()
+        self._stopped_by: Optional[str] = None
+
+    async def run(self) -> None:
+        """
+        Consume until the backend stream ends, then wait for in-flight messages.
+
+        Raises:
+            ConsumerStoppedError: A message of a committing backend could not be handled
+        """
+        try:
+            async for batch in self._batches():
+                for message in batch:
+                    await self._submit(message)
+                    if self._stopped_by is not None:
+                        break
+                if self._stopped_by is not None:
+                    break
+        finally:
+            await self.drain()
+        if self._stopped_by is not None:
+            raise ConsumerStoppedError(self._stopped_by)
+
+    async def drain(self) -> None:
+        """Wait for every in-flight message to finish."""
+        while self._in_flight:
+            await asyncio.wait(set(self._in_flight))
+
+    async def _batches(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        consume_batch = getattr(self._backend, "consume_batch", None)
+        if consume_batch is not None:
+            async for batch in consume_batch(group=self._group, max_messages=self._batch_size):
+                yield list(batch)
+            return
+        async for message in self._backend.consume(group=self._group):
+            yield [message]
+
+    async def _submit(self, message: Dict[str, Any]) -> None:
+        await self._slots.acquire()
+        CONSUMER_RECEIVED.inc(group=self._group)
+        delivery = _Delivery(message)
+        if self._committing:
+            self._uncommitted.append(delivery)
+        try:
+            event = deserialize_event(message)
+        except Exception:  # noqa: BLE001 - a poison message must not stop the consumer
+            logger.exception("Failed to decode ClickUp webhook message")
+            CONSUMER_HANDLED.inc(group=self._group, outcome="failed")
+            self._slots.release()
+            # Redelivering cannot help; settle it as handled so the consumer moves past it
+            await self._settle(delivery, ok=True)
+            return
+
+        key = self._partition_key(event) or self._group
+        previous = self._tails.get(key)
+        task = asyncio.create_task(self._process(delivery, event, key, previous))
+        self._tails[key] = task
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        CONSUMER_IN_FLIGHT.observe(len(self._in_flight), group=self._group)
+
+    async def _process(
+        self,
+        delivery: _Delivery,
+        event: ClickUpWebhookEvent,
+        key: str,
+        previous: Optional[asyncio.Task[None]],
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait({previous})
+            try:
+                await self._registry.dispatch(event)
+            except Exception:  # noqa: BLE001 - failures are isolated per message
+                logger.exception("Dispatch failed for ClickUp webhook event %s", event.type.value)
+                CONSUMER_HANDLED.inc(group=self._group, outcome="failed")
+                await self._settle(delivery, ok=False)
+            else:
+                CONSUMER_HANDLED.inc(group=self._group, outcome="processed")
+                await self._settle(delivery, ok=True)
+        finally:
+            self._slots.release()
+            if self._tails.get(key) is asyncio.current_task():
+                del self._tails[key]
+
+    async def _settle(self, delivery: _Delivery, *, ok: bool) -> None:
+        if self._committing:
+            if ok:
+                delivery.done = True
+                await self._commit_completed()
+            elif self._stopped_by is None:
+                self._stopped_by = "a queued ClickUp webhook event could not be handled; stopping so it is redelivered"
+            return
+        if isinstance(self._backend, AcknowledgingBackend):
+            result = self._backend.ack(delivery.message) if ok else self._backend.nack(delivery.message)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def _commit_completed(self) -> None:
+        # Serialized so commits reach the broker in arrival order
+        async with self._commit_lock:
+            while self._uncommitted and self._uncommitted[0].done:
+                delivery = self._uncommitted.popleft()
+                result = cast(CommittingBackend, self._backend).commit(delivery.message)
+                if asyncio.iscoroutine(result):
+                    await result
+
+
+async def run_clickup_webhook_consumer(
+    backend_name: str,
+    *,
+    concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> None:
     """
     Consume webhook events from MQ and dispatch to the local registry.
 
     Steps:
     - Import user handler modules (ensures registry contains handlers)
     - Resolve backend via the same mechanism used by the producer
-    - Consume messages and route to `get_registry().dispatch` after deserialization
+    - Run a `ClickUpWebhookConsumer` that deserializes messages and routes them to
+      the registry concurrently, preserving per-entity order
+    - Retry failed handlers with backoff and dead-letter them (see `event.retry`)
+    - Maintain webhook projections when `CLICKUP_WEBHOOK_PROJECTIONS_ENABLED` is set, and
+      run the workflow engine when `CLICKUP_WEBHOOK_WORKFLOWS_TEAM_ID` is set, since this
+      process, not the web server, sees the queued events (see `event.projections` and
+      `event.workflows`)
+
+    Args:
+        backend_name: Backend identifier (e.g., "kafka", "redis")
+        concurrency: Maximum in-flight messages (default from `CLICKUP_WEBHOOK_CONSUMER_CONCURRENCY`)
+        batch_size: Messages per batch pull (default from `CLICKUP_WEBHOOK_CONSUMER_BATCH_SIZE`)
     """
     # Make sure user handler modules are loaded so registry has handlers
     import_handler_modules_from_env()
     # Resolve loader the same way as the producer sink
     backend = _load_backend_selected(backend_name)
-    # Register webhook event handler
-    registry = get_registry()
+    # Dispatch through per-handler retries so failing handlers neither block nor lose events
+    dispatcher = get_dispatcher()
+
+    settings = get_settings()
+    if settings.clickup_webhook_projections_enabled:
+        install_projections()
+    api_client = _own_api_client() if settings.clickup_webhook_workflows_team_id else None
+    consumer = ClickUpWebhookConsumer(
+        backend,
+        dispatcher,
+        concurrency=concurrency or settings.clickup_webhook_consumer_concurrency,
+        batch_size=batch_size or settings.clickup_webhook_consumer_batch_size,
+        partition_key=settings.clickup_webhook_queue_partition_key,
+    )
+    try:
+        await start_workflow_engine()
+        await consumer.run()
+    finally:
+        await shutdown_dispatcher()
+        await shutdown_workflow_engine()
+        await shutdown_projections()
+        shutdown_handler_executors()
+        if api_client is not None:
+            await api_client.close()
+
+
+def _own_api_client() -> Optional[ClickUpAPIClient]:
+    # Workflow actions call ClickUp; the web server's client lives in another process
+    try:
+        ClickUpAPIClientFactory.get()
+    except AssertionError:
+        return ClickUpAPIClientFactory.create(api_token=get_api_token())
+    return None
+
 
-    async for msg in backend.consume(group=_TOPIC_NAME):
-        event = deserialize_event(msg)
-        await registry.dispatch(event)
+def _run_consumer_process(backend_name: str, concurrency: Optional[int], batch_size: Optional[int]) -> None:
+    asyncio.run(run_clickup_webhook_consumer(backend_name=backend_name, concurrency=concurrency, batch_size=batch_size))
 
 
 def main() -> None:  # pragma: no cover - thin CLI wrapper
     import argparse
+    import multiprocessing
     import os
 
     parser = argparse.ArgumentParser(description="Run ClickUp webhook consumer")
@@ -178,6 +625,52 @@ def main() -> None:  # pragma: no cover - thin CLI wrapper
         default=os.getenv("QUEUE_BACKEND", "local"),
         help="Queue backend name (default from QUEUE_BACKEND env)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of consumer processes to run (default: 1)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum in-flight messages per process (default from CLICKUP_WEBHOOK_CONSUMER_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=None,
+        help="Messages pulled per batch (default from CLICKUP_WEBHOOK_CONSUMER_BATCH_SIZE)",
+    )
     args = parser.parse_args()
-
-    asyncio.run(run_clickup_webhook_consumer(backend_name=args.queue_backend))
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.workers == 1:
+        asyncio.run(
+            run_clickup_webhook_consumer(
+                backend_name=args.queue_backend, concurrency=args.concurrency, batch_size=args.batch_size
+            )
+        )
+        return
+
+    processes = [
+        multiprocessing.Process(
+            target=_run_consumer_process,
+            args=(args.queue_backend, args.concurrency, args.batch_size),
+            name=f"clickup-webhook-consumer-{i}",
+        )
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
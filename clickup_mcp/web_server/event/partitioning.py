@@ -0,0 +1,98 @@
+"""
+Partition key strategies for queued ClickUp webhook events.
+
+Design:
+- Partitioned brokers (Kafka, Redis streams, ...) hash the message key to pick a partition.
+  Keying every event by the topic name sends all traffic to one partition, so consumers
+  cannot scale out. These strategies derive the key from the entity an event is about
+  instead, keeping per-entity ordering while spreading load.
+- The same strategy is used by the consumer as its ordering key, so events that share a
+  partition key are also handled in order within a consumer process.
+
+Strategies:
+- `entity` (default): the most specific id in the body (task, key result, goal, list,
+  folder, space), e.g. `task:abc123`.
+- `container`: the enclosing list/folder/space id when present, falling back to `entity`.
+  Orders all events of a list together at the cost of coarser partitioning.
+- `topic`: no entity key; every event uses the topic name (legacy behavior).
+
+Usage Examples:
+    from clickup_mcp.web_server.event.partitioning import get_partition_key_strategy
+
+    key_for = get_partition_key_strategy("entity")
+    key_for(event)  # "task:abc123" or None when the body carries no entity id
+"""
+
+from typing import Callable, Dict, Optional
+
+from .models import ClickUpWebhookEvent
+
+PartitionKeyStrategy = Callable[[ClickUpWebhookEvent], Optional[str]]
+
+# Most specific first: task events may also reference their list, goals their key results, ...
+_ENTITY_ID_FIELDS = (
+    ("task_id", "task"),
+    ("key_result_id", "key_result"),
+    ("goal_id", "goal"),
+    ("list_id", "list"),
+    ("folder_id", "folder"),
+    ("space_id", "space"),
+)
+
+_CONTAINER_ID_FIELDS = (
+    ("list_id", "list"),
+    ("folder_id", "folder"),
+    ("space_id", "space"),
+)
+
+
+def _first_id(event: ClickUpWebhookEvent, fields: tuple[tuple[str, str], ...]) -> Optional[str]:
+    body = event.body
+    for field_name, prefix in fields:
+        value = body.get(field_name)
+        if value:
+            return f"{prefix}:{value}"
+    return None
+
+
+def entity_partition_key(event: ClickUpWebhookEvent) -> Optional[str]:
+    """Key by the most specific entity id in the event body."""
+    return _first_id(event, _ENTITY_ID_FIELDS)
+
+
+def container_partition_key(event: ClickUpWebhookEvent) -> Optional[str]:
+    """Key by the enclosing list/folder/space, falling back to the entity id."""
+    return _first_id(event, _CONTAINER_ID_FIELDS) or entity_partition_key(event)
+
+
+def topic_partition_key(_: ClickUpWebhookEvent) -> Optional[str]:
+    """Disable entity keys; callers fall back to the topic name."""
+    return None
+
+
+_STRATEGIES: Dict[str, PartitionKeyStrategy] = {
+    "entity": entity_partition_key,
+    "container": container_partition_key,
+    "topic": topic_partition_key,
+}
+
+
+def get_partition_key_strategy(name: str) -> PartitionKeyStrategy:
+    """
+    Resolve a partition key strategy by name.
+
+    Args:
+        name: One of `entity`, `container`, `topic` (case-insensitive)
+
+    Returns:
+        PartitionKeyStrategy: Function mapping an event to its key (None means "use the topic")
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return _STRATEGIES[name.lower()]
+    except KeyError as exc:
+        raise ValueError(
+            f"Unknown partition key strategy '{name}'. Expected one of: {', '.join(sorted(_STRATEGIES))}"
+        ) from exc
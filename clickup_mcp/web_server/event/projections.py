@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+"""
+Incrementally maintained projections over ClickUp webhook events.
+
+Design:
+- A `Projection` folds events into in-memory state as they are dispatched by the handler
+  registry, so queries are answered from that state instead of listing tasks through
+  the ClickUp API.
+- `TaskProjection` keeps a small state record per task (list, status, closed flag,
+  assignees) fed by `taskCreated`, `taskStatusUpdated`, `taskAssigneeUpdated`,
+  `taskMoved` and `taskDeleted`. From these records it maintains two derived indexes:
+  task counts per status for each list, and open tasks per assignee. Each event updates
+  only the task it names, and each query is a dict lookup.
+- Applying an event sets task state; it does not add deltas. Re-applying events that
+  are already reflected (e.g. replaying the event log after restoring a checkpoint)
+  therefore leaves the state unchanged.
+- `ProjectionManager` registers the projections with the registry. It writes a JSON
+  checkpoint per projection at most every `checkpoint_interval` seconds and on shutdown.
+  On start it restores the checkpoints, then catches up from the event log (see
+  `event.eventlog`) when one is configured. Events are deltas, so the catch-up refuses
+  to read a compacted range of the log: after `clickup-webhook-log compact`, projections
+  need a checkpoint newer than the compaction watermark, or they start from the
+  checkpoints alone with a warning.
+- Projections only see events dispatched in this process. With a queue backend
+  (`QUEUE_BACKEND` other than "local") the web server does not install them;
+  `run_clickup_webhook_consumer` does, and the web server's `projection.*` tools report
+  them as unavailable rather than answering with counts that stopped at startup.
+- `install_projections` publishes the manager as the process-wide projection store of
+  `clickup_mcp.projections`, where the `projection.*` MCP tools read it.
+
+Usage Examples:
+    from clickup_mcp.web_server.event.projections import install_projections
+
+    manager = install_projections()            # registers handlers, restores checkpoints
+    tasks = manager.get("tasks")
+    tasks.status_counts("list_1")              # {"to do": 3, "in progress": 1}
+    tasks.open_tasks_for("183")                # 2
+
+Environment:
+- `CLICKUP_WEBHOOK_PROJECTIONS_ENABLED`: install projections at web server start, or at
+  consumer start with a queue backend
+- `CLICKUP_WEBHOOK_PROJECTION_CHECKPOINT_DIR`: checkpoint directory (no checkpoints when unset)
+- `CLICKUP_WEBHOOK_PROJECTION_CHECKPOINT_INTERVAL`: seconds between checkpoints (default 30)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set
+
+from clickup_mcp.projections import (
+    TASK_PROJECTION,
+    ProjectionStatus,
+    publish_projection_store,
+)
+
+from .handler import ClickUpEventRegistry, get_registry
+from .handler.registry import AsyncHandler
+from .models import ClickUpWebhookEvent, ClickUpWebhookEventType
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_VERSION = 1
+# ClickUp status types that mean the task is no longer open work
+_CLOSED_STATUS_TYPES = frozenset({"closed", "done"})
+
+
+class Projection(ABC):
+    """
+    State derived from webhook events.
+
+    Subclasses declare the event types they consume and implement an idempotent `apply`.
+    """
+
+    name: str
+    event_types: FrozenSet[ClickUpWebhookEventType]
+
+    @abstractmethod
+    def apply(self, event: ClickUpWebhookEvent) -> None:  # pragma: no cover - interface
+        """Fold one event into the state. Must not raise for unexpected payloads."""
+
+    @abstractmethod
+    def snapshot(self) -> Dict[str, Any]:  # pragma: no cover - interface
+        """Return a JSON-serializable copy of the state."""
+
+    @abstractmethod
+    def restore(self, state: Mapping[str, Any]) -> None:  # pragma: no cover - interface
+        """Replace the state with a snapshot."""
+
+
+@dataclass
+class _TaskState:
+    list_id: Optional[str] = None
+    status: Optional[str] = None
+    closed: bool = False
+    assignees: Set[str] = field(default_factory=set)
+
+
+def _epoch_ms(value: datetime) -> int:
+    # Naive datetimes are UTC, as produced by the webhook ingress
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def _history(event: ClickUpWebhookEvent) -> List[Mapping[str, Any]]:
+    items = event.body.get("history_items") or []
+    return [item for item in items if isinstance(item, Mapping)]
+
+
+def _as_id(value: Any) -> Optional[str]:
+    if isinstance(value, Mapping):
+        value = value.get("id")
+    return str(value) if value not in (None, "") else None
+
+
+class TaskProjection(Projection):
+    """
+    Task counts per status per list, and open tasks per assignee.
+    """
+
+    name = TASK_PROJECTION
+    event_types = frozenset(
+        {
+            ClickUpWebhookEventType.TASK_CREATED,
+            ClickUpWebhookEventType.TASK_STATUS_UPDATED,
+            ClickUpWebhookEventType.TASK_ASSIGNEE_UPDATED,
+            ClickUpWebhookEventType.TASK_MOVED,
+            ClickUpWebhookEventType.TASK_DELETED,
+        }
+    )
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, _TaskState] = {}
+        self._status_counts: Dict[str, Dict[str, int]] = {}
+        self._open_by_assignee: Dict[str, int] = {}
+
+    # ----- Queries (O(1) per key) -----
+
+    def status_counts(self, list_id: str) -> Dict[str, int]:
+        """Number of tasks per status name in a list."""
+        return dict(self._status_counts.get(list_id, {}))
+
+    def open_tasks_for(self, assignee_id: str) -> int:
+        """Number of open (not closed/done) tasks assigned to a user."""
+        return self._open_by_assignee.get(assignee_id, 0)
+
+    def workloads(self) -> Dict[str, int]:
+        """Open task count for every assignee with at least one open task."""
+        return dict(self._open_by_assignee)
+
+    @property
+    def task_count(self) -> int:
+        return len(self._tasks)
+
+    # ----- Event folding -----
+
+    def apply(self, event: ClickUpWebhookEvent) -> None:
+        task_id = _as_id(event.body.get("task_id"))
+        if task_id is None:
+            return
+        if event.type is ClickUpWebhookEventType.TASK_DELETED:
+            self._replace(task_id, None)
+            return
+
+        current = self._tasks.get(task_id)
+        state = _TaskState(
+            list_id=current.list_id if current else None,
+            status=current.status if current else None,
+            closed=current.closed if current else False,
+            assignees=set(current.assignees) if current else set(),
+        )
+        list_id = _as_id(event.body.get("list_id"))
+        for item in _history(event):
+            item_field = item.get("field")
+            after = item.get("after")
+            before = item.get("before")
+            if item_field == "status" and isinstance(after, Mapping):
+                state.status = after.get("status") or state.status
+                state.closed = str(after.get("type") or "").lower() in _CLOSED_STATUS_TYPES
+                list_id = list_id or _as_id(item.get("parent_id"))
+            elif item_field == "assignee_add":
+                if (user := _as_id(after)) is not None:
+                    state.assignees.add(user)
+            elif item_field == "assignee_rem":
+                if (user := _as_id(before)) is not None:
+                    state.assignees.discard(user)
+            elif item_field == "section_moved":
+                list_id = _as_id(after) or list_id
+            elif event.type is ClickUpWebhookEventType.TASK_CREATED:
+                list_id = list_id or _as_id(item.get("parent_id"))
+        if list_id is not None:
+            state.list_id = list_id
+        self._replace(task_id, state)
+
+    def _replace(self, task_id: str, state: Optional[_TaskState]) -> None:
+        previous = self._tasks.pop(task_id, None)
+        if previous is not None:
+            self._count(previous, -1)
+        if state is not None:
+            self._tasks[task_id] = state
+            self._count(state, +1)
+
+    def _count(self, state: _TaskState, delta: int) -> None:
+        if state.list_id is not None and state.status is not None:
+            per_list = self._status_counts.setdefault(state.list_id, {})
+            remaining = per_list.get(state.status, 0) + delta
+            if remaining > 0:
+                per_list[state.status] = remaining
+            else:
+                per_list.pop(state.status, None)
+                if not per_list:
+                    del self._status_counts[state.list_id]
+        if not state.closed:
+            for user in state.assignees:
+                remaining = self._open_by_assignee.get(user, 0) + delta
+                if remaining > 0:
+                    self._open_by_assignee[user] = remaining
+                else:
+                    self._open_by_assignee.pop(user, None)
+
+    # ----- Checkpointing -----
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "tasks": {
+                task_id: {
+                    "list_id": s.list_id,
+                    "status": s.status,
+                    "closed": s.closed,
+                    "assignees": sorted(s.assignees),
+                }
+                for task_id, s in self._tasks.items()
+            }
+        }
+
+    def restore(self, state: Mapping[str, Any]) -> None:
+        self._tasks.clear()
+        self._status_counts.clear()
+        self._open_by_assignee.clear()
+        for task_id, raw in (state.get("tasks") or {}).items():
+            self._replace(
+                task_id,
+                _TaskState(
+                    list_id=raw.get("list_id"),
+                    status=raw.get("status"),
+                    closed=bool(raw.get("closed")),
+                    assignees=set(raw.get("assignees") or ()),
+                ),
+            )
+
+
+class ProjectionManager:
+    """
+    Feeds projections from the registry and checkpoints them.
+
+    Args:
+        projections: Projections to maintain (unique names)
+        checkpoint_dir: Directory for `<name>.json` checkpoints; None disables them
+        checkpoint_interval: Minimum seconds between periodic checkpoints
+    """
+
+    def __init__(
+        self,
+        projections: Iterable[Projection],
+        *,
+        checkpoint_dir: Optional[str | os.PathLike[str]] = None,
+        checkpoint_interval: float = 30.0,
+    ) -> None:
+        self._projections: Dict[str, Projection] = {p.name: p for p in projections}
+        self._status: Dict[str, ProjectionStatus] = {name: ProjectionStatus() for name in self._projections}
+        self._checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
+        self._checkpoint_interval = checkpoint_interval
+        self._last_checkpoint = time.monotonic()
+        self._checkpointing: Optional[asyncio.Task[None]] = None
+
+    def get(self, name: str) -> Projection:
+        """Return a projection by name; raises KeyError if unknown."""
+        return self._projections[name]
+
+    def status(self, name: str) -> ProjectionStatus:
+        """Return the freshness counters of a projection."""
+        return self._status[name]
+
+    def install(self, registry: Optional[ClickUpEventRegistry] = None) -> None:
+        """Register one handler per consumed event type for every projection."""
+        registry = registry or get_registry()
+        for projection in self._projections.values():
+            handler = self._handler_for(projection)
+            for event_type in projection.event_types:
+                registry.register(event_type, handler)
+
+    def _handler_for(self, projection: Projection) -> AsyncHandler:
+        async def apply_projection(event: ClickUpWebhookEvent) -> None:
+            self.apply(projection, event)
+            self._maybe_checkpoint()
+
+        apply_projection.__qualname__ = f"{type(projection).__qualname__}.apply[{projection.name}]"
+        apply_projection.__module__ = type(projection).__module__
+        return apply_projection
+
+    def apply(self, projection: Projection, event: ClickUpWebhookEvent) -> None:
+        """Fold an event into one projection and update its freshness counters."""
+        projection.apply(event)
+        status = self._status[projection.name]
+        status.events_applied += 1
+        received_ms = _epoch_ms(event.received_at)
+        if status.last_event_ms is None or received_ms > status.last_event_ms:
+            status.last_event_ms = received_ms
+
+    def catch_up(self, log: Any) -> int:
+        """
+        Apply events from an `EventLog` newer than the checkpoints.
+
+        Re-applied events at the checkpoint boundary are harmless because projections
+        are idempotent.
+
+        Returns:
+            Number of log records applied
+
+        Raises:
+            EventLogCompactedError: If the records to apply include a compacted range
+                (no checkpoint, or one not newer than the log's compaction watermark)
+        """
+        from .eventlog import EventLogCompactedError
+
+        marks = [s.last_event_ms for s in self._status.values()]
+        since_ms = min(m for m in marks if m is not None) if marks and all(m is not None for m in marks) else None
+        watermark = log.compacted_through_ms
+        if watermark is not None and (since_ms is None or since_ms <= watermark):
+            raise EventLogCompactedError(
+                "The event log was compacted and its events are deltas; a projection checkpoint newer than "
+                "the compacted range is required to catch up from it"
+            )
+        since = datetime.fromtimestamp(since_ms / 1000, tz=timezone.utc) if since_ms is not None else None
+        applied = 0
+        for record in log.read(since=since):
+            for projection in self._projections.values():
+                if record.event.type in projection.event_types:
+                    self.apply(projection, record.event)
+            applied += 1
+        return applied
+
+    def load_checkpoints(self) -> None:
+        """Restore projections from their checkpoint files, when present."""
+        if self._checkpoint_dir is None:
+            return
+        for name, projection in self._projections.items():
+            path = self._checkpoint_dir / f"{name}.json"
+            if not path.exists():
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("version") != _CHECKPOINT_VERSION:
+                logger.warning("Ignoring checkpoint %s with unsupported version %r", path, data.get("version"))
+                continue
+            projection.restore(data["state"])
+            self._status[name] = ProjectionStatus(
+                events_applied=int(data.get("events_applied", 0)), last_event_ms=data.get("last_event_ms")
+            )
+
+    def _maybe_checkpoint(self) -> None:
+        if self._checkpoint_dir is None or (self._checkpointing is not None and not self._checkpointing.done()):
+            return
+        if time.monotonic() - self._last_checkpoint < self._checkpoint_interval:
+            return
+        self._checkpointing = asyncio.ensure_future(self.checkpoint())
+
+    async def checkpoint(self) -> None:
+        """Write a checkpoint of every projection (state copied on the loop, written in a thread)."""
+        if self._checkpoint_dir is None:
+            return
+        self._last_checkpoint = time.monotonic()
+        documents = {
+            name: {
+                "version": _CHECKPOINT_VERSION,
+                "name": name,
+                "events_applied": self._status[name].events_applied,
+                "last_event_ms": self._status[name].last_event_ms,
+                "state": projection.snapshot(),
+            }
+            for name, projection in self._projections.items()
+        }
+        await asyncio.to_thread(self._write_checkpoints, documents)
+
+    def _write_checkpoints(self, documents: Mapping[str, Mapping[str, Any]]) -> None:
+        assert self._checkpoint_dir is not None
+        self._checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        for name, document in documents.items():
+            path = self._checkpoint_dir / f"{name}.json"
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(json.dumps(document, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+
+    async def aclose(self) -> None:
+        """Wait for a running checkpoint and write a final one."""
+        if self._checkpointing is not None:
+            await asyncio.wait({self._checkpointing})
+        await self.checkpoint()
+
+
+_manager: Optional[ProjectionManager] = None
+
+
+def get_projection_manager() -> Optional[ProjectionManager]:
+    """Return the installed process-wide manager, or None when projections are disabled."""
+    return _manager
+
+
+def install_projections(registry: Optional[ClickUpEventRegistry] = None) -> ProjectionManager:
+    """
+    Create the process-wide manager with the built-in projections and register it.
+
+    Restores checkpoints, then catches up from the event log when
+    `CLICKUP_WEBHOOK_EVENT_LOG_DIR` is set and no compacted range would be replayed.
+    Calling it again returns the same manager.
+    """
+    global _manager
+    if _manager is not None:
+        return _manager
+    from clickup_mcp.config import get_settings
+
+    settings = get_settings()
+    manager = ProjectionManager(
+        [TaskProjection()],
+        checkpoint_dir=settings.clickup_webhook_projection_checkpoint_dir,
+        checkpoint_interval=settings.clickup_webhook_projection_checkpoint_interval,
+    )
+    manager.load_checkpoints()
+    if settings.clickup_webhook_event_log_dir and Path(settings.clickup_webhook_event_log_dir).exists():
+        from .eventlog import EventLog, EventLogCompactedError
+
+        log = EventLog(settings.clickup_webhook_event_log_dir)
+        try:
+            applied = manager.catch_up(log)
+        except EventLogCompactedError as exc:
+            logger.warning("Projections start from their checkpoints only: %s", exc)
+        else:
+            logger.info("Projections caught up with %d event log record(s)", applied)
+        finally:
+            log.close()
+    manager.install(registry)
+    _manager = manager
+    publish_projection_store(manager)
+    return manager
+
+
+async def shutdown_projections() -> None:
+    """Checkpoint and drop the process-wide manager, if installed."""
+    global _manager
+    manager, _manager = _manager, None
+    publish_projection_store(None)
+    if manager is not None:
+        await manager.aclose()
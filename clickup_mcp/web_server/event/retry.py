@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+"""
+Per-handler retries for ClickUp webhook events.
+
+Design:
+- `RetryingDispatcher` runs every handler registered for an event and isolates failures
+  per handler: a failing handler never stops the other handlers, the webhook request,
+  or the queue consumer.
+- A failed handler is scheduled again on a `DelayQueue` with exponential backoff
+  (`RetryPolicy`). Other events keep flowing while the retry waits. A retried handler
+  may therefore see a later event for the same entity before the retried one.
+- Before a retry is scheduled, a `pending` record is written to the dead-letter store, so
+  a retry waiting in memory survives a crash as a replayable record. It is removed when
+  the handler recovers. If it cannot be written the retry is not scheduled and
+  `dispatch` raises `RetryNotPersistedError` after running the other handlers: the
+  webhook request fails, or the queue consumer nacks, and the event is delivered again.
+- Once `max_attempts` is reached, or when a handler raises `PermanentHandlerError`, the
+  (event, handler) pair is written to the dead-letter store (see `event.deadletter`).
+- On shutdown (`aclose`) retries still waiting on the delay queue are dead-lettered:
+  their pending records are replaced by final ones.
+
+Usage Examples:
+    from clickup_mcp.web_server.event.retry import get_dispatcher
+
+    await get_dispatcher().dispatch(event)   # raises only when a retry cannot be persisted
+
+    # In a handler: skip retries for errors that cannot succeed later
+    from clickup_mcp.web_server.event.retry import PermanentHandlerError
+    raise PermanentHandlerError("task no longer exists")
+
+Environment:
+- `CLICKUP_WEBHOOK_HANDLER_MAX_ATTEMPTS`: attempts per handler, including the first (default 5)
+- `CLICKUP_WEBHOOK_HANDLER_RETRY_BASE_DELAY`: delay before the first retry, seconds (default 1)
+- `CLICKUP_WEBHOOK_HANDLER_RETRY_MAX_DELAY`: upper bound of a retry delay, seconds (default 300)
+- `CLICKUP_WEBHOOK_DEAD_LETTER_PATH`: dead-letter file, also holding pending retries
+"""
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from .codec import to_wire
+from .deadletter import (
+    DeadLetterRecord,
+    DeadLetterStore,
+    get_dead_letter_store,
+    handler_name,
+)
+from .handler import ClickUpEventRegistry, get_registry
+from .handler.registry import AsyncHandler
+from .models import ClickUpWebhookEvent
+
+logger = logging.getLogger(__name__)
+
+
+class PermanentHandlerError(Exception):
+    """Raised by a handler to dead-letter the event immediately, without retries."""
+
+
+class RetryNotPersistedError(RuntimeError):
+    """Raised by `RetryingDispatcher.dispatch` when a failed handler could not be persisted for retry or replay."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Exponential backoff settings.
+
+    The delay before attempt `n + 1` is `base_delay * multiplier ** (n - 1)`, capped at
+    `max_delay`, then spread by up to `jitter` (a fraction) in either direction.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 300.0
+    multiplier: float = 2.0
+    jitter: float = 0.1
+
+    def delay_for(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+
+@dataclass
+class _PendingRetry:
+    handler: AsyncHandler
+    event: ClickUpWebhookEvent
+    attempt: int
+    error: str
+    record_id: str
+    timer: asyncio.TimerHandle
+
+
+class DelayQueue:
+    """
+    Runs jobs after a delay without holding a task per waiting job.
+
+    Jobs are kept on the event loop's timer heap; when a job is due it is started as a
+    task. `drain_pending()` removes jobs that have not started yet and returns them.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[int, _PendingRetry] = {}
+        self._running: Set[asyncio.Task[Any]] = set()
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def schedule(
+        self,
+        delay: float,
+        handler: AsyncHandler,
+        event: ClickUpWebhookEvent,
+        attempt: int,
+        error: str,
+        record_id: str,
+        job: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Run `job` after `delay` seconds; the other fields describe it for `drain_pending`."""
+        job_id = self._next_id
+        self._next_id += 1
+        timer = asyncio.get_running_loop().call_later(delay, self._start, job_id, job)
+        self._pending[job_id] = _PendingRetry(handler, event, attempt, error, record_id, timer)
+
+    def _start(self, job_id: int, job: Callable[[], Awaitable[Any]]) -> None:
+        if self._pending.pop(job_id, None) is None:
+            return
+        task = asyncio.ensure_future(job())
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    def drain_pending(self) -> List[_PendingRetry]:
+        """Cancel and return the jobs that have not started."""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for item in pending:
+            item.timer.cancel()
+        return pending
+
+    async def wait_running(self) -> None:
+        """Wait for started jobs to finish."""
+        while self._running:
+            await asyncio.wait(set(self._running))
+
+
+@dataclass
+class DispatchMetrics:
+    """
+    Counters collected by `RetryingDispatcher`.
+
+    Attributes:
+        handler_failures: Handler attempts that raised
+        retries_scheduled: Retries put on the delay queue
+        recovered: Handlers that succeeded on a retry
+        dead_lettered: (event, handler) pairs written to the dead-letter store
+    """
+
+    handler_failures: int = 0
+    retries_scheduled: int = 0
+    recovered: int = 0
+    dead_lettered: int = 0
+
+
+class RetryingDispatcher:
+    """
+    Dispatches events to registry handlers with per-handler retry and dead-lettering.
+
+    Exposes the same `dispatch(event)` coroutine as `ClickUpEventRegistry`, so it can be
+    used wherever a registry is dispatched to.
+    """
+
+    def __init__(
+        self,
+        registry: ClickUpEventRegistry,
+        dead_letters: DeadLetterStore,
+        policy: RetryPolicy = RetryPolicy(),
+    ) -> None:
+        self._registry = registry
+        self._dead_letters = dead_letters
+        self._policy = policy
+        self._delays = DelayQueue()
+        self.metrics = DispatchMetrics()
+
+    @property
+    def pending_retries(self) -> int:
+        """Number of retries waiting on the delay queue."""
+        return len(self._delays)
+
+    async def dispatch(self, event: ClickUpWebhookEvent) -> None:
+        """
+        Run each handler matching the event in registration order; failures are retried, not raised.
+
+        Raises:
+            RetryNotPersistedError: If a failed handler's retry or dead letter could not be
+                written; the event should be delivered again
+        """
+        lost = 0
+        for handler in self._registry.handlers_for_event(event):
+            if not await self._attempt(handler, event, 1):
+                lost += 1
+        if lost:
+            raise RetryNotPersistedError(
+                f"{lost} failed handler(s) of ClickUp webhook event {event.type.value} could not be persisted"
+            )
+
+    async def _attempt(
+        self, handler: AsyncHandler, event: ClickUpWebhookEvent, attempt: int, record_id: Optional[str] = None
+    ) -> bool:
+        """Run one attempt; False when it failed and neither a retry nor a dead letter could be persisted."""
+        try:
+            await handler(event)
+        except Exception as exc:  # noqa: BLE001 - isolate every handler failure
+            self.metrics.handler_failures += 1
+            error = repr(exc)
+            if isinstance(exc, PermanentHandlerError) or attempt >= self._policy.max_attempts:
+                logger.error(
+                    "Handler %s failed for ClickUp webhook event %s after %d attempt(s): %s",
+                    handler_name(handler),
+                    event.type.value,
+                    attempt,
+                    error,
+                )
+                return await self._dead_letter(handler, event, attempt, error, replaces=record_id)
+            if record_id is None:
+                record = self._record(handler, event, attempt, error, pending=True)
+                try:
+                    await asyncio.to_thread(self._dead_letters.add, record)
+                except Exception:  # noqa: BLE001 - not retried in memory only; the caller redelivers
+                    logger.exception("Failed to persist retry of ClickUp webhook event: %s", record)
+                    return False
+                record_id = record.id
+            delay = self._policy.delay_for(attempt)
+            logger.warning(
+                "Handler %s failed for ClickUp webhook event %s (attempt %d/%d), retrying in %.2fs: %s",
+                handler_name(handler),
+                event.type.value,
+                attempt,
+                self._policy.max_attempts,
+                delay,
+                error,
+            )
+            self.metrics.retries_scheduled += 1
+            retry_of = record_id
+            self._delays.schedule(
+                delay,
+                handler,
+                event,
+                attempt,
+                error,
+                retry_of,
+                lambda: self._attempt(handler, event, attempt + 1, retry_of),
+            )
+        else:
+            if attempt > 1:
+                self.metrics.recovered += 1
+            if record_id is not None:
+                await self._remove_records([record_id])
+        return True
+
+    @staticmethod
+    def _record(
+        handler: AsyncHandler, event: ClickUpWebhookEvent, attempts: int, error: str, pending: bool = False
+    ) -> DeadLetterRecord:
+        return DeadLetterRecord(
+            handler=handler_name(handler), event=to_wire(event), error=error, attempts=attempts, pending=pending
+        )
+
+    async def _dead_letter(
+        self,
+        handler: AsyncHandler,
+        event: ClickUpWebhookEvent,
+        attempts: int,
+        error: str,
+        replaces: Optional[str] = None,
+    ) -> bool:
+        record = self._record(handler, event, attempts, error)
+        try:
+            await asyncio.to_thread(self._dead_letters.add, record)
+        except Exception:  # noqa: BLE001 - last resort; keep the event in the log
+            logger.exception("Failed to write dead letter for ClickUp webhook event: %s", record)
+            # A pending record, if any, still holds the event for replay
+            return replaces is not None
+        self.metrics.dead_lettered += 1
+        if replaces is not None:
+            await self._remove_records([replaces])
+        return True
+
+    async def _remove_records(self, ids: List[str]) -> None:
+        try:
+            await asyncio.to_thread(self._dead_letters.remove, ids)
+        except Exception:  # noqa: BLE001 - a stale pending record only risks a duplicate replay
+            logger.exception("Failed to remove pending retry record(s) %s", ids)
+
+    async def _dead_letter_pending(self) -> None:
+        pending = self._delays.drain_pending()
+        written: List[str] = []
+        for item in pending:
+            record = self._record(item.handler, item.event, item.attempt, f"{item.error} (retry pending at shutdown)")
+            try:
+                await asyncio.to_thread(self._dead_letters.add, record)
+            except Exception:  # noqa: BLE001 - the pending record stays for replay
+                logger.exception("Failed to write dead letter for ClickUp webhook event: %s", record)
+                continue
+            self.metrics.dead_lettered += 1
+            written.append(item.record_id)
+        if written:
+            # One rewrite of the store for all of them
+            await self._remove_records(written)
+
+    async def aclose(self) -> None:
+        """Dead-letter retries that have not started and wait for running ones."""
+        await self._dead_letter_pending()
+        await self._delays.wait_running()
+        # Retries that were already running may have scheduled further retries
+        await self._dead_letter_pending()
+
+
+_dispatcher: Optional[RetryingDispatcher] = None
+
+
+def get_dispatcher() -> RetryingDispatcher:
+    """Return the process-wide dispatcher over the global registry, built from settings on first use."""
+    global _dispatcher
+    if _dispatcher is None:
+        from clickup_mcp.config import get_settings
+
+        settings = get_settings()
+        _dispatcher = RetryingDispatcher(
+            get_registry(),
+            get_dead_letter_store(),
+            RetryPolicy(
+                max_attempts=settings.clickup_webhook_handler_max_attempts,
+                base_delay=settings.clickup_webhook_handler_retry_base_delay,
+                max_delay=settings.clickup_webhook_handler_retry_max_delay,
+            ),
+        )
+    return _dispatcher
+
+
+async def shutdown_dispatcher() -> None:
+    """Close and drop the process-wide dispatcher, if one was created."""
+    global _dispatcher
+    dispatcher, _dispatcher = _dispatcher, None
+    if dispatcher is not None:
+        await dispatcher.aclose()
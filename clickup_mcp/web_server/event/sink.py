@@ -7,9 +7,14 @@ Design:
 - Defines an `EventSink` abstraction that receives normalized `ClickUpWebhookEvent`
   and dispatches them either locally (in-process) or to a message queue (via mq.QueueEventSink).
 - Selection is controlled by the `QUEUE_BACKEND` environment variable.
+- When `CLICKUP_WEBHOOK_EVENT_LOG_DIR` is set, the sink is wrapped in `eventlog.EventLogSink`
+  so every event is also appended to the durable event log.
+- Sinks are cached per backend so stateful sinks (e.g., the batching queue sink) are
+  shared across requests; `shutdown_event_sinks()` flushes and drops them on shutdown.
 
 Backends:
-- `local` (default): dispatches events directly to the in-process registry.
+- `local` (default): dispatches events directly to the in-process registry, with
+  per-handler retries (see `event.retry`).
 - any other value: resolved by mq.QueueEventSink which publishes to a queue.
 
 Usage Examples:
@@ -27,11 +32,13 @@ Usage Examples:
 
 import os
 from abc import ABC, abstractmethod
+from typing import Dict
 
+from clickup_mcp.config import get_settings
 from clickup_mcp.types import EventSinkProtocol
 
-from .handler import get_registry
 from .models import ClickUpWebhookEvent
+from .retry import get_dispatcher
 
 
 class EventSink(ABC, EventSinkProtocol):
@@ -45,16 +52,36 @@ class EventSink(ABC, EventSinkProtocol):
     async def handle(self, event: ClickUpWebhookEvent) -> None:  # pragma: no cover - interface
         """Process a single webhook event."""
 
+    async def flush(self) -> None:
+        """Write out buffered events now. No-op by default."""
+
+    async def aclose(self) -> None:
+        """Release resources and flush pending work. No-op by default."""
+
 
 class LocalEventSink(EventSink):
     """
     In-process event sink using the global handler registry.
 
-    Useful for development or simple deployments without a queue.
+    Useful for development or simple deployments without a queue. Handler failures are
+    retried and dead-lettered by the process-wide `RetryingDispatcher`; they only fail the
+    webhook request, so that ClickUp delivers it again, when the retry cannot be persisted.
     """
 
     async def handle(self, event: ClickUpWebhookEvent) -> None:
-        await get_registry().dispatch(event)
+        await get_dispatcher().dispatch(event)
+
+
+_event_sinks: Dict[str, EventSink] = {}
+
+
+def _queue_backend_name() -> str:
+    return os.getenv("QUEUE_BACKEND", "local").lower()
+
+
+def dispatches_locally() -> bool:
+    """Whether webhook events are dispatched to this process's registry (QUEUE_BACKEND=local) rather than queued."""
+    return _queue_backend_name() == "local"
 
 
 def get_event_sink() -> EventSink:
@@ -62,15 +89,54 @@ def get_event_sink() -> EventSink:
     Resolve event sink from `QUEUE_BACKEND` environment variable.
 
     Returns:
-        EventSink: `LocalEventSink` when QUEUE_BACKEND=local (default), otherwise a `QueueEventSink`.
+        EventSink: `LocalEventSink` when QUEUE_BACKEND=local (default), otherwise a `QueueEventSink`,
+        wrapped in an `EventLogSink` when `CLICKUP_WEBHOOK_EVENT_LOG_DIR` is set.
+        The instance is cached per backend name.
 
     Notes:
         Uses a lazy import for MQ sink to avoid hard dependency when not needed.
     """
-    backend = os.getenv("QUEUE_BACKEND", "local").lower()
+    backend = _queue_backend_name()
+    sink = _event_sinks.get(backend)
+    if sink is not None:
+        return sink
+    settings = get_settings()
     if backend == "local":
-        return LocalEventSink()
-    # Lazy import to avoid hard dependency at import time
-    from .mq import QueueEventSink
+        sink = LocalEventSink()
+    else:
+        # Lazy import to avoid hard dependency at import time
+        from .mq import QueueEventSink
+
+        sink = QueueEventSink(
+            backend_name=backend,
+            max_batch_size=settings.clickup_webhook_queue_max_batch_size,
+            linger_ms=settings.clickup_webhook_queue_linger_ms,
+            max_batch_bytes=settings.clickup_webhook_queue_max_batch_bytes,
+            partition_key=settings.clickup_webhook_queue_partition_key,
+            header_allowlist=settings.clickup_webhook_header_allowlist,
+        )
+    if settings.clickup_webhook_event_log_dir:
+        from .eventlog import EventLog, EventLogSink
+
+        sink = EventLogSink(
+            sink,
+            EventLog(
+                settings.clickup_webhook_event_log_dir,
+                segment_bytes=settings.clickup_webhook_event_log_segment_bytes,
+                header_allowlist=settings.clickup_webhook_header_allowlist,
+            ),
+        )
+    _event_sinks[backend] = sink
+    return sink
+
+
+async def shutdown_event_sinks() -> None:
+    """
+    Flush and drop all cached event sinks.
 
-    return QueueEventSink(backend_name=backend)
+    Called when the web server shuts down so buffered events are not lost.
+    """
+    sinks = list(_event_sinks.values())
+    _event_sinks.clear()
+    for sink in sinks:
+        await sink.aclose()
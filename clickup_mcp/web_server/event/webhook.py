@@ -3,7 +3,25 @@ ClickUp webhook ingress endpoints.
 
 Design:
 - Exposes FastAPI routes under prefix `/webhook` for receiving ClickUp webhooks.
-- Validates payloads with Pydantic DTOs and normalizes to `ClickUpWebhookEvent`.
+- Reads the raw request bytes and parses the JSON once. Only the routing envelope is
+  validated (a JSON object with a known `event` and, if present, a list of
+  `history_items`); invalid requests get FastAPI's usual 422 response. The parsed dict
+  becomes the event body as-is. History items are validated into
+  `ClickUpWebhookHistoryItem` DTOs only when a handler reads `event.history`. The
+  OpenAPI document still describes the body with the `ClickUpWebhookRequest` schema.
+- Keeps only the `CLICKUP_WEBHOOK_HEADER_ALLOWLIST` headers (lower-cased names), picked
+  from the raw ASGI header list without copying the rest.
+- Calls ingress observers (`add_ingress_observer`) with the type of every valid delivery
+  before filtering. Observers react to what this process receives, such as invalidating
+  cached tool results, whatever `QUEUE_BACKEND` is. They are not handlers: they do not
+  subscribe this process to event types, so they never affect the filter below.
+- Drops events whose type has no registered handler (the registry's precomputed
+  `subscribed_types`) with a plain 200 before any normalization, and counts them in
+  `clickup_webhook_dropped_total` (see `clickup_mcp.metrics`). The filter only applies
+  when events are dispatched in this process (`QUEUE_BACKEND=local`), where the registry
+  holds every consumer, and once at least one handler is registered. Queued events are always published: the consumers'
+  handlers live in other processes. It can be disabled with
+  `CLICKUP_WEBHOOK_INGRESS_FILTER=false`.
 - Dispatches events to an `EventSink` abstraction selected by `QUEUE_BACKEND` env var:
   - `local` (default): direct in-process dispatch via handler registry
   - others: enqueues to MQ via `QueueEventSink` for async processing
@@ -14,36 +32,179 @@ Usage (curl):
       -d '{"event":"taskUpdated","task_id":"task_123","history_items":[]}'
 
 Environment:
-- `QUEUE_BACKEND`: "local" (default) for direct dispatch, otherwise selects MQ backend
+- `QUEUE_BACKEND`: "local" (default) for direct dispatch, otherwise selects MQ backend.
+  With a queue backend the in-process workflow engine (`CLICKUP_WEBHOOK_WORKFLOWS_TEAM_ID`)
+  runs in the webhook consumer process (`event.mq`), not in the web server
+- `CLICKUP_WEBHOOK_INGRESS_FILTER`: "true" (default) to drop events no local handler subscribes to
+- `CLICKUP_WEBHOOK_HEADER_ALLOWLIST`: headers kept on events (default x-signature, x-request-id, content-type)
+
+Lifecycle:
+- The router carries its own lifespan, merged into the app's by `include_router`. On
+  startup it loads the in-process workflow engine when configured and events are
+  dispatched locally. On shutdown it
+  flushes buffered sink events, dead-letters pending handler retries, waits for running
+  workflow actions, checkpoints projections and shuts down the sync handler pools. These
+  steps share the `SHUTDOWN_DRAIN_TIMEOUT` deadline of `clickup_mcp.lifecycle`; a step
+  still running at the deadline is cancelled and reported as abandoned.
 """
 
-from datetime import datetime
+import asyncio
+import contextlib
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, List, Tuple
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
 
-from .models import ClickUpWebhookEvent
+from clickup_mcp.config import get_settings
+from clickup_mcp.lifecycle import get_shutdown_coordinator
+from clickup_mcp.metrics import WEBHOOK_ACCEPTED, WEBHOOK_DROPPED, WEBHOOK_RECEIVED
+
+from .handler import get_registry, shutdown_handler_executors
+from .models import ClickUpWebhookEvent, ClickUpWebhookEventType
 from .models.dto import ClickUpWebhookRequest
-from .sink import get_event_sink
+from .projections import shutdown_projections
+from .retry import shutdown_dispatcher
+from .sink import dispatches_locally, get_event_sink, shutdown_event_sinks
+from .workflows import shutdown_workflow_engine, start_workflow_engine
+
+IngressObserver = Callable[[ClickUpWebhookEventType], None]
 
-router = APIRouter(tags=["webhooks"], prefix="/webhook")
+_ingress_observers: List[IngressObserver] = []
 
 
-@router.post("/clickup")
-async def clickup_webhook(dto: ClickUpWebhookRequest, request: Request):
+def add_ingress_observer(observer: IngressObserver) -> None:
+    """
+    Call `observer` with the type of every valid webhook delivery this process receives.
+
+    Observers run synchronously on the request path, before the ingress filter, and must
+    be cheap and not raise. Adding the same observer again does nothing.
+    """
+    if observer not in _ingress_observers:
+        _ingress_observers.append(observer)
+
+
+def remove_ingress_observer(observer: IngressObserver) -> None:
+    """Stop calling a previously added ingress observer."""
+    if observer in _ingress_observers:
+        _ingress_observers.remove(observer)
+
+
+@contextlib.asynccontextmanager
+async def _webhook_lifespan(_: FastAPI) -> AsyncIterator[None]:
+    shutdown = get_shutdown_coordinator()
+    shutdown.open()
+    try:
+        # Queued events are dispatched, and workflows run, in the consumer process
+        if dispatches_locally():
+            await start_workflow_engine()
+        yield
+        # Each step gets what is left of the shared drain deadline
+        await shutdown.run_step("event sinks", shutdown_event_sinks)
+        await shutdown.run_step("handler retries", shutdown_dispatcher)
+        await shutdown.run_step("workflow engine", shutdown_workflow_engine)
+        await shutdown.run_step("projections", shutdown_projections)
+        await shutdown.run_step("handler executors", lambda: asyncio.to_thread(shutdown_handler_executors))
+    finally:
+        shutdown.close()
+
+
+router = APIRouter(tags=["webhooks"], prefix="/webhook", lifespan=_webhook_lifespan)
+
+
+_EVENT_TYPES: Dict[str, ClickUpWebhookEventType] = {t.value: t for t in ClickUpWebhookEventType}
+
+
+def _inline_refs(node: Any, defs: Dict[str, Any]) -> Any:
+    # Operation schemas cannot point into the model's own `$defs`, so substitute them
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            target = _inline_refs(defs[ref.removeprefix("#/$defs/")], defs)
+            return {**target, **{k: _inline_refs(v, defs) for k, v in node.items() if k != "$ref"}}
+        return {k: _inline_refs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, defs) for v in node]
+    return node
+
+
+def _request_body_openapi() -> Dict[str, Any]:
+    schema = ClickUpWebhookRequest.model_json_schema()
+    defs = schema.pop("$defs", {})
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_refs(schema, defs)}},
+        }
+    }
+
+
+def _invalid(error_type: str, loc: Tuple[Any, ...], msg: str, value: Any) -> RequestValidationError:
+    return RequestValidationError([{"type": error_type, "loc": ("body", *loc), "msg": msg, "input": value}])
+
+
+def parse_webhook_body(raw: bytes) -> Tuple[ClickUpWebhookEventType, Dict[str, Any]]:
+    """
+    Parse a webhook request body and validate its routing envelope.
+
+    Args:
+        raw: Request body bytes
+
+    Returns:
+        Tuple of the event type and the parsed body
+
+    Raises:
+        RequestValidationError: If the body is not a JSON object with a known `event`
+            or `history_items` is not a list
+    """
+    try:
+        body = json.loads(raw)
+    except ValueError as exc:
+        raise _invalid("json_invalid", (), f"JSON decode error: {exc}", {}) from exc
+    if not isinstance(body, dict):
+        raise _invalid("model_attributes_type", (), "Input should be a valid dictionary or object", body)
+    value = body.get("event")
+    event_type = _EVENT_TYPES.get(value) if isinstance(value, str) else None
+    if event_type is None:
+        if value is None:
+            raise _invalid("missing", ("event",), "Field required", body)
+        raise _invalid("enum", ("event",), "Input should be a known ClickUp webhook event", value)
+    history = body.get("history_items")
+    if history is not None and not isinstance(history, list):
+        raise _invalid("list_type", ("history_items",), "Input should be a valid list", history)
+    return event_type, body
+
+
+@lru_cache(maxsize=8)
+def _raw_header_allowlist(names: Tuple[str, ...]) -> FrozenSet[bytes]:
+    return frozenset(name.lower().encode("latin-1") for name in names)
+
+
+def _allowed_headers(request: Request, names: Tuple[str, ...]) -> Dict[str, str]:
+    allowed = _raw_header_allowlist(names)
+    # ASGI header names are already lower-case bytes
+    return {k.decode("latin-1"): v.decode("latin-1") for k, v in request.scope["headers"] if k in allowed}
+
+
+@router.post("/clickup", openapi_extra=_request_body_openapi())
+async def clickup_webhook(request: Request):
     """
     Ingest a ClickUp webhook event and route it to the event sink.
 
     Flow:
-    - Validate request body into `ClickUpWebhookRequest` (Pydantic)
-    - Build normalized `ClickUpWebhookEvent` with headers and timestamp
+    - Parse the body once and validate the routing envelope (`parse_webhook_body`)
+    - Notify ingress observers of the event type
+    - Acknowledge and drop the event if it is dispatched locally and no handler subscribes to its type
+    - Build normalized `ClickUpWebhookEvent` with allowlisted headers and timestamp
     - Resolve sink via `get_event_sink()` and forward for handling
 
     Args:
-        dto: Validated ClickUp webhook payload
-        request: FastAPI request (used to capture headers)
+        request: FastAPI request (raw body and headers)
 
     Returns:
-        JSON object `{ "ok": true }` on acceptance
+        JSON object `{ "ok": true }` on acceptance (including dropped events)
 
     Examples:
         # Python - unit test style
@@ -55,20 +216,31 @@ async def clickup_webhook(dto: ClickUpWebhookRequest, request: Request):
         resp = client.post('/webhook/clickup', json={"event":"taskUpdated","task_id":"t1"})
         assert resp.status_code == 200 and resp.json()["ok"] is True
     """
-    headers = dict(request.headers)
-
-    # Construct domain event from validated DTO
-    body = dto.model_dump(mode="python")
+    raw = await request.body()
+    event_type, body = parse_webhook_body(raw)
+    WEBHOOK_RECEIVED.inc(event_type=event_type.value)
+    for observer in _ingress_observers:
+        observer(event_type)
+    settings = get_settings()
+    if settings.clickup_webhook_ingress_filter and dispatches_locally():
+        subscribed = get_registry().subscribed_types
+        if subscribed and event_type not in subscribed:
+            WEBHOOK_DROPPED.inc(event_type=event_type.value)
+            return {"ok": True}
+
+    headers = _allowed_headers(request, tuple(settings.clickup_webhook_header_allowlist))
     event = ClickUpWebhookEvent(
-        type=dto.event,
+        type=event_type,
         body=body,
         raw=body,
         headers=headers,
-        received_at=datetime.utcnow(),
-        delivery_id=headers.get("X-Request-Id"),
+        received_at=datetime.now(timezone.utc).replace(tzinfo=None),  # naive UTC, as handlers receive it
+        delivery_id=headers.get("x-request-id"),
+        body_size=len(raw),
     )
 
     sink = get_event_sink()
     await sink.handle(event)
+    WEBHOOK_ACCEPTED.inc(event_type=event_type.value)
 
     return {"ok": True}
@@ -0,0 +1,505 @@
+from __future__ import annotations
+
+"""
+In-process workflow rule engine driven by ClickUp webhook events.
+
+Design:
+- Active `Workflow` automations of a team are loaded through `WorkflowAPI` and compiled
+  once into `CompiledWorkflow` rules: the trigger type is resolved to a
+  `ClickUpWebhookEventType`, `trigger_config` becomes a `HandlerScope` (plus an optional
+  target status), and every action is validated against the supported action types.
+  Workflows that cannot be compiled are skipped and reported in the `CompileReport`.
+- Rules are indexed by event type. The engine registers one handler per indexed type
+  with the handler registry; matching an event is a dict lookup plus the precompiled
+  scope checks against facets extracted once per event, with no ClickUp round trip.
+- Actions run through the ClickUp API client. Each matching workflow runs its actions
+  in order; at most `max_concurrency` workflow runs are in flight, and the handler waits
+  for a free slot before scheduling more, so a burst of events applies backpressure to
+  the dispatcher instead of queueing unbounded work.
+- A reload swaps the whole index at once. With `refresh_interval` set, the engine
+  reloads periodically so edits made in ClickUp are picked up.
+- A workflow with active `WorkflowContext`s only runs when at least one of them has all
+  of its conditions hold. Conditions are compiled once at load time (see
+  `event.conditions`); the condition bindings are built at most once per event, and only
+  when a triggered workflow has contexts.
+
+Triggers:
+- Event type values (`taskCreated`), their snake_case names (`task_created`) and the
+  aliases in `_TRIGGER_ALIASES` (`status_changed`, `assignee_changed`, ...).
+
+trigger_config keys:
+- `list_id`, `folder_id`, `space_id`, `field`: a single value or a list (see `handler.scope`)
+- `status`: the status (or statuses) a `status` history item must change to
+
+Actions (`{"type": ..., ...}`) applied to the event's task:
+- `set_status` (`status`), `set_priority` (`priority`), `assign` / `unassign` (`user_id`),
+  `set_custom_field` (`field_id`, `value`)
+
+Actions change tasks, which emits further webhooks. Setting a value the task already has
+emits nothing, but two workflows that flip a field back and forth will loop.
+
+Usage Examples:
+    from clickup_mcp.client import ClickUpAPIClientFactory
+    from clickup_mcp.web_server.event.workflows import WorkflowEngine
+
+    engine = WorkflowEngine(ClickUpAPIClientFactory.get, max_concurrency=8)
+    report = engine.load(workflows)      # or: await engine.refresh("team_1")
+    report.skipped                       # {"wf_9": "unsupported action type 'email'"}
+
+Environment:
+- `CLICKUP_WEBHOOK_WORKFLOWS_TEAM_ID`: run the active workflows of this team (disabled when unset).
+  The engine starts in the process that dispatches events: the web server with
+  `QUEUE_BACKEND=local`, otherwise `run_clickup_webhook_consumer`
+- `CLICKUP_WEBHOOK_WORKFLOW_ACTION_CONCURRENCY`: concurrent workflow runs (default 8)
+- `CLICKUP_WEBHOOK_WORKFLOW_REFRESH_INTERVAL`: seconds between reloads (default 300, 0 disables)
+"""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from clickup_mcp.models.domain.workflow import Workflow
+from clickup_mcp.models.domain.workflow_context import WorkflowContext
+from clickup_mcp.models.dto.task import TaskUpdate
+from clickup_mcp.models.mapping.workflow_mapper import WorkflowMapper
+
+from .conditions import (
+    CompiledContext,
+    ConditionSyntaxError,
+    compile_context,
+    event_bindings,
+)
+from .handler import ClickUpEventRegistry, HandlerScope, get_registry
+from .handler.scope import EventFacets
+from .models import ClickUpWebhookEvent, ClickUpWebhookEventType
+
+if TYPE_CHECKING:
+    from clickup_mcp.client import ClickUpAPIClient
+
+logger = logging.getLogger(__name__)
+
+_TRIGGER_ALIASES: Dict[str, ClickUpWebhookEventType] = {
+    "status_changed": ClickUpWebhookEventType.TASK_STATUS_UPDATED,
+    "assignee_changed": ClickUpWebhookEventType.TASK_ASSIGNEE_UPDATED,
+    "priority_changed": ClickUpWebhookEventType.TASK_PRIORITY_UPDATED,
+    "due_date_changed": ClickUpWebhookEventType.TASK_DUE_DATE_UPDATED,
+    "tag_changed": ClickUpWebhookEventType.TASK_TAG_UPDATED,
+    "comment_posted": ClickUpWebhookEventType.TASK_COMMENT_POSTED,
+}
+
+_SCOPE_KEYS = ("list_id", "folder_id", "space_id", "field")
+
+ActionRunner = Callable[["ClickUpAPIClient", str, Mapping[str, Any]], Awaitable[bool]]
+
+
+async def _set_status(client: ClickUpAPIClient, task_id: str, action: Mapping[str, Any]) -> bool:
+    return await client.task.update(task_id, TaskUpdate(status=action["status"])) is not None
+
+
+async def _set_priority(client: ClickUpAPIClient, task_id: str, action: Mapping[str, Any]) -> bool:
+    return await client.task.update(task_id, TaskUpdate(priority=int(action["priority"]))) is not None
+
+
+async def _assign(client: ClickUpAPIClient, task_id: str, action: Mapping[str, Any]) -> bool:
+    return await client.task.add_assignee(task_id, action["user_id"])
+
+
+async def _unassign(client: ClickUpAPIClient, task_id: str, action: Mapping[str, Any]) -> bool:
+    return await client.task.remove_assignee(task_id, action["user_id"])
+
+
+async def _set_custom_field(client: ClickUpAPIClient, task_id: str, action: Mapping[str, Any]) -> bool:
+    return await client.task.set_custom_field(task_id, action["field_id"], action["value"])
+
+
+# action type -> (runner, required keys)
+_ACTIONS: Dict[str, Tuple[ActionRunner, Tuple[str, ...]]] = {
+    "set_status": (_set_status, ("status",)),
+    "set_priority": (_set_priority, ("priority",)),
+    "assign": (_assign, ("user_id",)),
+    "unassign": (_unassign, ("user_id",)),
+    "set_custom_field": (_set_custom_field, ("field_id", "value")),
+}
+
+
+def resolve_trigger(trigger_type: str) -> Optional[ClickUpWebhookEventType]:
+    """Map a workflow trigger type to a webhook event type, or None if unsupported."""
+    normalized = trigger_type.strip()
+    if normalized in _TRIGGER_ALIASES:
+        return _TRIGGER_ALIASES[normalized]
+    try:
+        return ClickUpWebhookEventType(normalized)
+    except ValueError:
+        pass
+    try:
+        return ClickUpWebhookEventType[normalized.upper()]
+    except KeyError:
+        return None
+
+
+class WorkflowCompileError(ValueError):
+    """Raised when a workflow cannot run in-process; the message says why."""
+
+
+@dataclass(frozen=True)
+class CompiledWorkflow:
+    """
+    A workflow prepared for matching.
+
+    Attributes:
+        workflow_id: Source workflow id
+        name: Source workflow name
+        event_type: Webhook event type that triggers it
+        scope: Scope compiled from `trigger_config`
+        statuses: Lower-cased target statuses from `trigger_config["status"]`, if any
+        actions: Validated actions, in execution order
+        priority: Source priority; lower runs first, None last
+        contexts: Compiled active contexts; when present, one of them must match
+    """
+
+    workflow_id: str
+    name: str
+    event_type: ClickUpWebhookEventType
+    scope: HandlerScope
+    statuses: Optional[frozenset[str]]
+    actions: Tuple[Mapping[str, Any], ...]
+    priority: Optional[int] = None
+    contexts: Tuple[CompiledContext, ...] = ()
+
+    def matches(self, event: ClickUpWebhookEvent, facets: EventFacets) -> bool:
+        """Return True when the event satisfies the trigger config (contexts not included)."""
+        if not self.scope.is_empty and not self.scope.matches_facets(facets):
+            return False
+        if self.statuses is not None:
+            return any(status in self.statuses for status in _new_statuses(event))
+        return True
+
+
+def _new_statuses(event: ClickUpWebhookEvent) -> Iterable[str]:
+    for item in event.body.get("history_items") or ():
+        if isinstance(item, Mapping) and item.get("field") == "status":
+            after = item.get("after")
+            if isinstance(after, Mapping) and after.get("status"):
+                yield str(after["status"]).lower()
+
+
+def compile_workflow(workflow: Workflow, contexts: Iterable[WorkflowContext] = ()) -> CompiledWorkflow:
+    """
+    Compile a workflow and its active contexts into a matching rule.
+
+    Raises:
+        WorkflowCompileError: If the trigger, trigger config, an action or a context
+            condition is unsupported
+    """
+    event_type = resolve_trigger(workflow.trigger_type)
+    if event_type is None:
+        raise WorkflowCompileError(f"unsupported trigger type '{workflow.trigger_type}'")
+
+    config = dict(workflow.trigger_config or {})
+    unknown = sorted(set(config) - set(_SCOPE_KEYS) - {"status"})
+    if unknown:
+        raise WorkflowCompileError(f"unsupported trigger_config keys: {', '.join(unknown)}")
+    try:
+        scope = HandlerScope.of(**{key: config.get(key) for key in _SCOPE_KEYS})
+    except ValueError as exc:
+        raise WorkflowCompileError(str(exc)) from exc
+    statuses = None
+    if config.get("status") is not None:
+        raw = config["status"]
+        statuses = frozenset(str(s).lower() for s in ([raw] if isinstance(raw, str) else raw))
+
+    if not workflow.actions:
+        raise WorkflowCompileError("workflow has no actions")
+    if not event_type.value.startswith("task"):
+        raise WorkflowCompileError(f"actions apply to tasks but '{event_type.value}' events carry no task")
+    for action in workflow.actions:
+        spec = _ACTIONS.get(str(action.get("type")))
+        if spec is None:
+            raise WorkflowCompileError(f"unsupported action type '{action.get('type')}'")
+        missing = [key for key in spec[1] if key not in action]
+        if missing:
+            raise WorkflowCompileError(f"action '{action['type']}' is missing {', '.join(missing)}")
+    try:
+        compiled_contexts = tuple(compile_context(c) for c in contexts if c.is_active)
+    except ConditionSyntaxError as exc:
+        raise WorkflowCompileError(str(exc)) from exc
+
+    return CompiledWorkflow(
+        workflow_id=workflow.workflow_id,
+        name=workflow.name,
+        event_type=event_type,
+        scope=scope,
+        statuses=statuses,
+        actions=tuple(dict(a) for a in workflow.actions),
+        priority=workflow.priority,
+        contexts=compiled_contexts,
+    )
+
+
+@dataclass
+class CompileReport:
+    """Outcome of loading workflows: compiled ids and skipped ids with the reason."""
+
+    compiled: List[str] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class WorkflowEngineMetrics:
+    """Counters exposed for monitoring."""
+
+    events_matched: int = 0
+    runs_started: int = 0
+    actions_succeeded: int = 0
+    actions_failed: int = 0
+
+
+class WorkflowEngine:
+    """
+    Evaluates compiled workflows against webhook events and runs their actions.
+
+    Args:
+        client_provider: Zero-argument callable returning the ClickUp API client
+        max_concurrency: Maximum workflow runs in flight
+        registry: Registry to install handlers into (defaults to the global one)
+    """
+
+    def __init__(
+        self,
+        client_provider: Callable[[], ClickUpAPIClient],
+        *,
+        max_concurrency: int = 8,
+        registry: Optional[ClickUpEventRegistry] = None,
+    ) -> None:
+        self._client_provider = client_provider
+        self._registry = registry or get_registry()
+        self._index: Dict[ClickUpWebhookEventType, Tuple[CompiledWorkflow, ...]] = {}
+        self._installed: Set[ClickUpWebhookEventType] = set()
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._running: Set[asyncio.Task[None]] = set()
+        self._refresher: Optional[asyncio.Task[None]] = None
+        self.metrics = WorkflowEngineMetrics()
+
+    @property
+    def workflows(self) -> List[CompiledWorkflow]:
+        """Compiled workflows currently indexed."""
+        return [wf for rules in self._index.values() for wf in rules]
+
+    def load(
+        self,
+        workflows: Iterable[Workflow],
+        contexts: Optional[Mapping[str, Iterable[WorkflowContext]]] = None,
+    ) -> CompileReport:
+        """
+        Compile active workflows, replace the index and register handlers for new event types.
+
+        Args:
+            workflows: Workflows to compile; inactive ones are ignored
+            contexts: Contexts per workflow id, if any
+        """
+        contexts = contexts or {}
+        report = CompileReport()
+        index: Dict[ClickUpWebhookEventType, List[CompiledWorkflow]] = {}
+        for workflow in workflows:
+            if not workflow.is_active:
+                continue
+            try:
+                compiled = compile_workflow(workflow, contexts.get(workflow.workflow_id, ()))
+            except WorkflowCompileError as exc:
+                report.skipped[workflow.workflow_id] = str(exc)
+                logger.warning("Skipping workflow %s (%s): %s", workflow.workflow_id, workflow.name, exc)
+                continue
+            index.setdefault(compiled.event_type, []).append(compiled)
+            report.compiled.append(compiled.workflow_id)
+
+        self._index = {
+            event_type: tuple(sorted(rules, key=lambda wf: (wf.priority is None, wf.priority or 0)))
+            for event_type, rules in index.items()
+        }
+        for event_type in self._index.keys() - self._installed:
+            self._registry.register(event_type, self.handle)
+            self._installed.add(event_type)
+        return report
+
+    async def refresh(self, team_id: str, *, page_size: int = 100) -> CompileReport:
+        """Load the team's active workflows and their contexts through the API and recompile the index."""
+        api = self._client_provider().workflow
+        workflows: List[Workflow] = []
+        page = 0
+        while True:
+            response = await api.list(team_id, page=page, limit=page_size, is_active=True)
+            if response is None:
+                raise RuntimeError(f"Listing workflows for team {team_id} failed")
+            workflows.extend(WorkflowMapper.to_domain(item) for item in response.items)
+            if len(response.items) < page_size:
+                break
+            page += 1
+        contexts = {wf.workflow_id: await self._list_contexts(wf.workflow_id, page_size) for wf in workflows}
+        return self.load(workflows, contexts)
+
+    async def _list_contexts(self, workflow_id: str, page_size: int) -> List[WorkflowContext]:
+        api = self._client_provider().workflow_context
+        contexts: List[WorkflowContext] = []
+        page = 0
+        while True:
+            response = await api.list(workflow_id, page=page, limit=page_size)
+            if response is None:
+                # Running without the contexts would drop their conditions
+                raise RuntimeError(f"Listing contexts for workflow {workflow_id} failed")
+            contexts.extend(
+                WorkflowContext(
+                    id=item.id,
+                    workflow_id=item.workflow_id,
+                    name=item.name,
+                    variables=item.variables,
+                    conditions=item.conditions,
+                    is_active=item.is_active,
+                )
+                for item in response.items
+            )
+            if len(response.items) < page_size:
+                return contexts
+            page += 1
+
+    def match(self, event: ClickUpWebhookEvent) -> List[CompiledWorkflow]:
+        """Return the workflows triggered by an event, in priority order."""
+        rules = self._index.get(event.type)
+        if not rules:
+            return []
+        facets = EventFacets.of(event)
+        bindings: Optional[Dict[str, Any]] = None
+        matched: List[CompiledWorkflow] = []
+        for wf in rules:
+            if not wf.matches(event, facets):
+                continue
+            if wf.contexts:
+                if bindings is None:
+                    bindings = event_bindings(event, facets)
+                if not any(ctx.matches(bindings) for ctx in wf.contexts):
+                    continue
+            matched.append(wf)
+        return matched
+
+    async def handle(self, event: ClickUpWebhookEvent) -> None:
+        """Registry handler: schedule a run per matching workflow, waiting for free slots."""
+        matched = self.match(event)
+        if not matched:
+            return
+        task_id = event.body.get("task_id")
+        if not task_id:
+            return
+        self.metrics.events_matched += 1
+        for workflow in matched:
+            await self._slots.acquire()
+            self.metrics.runs_started += 1
+            run = asyncio.ensure_future(self._run(workflow, str(task_id)))
+            self._running.add(run)
+            run.add_done_callback(self._running.discard)
+
+    async def _run(self, workflow: CompiledWorkflow, task_id: str) -> None:
+        try:
+            client = self._client_provider()
+            for action in workflow.actions:
+                runner = _ACTIONS[action["type"]][0]
+                try:
+                    ok = await runner(client, task_id, action)
+                except Exception as exc:  # noqa: BLE001 - one failing action must not stop the engine
+                    logger.error(
+                        "Workflow %s action %s failed for task %s: %r",
+                        workflow.workflow_id,
+                        action["type"],
+                        task_id,
+                        exc,
+                    )
+                    ok = False
+                if not ok:
+                    self.metrics.actions_failed += 1
+                    return
+                self.metrics.actions_succeeded += 1
+        finally:
+            self._slots.release()
+
+    def start(self, team_id: str, *, refresh_interval: float = 300.0) -> None:
+        """Start periodic reloads of the team's workflows (no-op when the interval is 0)."""
+        if refresh_interval <= 0 or self._refresher is not None:
+            return
+
+        async def _refresh_forever() -> None:
+            while True:
+                await asyncio.sleep(refresh_interval)
+                try:
+                    await self.refresh(team_id)
+                except Exception as exc:  # noqa: BLE001 - keep the previous index on failure
+                    logger.warning("Reloading workflows for team %s failed: %r", team_id, exc)
+
+        self._refresher = asyncio.ensure_future(_refresh_forever())
+
+    async def aclose(self) -> None:
+        """Stop reloading and wait for in-flight workflow runs."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+        if self._running:
+            await asyncio.wait(set(self._running))
+
+
+_engine: Optional[WorkflowEngine] = None
+
+
+def get_workflow_engine() -> Optional[WorkflowEngine]:
+    """Return the installed process-wide engine, or None when workflows are disabled."""
+    return _engine
+
+
+async def start_workflow_engine(registry: Optional[ClickUpEventRegistry] = None) -> Optional[WorkflowEngine]:
+    """
+    Create the process-wide engine, load the team's workflows and start periodic reloads.
+
+    Does nothing when `CLICKUP_WEBHOOK_WORKFLOWS_TEAM_ID` is unset. A failed initial load is
+    logged and retried by the periodic reload.
+    """
+    global _engine
+    from clickup_mcp.client import ClickUpAPIClientFactory
+    from clickup_mcp.config import get_settings
+
+    settings = get_settings()
+    team_id = settings.clickup_webhook_workflows_team_id
+    if not team_id:
+        return None
+    if _engine is None:
+        _engine = WorkflowEngine(
+            ClickUpAPIClientFactory.get,
+            max_concurrency=settings.clickup_webhook_workflow_action_concurrency,
+            registry=registry,
+        )
+    try:
+        report = await _engine.refresh(team_id)
+        logger.info("Loaded %d workflow(s) for team %s; skipped %d", len(report.compiled), team_id, len(report.skipped))
+    except Exception as exc:  # noqa: BLE001 - the server must start without ClickUp reachable
+        logger.warning("Loading workflows for team %s failed: %r", team_id, exc)
+    _engine.start(team_id, refresh_interval=settings.clickup_webhook_workflow_refresh_interval)
+    return _engine
+
+
+async def shutdown_workflow_engine() -> None:
+    """Stop the process-wide engine, if any, after its in-flight runs finish."""
+    global _engine
+    engine, _engine = _engine, None
+    if engine is not None:
+        await engine.aclose()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Read Projection Benchmark
+
+Per-item cost of building read-tool outputs from response DTOs, through the domain
+entity (DTO → domain → output, as the tools used to) versus the direct projections
+(DTO → output), for:
+
+- task.list_in_list items (`TaskListItem`) and task.get results (`TaskResult`)
+- time_entry.list items (`TimeEntryListItem`)
+- list.list_in_folder items (`ListListItem`) and list.get results (`ListResult`)
+- space.list items (`SpaceListItem`)
+
+Usage:
+    python scripts/benchmarks/read_projection.py --items 1000 --rounds 20
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List, Tuple
+
+from clickup_mcp.mcp_server.models.outputs.time import TimeEntryListItem
+from clickup_mcp.models.dto.list import ListResp
+from clickup_mcp.models.dto.space import SpaceResp
+from clickup_mcp.models.dto.task import TaskResp
+from clickup_mcp.models.dto.time import TimeEntryResponse
+from clickup_mcp.models.mapping.list_mapper import ListMapper
+from clickup_mcp.models.mapping.space_mapper import SpaceMapper
+from clickup_mcp.models.mapping.task_mapper import TaskMapper
+from clickup_mcp.models.mapping.time_mapper import TimeMapper
+
+
+def _task(i: int) -> TaskResp:
+    return TaskResp.deserialize(
+        {
+            "id": f"86a{i:05d}",
+            "name": f"Backfill analytics for shard {i}",
+            "status": {"id": "sc1_open", "status": "in progress", "type": "custom"},
+            "priority": {"id": str(i % 4 + 1), "priority": "normal"},
+            "assignees": [{"id": 183 + i % 7}, {"id": 90 + i % 3}],
+            "list": {"id": "901"},
+            "due_date": 1731004800000 + i,
+            "url": f"https://app.clickup.com/t/86a{i:05d}",
+        }
+    )
+
+
+def _time_entry(i: int) -> TimeEntryResponse:
+    return TimeEntryResponse.deserialize(
+        {"id": f"e{i}", "task_id": f"86a{i:05d}", "user_id": 183, "team_id": "T1", "duration": 60000 * i}
+    )
+
+
+def _list(i: int) -> ListResp:
+    statuses = [{"status": "open", "type": "open", "orderindex": 0}, {"status": "done", "type": "closed"}]
+    return ListResp.deserialize(
+        {"id": f"L{i}", "name": f"Sprint {i}", "folder": {"id": "F1"}, "space": {"id": "S1"}, "statuses": statuses}
+    )
+
+
+def _space(i: int) -> SpaceResp:
+    return SpaceResp.deserialize({"id": f"S{i}", "name": f"Space {i}", "team_id": "T1"})
+
+
+Variant = Tuple[str, Callable[[int], Any], Callable[[Any], Any], Callable[[Any], Any]]
+
+VARIANTS: List[Variant] = [
+    (
+        "TaskListItem",
+        _task,
+        lambda r: TaskMapper.to_task_list_item_output(TaskMapper.to_domain(r), url=r.url),
+        TaskMapper.resp_to_task_list_item_output,
+    ),
+    (
+        "TaskResult",
+        _task,
+        lambda r: TaskMapper.to_task_result_output(TaskMapper.to_domain(r), url=r.url),
+        TaskMapper.resp_to_task_result_output,
+    ),
+    (
+        "TimeEntryListItem",
+        _time_entry,
+        lambda r: TimeEntryListItem(**TimeMapper.to_time_entry_list_item_output(TimeMapper.to_domain(r))),
+        TimeMapper.resp_to_time_entry_list_item_output,
+    ),
+    (
+        "ListListItem",
+        _list,
+        lambda r: ListMapper.to_list_list_item_output(ListMapper.to_domain(r)),
+        ListMapper.resp_to_list_list_item_output,
+    ),
+    (
+        "ListResult",
+        _list,
+        lambda r: ListMapper.to_list_result_output(ListMapper.to_domain(r)),
+        ListMapper.resp_to_list_result_output,
+    ),
+    (
+        "SpaceListItem",
+        _space,
+        lambda r: SpaceMapper.to_space_list_item_output(SpaceMapper.to_domain(r)),
+        SpaceMapper.resp_to_space_list_item_output,
+    ),
+]
+
+
+def _per_item(items: List[Any], convert: Callable[[Any], Any], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            convert(item)
+    return (time.perf_counter() - start) / (rounds * len(items))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DTO → output projections against the domain path")
+    parser.add_argument("--items", type=int, default=1000, help="DTOs per variant")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the DTOs per path")
+    args = parser.parse_args()
+
+    print(f"items: {args.items}  rounds: {args.rounds}")
+    print(f"{'output':<18} {'domain us/item':>15} {'direct us/item':>15} {'speedup':>8}")
+    for label, make, via_domain, direct in VARIANTS:
+        items = [make(i) for i in range(args.items)]
+        slow = _per_item(items, via_domain, args.rounds)
+        fast = _per_item(items, direct, args.rounds)
+        print(f"{label:<18} {slow * 1e6:>15.2f} {fast * 1e6:>15.2f} {slow / fast:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
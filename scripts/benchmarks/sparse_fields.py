@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Sparse Fieldset Benchmark
+
+Maps a page of ClickUp tasks (DTO → domain → MCP output) and serializes the tool
+envelope the way FastMCP does, with and without a `fields` selection, for:
+
+- task.list_in_list items (`TaskListItem`)
+- task.get / task.get_many results (`TaskResult`)
+
+Reports response bytes and map+serialize time per page.
+
+Usage:
+    python scripts/benchmarks/sparse_fields.py --tasks 1000 --rounds 20
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pydantic_core
+
+from clickup_mcp.mcp_server.errors.models import ToolResponse
+from clickup_mcp.mcp_server.models.outputs.task import TaskListResult
+from clickup_mcp.models.dto.task import TaskResp
+from clickup_mcp.models.mapping.task_mapper import TaskMapper
+
+
+def _task(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"86a{i:05d}",
+        "custom_id": f"ENG-{i}",
+        "name": f"Backfill analytics for shard {i}",
+        "status": {"id": "sc1_open", "status": "in progress", "type": "custom", "color": "#4194f6"},
+        "priority": {"id": str(i % 4 + 1), "priority": "normal", "color": "#6fddff"},
+        "assignees": [{"id": 183 + i % 7, "username": "dev"}, {"id": 90 + i % 3, "username": "qa"}],
+        "list": {"id": "901"},
+        "folder": {"id": "456"},
+        "space": {"id": "789"},
+        "due_date": 1731004800000 + i,
+        "url": f"https://app.clickup.com/t/86a{i:05d}",
+        "parent": None if i % 5 else "86a00000",
+    }
+
+
+def _measure(page: List[TaskResp], build: Callable[[List[TaskResp]], Any], rounds: int) -> Tuple[int, float]:
+    size = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        envelope = ToolResponse[Any](ok=True, result=build(page))
+        size = len(pydantic_core.to_json(envelope, fallback=str, indent=2))
+    return size, (time.perf_counter() - start) / rounds
+
+
+def _list_items(fields: Optional[List[str]]) -> Callable[[List[TaskResp]], Any]:
+    def build(page: List[TaskResp]) -> Any:
+        items = [TaskMapper.to_task_list_item_output(TaskMapper.to_domain(t), url=t.url, fields=fields) for t in page]
+        return TaskListResult(items=items)
+
+    return build
+
+
+def _results(fields: Optional[List[str]]) -> Callable[[List[TaskResp]], Any]:
+    def build(page: List[TaskResp]) -> Any:
+        return [TaskMapper.to_task_result_output(TaskMapper.to_domain(t), url=t.url, fields=fields) for t in page]
+
+    return build
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sparse fieldsets for task tool outputs")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks per page")
+    parser.add_argument("--rounds", type=int, default=20, help="Pages mapped and serialized per variant")
+    args = parser.parse_args()
+
+    page = [TaskResp(**_task(i)) for i in range(args.tasks)]
+    variants = [
+        ("list items, all fields", _list_items(None)),
+        ("list items, [status]", _list_items(["status"])),
+        ("results, all fields", _results(None)),
+        ("results, [name, status]", _results(["name", "status"])),
+        ("results, [due_date_ms]", _results(["due_date_ms"])),
+    ]
+
+    print(f"tasks per page: {args.tasks}  rounds: {args.rounds}")
+    print(f"{'variant':<26} {'bytes':>10} {'ms/page':>9} {'us/task':>8}")
+    baseline: Dict[str, Tuple[int, float]] = {}
+    for label, build in variants:
+        size, seconds = _measure(page, build, args.rounds)
+        kind = label.split(",")[0]
+        saved = ""
+        if kind in baseline:
+            base_size, base_seconds = baseline[kind]
+            saved = f"   ({1 - size / base_size:.0%} smaller, {1 - seconds / base_seconds:.0%} faster)"
+        else:
+            baseline[kind] = (size, seconds)
+        print(f"{label:<26} {size:>10,} {seconds * 1e3:>9.1f} {seconds * 1e6 / args.tasks:>8.1f}{saved}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
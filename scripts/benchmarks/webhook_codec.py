@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Webhook Wire Format Benchmark
+
+Compares the legacy version 1 queue payload (nested dict with every header, an ISO
+timestamp and the body twice) with the compact version 2 envelope, both as JSON and,
+when `msgpack` is installed, as MessagePack bytes.
+
+Reports bytes per event and encode/decode time per event.
+
+Usage:
+    python scripts/benchmarks/webhook_codec.py --iterations 20000
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+from clickup_mcp.web_server.event import codec
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+# Representative taskStatusUpdated delivery, as documented by ClickUp
+_BODY: Dict[str, Any] = {
+    "event": "taskStatusUpdated",
+    "webhook_id": "7fa3ec74-69a8-4530-a251-8a13730bd204",
+    "task_id": "1vj37mc",
+    "history_items": [
+        {
+            "id": "2800787326392356843",
+            "type": 1,
+            "date": "1642736652800",
+            "field": "status",
+            "parent_id": "162641062",
+            "data": {"status_type": "custom"},
+            "source": None,
+            "user": {
+                "id": 183,
+                "username": "John",
+                "email": "john@company.com",
+                "color": "#7b68ee",
+                "initials": "J",
+                "profilePicture": None,
+            },
+            "before": {"status": "to do", "color": "#f9d900", "orderindex": 0, "type": "open"},
+            "after": {"status": "in progress", "color": "#7C4DFF", "orderindex": 1, "type": "custom"},
+        }
+    ],
+}
+
+# Headers as captured by `dict(request.headers)` behind a typical proxy
+_HEADERS: Dict[str, str] = {
+    "host": "hooks.example.com",
+    "user-agent": "ClickUp-Webhook/1.0",
+    "content-length": "812",
+    "accept": "application/json, text/plain, */*",
+    "accept-encoding": "gzip, compress, deflate, br",
+    "content-type": "application/json",
+    "x-forwarded-for": "34.203.1.10",
+    "x-forwarded-proto": "https",
+    "x-amzn-trace-id": "Root=1-61ea7e6c-0c3e41c25a2e9f1b3d7c1a11",
+    "x-signature": "f4a1c0d8e5b2a7c93e1f6b4d8a2c5e7f9b1d3a5c7e9f2b4d6a8c0e2f4b6d8a0c",
+    "x-request-id": "1a2b3c4d-5e6f-7081-92a3-b4c5d6e7f809",
+}
+
+
+def _legacy_serialize(event: ClickUpWebhookEvent) -> Dict[str, Any]:
+    return {
+        "type": event.type.value,
+        "body": event.body,
+        "headers": dict(event.headers),
+        "received_at": event.received_at.isoformat(),
+        "delivery_id": event.delivery_id,
+    }
+
+
+def _legacy_deserialize(message: Dict[str, Any]) -> ClickUpWebhookEvent:
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType(message["type"]),
+        body=message["body"],
+        raw=message.get("body", {}),
+        headers=message.get("headers") or {},
+        received_at=datetime.fromisoformat(message["received_at"]),
+        delivery_id=message.get("delivery_id"),
+    )
+
+
+def _variants(event: ClickUpWebhookEvent) -> List[Tuple[str, Callable[[], bytes], Callable[[bytes], Any]]]:
+    variants: List[Tuple[str, Callable[[], bytes], Callable[[bytes], Any]]] = [
+        (
+            "v1 json (legacy)",
+            lambda: json.dumps(_legacy_serialize(event)).encode(),
+            lambda data: _legacy_deserialize(json.loads(data)),
+        ),
+        (
+            "v2 json",
+            lambda: codec.encode_event(event, use_msgpack=False),
+            codec.decode_event,
+        ),
+    ]
+    if codec.msgpack is not None:
+        variants.append(("v2 msgpack", lambda: codec.encode_event(event, use_msgpack=True), codec.decode_event))
+    return variants
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ClickUp webhook wire formats")
+    parser.add_argument("--iterations", type=int, default=20000, help="Events encoded/decoded per variant")
+    args = parser.parse_args()
+
+    event = ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_STATUS_UPDATED,
+        body=_BODY,
+        raw=_BODY,
+        headers=_HEADERS,
+        received_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        delivery_id=_HEADERS["x-request-id"],
+    )
+
+    print(f"{'format':<18} {'bytes/event':>12} {'encode us':>10} {'decode us':>10}")
+    baseline: Tuple[int, float, float] | None = None
+    for name, encode, decode in _variants(event):
+        data = encode()
+        encode_us = timeit.timeit(encode, number=args.iterations) / args.iterations * 1e6
+        decode_us = timeit.timeit(lambda: decode(data), number=args.iterations) / args.iterations * 1e6
+        line = f"{name:<18} {len(data):>12} {encode_us:>10.2f} {decode_us:>10.2f}"
+        if baseline is None:
+            baseline = (len(data), encode_us, decode_us)
+        else:
+            line += (
+                f"   ({1 - len(data) / baseline[0]:.0%} smaller,"
+                f" encode {baseline[1] / encode_us:.1f}x, decode {baseline[2] / decode_us:.1f}x)"
+            )
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
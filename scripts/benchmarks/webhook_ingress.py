@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Webhook Ingress Benchmark
+
+Measures requests per second on one core for `POST /webhook/clickup`:
+
+- legacy: the previous endpoint (body validated into `ClickUpWebhookRequest` including
+  every history item, `model_dump` back to a dict, all headers copied)
+- raw: the current endpoint (JSON parsed once, envelope-only validation, allowlisted headers)
+
+Requests are driven straight through the ASGI app (no sockets, no HTTP client) against a
+no-op sink, so the numbers isolate the ingress work done per request.
+
+Usage:
+    python scripts/benchmarks/webhook_ingress.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI, Request
+
+from clickup_mcp.web_server.event import webhook as webhook_module
+from clickup_mcp.web_server.event.handler import get_registry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookRequest,
+)
+
+# Representative taskUpdated delivery with several history items
+_BODY: Dict[str, Any] = {
+    "event": "taskUpdated",
+    "webhook_id": "7fa3ec74-69a8-4530-a251-8a13730bd204",
+    "task_id": "1vj37mc",
+    "history_items": [
+        {
+            "id": f"28007873263923568{i}",
+            "type": 1,
+            "date": "1642736652800",
+            "field": field,
+            "parent_id": "162641062",
+            "data": {},
+            "source": None,
+            "user": {"id": 183, "username": "John", "email": "john@company.com", "color": "#7b68ee"},
+            "before": {"status": "to do", "color": "#f9d900", "orderindex": 0, "type": "open"},
+            "after": {"status": "in progress", "color": "#7C4DFF", "orderindex": 1, "type": "custom"},
+        }
+        for i, field in enumerate(("status", "priority", "due_date", "assignee_add"))
+    ],
+}
+
+_HEADERS: List[Tuple[bytes, bytes]] = [
+    (b"host", b"hooks.example.com"),
+    (b"user-agent", b"ClickUp-Webhook/1.0"),
+    (b"accept", b"application/json, text/plain, */*"),
+    (b"accept-encoding", b"gzip, compress, deflate, br"),
+    (b"content-type", b"application/json"),
+    (b"x-forwarded-for", b"34.203.1.10"),
+    (b"x-forwarded-proto", b"https"),
+    (b"x-amzn-trace-id", b"Root=1-61ea7e6c-0c3e41c25a2e9f1b3d7c1a11"),
+    (b"x-signature", b"f4a1c0d8e5b2a7c93e1f6b4d8a2c5e7f9b1d3a5c7e9f2b4d6a8c0e2f4b6d8a0c"),
+    (b"x-request-id", b"1a2b3c4d-5e6f-7081-92a3-b4c5d6e7f809"),
+]
+
+
+class _NullSink:
+    async def handle(self, event: ClickUpWebhookEvent) -> None:
+        return None
+
+
+def _legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/webhook/clickup")
+    async def clickup_webhook(dto: ClickUpWebhookRequest, request: Request):
+        headers = dict(request.headers)
+        body = dto.model_dump(mode="python")
+        event = ClickUpWebhookEvent(
+            type=dto.event,
+            body=body,
+            raw=body,
+            headers=headers,
+            received_at=datetime.utcnow(),
+            delivery_id=headers.get("X-Request-Id"),
+        )
+        await _NullSink().handle(event)
+        return {"ok": True}
+
+    return app
+
+
+def _raw_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(webhook_module.router)
+    return app
+
+
+async def _drive(app: FastAPI, payload: bytes, n: int) -> float:
+    headers = _HEADERS + [(b"content-length", str(len(payload)).encode())]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "https",
+        "path": "/webhook/clickup",
+        "raw_path": b"/webhook/clickup",
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("34.203.1.10", 443),
+        "server": ("hooks.example.com", 443),
+    }
+    status: List[int] = []
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(dict(scope), receive, send)
+    elapsed = time.perf_counter() - start
+    assert set(status) == {200}, set(status)
+    return n / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ClickUp webhook ingress endpoint")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per variant")
+    args = parser.parse_args()
+
+    webhook_module.get_event_sink = lambda: _NullSink()  # type: ignore[assignment]
+    get_registry().clear()
+    payload = json.dumps(_BODY).encode()
+
+    print(f"payload: {len(payload)} bytes, {len(_BODY['history_items'])} history items")
+    print(f"{'variant':<8} {'req/s':>10} {'us/req':>8}")
+    baseline = None
+    for name, app in (("legacy", _legacy_app()), ("raw", _raw_app())):
+        asyncio.run(_drive(app, payload, min(1000, args.requests)))  # warm up
+        rps = asyncio.run(_drive(app, payload, args.requests))
+        line = f"{name:<8} {rps:>10,.0f} {1e6 / rps:>8.1f}"
+        if baseline is None:
+            baseline = rps
+        else:
+            line += f"   ({rps / baseline:.2f}x)"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
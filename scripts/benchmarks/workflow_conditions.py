@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Workflow Condition Evaluation Benchmark
+
+Evaluates the conditions of many `WorkflowContext`s against one webhook event and
+reports contexts per second for:
+
+- compiled: conditions compiled once (`compile_context`), bindings built once per event
+- reparse: every condition parsed and compiled again on each evaluation (no cache), which
+  is what evaluating the raw strings per event costs
+
+Usage:
+    python scripts/benchmarks/workflow_conditions.py --contexts 5000 --rounds 20
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from clickup_mcp.models.domain.workflow_context import WorkflowContext
+from clickup_mcp.web_server.event import conditions
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+_BODY: Dict[str, Any] = {
+    "event": "taskStatusUpdated",
+    "task_id": "1vj37mc",
+    "history_items": [
+        {
+            "field": "status",
+            "parent_id": "162641062",
+            "user": {"id": 183},
+            "before": {"status": "to do", "type": "open"},
+            "after": {"status": "in progress", "type": "custom"},
+        }
+    ],
+}
+
+# A few shapes repeated with different variables, as teams tend to copy contexts
+_CONDITIONS: List[List[str]] = [
+    ["lower(status) == vars.target", "list_id == vars.list"],
+    ["'status' in fields", "previous_status != status", "vars.team in ('core', 'web', 'ops')"],
+    ["user_id == vars.owner or vars.any == 'yes'"],
+]
+
+
+def _contexts(n: int) -> List[WorkflowContext]:
+    return [
+        WorkflowContext(
+            id=f"ctx_{i}",
+            workflow_id=f"wf_{i % 50}",
+            name=f"Context {i}",
+            variables={
+                "target": "in progress" if i % 2 else "done",
+                "list": "162641062" if i % 3 else "1",
+                "team": ("core", "web", "data")[i % 3],
+                "owner": str(i),
+                "any": "no",
+            },
+            conditions=_CONDITIONS[i % len(_CONDITIONS)],
+        )
+        for i in range(n)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark workflow condition evaluation")
+    parser.add_argument("--contexts", type=int, default=5000, help="Contexts evaluated per event")
+    parser.add_argument("--rounds", type=int, default=20, help="Events evaluated (compiled variant)")
+    args = parser.parse_args()
+
+    event = ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_STATUS_UPDATED,
+        body=_BODY,
+        raw=_BODY,
+        headers={},
+        received_at=datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+    contexts = _contexts(args.contexts)
+
+    start = time.perf_counter()
+    compiled = [conditions.compile_context(c) for c in contexts]
+    compile_s = time.perf_counter() - start
+
+    matched = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        bindings = conditions.event_bindings(event)
+        matched = sum(1 for c in compiled if c.matches(bindings))
+    compiled_rate = args.contexts * args.rounds / (time.perf_counter() - start)
+
+    reparse = conditions.compile_condition.__wrapped__  # type: ignore[attr-defined]
+    start = time.perf_counter()
+    bindings = conditions.event_bindings(event)
+    for ctx in contexts:
+        all(reparse(source)(bindings, ctx.variables) for source in ctx.conditions)
+    reparse_rate = args.contexts / (time.perf_counter() - start)
+
+    print(f"contexts: {args.contexts}  matched: {matched}  compile: {compile_s * 1e3:.1f} ms")
+    print(f"{'variant':<10} {'contexts/s':>14} {'us/context':>11}")
+    print(f"{'compiled':<10} {compiled_rate:>14,.0f} {1e6 / compiled_rate:>11.2f}")
+    print(
+        f"{'reparse':<10} {reparse_rate:>14,.0f} {1e6 / reparse_rate:>11.2f}   ({compiled_rate / reparse_rate:.0f}x slower)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
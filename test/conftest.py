@@ -9,6 +9,8 @@ from test.config import TestSettings, get_test_settings
 
 import pytest
 
+from clickup_mcp.mcp_server.tool_cache import get_tool_cache
+
 
 @pytest.fixture
 def test_settings() -> TestSettings:
@@ -28,3 +30,11 @@ def test_settings() -> TestSettings:
             ...     team_id = test_settings.clickup_test_team_id
     """
     return get_test_settings()
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    """Keep cached read-only tool results from leaking between tests."""
+    get_tool_cache().clear()
+    yield
+    get_tool_cache().clear()
@@ -1,12 +1,25 @@
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from clickup_mcp.metrics import (
+    QUEUE_PUBLISH_FAILURES,
+    WEBHOOK_ACCEPTED,
+    WEBHOOK_DROPPED,
+    WEBHOOK_RECEIVED,
+    get_metrics_registry,
+)
+from clickup_mcp.web_server.event import webhook as webhook_module
 from clickup_mcp.web_server.event.handler import get_registry
 from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEvent,
     ClickUpWebhookEventType,
 )
-from clickup_mcp.web_server.event.webhook import router
+from clickup_mcp.web_server.event.mq import QueueEventSink
+from clickup_mcp.web_server.event.webhook import (
+    add_ingress_observer,
+    remove_ingress_observer,
+    router,
+)
 
 
 def test_webhook_endpoint_dispatches_handlers():
@@ -36,3 +49,210 @@ def test_webhook_endpoint_dispatches_handlers():
     event = calls[0]
     assert event.type == ClickUpWebhookEventType.TASK_STATUS_UPDATED
     assert event.body["data"]["foo"] == "bar"
+
+
+def test_webhook_endpoint_drops_unsubscribed_event_types(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    forwarded: list[ClickUpWebhookEvent] = []
+
+    class _RecordingSink:
+        async def handle(self, ev: ClickUpWebhookEvent) -> None:
+            forwarded.append(ev)
+
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: _RecordingSink())
+    monkeypatch.delenv("QUEUE_BACKEND", raising=False)
+    get_metrics_registry().reset()
+
+    async def handler(_: ClickUpWebhookEvent) -> None:
+        return None
+
+    reg = get_registry()
+    reg.clear()
+    reg.register(ClickUpWebhookEventType.TASK_CREATED, handler)
+
+    for event in ("taskCreated", "taskUpdated", "taskUpdated", "listCreated"):
+        resp = client.post("/webhook/clickup", json={"event": event, "task_id": "t1"})
+        assert resp.status_code == 200
+        assert resp.json() == {"ok": True}
+
+    assert [ev.type for ev in forwarded] == [ClickUpWebhookEventType.TASK_CREATED]
+    assert [WEBHOOK_RECEIVED.value(event_type=t) for t in ("taskCreated", "taskUpdated", "listCreated")] == [1, 2, 1]
+    assert WEBHOOK_ACCEPTED.value(event_type="taskCreated") == 1
+    assert WEBHOOK_ACCEPTED.value(event_type="taskUpdated") == 0
+    assert WEBHOOK_DROPPED.value(event_type="taskUpdated") == 2
+    assert WEBHOOK_DROPPED.value(event_type="listCreated") == 1
+    get_metrics_registry().reset()
+    reg.clear()
+
+
+def test_webhook_endpoint_forwards_every_type_when_events_are_queued(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    forwarded: list[ClickUpWebhookEvent] = []
+
+    class _RecordingSink:
+        async def handle(self, ev: ClickUpWebhookEvent) -> None:
+            forwarded.append(ev)
+
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: _RecordingSink())
+    # Consumers in other processes may handle types this process has no handler for
+    monkeypatch.setenv("QUEUE_BACKEND", "kafka")
+
+    async def handler(_: ClickUpWebhookEvent) -> None:
+        return None
+
+    reg = get_registry()
+    reg.clear()
+    reg.register(ClickUpWebhookEventType.TASK_CREATED, handler)
+
+    for event in ("taskCreated", "goalCreated", "keyResultUpdated"):
+        resp = client.post("/webhook/clickup", json={"event": event})
+        assert resp.status_code == 200
+
+    assert [ev.type.value for ev in forwarded] == ["taskCreated", "goalCreated", "keyResultUpdated"]
+    reg.clear()
+
+
+def test_webhook_endpoint_forwards_everything_without_registered_handlers(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    forwarded: list[ClickUpWebhookEvent] = []
+
+    class _RecordingSink:
+        async def handle(self, ev: ClickUpWebhookEvent) -> None:
+            forwarded.append(ev)
+
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: _RecordingSink())
+    get_registry().clear()
+
+    resp = client.post("/webhook/clickup", json={"event": "taskUpdated", "task_id": "t1"})
+
+    assert resp.status_code == 200
+    assert len(forwarded) == 1
+
+
+def test_webhook_endpoint_notifies_observers_without_subscribing_them(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    forwarded: list[ClickUpWebhookEvent] = []
+    observed: list[ClickUpWebhookEventType] = []
+
+    class _RecordingSink:
+        async def handle(self, ev: ClickUpWebhookEvent) -> None:
+            forwarded.append(ev)
+
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: _RecordingSink())
+    monkeypatch.delenv("QUEUE_BACKEND", raising=False)
+    get_registry().clear()
+    add_ingress_observer(observed.append)
+    try:
+        resp = client.post("/webhook/clickup", json={"event": "taskUpdated"})
+    finally:
+        remove_ingress_observer(observed.append)
+
+    assert resp.status_code == 200
+    assert observed == [ClickUpWebhookEventType.TASK_UPDATED]
+    # An observer is not a handler: with no handlers registered nothing is filtered
+    assert get_registry().subscribed_types == frozenset()
+    assert [ev.type for ev in forwarded] == [ClickUpWebhookEventType.TASK_UPDATED]
+
+
+def test_webhook_endpoint_keeps_raw_body_allowlisted_headers_and_delivery_id(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    forwarded: list[ClickUpWebhookEvent] = []
+
+    class _RecordingSink:
+        async def handle(self, ev: ClickUpWebhookEvent) -> None:
+            forwarded.append(ev)
+
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: _RecordingSink())
+    get_registry().clear()
+
+    body = {
+        "event": "taskStatusUpdated",
+        "task_id": "t1",
+        "history_items": [
+            {"id": "h1", "date": "1", "field": "status", "parent_id": "L1", "user": {"id": 183, "email": "a@b.c"}}
+        ],
+    }
+    resp = client.post(
+        "/webhook/clickup",
+        json=body,
+        headers={"X-Request-Id": "req-7", "X-Signature": "sig", "Authorization": "secret", "X-Trace": "t"},
+    )
+
+    assert resp.status_code == 200
+    event = forwarded[0]
+    assert event.body == body
+    assert event.body_size == int(resp.request.headers["content-length"])
+    assert event.delivery_id == "req-7"
+    assert event.headers == {"x-request-id": "req-7", "x-signature": "sig", "content-type": "application/json"}
+    # History items are validated only on access and keep undeclared keys
+    assert event.history[0].field == "status"
+    assert event.history[0].parent_id == "L1"
+    assert event.history[0].user.id == 183
+
+
+def test_webhook_endpoint_rejects_invalid_envelopes():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    cases = [
+        (b"{not json", ["body"]),
+        (b"[1, 2]", ["body"]),
+        (b'{"task_id": "t1"}', ["body", "event"]),
+        (b'{"event": "taskExploded"}', ["body", "event"]),
+        (b'{"event": "taskCreated", "history_items": {}}', ["body", "history_items"]),
+    ]
+    for payload, loc in cases:
+        resp = client.post("/webhook/clickup", content=payload, headers={"Content-Type": "application/json"})
+        assert resp.status_code == 422, payload
+        assert resp.json()["detail"][0]["loc"][: len(loc)] == loc
+
+
+def test_webhook_endpoint_fails_when_the_queue_publish_fails(monkeypatch):
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app, raise_server_exceptions=False)
+
+    class _DownBackend:
+        async def publish(self, *, key: str, payload: dict) -> None:
+            raise RuntimeError("broker down")
+
+    sink = QueueEventSink(backend_name="down", backend=_DownBackend(), linger_ms=0)
+    monkeypatch.setattr(webhook_module, "get_event_sink", lambda: sink)
+    get_registry().clear()
+    get_metrics_registry().reset()
+
+    resp = client.post("/webhook/clickup", json={"event": "taskUpdated", "task_id": "t1"})
+
+    # Not acknowledged, so ClickUp redelivers the event
+    assert resp.status_code == 500
+    assert QUEUE_PUBLISH_FAILURES.value(backend="down") == 1
+    get_metrics_registry().reset()
+
+
+def test_webhook_endpoint_documents_its_request_body():
+    app = FastAPI()
+    app.include_router(router)
+
+    body = app.openapi()["paths"]["/webhook/clickup"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+
+    assert body["required"] is True
+    assert schema["title"] == "ClickUpWebhookRequest"
+    assert "taskCreated" in schema["properties"]["event"]["enum"]
+    assert "$ref" not in str(schema)
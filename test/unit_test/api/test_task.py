@@ -205,6 +205,27 @@ class TestTaskAPI(BaseAPIClientTestSuite):
         assert len(result) == 1
         assert mock_api_client.get.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_list_in_list_reports_progress_per_page(self, task_api, mock_api_client, sample_task_data):
+        """Test that list_in_list reports the running task count after each page."""
+        # Arrange
+        query = TaskListQuery(page=0, limit=1)
+        mock_api_client.get.side_effect = [
+            APIResponse(success=True, status_code=200, data={"tasks": [sample_task_data]}, headers={}),
+            APIResponse(success=True, status_code=200, data={"tasks": [sample_task_data]}, headers={}),
+            APIResponse(success=True, status_code=200, data={"tasks": []}, headers={}),
+        ]
+        reported = []
+
+        async def on_progress(completed, total):
+            reported.append((completed, total))
+
+        # Act
+        await task_api.list_in_list("list_123", query, on_progress=on_progress)
+
+        # Assert
+        assert reported == [(1, None), (2, None)]
+
     @pytest.mark.asyncio
     async def test_update_task(self, task_api, mock_api_client, sample_task_data):
         """Test updating a task."""
@@ -0,0 +1,168 @@
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_mcp.api import bulk as bulk_module
+from clickup_mcp.api.bulk import BulkItemResult
+from clickup_mcp.api.task import TaskAPI
+from clickup_mcp.client import APIResponse
+from clickup_mcp.exceptions import (
+    ClickUpAPIError,
+    RateLimitError,
+    ResourceNotFoundError,
+)
+from clickup_mcp.models.dto.task import TaskCreate, TaskResp, TaskUpdate
+
+
+def _task(result: BulkItemResult[TaskResp]) -> TaskResp:
+    assert result.value is not None
+    return result.value
+
+
+class _FlakyClient:
+    """Records concurrency and fails the first request for selected paths."""
+
+    def __init__(self, fail_once: dict[str, Exception] | None = None, status: dict[str, int] | None = None) -> None:
+        self.fail_once = dict(fail_once or {})
+        self.status = status or {}
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _request(self, path: str) -> APIResponse:
+        self.calls.append(path)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.005)
+            if path in self.fail_once:
+                raise self.fail_once.pop(path)
+            code = self.status.get(path, 200)
+            data = {"id": path.split("/")[2], "name": "t"} if code == 200 else {"err": "nope"}
+            return APIResponse(status_code=code, data=data, success=code == 200)
+        finally:
+            self.in_flight -= 1
+
+    async def post(self, path: str, data: Any = None) -> APIResponse:
+        return await self._request(path)
+
+    async def put(self, path: str, data: Any = None) -> APIResponse:
+        return await self._request(path)
+
+    async def delete(self, path: str) -> APIResponse:
+        return await self._request(path)
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bulk_module, "_RETRY_BASE_DELAY", 0.0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_bounds_concurrency_and_keeps_order() -> None:
+    client = _FlakyClient(status={"/task/t3": 404})
+    api = TaskAPI(client)  # type: ignore[arg-type]
+
+    results = await api.bulk_update([(f"t{i}", TaskUpdate(status="done")) for i in range(300)], max_in_flight=7)
+
+    assert client.peak == 7
+    assert [r.index for r in results] == list(range(300))
+    assert [r.index for r in results if not r.ok] == [3]
+    assert _task(results[0]).id == "t0"
+    assert isinstance(results[3].error, ClickUpAPIError)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_items_are_retried_for_every_operation() -> None:
+    client = _FlakyClient(fail_once={"/list/L1/task": RateLimitError(), "/task/t1": RateLimitError()})
+    api = TaskAPI(client)  # type: ignore[arg-type]
+
+    created = await api.bulk_create([("L1", TaskCreate(name="A"))], max_in_flight=2)
+    deleted = await api.bulk_delete(["t1", "t2"], max_in_flight=2)
+
+    assert created[0].ok is True and created[0].attempts == 2
+    assert [(r.ok, r.attempts) for r in deleted] == [(True, 2), (True, 1)]
+
+
+@pytest.mark.asyncio
+async def test_unknown_outcomes_are_retried_only_when_idempotent() -> None:
+    lost = "Request failed after 4 attempts: timed out"
+    client = _FlakyClient(
+        fail_once={"/list/L1/task": ClickUpAPIError(lost), "/task/t1/member/42": ClickUpAPIError(lost)}
+    )
+    api = TaskAPI(client)  # type: ignore[arg-type]
+
+    created = await api.bulk_create([("L1", TaskCreate(name="A"))], max_in_flight=1)
+    assigned = await api.bulk_add_assignee([("t1", 42)], max_in_flight=1)
+
+    assert created[0].ok is False and client.calls.count("/list/L1/task") == 1
+    assert assigned[0].ok is True and assigned[0].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_default_in_flight_limit_comes_from_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    from clickup_mcp.api import task as task_module
+
+    monkeypatch.setattr(task_module, "get_settings", lambda: Mock(clickup_bulk_max_in_flight=3))
+    client = _FlakyClient()
+
+    await TaskAPI(client).bulk_delete([f"t{i}" for i in range(20)])  # type: ignore[arg-type]
+
+    assert client.peak == 3
+
+
+class _GetClient:
+    """Serves GET /task/{id}; IDs starting with "CU-" are custom IDs of task "t<suffix>"."""
+
+    def __init__(self) -> None:
+        self.gets: list[tuple[str, Any]] = []
+
+    async def get(self, path: str, params: Any = None) -> APIResponse:
+        self.gets.append((path, params))
+        await asyncio.sleep(0)
+        task_id = path.split("/")[2]
+        if task_id == "gone":
+            return APIResponse(status_code=404, data={"err": "Task not found"}, success=False)
+        if task_id.startswith("CU-"):
+            return APIResponse(status_code=200, data={"id": "t" + task_id[3:], "custom_id": task_id, "name": "c"})
+        return APIResponse(status_code=200, data={"id": task_id, "name": "n"})
+
+    async def put(self, path: str, data: Any = None) -> APIResponse:
+        return APIResponse(status_code=200, data={"id": path.split("/")[2], "name": "updated"})
+
+
+@pytest.mark.asyncio
+async def test_get_many_dedups_serves_cache_and_keeps_order() -> None:
+    client = _GetClient()
+    api = TaskAPI(client)  # type: ignore[arg-type]
+    await api.get("t1")
+
+    results = await api.get_many(["t2", "t1", "gone", "t2"])
+
+    assert [(r.index, r.ok) for r in results] == [(0, True), (1, True), (2, False), (3, True)]
+    assert [_task(r).id for r in results if r.ok] == ["t2", "t1", "t2"]
+    assert results[1].attempts == 0
+    assert sorted(path for path, _ in client.gets) == ["/task/gone", "/task/t1", "/task/t2"]
+    assert isinstance(results[2].error, ResourceNotFoundError)
+
+
+@pytest.mark.asyncio
+async def test_get_many_resolves_custom_ids_once_and_writes_invalidate() -> None:
+    client = _GetClient()
+    api = TaskAPI(client)  # type: ignore[arg-type]
+
+    first = await api.get_many(["CU-1", "CU-2"], custom_task_ids=True, team_id="team")
+    again = await api.get_many(["CU-1", "t2"], custom_task_ids=False)
+    again_custom = await api.get_many(["CU-1"], custom_task_ids=True, team_id="team")
+
+    assert [_task(r).id for r in first] == ["t1", "t2"]
+    assert _task(first[0]).custom_id == "CU-1"
+    assert client.gets[0][1] == {"custom_task_ids": "true", "team_id": "team"}
+    assert again[1].attempts == 0 and again_custom[0].attempts == 0
+    assert len(client.gets) == 3  # CU-1 and CU-2, then CU-1 as a (non-custom) canonical ID
+
+    await api.update("t2", TaskUpdate(status="done"))
+    refreshed = await api.get_many(["t2"])
+    assert refreshed[0].attempts == 1
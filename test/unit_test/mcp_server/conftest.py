@@ -0,0 +1,20 @@
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_get_client() -> Iterator[MagicMock]:
+    """
+    Patch `ClickUpAPIClientFactory.get` for every MCP tool module.
+
+    `mock_get_client.return_value` is the client the tools get, an async context manager
+    yielding itself. Tests set the API groups they exercise on it, e.g.
+    `mock_get_client.return_value.task = _FakeTaskAPI()`.
+    """
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    with patch("clickup_mcp.client.ClickUpAPIClientFactory.get", return_value=client) as mock_get_client:
+        yield mock_get_client
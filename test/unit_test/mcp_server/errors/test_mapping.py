@@ -67,3 +67,9 @@ def test_rate_limit_retry_after_ms_from_domain_error() -> None:
     assert issue.code == IssueCode.RATE_LIMIT
     # 1.5s -> 1500ms
     assert issue.retry_after_ms == 1500
+
+
+def test_rate_limit_without_retry_after_still_maps_to_rate_limit() -> None:
+    issue = map_exception(RateLimitError())
+    assert issue.code == IssueCode.RATE_LIMIT
+    assert issue.retry_after_ms is None
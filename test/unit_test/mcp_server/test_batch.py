@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clickup_mcp.config import get_settings
+from clickup_mcp.exceptions import ResourceNotFoundError
+from clickup_mcp.mcp_server.batch import batch_execute
+from clickup_mcp.mcp_server.errors import IssueCode
+from clickup_mcp.mcp_server.models.inputs.batch import (
+    BatchExecuteInput,
+    BatchOperation,
+)
+from clickup_mcp.models.dto.task import TaskResp
+
+
+class _FakeTaskAPI:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.updated: list[tuple[str, Any]] = []
+
+    async def _slow(self) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def create(self, list_id: str, dto: Any) -> TaskResp:
+        await self._slow()
+        return TaskResp.model_validate({"id": f"new-in-{list_id}", "name": dto.name, "list": {"id": list_id}})
+
+    async def update(self, task_id: str, dto: Any) -> TaskResp:
+        await self._slow()
+        if task_id == "missing":
+            raise ResourceNotFoundError("Task not found")
+        self.updated.append((task_id, dto.status))
+        return TaskResp.model_validate({"id": task_id, "name": "t"})
+
+
+@pytest.fixture
+def tasks(mock_get_client: MagicMock) -> _FakeTaskAPI:
+    mock_get_client.return_value.task = fake = _FakeTaskAPI()
+    return fake
+
+
+def _update(task_id: Any, **kwargs: Any) -> BatchOperation:
+    return BatchOperation(tool="task.update", arguments={"input": {"task_id": task_id, "status": "done"}}, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_operations_run_concurrently_with_per_item_envelopes(tasks: _FakeTaskAPI) -> None:
+    operations = [_update(f"t{i}") for i in range(6)] + [
+        _update("missing"),
+        BatchOperation(tool="task.update", arguments={"input": {"status": "done"}}),
+        BatchOperation(tool="task.nope"),
+    ]
+
+    response = await batch_execute(BatchExecuteInput(operations=operations, concurrency=3))
+
+    assert response.ok is True
+    result = response.result
+    assert [item.index for item in result.results] == list(range(9))
+    assert (result.succeeded, result.failed, result.skipped) == (6, 3, 0)
+    assert tasks.peak == 3
+    assert result.results[7].response.issues[0].code is IssueCode.VALIDATION_ERROR
+    assert "Unknown tool" in result.results[8].response.issues[0].message
+
+
+@pytest.mark.asyncio
+async def test_references_wait_for_results_and_failed_dependencies_skip(tasks: _FakeTaskAPI) -> None:
+    operations = [
+        _update({"$ref": "created.id"}),
+        BatchOperation(id="created", tool="task.create", arguments={"input": {"list_id": "L1", "name": "A"}}),
+        _update("missing", id="broken"),
+        _update("t9", depends_on=["broken"]),
+    ]
+
+    result = (await batch_execute(BatchExecuteInput(operations=operations))).result
+
+    assert result.results[1].response.result.id == "new-in-L1"
+    assert result.results[0].response.ok is True
+    assert tasks.updated == [("new-in-L1", "done")]
+    assert result.results[3].skipped is True
+    assert result.results[3].response.issues[0].code is IssueCode.CONFLICT
+    assert (result.succeeded, result.failed, result.skipped) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [_update({"$ref": "a.id"}, id="b"), _update({"$ref": "b.id"}, id="a")],
+        [_update({"$ref": "nowhere.id"})],
+        [BatchOperation(tool="batch.execute", arguments={})],
+    ],
+)
+async def test_invalid_graphs_fail_before_running(tasks: _FakeTaskAPI, operations: list[BatchOperation]) -> None:
+    response = await batch_execute(BatchExecuteInput(operations=operations))
+
+    assert response.ok is False
+    assert response.issues[0].code is IssueCode.VALIDATION_ERROR
+    assert tasks.updated == []
+
+
+class _SlowTaskAPI:
+    async def update(self, task_id: str, dto: Any) -> TaskResp:
+        await asyncio.sleep(float(task_id))
+        return TaskResp.model_validate({"id": task_id, "name": "t"})
+
+
+@pytest.mark.asyncio
+async def test_batch_past_its_timeout_returns_finished_operations(
+    mock_get_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mock_get_client.return_value.task = _SlowTaskAPI()
+    monkeypatch.setenv("MCP_TOOL_TIMEOUTS", '{"batch.execute": 0.1}')
+    operations = [
+        BatchOperation(tool="task.update", arguments={"input": {"task_id": seconds, "status": "done"}})
+        for seconds in ("0", "5", "0")
+    ]
+    get_settings.cache_clear()
+    try:
+        response = await batch_execute(BatchExecuteInput(operations=operations, concurrency=2))
+    finally:
+        get_settings.cache_clear()
+
+    assert response.ok
+    items = response.result.results
+    assert [item.response.ok for item in items] == [True, False, True]
+    assert items[1].response.issues[0].code == IssueCode.DEADLINE_EXCEEDED
+    assert (response.result.succeeded, response.result.failed) == (2, 1)
@@ -0,0 +1,86 @@
+import asyncio
+from typing import Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from clickup_mcp.client import ClickUpAPIClient
+from clickup_mcp.config import get_settings
+from clickup_mcp.diagnostics import current_recorder, recording
+from clickup_mcp.mcp_server import task as task_tools
+from clickup_mcp.mcp_server.models.inputs.task import TaskGetInput
+
+
+def _ok(body: bytes = b'{"id": "t1", "name": "Ship"}') -> Mock:
+    response = Mock(spec=httpx.Response, status_code=200, content=body, headers={})
+    response.json.return_value = {"id": "t1", "name": "Ship"}
+    return response
+
+
+@pytest.fixture
+def client() -> Iterator[ClickUpAPIClient]:
+    api = ClickUpAPIClient(api_token="pk_test", retry_delay=0.01)
+    with patch("clickup_mcp.mcp_server.task.ClickUpAPIClientFactory.get", return_value=api):
+        yield api
+
+
+@pytest.fixture
+def diagnostics_on(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("MCP_TOOL_DIAGNOSTICS", "true")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_are_off_by_default(client: ClickUpAPIClient) -> None:
+    with patch("httpx.AsyncClient.request", AsyncMock(return_value=_ok())):
+        response = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert response.ok
+    assert response.diagnostics is None
+
+
+@pytest.mark.asyncio
+async def test_breakdown_of_a_retried_call(client: ClickUpAPIClient, diagnostics_on: None) -> None:
+    request = AsyncMock(side_effect=[httpx.ConnectError("reset"), _ok()])
+    with patch("httpx.AsyncClient.request", request):
+        response = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    diagnostics = response.diagnostics
+    assert diagnostics.upstream_calls == 1
+    assert diagnostics.retries == 1
+    assert diagnostics.retry_wait_ms == 10.0
+    assert diagnostics.cache_hits == 0
+    assert diagnostics.total_ms >= diagnostics.retry_wait_ms + diagnostics.serialization_ms
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_report_their_own_diagnostics(client: ClickUpAPIClient, diagnostics_on: None) -> None:
+    with patch("httpx.AsyncClient.request", AsyncMock(return_value=_ok())):
+        await task_tools.task_get(TaskGetInput(task_id="t1"))
+        hit = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert hit.cache.status == "hit"
+    assert hit.diagnostics.cache_hits == 1
+    assert hit.diagnostics.upstream_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_nested_recorders_count_towards_the_enclosing_call() -> None:
+    assert current_recorder() is None
+    with recording() as outer:
+
+        async def call(delay: float) -> None:
+            with recording() as inner:
+                with inner.upstream():
+                    await asyncio.sleep(delay)
+                inner.add(upstream_calls=1)
+
+        await asyncio.gather(call(0.05), call(0.05))
+
+    assert outer.upstream_calls == 2
+    # The two requests overlapped, so the outer call was busy for about one of them
+    assert 0.05 <= outer.busy_s < 0.1
+    assert current_recorder() is None
@@ -0,0 +1,123 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from clickup_mcp.api.task import TaskAPI
+from clickup_mcp.lifecycle import get_shutdown_coordinator
+from clickup_mcp.mcp_server import progress as progress_module
+from clickup_mcp.mcp_server import task as task_tools
+from clickup_mcp.mcp_server.batch import batch_execute
+from clickup_mcp.mcp_server.models.inputs.batch import (
+    BatchExecuteInput,
+    BatchOperation,
+)
+from clickup_mcp.mcp_server.models.inputs.task import (
+    TaskBulkUpdateInput,
+    TaskUpdateInput,
+)
+from clickup_mcp.mcp_server.progress import ToolProgress
+from clickup_mcp.models.dto.task import TaskResp
+
+
+class _FakeContext:
+    def __init__(self, token: Optional[str] = "tok") -> None:
+        self.request_context = SimpleNamespace(meta=SimpleNamespace(progressToken=token))
+        self.sent: list[tuple[float, Optional[float], Optional[str]]] = []
+
+    async def report_progress(self, progress: float, total: Optional[float] = None, message: Optional[str] = None):
+        self.sent.append((progress, total, message))
+
+
+class _FakeTaskAPI(TaskAPI):
+    """Real bulk helpers over a fake `update`."""
+
+    def __init__(self) -> None:
+        super().__init__(MagicMock())
+        self.started: list[str] = []
+        self.cancelled: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def update(self, task_id: str, task_update: Any) -> TaskResp:
+        self.started.append(task_id)
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(task_id)
+            raise
+        return TaskResp.model_validate({"id": task_id, "name": "t"})
+
+
+@pytest.fixture
+def tasks(mock_get_client: MagicMock) -> _FakeTaskAPI:
+    mock_get_client.return_value.task = fake = _FakeTaskAPI()
+    return fake
+
+
+@pytest.fixture
+def ctx(monkeypatch: pytest.MonkeyPatch) -> _FakeContext:
+    fake = _FakeContext()
+    monkeypatch.setattr(progress_module.mcp, "get_context", lambda: fake)
+    return fake
+
+
+def _bulk_update(count: int, max_in_flight: int = 10) -> TaskBulkUpdateInput:
+    items = [TaskUpdateInput(task_id=f"t{i}", status="done") for i in range(count)]
+    return TaskBulkUpdateInput(items=items, max_in_flight=max_in_flight)
+
+
+@pytest.mark.asyncio
+async def test_bulk_tool_reports_first_and_final_progress(tasks: _FakeTaskAPI, ctx: _FakeContext) -> None:
+    response = await task_tools.task_bulk_update(_bulk_update(3))
+
+    assert response.ok is True
+    assert ctx.sent[0] == (1, 3, "1/3 tasks updated")
+    assert ctx.sent[-1] == (3, 3, "3/3 tasks updated")
+
+
+@pytest.mark.asyncio
+async def test_reporter_throttles_and_needs_a_progress_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    ctx = _FakeContext()
+    monkeypatch.setattr(progress_module.mcp, "get_context", lambda: ctx)
+    progress = ToolProgress("pages", interval=60)
+    for done in range(1, 6):
+        await progress(done, 5)
+    await progress(7)
+
+    assert [sent[0] for sent in ctx.sent] == [1, 5]
+
+    monkeypatch.setattr(progress_module.mcp, "get_context", lambda: _FakeContext(token=None))
+    assert ToolProgress().enabled is False
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_operations_and_mutes_nested_tools(tasks: _FakeTaskAPI, ctx: _FakeContext) -> None:
+    operations = [
+        BatchOperation(tool="task.bulk_update", arguments={"input": _bulk_update(4).model_dump(exclude_none=True)}),
+        BatchOperation(tool="task.update", arguments={"input": {"task_id": "t9", "status": "done"}}),
+    ]
+
+    response = await batch_execute(BatchExecuteInput(operations=operations))
+
+    assert response.result.succeeded == 2
+    assert ctx.sent[-1] == (2, 2, "2/2 operations finished")
+    assert all(message is not None and message.endswith("operations finished") for _, _, message in ctx.sent)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_bulk_tool_aborts_running_and_queued_calls(tasks: _FakeTaskAPI) -> None:
+    tasks.release.clear()
+    call = asyncio.create_task(task_tools.task_bulk_update(_bulk_update(6, max_in_flight=2)))
+    while len(tasks.started) < 2:
+        await asyncio.sleep(0)
+
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert tasks.started == ["t0", "t1"]
+    assert tasks.cancelled == ["t0", "t1"]
+    assert get_shutdown_coordinator().in_flight == []
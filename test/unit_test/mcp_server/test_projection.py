@@ -0,0 +1,71 @@
+"""
+Unit tests for the webhook-fed projection MCP tools.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from clickup_mcp.mcp_server import projection as projection_tools
+from clickup_mcp.mcp_server.models.inputs.projection import (
+    AssigneeWorkloadInput,
+    TaskStatusCountsInput,
+)
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.projections import ProjectionManager, TaskProjection
+
+
+def _event(type_: ClickUpWebhookEventType, task_id: str, item: dict) -> ClickUpWebhookEvent:
+    body = {"event": type_.value, "task_id": task_id, "history_items": [item]}
+    return ClickUpWebhookEvent(type=type_, body=body, raw=body, headers={}, received_at=datetime(2025, 1, 1))
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> ProjectionManager:
+    manager = ProjectionManager([TaskProjection()])
+    tasks = manager.get("tasks")
+    status = {
+        "id": "h",
+        "date": "0",
+        "field": "status",
+        "parent_id": "L1",
+        "after": {"status": "to do", "type": "open"},
+    }
+    for task_id, user in (("t1", 1), ("t2", 1), ("t3", 2)):
+        manager.apply(tasks, _event(ClickUpWebhookEventType.TASK_CREATED, task_id, status))
+        add = {"id": "h", "date": "0", "field": "assignee_add", "after": {"id": user}}
+        manager.apply(tasks, _event(ClickUpWebhookEventType.TASK_ASSIGNEE_UPDATED, task_id, add))
+    monkeypatch.setattr(projection_tools, "get_projection_store", lambda: manager)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_task_status_counts(manager: ProjectionManager) -> None:
+    envelope = await projection_tools.projection_task_status_counts(TaskStatusCountsInput(list_id="L1"))
+
+    assert envelope.ok is True
+    assert envelope.result.counts == {"to do": 3}
+    assert envelope.result.total == 3
+    assert envelope.result.freshness.events_applied == 6
+
+
+@pytest.mark.asyncio
+async def test_assignee_workload_all_and_single(manager: ProjectionManager) -> None:
+    everyone = await projection_tools.projection_assignee_workload(AssigneeWorkloadInput())
+    single = await projection_tools.projection_assignee_workload(AssigneeWorkloadInput(assignee_id="2"))
+
+    assert [(i.assignee_id, i.open_tasks) for i in everyone.result.items] == [("1", 2), ("2", 1)]
+    assert [(i.assignee_id, i.open_tasks) for i in single.result.items] == [("2", 1)]
+
+
+@pytest.mark.asyncio
+async def test_tools_report_disabled_projections(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(projection_tools, "get_projection_store", lambda: None)
+
+    envelope = await projection_tools.projection_task_status_counts(TaskStatusCountsInput(list_id="L1"))
+
+    assert envelope.ok is False
+    assert "CLICKUP_WEBHOOK_PROJECTIONS_ENABLED" in (envelope.issues[0].hint or "")
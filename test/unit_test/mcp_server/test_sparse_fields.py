@@ -0,0 +1,93 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import jsonschema
+import pytest
+
+from clickup_mcp.mcp_server.app import mcp
+from clickup_mcp.models.dto.task import TaskResp
+from clickup_mcp.models.dto.time import TimeEntryListResponse
+
+
+class _FakeAPI:
+    async def list_in_list(self, list_id: str, query: Any, **_: Any) -> list[TaskResp]:
+        payload = {"status": {"status": "open"}, "priority": {"id": "2"}, "url": "https://app.clickup.com/t/x"}
+        return [TaskResp.model_validate({"id": f"t{i}", "name": f"Task {i}", **payload}) for i in range(3)]
+
+    async def list(self, team_id: str, query: Any) -> TimeEntryListResponse:
+        entry = {"id": "e1", "task_id": "t1", "user_id": 1, "team_id": team_id, "duration": 60000, "description": "d"}
+        return TimeEntryListResponse.model_validate({"items": [entry]})
+
+
+@pytest.fixture(autouse=True)
+def client(mock_get_client: MagicMock) -> None:
+    mock_get_client.return_value.task = mock_get_client.return_value.time = _FakeAPI()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("name", "arguments", "expected"),
+    [
+        ("task.list_in_list", {"list_id": "L1", "fields": ["status"]}, {"id": "t0", "status": "open"}),
+        ("time_entry.list", {"team_id": "team", "fields": ["duration"]}, {"id": "e1", "duration": 60000}),
+    ],
+)
+async def test_sparse_structured_output_matches_the_output_schema(
+    name: str, arguments: dict[str, Any], expected: dict[str, Any]
+) -> None:
+    tool = mcp._tool_manager.get_tool(name)
+    assert tool is not None
+
+    _, structured = await tool.run({"input": arguments}, convert_result=True)
+
+    assert structured["result"]["items"][0] == expected
+    jsonschema.validate(structured, tool.output_schema)
+
+
+@pytest.mark.asyncio
+async def test_without_fields_every_item_field_is_returned() -> None:
+    tool = mcp._tool_manager.get_tool("task.list_in_list")
+    assert tool is not None
+
+    _, structured = await tool.run({"input": {"list_id": "L1"}}, convert_result=True)
+
+    assert set(structured["result"]["items"][0]) == {"id", "name", "status", "list_id", "url"}
+
+
+def test_unknown_field_names_are_rejected() -> None:
+    from clickup_mcp.mcp_server.models.inputs.task import TaskListInListInput
+
+    with pytest.raises(ValueError):
+        TaskListInListInput.model_validate({"list_id": "L1", "fields": ["secret"]})
+
+
+def test_full_models_keep_their_required_fields() -> None:
+    from clickup_mcp.mcp_server.models.outputs.task import SparseTaskResult, TaskResult
+
+    assert TaskResult.model_json_schema()["required"] == ["id", "name"]
+    assert SparseTaskResult.model_json_schema()["required"] == ["id"]
+
+
+def test_sparse_results_read_unselected_fields_as_none() -> None:
+    from clickup_mcp.mcp_server.models.outputs.task import SparseTaskResult
+
+    result = SparseTaskResult.select(id="t1", status="open")
+
+    assert result.name is None
+    assert result.model_dump() == {"id": "t1", "status": "open"}
+
+
+def test_sparse_models_must_mirror_their_full_model() -> None:
+    from pydantic import BaseModel
+
+    from clickup_mcp.mcp_server.models.outputs.common import SparseModel
+
+    class Full(BaseModel):
+        id: str
+        name: str
+
+    with pytest.raises(TypeError, match="does not match"):
+
+        class MissingName(SparseModel):
+            full_model = Full
+            id: str
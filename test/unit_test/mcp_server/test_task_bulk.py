@@ -0,0 +1,96 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from clickup_mcp.api.bulk import BulkItemResult
+from clickup_mcp.exceptions import RateLimitError, ResourceNotFoundError
+from clickup_mcp.mcp_server import task as task_tools
+from clickup_mcp.mcp_server.errors import IssueCode
+from clickup_mcp.mcp_server.models.inputs.task import (
+    TaskBulkCreateInput,
+    TaskBulkDeleteInput,
+    TaskCreateInput,
+    TaskGetManyInput,
+)
+from clickup_mcp.models.dto.task import TaskResp
+
+
+class _FakeTaskAPI:
+    def __init__(self) -> None:
+        self.max_in_flight: Any = "unset"
+
+    async def bulk_create(
+        self, pairs: list[tuple[str, Any]], *, max_in_flight: Any, **_: Any
+    ) -> list[BulkItemResult[Any]]:
+        self.max_in_flight = max_in_flight
+        return [
+            BulkItemResult(index=0, ok=True, value=TaskResp.deserialize({"id": "new1", "name": pairs[0][1].name})),
+            BulkItemResult(index=1, ok=False, error=RateLimitError(), attempts=3),
+        ]
+
+    async def bulk_delete(self, task_ids: list[str], *, max_in_flight: Any, **_: Any) -> list[BulkItemResult[Any]]:
+        self.max_in_flight = max_in_flight
+        return [
+            BulkItemResult(index=0, ok=True, value=True),
+            BulkItemResult(index=1, ok=False, error=ResourceNotFoundError("Task not found")),
+        ]
+
+
+@pytest.fixture
+def tasks(mock_get_client: MagicMock) -> _FakeTaskAPI:
+    mock_get_client.return_value.task = fake = _FakeTaskAPI()
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_items_in_request_order(tasks: _FakeTaskAPI) -> None:
+    items = [TaskCreateInput(list_id="L1", name="A"), TaskCreateInput(list_id="L1", name="B")]
+
+    response = await task_tools.task_bulk_create(TaskBulkCreateInput(items=items, max_in_flight=4))
+
+    assert response.ok is True
+    result = response.result
+    assert (result.succeeded, result.failed) == (1, 1)
+    assert result.items[0].task.name == "A" and result.items[0].task_id == "new1"
+    assert result.items[1].issue.code is IssueCode.RATE_LIMIT and result.items[1].attempts == 3
+    assert tasks.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_maps_item_failures(tasks: _FakeTaskAPI) -> None:
+    response = await task_tools.task_bulk_delete(TaskBulkDeleteInput(task_ids=["t1", "gone"]))
+
+    items = response.result.items
+    assert [(item.task_id, item.ok) for item in items] == [("t1", True), ("gone", False)]
+    assert items[1].issue.code is IssueCode.NOT_FOUND
+    assert tasks.max_in_flight is None
+
+
+def test_bulk_inputs_cap_item_count() -> None:
+    with pytest.raises(ValueError):
+        TaskBulkDeleteInput(task_ids=[f"t{i}" for i in range(501)])
+
+
+@pytest.mark.asyncio
+async def test_get_many_counts_cached_items(mock_get_client: MagicMock) -> None:
+    class _GetManyAPI:
+        async def get_many(self, task_ids: list[str], **kwargs: Any) -> list[BulkItemResult[Any]]:
+            assert kwargs["use_cache"] is False
+            return [
+                BulkItemResult(index=0, ok=True, value=TaskResp.deserialize({"id": "t1", "name": "A"}), attempts=0),
+                BulkItemResult(index=1, ok=False, error=ResourceNotFoundError("Task not found")),
+            ]
+
+    mock_get_client.return_value.task = _GetManyAPI()
+
+    response = await task_tools.task_get_many(TaskGetManyInput(task_ids=["t1", "gone"], fresh=True))
+
+    result = response.result
+    assert (result.succeeded, result.failed, result.cached) == (1, 1, 1)
+    assert result.items[1].task_id == "gone" and result.items[1].issue.code is IssueCode.NOT_FOUND
+
+
+def test_get_many_requires_team_for_custom_ids() -> None:
+    with pytest.raises(ValueError):
+        TaskGetManyInput(task_ids=["CU-1"], custom_task_ids=True)
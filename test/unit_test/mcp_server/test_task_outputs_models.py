@@ -90,7 +90,7 @@ async def test_task_list_in_list_truncates_and_forwards_timl(mock_get_client: Ma
     # Return more than limit to exercise truncation
     tasks = [_fake_task_resp(id=f"t{i}") for i in range(105)]
 
-    async def _list_in_list(list_id, query):
+    async def _list_in_list(list_id, query, **_):
         # Assert include_timl flag is forwarded as set
         assert query.include_timl is True
         assert query.limit <= 100
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from clickup_mcp.config import get_settings
+from clickup_mcp.mcp_server import task as task_tools
+from clickup_mcp.mcp_server.errors import ToolResponse
+from clickup_mcp.mcp_server.models.inputs.task import TaskGetInput, TaskUpdateInput
+from clickup_mcp.mcp_server.tool_cache import (
+    cached_tool,
+    event_scopes,
+    get_tool_cache,
+    invalidate_for_event,
+)
+from clickup_mcp.models.dto.task import TaskResp
+from clickup_mcp.web_server.event.models import ClickUpWebhookEventType
+
+
+class _FakeTaskAPI:
+    def __init__(self) -> None:
+        self.gets: list[str] = []
+        self.name = "first"
+        self.fail: Optional[Exception] = None
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def get(self, task_id: str, **_: Any) -> TaskResp:
+        self.gets.append(task_id)
+        await self.release.wait()
+        if self.fail:
+            raise self.fail
+        return TaskResp.model_validate({"id": task_id, "name": self.name})
+
+    async def update(self, task_id: str, dto: Any) -> TaskResp:
+        self.name = "updated"
+        return TaskResp.model_validate({"id": task_id, "name": self.name})
+
+
+@pytest.fixture
+def tasks(mock_get_client: MagicMock) -> _FakeTaskAPI:
+    mock_get_client.return_value.task = fake = _FakeTaskAPI()
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_repeated_read_is_served_from_cache(tasks: _FakeTaskAPI) -> None:
+    first = await task_tools.task_get(TaskGetInput(task_id="t1"))
+    second = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert tasks.gets == ["t1"]
+    assert first.cache.status == "miss" and first.cache.age_ms is None
+    assert second.cache.status == "hit" and second.cache.age_ms >= 0
+    assert second.cache.ttl_ms == 15000
+    assert second.result == first.result
+
+
+@pytest.mark.asyncio
+async def test_inputs_are_canonicalized(tasks: _FakeTaskAPI) -> None:
+    await task_tools.task_get(TaskGetInput(task_id="t1"))
+    explicit = TaskGetInput.model_validate({"task_id": "t1", "custom_task_ids": False, "team_id": None})
+    hit = await task_tools.task_get(input=explicit)
+    other = await task_tools.task_get(TaskGetInput(task_id="t1", fields=["name"]))
+
+    assert hit.cache.status == "hit"
+    assert other.cache.status == "miss"
+    assert tasks.gets == ["t1", "t1"]
+
+
+@pytest.mark.asyncio
+async def test_write_tool_invalidates_related_reads(tasks: _FakeTaskAPI) -> None:
+    await task_tools.task_get(TaskGetInput(task_id="t1"))
+    await task_tools.task_update(TaskUpdateInput(task_id="t1", name="updated"))
+    after = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert after.cache.status == "miss"
+    assert after.result.name == "updated"
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached(tasks: _FakeTaskAPI) -> None:
+    tasks.fail = RuntimeError("boom")
+    failed = await task_tools.task_get(TaskGetInput(task_id="t1"))
+    tasks.fail = None
+    retried = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert not failed.ok
+    assert retried.ok and retried.cache.status == "miss"
+
+
+@pytest.mark.asyncio
+async def test_read_overlapping_a_write_is_not_stored(tasks: _FakeTaskAPI) -> None:
+    tasks.release.clear()
+    read = asyncio.create_task(task_tools.task_get(TaskGetInput(task_id="t1")))
+    await asyncio.sleep(0)
+    await task_tools.task_update(TaskUpdateInput(task_id="t1", name="updated"))
+    tasks.release.set()
+    await read
+
+    again = await task_tools.task_get(TaskGetInput(task_id="t1"))
+    assert again.cache.status == "miss"
+
+
+@pytest.mark.asyncio
+async def test_per_tool_ttl_override(tasks: _FakeTaskAPI, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MCP_TOOL_CACHE_TTLS", '{"task.get": 0}')
+    get_settings.cache_clear()
+    try:
+        first = await task_tools.task_get(TaskGetInput(task_id="t1"))
+        await task_tools.task_get(TaskGetInput(task_id="t1"))
+    finally:
+        get_settings.cache_clear()
+
+    assert first.cache is None
+    assert tasks.gets == ["t1", "t1"]
+
+
+@pytest.mark.asyncio
+async def test_webhook_events_invalidate_their_scopes(tasks: _FakeTaskAPI) -> None:
+    await task_tools.task_get(TaskGetInput(task_id="t1"))
+    invalidate_for_event(ClickUpWebhookEventType.LIST_UPDATED)
+    unrelated = await task_tools.task_get(TaskGetInput(task_id="t1"))
+    invalidate_for_event(ClickUpWebhookEventType.TASK_UPDATED)
+    after = await task_tools.task_get(TaskGetInput(task_id="t1"))
+
+    assert unrelated.cache.status == "hit"
+    assert after.cache.status == "miss"
+    assert event_scopes("spaceDeleted") == ("space", "folder", "list", "task")
+    assert event_scopes("taskTimeTrackedUpdated") == ("task", "time")
+
+
+def test_unknown_scope_is_rejected() -> None:
+    with pytest.raises(ValueError, match="scopes"):
+        cached_tool("x.get", scopes=("goal",))
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_entries() -> None:
+    calls: list[int] = []
+
+    @cached_tool("test.echo", scopes=("task",), ttl=60)
+    async def echo(value: int) -> ToolResponse[int]:
+        calls.append(value)
+        return ToolResponse(ok=True, result=value)
+
+    await echo(1)
+    await echo(value=1)
+    get_tool_cache().clear()
+    await echo(1)
+
+    assert calls == [1, 1]
@@ -0,0 +1,182 @@
+"""Equivalence tests: read-only projections vs. the DTO → domain → output mappers."""
+
+import warnings
+from typing import Any, Callable
+
+import pytest
+from pydantic import BaseModel
+
+from clickup_mcp.mcp_server.models.outputs.space import SpaceListItem
+from clickup_mcp.mcp_server.models.outputs.time import (
+    TimeEntryListItem,
+    TimeEntryResult,
+)
+from clickup_mcp.models.dto.list import ListResp
+from clickup_mcp.models.dto.reporting import TimeReportResponse
+from clickup_mcp.models.dto.space import SpaceResp
+from clickup_mcp.models.dto.task import TaskResp
+from clickup_mcp.models.dto.time import TimeEntryResponse
+from clickup_mcp.models.mapping.list_mapper import ListMapper
+from clickup_mcp.models.mapping.projection import OutputProjection
+from clickup_mcp.models.mapping.reporting_mapper import ReportingMapper
+from clickup_mcp.models.mapping.space_mapper import SpaceMapper
+from clickup_mcp.models.mapping.task_mapper import TaskMapper
+from clickup_mcp.models.mapping.time_mapper import TimeMapper
+
+TASKS = [
+    TaskResp.model_validate({"id": "t0", "name": "Bare"}),
+    TaskResp.model_validate(
+        {
+            "id": "t1",
+            "name": "Full",
+            "status": {"status": "in progress", "type": "custom"},
+            "priority": {"id": "2", "priority": "high"},
+            "assignees": [{"id": 7}, {"id": "8"}, {"username": "no-id"}],
+            "list": {"id": "L1"},
+            "due_date": 1731004800000,
+            "url": "https://app.clickup.com/t/t1",
+            "parent": "t0",
+        }
+    ),
+    TaskResp.model_validate({"id": "t2", "name": "Odd", "status": {"status": ""}, "priority": {"id": "9"}, "list": {}}),
+]
+TIME_ENTRIES = [
+    TimeEntryResponse.model_validate({"id": "e1", "task_id": "t1", "user_id": 42, "team_id": "T1"}),
+    TimeEntryResponse.model_validate(
+        {
+            "id": "e2",
+            "task_id": "t1",
+            "user_id": 43,
+            "team_id": "T1",
+            "description": "Review",
+            "start": 1,
+            "end": 3600001,
+            "duration": 3600000,
+            "billable": True,
+        }
+    ),
+]
+LISTS = [
+    ListResp.model_validate({"id": "L0", "name": "Bare", "statuses": []}),
+    ListResp.model_validate(
+        {
+            "id": "L1",
+            "name": "Sprint",
+            "status": "open",
+            "folder": {"id": "F1"},
+            "space": {"id": "S1"},
+            "statuses": [{"status": "open", "type": "open", "orderindex": 0}, {"status": "done", "color": "#0f0"}],
+        }
+    ),
+]
+SPACES = [
+    SpaceResp.model_validate({"id": "S0", "name": "Bare"}),
+    SpaceResp.model_validate({"id": "S1", "name": "Eng", "private": True, "team_id": "T1"}),
+]
+REPORTS = [
+    TimeReportResponse.model_validate({"id": "r1", "team_id": "T1", "start_date": 1, "end_date": 2}),
+    TimeReportResponse.model_validate(
+        {"id": "r2", "team_id": "T1", "start_date": 1, "end_date": 2, "total_duration": 60, "user_id": "u"}
+    ),
+]
+
+CASES: list[tuple[str, list[Any], Callable[[Any], BaseModel], Callable[[Any], BaseModel]]] = [
+    (
+        "task result",
+        TASKS,
+        TaskMapper.resp_to_task_result_output,
+        lambda r: TaskMapper.to_task_result_output(TaskMapper.to_domain(r), url=r.url),
+    ),
+    (
+        "task list item",
+        TASKS,
+        TaskMapper.resp_to_task_list_item_output,
+        lambda r: TaskMapper.to_task_list_item_output(TaskMapper.to_domain(r), url=r.url),
+    ),
+    (
+        "time entry result",
+        TIME_ENTRIES,
+        TimeMapper.resp_to_time_entry_result_output,
+        lambda r: TimeEntryResult(**TimeMapper.to_time_entry_result_output(TimeMapper.to_domain(r))),
+    ),
+    (
+        "time entry list item",
+        TIME_ENTRIES,
+        TimeMapper.resp_to_time_entry_list_item_output,
+        lambda r: TimeEntryListItem(**TimeMapper.to_time_entry_list_item_output(TimeMapper.to_domain(r))),
+    ),
+    (
+        "list result",
+        LISTS,
+        ListMapper.resp_to_list_result_output,
+        lambda r: ListMapper.to_list_result_output(ListMapper.to_domain(r)),
+    ),
+    (
+        "list list item",
+        LISTS,
+        ListMapper.resp_to_list_list_item_output,
+        lambda r: ListMapper.to_list_list_item_output(ListMapper.to_domain(r)),
+    ),
+    (
+        "space result",
+        SPACES,
+        SpaceMapper.resp_to_space_result_output,
+        lambda r: SpaceMapper.to_space_result_output(SpaceMapper.to_domain(r)),
+    ),
+    (
+        "space list item",
+        SPACES,
+        SpaceMapper.resp_to_space_list_item_output,
+        lambda r: SpaceMapper.to_space_list_item_output(SpaceMapper.to_domain(r)),
+    ),
+    (
+        "time report list item",
+        REPORTS,
+        ReportingMapper.resp_to_time_report_list_item_output,
+        lambda r: _report_list_item(ReportingMapper.to_time_report_list_item_output(ReportingMapper.to_domain(r))),
+    ),
+]
+
+
+def _report_list_item(values: dict[str, Any]) -> BaseModel:
+    from clickup_mcp.mcp_server.models.outputs.reporting import TimeReportListItem
+
+    return TimeReportListItem(**values)
+
+
+@pytest.mark.parametrize("name, sources, project, via_domain", CASES, ids=[case[0] for case in CASES])
+def test_projection_matches_domain_path(
+    name: str,
+    sources: list[Any],
+    project: Callable[[Any], BaseModel],
+    via_domain: Callable[[Any], BaseModel],
+) -> None:
+    for source in sources:
+        expected = via_domain(source)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # serializer warnings would mean a mistyped value
+            actual = project(source)
+            assert type(actual) is type(expected)
+            assert actual.model_dump() == expected.model_dump()
+            assert actual.model_dump_json() == expected.model_dump_json()
+        assert actual == type(expected).model_validate(actual.model_dump())
+
+
+@pytest.mark.parametrize("fields", [["status"], ["priority", "url"], ["id"], []])
+def test_sparse_task_projection_matches_domain_path(fields: list[str]) -> None:
+    for resp in TASKS:
+        actual = TaskMapper.resp_to_task_result_output(resp, fields=fields)
+        expected = TaskMapper.to_task_result_output(TaskMapper.to_domain(resp), url=resp.url, fields=fields)
+
+        assert actual.model_fields_set == expected.model_fields_set
+        assert actual.model_dump_json() == expected.model_dump_json()
+
+
+def test_projection_must_cover_the_model_fields() -> None:
+    projection: OutputProjection[SpaceResp, SpaceListItem] = OutputProjection(
+        "clickup_mcp.mcp_server.models.outputs.space.SpaceListItem",
+        {"id": lambda resp: resp.id, "title": lambda resp: resp.name},
+    )
+
+    with pytest.raises(TypeError, match=r"\['name', 'title'\]"):
+        projection(SPACES[0])
@@ -208,3 +208,25 @@ def test_to_task_result_output_no_log_when_priority_none(caplog: pytest.LogCaptu
     # No error logs should be emitted
     records = [r for r in caplog.records if r.levelno >= logging.ERROR and "Failed to map priority" in r.getMessage()]
     assert not records
+
+
+def test_to_task_result_output_sparse_fields_serialize_only_requested() -> None:
+    dom = ClickUpTask(id="t1", name="Task One", status="open", priority=2, list_id="l1", assignee_ids=[1])
+
+    full = TaskMapper.to_task_result_output(dom, url="u")
+    sparse = TaskMapper.to_task_result_output(dom, url="u", fields=["priority", "url"])
+
+    assert set(full.model_dump()) >= {"name", "status", "assignee_ids", "parent_id"}
+    assert sparse.model_dump() == {"id": "t1", "priority": {"value": 2, "label": "HIGH"}, "url": "u"}
+    assert sparse.model_dump_json() == '{"id":"t1","priority":{"value":2,"label":"HIGH"},"url":"u"}'
+
+
+def test_to_task_result_output_sparse_skips_unrequested_getters(caplog: pytest.LogCaptureFixture) -> None:
+    dom = ClickUpTask(id="t1", name="Task One", priority=2)
+    dom.priority = 99  # would log a mapping error if the priority were computed
+
+    with caplog.at_level(logging.ERROR):
+        item = TaskMapper.to_task_list_item_output(dom, fields=["name"])
+
+    assert item.model_dump() == {"id": "t1", "name": "Task One"}
+    assert not caplog.records
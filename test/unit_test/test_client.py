@@ -46,6 +46,22 @@ class TestClickUpAPIClient(BaseAPIClientTestSuite):
         # Client should be closed after context exit
         # (We can't easily test this without mocking the httpx client)
 
+    @pytest.mark.asyncio
+    async def test_overlapping_contexts_share_the_pool(self, api_client: ClickUpAPIClient) -> None:
+        """Test that the pool closes with the last open context and reopens on the next request."""
+        async with api_client:
+            async with api_client:
+                pass
+            assert api_client._client.is_closed is False
+        assert api_client._client.is_closed is True
+
+        mock_response = Mock(spec=httpx.Response, status_code=200, content=b"{}", headers={})
+        mock_response.json.return_value = {}
+        with patch("httpx.AsyncClient.request", AsyncMock(return_value=mock_response)):
+            response = await api_client._make_request("GET", "/test")
+        assert response.status_code == 200
+        assert api_client._client.is_closed is False
+
     @pytest.mark.asyncio
     async def test_rate_limiting(self, api_client: ClickUpAPIClient) -> None:
         """Test rate limiting functionality."""
@@ -227,6 +243,28 @@ class TestClickUpAPIClient(BaseAPIClientTestSuite):
 
             assert "Request failed after" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_post_is_not_repeated_when_it_may_have_been_sent(self, api_client: ClickUpAPIClient) -> None:
+        """A POST whose outcome is unknown is not retried, so it cannot create twice."""
+        request = AsyncMock(side_effect=httpx.ReadTimeout("no response"))
+        with patch.object(api_client._client, "request", request):
+            with pytest.raises(ClickUpAPIError, match="after 1 attempts"):
+                await api_client.post("/list/1/task", data={"name": "A"})
+
+        assert request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_is_retried_when_it_was_never_sent(self, api_client: ClickUpAPIClient) -> None:
+        """Connection failures happen before sending, so a POST is retried like a GET."""
+        ok = Mock(status_code=200, content=b"{}", json=lambda: {}, headers={})
+        request = AsyncMock(side_effect=[httpx.ConnectError("refused"), ok])
+        api_client.retry_delay = 0.01
+        with patch.object(api_client._client, "request", request):
+            response = await api_client.post("/list/1/task", data={"name": "A"})
+
+        assert response.status_code == 200
+        assert request.await_count == 2
+
     @pytest.mark.asyncio
     async def test_logs_error_on_client_error_response(
         self, api_client: ClickUpAPIClient, caplog: pytest.LogCaptureFixture
@@ -32,6 +32,7 @@ class TestConfig:
             "LOG_LEVEL",
             "CLICKUP_WEBHOOK_HANDLER_MODULES",
             "CLICKUP_TEST_TEAM_ID",
+            "CLICKUP_MCP_DATA_DIR",
         ]:
             if key in os.environ:
                 del os.environ[key]
@@ -144,6 +145,18 @@ class TestConfig:
         assert settings.cors_allow_methods == ["GET", "POST"]
         assert settings.cors_allow_headers == ["Authorization", "Content-Type"]
 
+    def test_relative_data_paths_resolve_against_the_data_dir(self, tmp_path: Path) -> None:
+        """Test that webhook data files are not written to the working directory by default."""
+        os.environ["CLICKUP_MCP_DATA_DIR"] = str(tmp_path)
+        os.environ["CLICKUP_WEBHOOK_EVENT_LOG_DIR"] = str(tmp_path / "elsewhere")
+
+        settings = Settings(_env_file="non_existent_env_file")
+
+        assert settings.clickup_webhook_dead_letter_path == str(tmp_path / "clickup_webhook_dead_letters.jsonl")
+        assert settings.clickup_webhook_durable_queue_path == str(tmp_path / "clickup_webhook_queue.db")
+        assert settings.clickup_webhook_event_log_dir == str(tmp_path / "elsewhere")
+        assert settings.clickup_webhook_projection_checkpoint_dir is None
+
     def test_webhook_modules_parsing(self, tmp_path: Path) -> None:
         """Test parsing of webhook modules from env."""
         env_file = tmp_path / ".env"
@@ -0,0 +1,183 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from clickup_mcp.api.bulk import run_bulk
+from clickup_mcp.client import ClickUpAPIClient
+from clickup_mcp.config import get_settings
+from clickup_mcp.deadline import (
+    current_deadline,
+    deadline_scope,
+    item_deadline,
+    partial_results_at_deadline,
+    remaining_time,
+)
+from clickup_mcp.exceptions import DeadlineExceededError, RateLimitError
+from clickup_mcp.mcp_server.app import mcp
+from clickup_mcp.mcp_server.errors import IssueCode, handle_tool_errors
+
+
+def _ok() -> Mock:
+    response = Mock(spec=httpx.Response, status_code=200, content=b"{}", headers={})
+    response.json.return_value = {}
+    return response
+
+
+@pytest.mark.asyncio
+async def test_scopes_only_shorten_the_deadline() -> None:
+    assert current_deadline() is None
+    async with deadline_scope(10) as outer:
+        async with deadline_scope(60) as inner:
+            assert inner is outer
+        async with deadline_scope(1) as inner:
+            assert inner.budget == 1
+            assert remaining_time() <= 1
+        async with deadline_scope(0) as inner:
+            assert inner is outer
+    assert current_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_scope_cancels_work_past_the_deadline() -> None:
+    with pytest.raises(DeadlineExceededError, match="0.05s time budget"):
+        async with deadline_scope(0.05):
+            await asyncio.sleep(5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_wait_past_the_deadline_fails_fast() -> None:
+    client = ClickUpAPIClient(api_token="pk_test", rate_limit_requests_per_minute=1)
+    with patch("httpx.AsyncClient.request", AsyncMock(return_value=_ok())):
+        await client._make_request("GET", "/team")
+        async with deadline_scope(5):
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededError) as raised:
+                await client._make_request("GET", "/team")
+
+    assert raised.value.operation == "waiting on the rate limiter"
+    assert time.monotonic() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_past_the_deadline_fails_fast() -> None:
+    client = ClickUpAPIClient(api_token="pk_test", retry_delay=10)
+    request = AsyncMock(side_effect=httpx.ConnectError("reset"))
+    with patch("httpx.AsyncClient.request", request):
+        async with deadline_scope(5):
+            with pytest.raises(DeadlineExceededError) as raised:
+                await client._make_request("GET", "/team")
+
+    assert raised.value.operation == "retrying a failed request"
+    assert request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_http_timeout_is_capped_at_the_time_left() -> None:
+    client = ClickUpAPIClient(api_token="pk_test", timeout=30)
+    request = AsyncMock(return_value=_ok())
+    with patch("httpx.AsyncClient.request", request):
+        await client._make_request("GET", "/team")
+        async with deadline_scope(2):
+            await client._make_request("GET", "/team")
+
+    assert request.await_args_list[0].kwargs["timeout"] == 30
+    assert 0 < request.await_args_list[1].kwargs["timeout"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_items_are_not_retried_past_the_deadline() -> None:
+    async def call(_: int) -> None:
+        raise RateLimitError("slow down", retry_after=5)
+
+    async with deadline_scope(1):
+        results = await run_bulk([1, 2], call, max_in_flight=2, idempotent=True)
+
+    assert [(r.ok, r.attempts) for r in results] == [(False, 1), (False, 1)]
+    assert all(isinstance(r.error, RateLimitError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_item_deadline_cancels_only_the_item() -> None:
+    async with deadline_scope(0.05, cancel=False):
+        with pytest.raises(DeadlineExceededError) as running:
+            async with item_deadline():
+                await asyncio.sleep(5)
+        with pytest.raises(DeadlineExceededError) as waiting:
+            async with item_deadline():
+                pytest.fail("an item must not start past the deadline")
+
+    assert running.value.operation == "running the item"
+    assert waiting.value.operation == "waiting to start the item"
+
+
+@pytest.mark.asyncio
+async def test_bulk_items_past_the_deadline_fail_and_the_rest_finish() -> None:
+    async def call(seconds: float) -> float:
+        await asyncio.sleep(seconds)
+        return seconds
+
+    async with deadline_scope(0.1, cancel=False):
+        results = await run_bulk([0, 5, 0, 0], call, max_in_flight=2, idempotent=True)
+
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert isinstance(results[1].error, DeadlineExceededError)
+
+
+@handle_tool_errors
+async def slow_tool(seconds: float) -> dict:
+    await asyncio.sleep(seconds)
+    return {"slept": seconds}
+
+
+@pytest.mark.asyncio
+async def test_tool_call_past_its_timeout_reports_a_deadline_issue(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MCP_TOOL_TIMEOUT", "5")
+    monkeypatch.setenv("MCP_TOOL_TIMEOUTS", '{"slow.tool": 0.05}')
+    get_settings.cache_clear()
+    try:
+        response = await slow_tool(5)
+    finally:
+        get_settings.cache_clear()
+
+    assert not response.ok
+    assert response.issues[0].code == IssueCode.DEADLINE_EXCEEDED
+    assert "0.05s time budget" in response.issues[0].message
+
+
+@pytest.mark.asyncio
+async def test_request_meta_timeout_overrides_the_configured_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    context = SimpleNamespace(request_context=SimpleNamespace(meta=SimpleNamespace(timeout=0.05)))
+    monkeypatch.setattr(mcp, "get_context", lambda: context)
+
+    response = await slow_tool(5)
+
+    assert response.issues[0].code == IssueCode.DEADLINE_EXCEEDED
+
+
+@handle_tool_errors
+@partial_results_at_deadline
+async def slow_bulk_tool(seconds: list[float]) -> list[Any]:
+    async def call(item: float) -> float:
+        await asyncio.sleep(item)
+        return item
+
+    return await run_bulk(seconds, call, max_in_flight=1, idempotent=True)
+
+
+@pytest.mark.asyncio
+async def test_marked_tool_past_its_timeout_returns_partial_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MCP_TOOL_TIMEOUTS", '{"slow.bulk.tool": 0.1}')
+    get_settings.cache_clear()
+    try:
+        response = await slow_bulk_tool([0, 5, 0])
+    finally:
+        get_settings.cache_clear()
+
+    assert response.ok
+    assert [(r.ok, r.attempts) for r in response.result] == [(True, 1), (False, 1), (False, 0)]
+    assert all(isinstance(r.error, DeadlineExceededError) for r in response.result[1:])
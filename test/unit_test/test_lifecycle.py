@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from clickup_mcp.lifecycle import ShutdownCoordinator
+from clickup_mcp.mcp_server.errors import handler as handler_module
+from clickup_mcp.mcp_server.errors.codes import IssueCode
+from clickup_mcp.mcp_server.errors.handler import handle_tool_errors
+
+
+@pytest.fixture
+def coordinator(monkeypatch: pytest.MonkeyPatch) -> ShutdownCoordinator:
+    coordinator = ShutdownCoordinator(timeout=0.3)
+    monkeypatch.setattr(handler_module, "get_shutdown_coordinator", lambda: coordinator)
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_in_flight_calls_drain_and_new_calls_are_rejected(coordinator: ShutdownCoordinator) -> None:
+    release = asyncio.Event()
+
+    @handle_tool_errors
+    async def slow_tool() -> dict:
+        await release.wait()
+        return {"done": True}
+
+    coordinator.open()
+    running = asyncio.ensure_future(slow_tool())
+    await asyncio.sleep(0)
+    assert coordinator.in_flight == ["slow_tool"]
+
+    coordinator.begin()
+    rejected = await slow_tool()
+    assert rejected.ok is False
+    assert rejected.issues[0].code is IssueCode.TRANSIENT
+
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    assert await coordinator.wait_for_tool_calls() == []
+    assert (await running).result == {"done": True}
+
+    report = coordinator.close()
+    assert report is not None and report.clean
+    assert (report.drained_tool_calls, report.rejected_tool_calls) == (1, 1)
+    # The last lifespan re-opens the coordinator for a later application
+    assert coordinator.draining is False
+    assert (await slow_tool()).ok is True
+
+
+@pytest.mark.asyncio
+async def test_deadline_abandons_work_and_later_steps_still_run(coordinator: ShutdownCoordinator) -> None:
+    @handle_tool_errors
+    async def stuck_tool() -> None:
+        await asyncio.sleep(10)
+
+    async def stuck_step() -> None:
+        await asyncio.sleep(10)
+
+    async def failing_step() -> None:
+        raise RuntimeError("boom")
+
+    flushed = []
+
+    async def flush_step() -> None:
+        flushed.append(True)
+
+    coordinator.open()
+    coordinator.open()
+    running = asyncio.ensure_future(stuck_tool())
+    await asyncio.sleep(0)
+
+    assert await coordinator.run_step("failing", failing_step) is False
+    assert await coordinator.run_step("stuck", stuck_step) is False
+    assert coordinator.close() is None  # an outer lifespan is still shutting down
+    assert await coordinator.wait_for_tool_calls() == ["stuck_tool"]
+    assert await coordinator.run_step("flush", flush_step) is True
+
+    report = coordinator.close()
+    running.cancel()
+    assert report is not None and not report.clean
+    assert report.abandoned_tool_calls == ["stuck_tool"]
+    assert report.abandoned_steps == ["stuck"]
+    assert list(report.failed_steps) == ["failing"]
+    assert report.completed_steps == ["flush"] and flushed == [True]
@@ -0,0 +1,101 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from clickup_mcp.client import ClickUpAPIClient, _endpoint_template
+from clickup_mcp.mcp_server.errors import handle_tool_errors
+from clickup_mcp.metrics import (
+    RATE_LIMIT_WAIT,
+    REQUEST_BYTES,
+    RESPONSE_BYTES,
+    TOOL_DURATION,
+    TOOL_ERRORS,
+    UPSTREAM_DURATION,
+    UPSTREAM_RETRIES,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("op_seconds", "Op latency", ("op",), buckets=(0.1, 1.0))
+    counter = registry.counter("op_errors_total", "Op errors", ("op",))
+    histogram.observe(0.05, op='a"b')
+    histogram.observe(0.1, op='a"b')
+    histogram.observe(3.0, op='a"b')
+    counter.inc(op="a")
+
+    assert registry.render().splitlines() == [
+        "# HELP op_seconds Op latency",
+        "# TYPE op_seconds histogram",
+        'op_seconds_bucket{op="a\\"b",le="0.1"} 2',
+        'op_seconds_bucket{op="a\\"b",le="1.0"} 2',
+        'op_seconds_bucket{op="a\\"b",le="+Inf"} 3',
+        'op_seconds_sum{op="a\\"b"} 3.15',
+        'op_seconds_count{op="a\\"b"} 3',
+        "# HELP op_errors_total Op errors",
+        "# TYPE op_errors_total counter",
+        'op_errors_total{op="a"} 1',
+    ]
+
+
+def test_labels_must_match() -> None:
+    with pytest.raises(ValueError, match="expects labels"):
+        TOOL_DURATION.observe(1.0, tool="x")
+
+
+@pytest.mark.parametrize(
+    "endpoint, template",
+    [
+        ("/team", "/team"),
+        ("/task/86a1b2c/dependency", "/task/{id}/dependency"),
+        ("/team/9018752317/time_entries/current", "/team/{id}/time_entries/current"),
+        ("/list/abc/task/def", "/list/{id}/task/{id}"),
+    ],
+)
+def test_endpoint_template(endpoint: str, template: str) -> None:
+    assert _endpoint_template(endpoint) == template
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_record_latency_and_errors() -> None:
+    @handle_tool_errors
+    async def sample_tool(fail: bool) -> dict:
+        if fail:
+            raise ValueError("bad input")
+        return {"ok": True}
+
+    await sample_tool(False)
+    await sample_tool(True)
+
+    assert TOOL_DURATION.count(tool="sample_tool", outcome="ok") == 1
+    assert TOOL_DURATION.count(tool="sample_tool", outcome="error") == 1
+    assert TOOL_ERRORS.value(tool="sample_tool", code="INTERNAL") == 1
+
+
+@pytest.mark.asyncio
+async def test_upstream_requests_record_latency_retries_and_sizes() -> None:
+    client = ClickUpAPIClient(api_token="pk_test", retry_delay=0)
+    ok = Mock(spec=httpx.Response, status_code=200, content=b'{"id": "1"}', headers={})
+    ok.json.return_value = {"id": "1"}
+    request = AsyncMock(side_effect=[httpx.ConnectError("reset"), ok])
+
+    with patch("httpx.AsyncClient.request", request):
+        await client._make_request("PUT", "/task/86a1b2c", data={"name": "x"})
+
+    labels = {"method": "PUT", "endpoint": "/task/{id}"}
+    assert UPSTREAM_DURATION.count(status="error", **labels) == 1
+    assert UPSTREAM_DURATION.count(status="200", **labels) == 1
+    assert UPSTREAM_RETRIES.sum(**labels) == 1
+    assert RATE_LIMIT_WAIT.count(**labels) == 1
+    assert REQUEST_BYTES.sum(**labels) == len('{"name": "x"}')
+    assert RESPONSE_BYTES.sum(**labels) == len(b'{"id": "1"}')
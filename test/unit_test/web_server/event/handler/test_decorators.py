@@ -29,6 +29,28 @@ async def test_decorator_enum_style_registers_and_runs():
     assert seen == [1]
 
 
+@pytest.mark.asyncio
+async def test_decorator_scope_kwargs_narrow_dispatch():
+    seen: list[str] = []
+
+    @clickup_event(ClickUpWebhookEventType.TASK_UPDATED, list_id="901", field=("status", "priority"))
+    async def handle(ev: ClickUpWebhookEvent) -> None:
+        seen.append(ev.body["history_items"][0]["field"])
+
+    for list_id, field in (("901", "status"), ("902", "status"), ("901", "name"), ("901", "priority")):
+        body = {"task_id": "t1", "history_items": [{"field": field, "parent_id": list_id}]}
+        ev = ClickUpWebhookEvent(
+            type=ClickUpWebhookEventType.TASK_UPDATED,
+            body=body,
+            raw=body,
+            headers={},
+            received_at=datetime.utcnow(),
+        )
+        await get_registry().dispatch(ev)
+
+    assert seen == ["status", "priority"]
+
+
 @pytest.mark.asyncio
 async def test_decorator_attr_style_registers_and_runs():
     seen: list[int] = []
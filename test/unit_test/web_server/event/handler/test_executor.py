@@ -0,0 +1,142 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from clickup_mcp.config import get_settings
+from clickup_mcp.web_server.event.handler import (
+    BaseClickUpWebhookHandler,
+    clickup_event,
+    get_registry,
+    handler_execution,
+    shutdown_handler_executors,
+)
+from clickup_mcp.web_server.event.handler.executor import ensure_async
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_executors():
+    yield
+    shutdown_handler_executors()
+
+
+def _event(body: dict | None = None) -> ClickUpWebhookEvent:
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_CREATED,
+        body=body or {},
+        raw=body or {},
+        headers={},
+        received_at=datetime.utcnow(),
+    )
+
+
+def _write_pid(event: ClickUpWebhookEvent) -> None:
+    Path(event.body["path"]).write_text(str(os.getpid()))
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_in_thread_pool_without_blocking_loop():
+    threads: list[int] = []
+
+    @clickup_event.task_created
+    def blocking(_: ClickUpWebhookEvent) -> None:
+        threads.append(threading.get_ident())
+        time.sleep(0.2)
+
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    tick_task = asyncio.create_task(ticker())
+    await get_registry().dispatch(_event())
+    tick_task.cancel()
+
+    assert threads and threads[0] != threading.get_ident()
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_inline_execution_runs_on_event_loop_thread():
+    threads: list[int] = []
+
+    @clickup_event(ClickUpWebhookEventType.TASK_CREATED, execution="inline")
+    def trivial(_: ClickUpWebhookEvent) -> None:
+        threads.append(threading.get_ident())
+
+    await get_registry().dispatch(_event())
+
+    assert threads == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_handler_execution_marker_applies_to_oop_sync_methods():
+    threads: list[int] = []
+
+    class Handler(BaseClickUpWebhookHandler):
+        @handler_execution("inline")
+        def on_task_created(self, event: ClickUpWebhookEvent) -> None:  # type: ignore[override]
+            threads.append(threading.get_ident())
+
+        def on_task_updated(self, event: ClickUpWebhookEvent) -> None:  # type: ignore[override]
+            threads.append(threading.get_ident())
+
+    Handler()
+    await get_registry().dispatch(_event())
+    updated = _event()
+    updated.type = ClickUpWebhookEventType.TASK_UPDATED
+    await get_registry().dispatch(updated)
+
+    assert threads[0] == threading.get_ident()
+    assert threads[1] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_exceptions_propagate_from_thread_pool():
+    def boom(_: ClickUpWebhookEvent) -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await ensure_async(boom)(_event())
+
+
+@pytest.mark.asyncio
+async def test_process_execution_runs_in_another_process(tmp_path: Path):
+    target = tmp_path / "pid"
+
+    await ensure_async(_write_pid, execution="process")(_event({"path": str(target)}))
+
+    assert int(target.read_text()) != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_default_execution_mode_comes_from_settings(monkeypatch):
+    monkeypatch.setenv("CLICKUP_WEBHOOK_SYNC_HANDLER_EXECUTION", "inline")
+    get_settings.cache_clear()
+    threads: list[int] = []
+
+    def trivial(_: ClickUpWebhookEvent) -> None:
+        threads.append(threading.get_ident())
+
+    try:
+        await ensure_async(trivial)(_event())
+    finally:
+        get_settings.cache_clear()
+
+    assert threads == [threading.get_ident()]
+
+
+def test_handler_execution_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        handler_execution("fiber")  # type: ignore[arg-type]
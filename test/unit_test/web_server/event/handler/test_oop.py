@@ -119,3 +119,31 @@ def test_oop_every_enum_event_resolves_to_corresponding_on_method():
         assert (
             resolved.__name__ == expected_name
         ), f"Resolved handler name mismatch for {et}: got {resolved.__name__}, expected {expected_name}"
+
+
+@pytest.mark.asyncio
+async def test_oop_scope_class_attribute_applies_to_overrides():
+    from clickup_mcp.web_server.event.handler import HandlerScope
+
+    seen: list[str] = []
+
+    class TeamHandler(BaseClickUpWebhookHandler):
+        scope = HandlerScope.of(list_id="901")
+
+        async def on_task_created(self, event: ClickUpWebhookEvent) -> None:
+            seen.append(event.body["list_id"])
+
+    _ = TeamHandler()
+    for list_id in ("901", "902"):
+        body = {"list_id": list_id}
+        await get_registry().dispatch(
+            ClickUpWebhookEvent(
+                type=ClickUpWebhookEventType.TASK_CREATED,
+                body=body,
+                raw=body,
+                headers={},
+                received_at=datetime.utcnow(),
+            )
+        )
+
+    assert seen == ["901"]
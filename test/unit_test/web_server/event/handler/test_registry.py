@@ -3,7 +3,7 @@ from typing import Any
 
 import pytest
 
-from clickup_mcp.web_server.event.handler import get_registry
+from clickup_mcp.web_server.event.handler import HandlerScope, get_registry
 from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEvent,
     ClickUpWebhookEventType,
@@ -84,3 +84,98 @@ async def test_registry_clear_removes_all_handlers():
 
     # Since we cleared the registry, the handler should not be called
     assert calls == []
+
+
+def test_registry_subscribed_types_follow_registration():
+    async def h(_: ClickUpWebhookEvent) -> None:
+        return None
+
+    reg = get_registry()
+    assert reg.subscribed_types == frozenset()
+
+    reg.register(ClickUpWebhookEventType.TASK_CREATED, h)
+    reg.register(ClickUpWebhookEventType.TASK_CREATED, h)
+    reg.register(ClickUpWebhookEventType.LIST_UPDATED, h)
+
+    assert reg.subscribed_types == {ClickUpWebhookEventType.TASK_CREATED, ClickUpWebhookEventType.LIST_UPDATED}
+    assert reg.is_subscribed(ClickUpWebhookEventType.LIST_UPDATED)
+    assert not reg.is_subscribed(ClickUpWebhookEventType.TASK_DELETED)
+
+    reg.clear()
+    assert reg.subscribed_types == frozenset()
+
+
+def _task_event(list_id: str, field: str, event_type=ClickUpWebhookEventType.TASK_UPDATED) -> ClickUpWebhookEvent:
+    body = {
+        "event": event_type.value,
+        "task_id": "t1",
+        "history_items": [{"id": "h1", "field": field, "parent_id": list_id, "after": {}}],
+    }
+    return ClickUpWebhookEvent(type=event_type, body=body, raw=body, headers={}, received_at=datetime.utcnow())
+
+
+@pytest.mark.asyncio
+async def test_registry_routes_scoped_handlers_by_index_in_registration_order():
+    calls: list[str] = []
+
+    def make(name: str):
+        async def h(_: ClickUpWebhookEvent) -> None:
+            calls.append(name)
+
+        return h
+
+    reg = get_registry()
+    reg.register(ClickUpWebhookEventType.TASK_UPDATED, make("list-901"), scope=HandlerScope.of(list_id="901"))
+    reg.register(ClickUpWebhookEventType.TASK_UPDATED, make("any"))
+    reg.register(
+        ClickUpWebhookEventType.TASK_UPDATED,
+        make("901-status"),
+        scope=HandlerScope.of(list_id=["901", "903"], field="status"),
+    )
+    reg.register(ClickUpWebhookEventType.TASK_UPDATED, make("list-902"), scope=HandlerScope.of(list_id=902))
+    reg.register(ClickUpWebhookEventType.TASK_UPDATED, make("priority"), scope=HandlerScope.of(field="priority"))
+    reg.register(ClickUpWebhookEventType.TASK_UPDATED, make("space"), scope=HandlerScope.of(space_id="s1"))
+
+    await reg.dispatch(_task_event("901", "status"))
+    assert calls == ["list-901", "any", "901-status"]
+
+    calls.clear()
+    await reg.dispatch(_task_event("902", "priority"))
+    assert calls == ["any", "list-902", "priority"]
+
+    calls.clear()
+    await reg.dispatch(_task_event("901", "due_date"))
+    assert calls == ["list-901", "any"]
+
+    # Scoped handlers still subscribe their type and are listed by handlers_for
+    assert reg.is_subscribed(ClickUpWebhookEventType.TASK_UPDATED)
+    assert len(reg.handlers_for(ClickUpWebhookEventType.TASK_UPDATED)) == 6
+
+
+def test_handler_scope_matches_container_ids_and_moves():
+    moved = ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_MOVED,
+        body={
+            "task_id": "t1",
+            "history_items": [{"field": "section_moved", "before": {"id": "L1"}, "after": {"id": "L2"}}],
+        },
+        raw={},
+        headers={},
+        received_at=datetime.utcnow(),
+    )
+    folder = ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.LIST_CREATED,
+        body={"list_id": "L9", "folder_id": "F1", "space_id": "S1"},
+        raw={},
+        headers={},
+        received_at=datetime.utcnow(),
+    )
+
+    assert HandlerScope.of(list_id="L1").matches(moved)
+    assert HandlerScope.of(list_id="L2", field="section_moved").matches(moved)
+    assert not HandlerScope.of(list_id="L3").matches(moved)
+    assert HandlerScope.of(folder_id="F1", space_id=["S1", "S2"]).matches(folder)
+    assert not HandlerScope.of(folder_id="F1", list_id="L1").matches(folder)
+    assert HandlerScope().matches(folder)
+    with pytest.raises(ValueError):
+        HandlerScope.of(list_id=[])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+import clickup_mcp.web_server.event.codec as codec
+from clickup_mcp.web_server.event.codec import (
+    decode_event,
+    encode_event,
+    filter_headers,
+    from_wire,
+    to_wire,
+)
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+
+def _event() -> ClickUpWebhookEvent:
+    body = {
+        "event": "taskStatusUpdated",
+        "task_id": "t1",
+        "history_items": [{"id": "h1", "date": "1642736652800", "before": {"status": "open"}}],
+    }
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_STATUS_UPDATED,
+        body=body,
+        raw=body,
+        headers={"X-Signature": "sig", "User-Agent": "ClickUp", "Accept": "*/*"},
+        received_at=datetime(2024, 1, 2, 3, 4, 5, 678000),
+        delivery_id="d1",
+    )
+
+
+def test_filter_headers_is_case_insensitive() -> None:
+    assert filter_headers({"X-Signature": "a", "Host": "b"}) == {"x-signature": "a"}
+    assert filter_headers({"Host": "b"}, ["host"]) == {"host": "b"}
+
+
+def test_to_wire_is_compact() -> None:
+    wire = to_wire(_event())
+
+    assert wire == {
+        "v": 2,
+        "t": "taskStatusUpdated",
+        "ts": 1704164645678,
+        "id": "d1",
+        "h": {"x-signature": "sig"},
+        "b": _event().body,
+    }
+
+
+def test_from_wire_roundtrip_shares_body_and_raw() -> None:
+    restored = from_wire(to_wire(_event()))
+
+    assert restored.type == ClickUpWebhookEventType.TASK_STATUS_UPDATED
+    assert restored.received_at == datetime(2024, 1, 2, 3, 4, 5, 678000)
+    assert restored.raw is restored.body
+    assert restored.delivery_id == "d1"
+
+
+def test_to_wire_converts_aware_timestamps() -> None:
+    event = _event()
+    event.received_at = datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+    assert to_wire(event)["ts"] == 1704164645678
+
+
+def test_from_wire_accepts_version_1() -> None:
+    legacy = {
+        "type": "taskCreated",
+        "body": {"task_id": "t9"},
+        "headers": {"h": "1"},
+        "received_at": "2024-01-02T03:04:05.678000",
+        "delivery_id": "x",
+    }
+    restored = from_wire(legacy)
+
+    assert restored.type == ClickUpWebhookEventType.TASK_CREATED
+    assert restored.body == {"task_id": "t9"}
+    assert restored.received_at == datetime(2024, 1, 2, 3, 4, 5, 678000)
+
+
+def test_from_wire_rejects_unknown_version() -> None:
+    with pytest.raises(ValueError):
+        from_wire({"v": 99})
+
+
+@pytest.mark.parametrize("use_msgpack", [True, False])
+def test_encode_decode_roundtrip(use_msgpack: bool) -> None:
+    if use_msgpack and codec.msgpack is None:
+        pytest.skip("msgpack not installed")
+    data = encode_event(_event(), use_msgpack=use_msgpack)
+    restored = decode_event(data)
+
+    assert restored.body == _event().body
+    assert restored.headers == {"x-signature": "sig"}
+
+
+def test_decode_rejects_unknown_tag() -> None:
+    with pytest.raises(ValueError):
+        decode_event(b"\x09{}")
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import pytest
+
+from clickup_mcp.models.domain.workflow_context import WorkflowContext
+from clickup_mcp.web_server.event.conditions import (
+    ConditionSyntaxError,
+    compile_condition,
+    compile_context,
+    event_bindings,
+)
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+
+def _event() -> ClickUpWebhookEvent:
+    body = {
+        "event": "taskStatusUpdated",
+        "task_id": "t1",
+        "custom": {"tags": ["bug", "p1"]},
+        "history_items": [
+            {
+                "field": "status",
+                "parent_id": "L1",
+                "user": {"id": 183},
+                "before": {"status": "to do"},
+                "after": {"status": "Done"},
+            },
+            {"field": "assignee_add", "after": {"id": 42}},
+        ],
+    }
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_STATUS_UPDATED, body=body, raw=body, headers={}, received_at=datetime.utcnow()
+    )
+
+
+def test_event_bindings_extract_documented_names() -> None:
+    bindings = event_bindings(_event())
+
+    assert bindings["event_type"] == "taskStatusUpdated"
+    assert (bindings["task_id"], bindings["list_id"], bindings["user_id"]) == ("t1", "L1", "183")
+    assert (bindings["status"], bindings["previous_status"]) == ("Done", "to do")
+    assert bindings["fields"] == {"status", "assignee_add"}
+    assert bindings["assignees_added"] == {"42"}
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("lower(status) == 'done'", True),
+        ("status == 'Done' and previous_status != 'Done'", True),
+        ("'status' in fields and not 'priority' in fields", True),
+        ("list_id in ('L1', 'L2')", True),
+        ("'42' in assignees_added or user_id == '1'", True),
+        ("vars.team == 'core'", True),
+        ("team == 'core'", True),
+        ("int(vars.limit) > 2 and int(vars.limit) <= 5", True),
+        ("1 < int(vars.limit) < 3", False),
+        ("'bug' in event.custom.tags and event.custom.tags[1] == 'p1'", True),
+        ("event.missing.deep == None", True),
+        ("vars.limit > 2", False),  # '3' vs 2: incompatible ordering is False, not an error
+        ("len(vars.unknown) > 0", False),  # runtime error evaluates to False
+    ],
+)
+def test_conditions_evaluate(source: str, expected: bool) -> None:
+    condition = compile_condition(source)
+
+    assert condition(event_bindings(_event()), {"team": "core", "limit": "3"}) is expected
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "__import__('os').system('true')",
+        "status.__class__",
+        "(lambda: 1)()",
+        "[x for x in fields]",
+        "status = 'done'",
+        "open('f')",
+        "status + 'x' == 'y'",
+        "a" * 1001,
+    ],
+)
+def test_unsupported_syntax_is_rejected_at_compile_time(source: str) -> None:
+    with pytest.raises(ConditionSyntaxError):
+        compile_condition(source)
+
+
+def test_compiled_conditions_are_cached_by_source() -> None:
+    assert compile_condition("status == 'done'") is compile_condition("status == 'done'")
+
+
+def test_compiled_context_requires_every_condition() -> None:
+    context = WorkflowContext(
+        id="ctx_1",
+        workflow_id="wf_1",
+        name="Core team",
+        variables={"team": "core"},
+        conditions=["vars.team == 'core'", "lower(status) == 'done'"],
+    )
+    other = context.model_copy(update={"variables": {"team": "web"}})
+    bindings = event_bindings(_event())
+
+    assert compile_context(context).matches(bindings) is True
+    assert compile_context(other).matches(bindings) is False
@@ -0,0 +1,111 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from clickup_mcp.web_server.event import deadletter
+from clickup_mcp.web_server.event.codec import to_wire
+from clickup_mcp.web_server.event.deadletter import (
+    DeadLetterRecord,
+    FileDeadLetterStore,
+    handler_name,
+    replay_dead_letters,
+)
+from clickup_mcp.web_server.event.handler import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+
+
+def _record(handler: str, task_id: str) -> DeadLetterRecord:
+    body = {"event": "taskCreated", "task_id": task_id}
+    event = ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_CREATED,
+        body=body,
+        raw=body,
+        headers={},
+        received_at=datetime.utcnow(),
+    )
+    return DeadLetterRecord(handler=handler, event=to_wire(event), error="RuntimeError()", attempts=5)
+
+
+def test_file_store_add_list_remove(tmp_path: Path) -> None:
+    store = FileDeadLetterStore(tmp_path / "nested" / "dlq.jsonl")
+    first, second = _record("h", "t1"), _record("h", "t2")
+    store.add(first)
+    store.add(second)
+
+    assert [r.id for r in store.list()] == [first.id, second.id]
+    assert store.remove([first.id, "unknown"]) == 1
+    assert [r.id for r in store.list()] == [second.id]
+
+
+@pytest.mark.asyncio
+async def test_replay_runs_only_the_failed_handler_and_prunes_successes(tmp_path: Path) -> None:
+    registry = ClickUpEventRegistry()
+    seen: list[str] = []
+
+    async def fixed(evt: ClickUpWebhookEvent) -> None:
+        seen.append(evt.body["task_id"])
+
+    async def other(_: ClickUpWebhookEvent) -> None:
+        seen.append("other")
+
+    async def still_broken(_: ClickUpWebhookEvent) -> None:
+        raise RuntimeError("still down")
+
+    for h in (fixed, other, still_broken):
+        registry.register(ClickUpWebhookEventType.TASK_CREATED, h)
+
+    store = FileDeadLetterStore(tmp_path / "dlq.jsonl")
+    ok, failing, orphan = (
+        _record(handler_name(fixed), "t1"),
+        _record(handler_name(still_broken), "t2"),
+        _record("gone.module.handler", "t3"),
+    )
+    for record in (ok, failing, orphan):
+        store.add(record)
+
+    result = await replay_dead_letters(store, registry)
+
+    assert seen == ["t1"]
+    assert result.succeeded == [ok.id]
+    assert result.failed == [failing.id]
+    assert result.missing_handler == [orphan.id]
+    assert [r.id for r in store.list()] == [failing.id, orphan.id]
+
+
+@pytest.mark.asyncio
+async def test_pending_retries_are_replayed_only_on_request(tmp_path: Path) -> None:
+    registry = ClickUpEventRegistry()
+    seen: list[str] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        seen.append(evt.body["task_id"])
+
+    registry.register(ClickUpWebhookEventType.TASK_CREATED, handler)
+    store = FileDeadLetterStore(tmp_path / "dlq.jsonl")
+    pending = _record(handler_name(handler), "t1")
+    pending.pending = True
+    store.add(pending)
+
+    skipped = await replay_dead_letters(store, registry)
+    replayed = await replay_dead_letters(store, registry, include_pending=True)
+
+    assert skipped.succeeded == [] and replayed.succeeded == [pending.id]
+    assert seen == ["t1"]
+    assert store.list() == []
+
+
+def test_cli_list_and_purge(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "dlq.jsonl"
+    store = FileDeadLetterStore(path)
+    record = _record("pkg.handler", "t1")
+    store.add(record)
+
+    assert deadletter.main(["--path", str(path), "list"]) == 0
+    assert record.id in capsys.readouterr().out
+
+    assert deadletter.main(["--path", str(path), "purge", "--all"]) == 0
+    assert store.list() == []
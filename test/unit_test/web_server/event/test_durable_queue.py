@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from clickup_mcp.metrics import CONSUMER_HANDLED, get_metrics_registry
+from clickup_mcp.web_server.event import mq as mq_module
+from clickup_mcp.web_server.event.backends import LocalDurableQueueBackend
+from clickup_mcp.web_server.event.handler.registry import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.mq import (
+    ClickUpWebhookConsumer,
+    QueueEventSink,
+    serialize_event,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def _event(task_id: str, seq: int) -> ClickUpWebhookEvent:
+    body: Dict[str, Any] = {"event": "taskUpdated", "task_id": task_id, "seq": seq}
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_UPDATED, body=body, raw=body, headers={}, received_at=datetime.utcnow()
+    )
+
+
+async def _take(backend: LocalDurableQueueBackend, n: int) -> List[Dict[str, Any]]:
+    taken: List[Dict[str, Any]] = []
+    async for batch in backend.consume_batch(max_messages=n):
+        taken.extend(batch)
+        if len(taken) >= n:
+            break
+    return taken
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_share_commits_and_are_consumed_in_order(tmp_path: Path) -> None:
+    backend = LocalDurableQueueBackend(tmp_path / "queue.db")
+
+    batches = [[(f"task:{b}", serialize_event(_event(f"t{b}", b * 10 + i))) for i in range(10)] for b in range(20)]
+    await asyncio.gather(*(backend.publish_batch(batch) for batch in batches))
+
+    stats = await backend.stats()
+    assert stats.published == 200 and stats.ready == 200
+    assert stats.commits < 20  # batches published during a commit join the next one
+
+    messages = await _take(backend, 200)
+    assert sorted(m["b"]["seq"] for m in messages) == list(range(200))
+    ids = [m.message_id for m in messages]
+    assert ids == sorted(ids)
+    for message in messages:
+        await backend.ack(message)
+    backend.close()
+
+    reopened = LocalDurableQueueBackend(tmp_path / "queue.db")
+    assert (await reopened.stats()).ready == 0 and (await reopened.stats()).in_flight == 0
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_unacknowledged_messages_are_redelivered_until_dead(tmp_path: Path) -> None:
+    path = tmp_path / "queue.db"
+    backend = LocalDurableQueueBackend(path, visibility_timeout=0.05, max_deliveries=2, nack_delay=0)
+    await backend.publish("task:t1", serialize_event(_event("t1", 1)))
+    await backend.publish("task:t2", serialize_event(_event("t2", 2)))
+
+    first = await _take(backend, 2)
+    await backend.nack(first[0])
+    backend.close()  # the second message was claimed but never settled (consumer crash)
+
+    await asyncio.sleep(0.06)
+    backend = LocalDurableQueueBackend(path, visibility_timeout=0.05, max_deliveries=2, nack_delay=0)
+    again = await _take(backend, 2)
+    assert [m["b"]["seq"] for m in again] == [1, 2]
+
+    await asyncio.sleep(0.06)
+    stats = await backend.stats()
+    assert (stats.ready, stats.dead) == (0, 2)
+    backend.close()
+
+
+@pytest.mark.asyncio
+async def test_queue_sink_and_consumer_round_trip(tmp_path: Path) -> None:
+    backend = LocalDurableQueueBackend(tmp_path / "queue.db")
+    sink = QueueEventSink(backend_name="local-durable", backend=backend, max_batch_size=8, linger_ms=1)
+    seen: List[int] = []
+    registry = ClickUpEventRegistry()
+
+    async def handler(event: ClickUpWebhookEvent) -> None:
+        seen.append(event.body["seq"])
+        if len(seen) == 30:
+            backend.close()
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    for i in range(30):
+        await sink.handle(_event("t1", i))
+    await sink.aclose()
+
+    consumer = ClickUpWebhookConsumer(backend, registry, concurrency=4, batch_size=16)  # type: ignore[arg-type]
+    await asyncio.wait_for(consumer.run(), timeout=5)
+
+    assert seen == list(range(30))  # one entity: strictly in publish order
+    assert CONSUMER_HANDLED.value(group="clickup.webhooks", outcome="processed") == 30
+
+
+def test_builtin_backend_is_loaded_without_abe_plugin(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(mq_module, "_queue_backend", None)
+    monkeypatch.setenv("QUEUE_BACKEND", "local")  # restored after the loader overwrites it
+    monkeypatch.setattr(LocalDurableQueueBackend, "from_env", classmethod(lambda cls: cls(tmp_path / "q.db")))
+    monkeypatch.setattr(mq_module, "load_backend", lambda: pytest.fail("abe loader should not be used"))
+
+    backend = mq_module._load_backend_selected("local-durable")
+
+    assert isinstance(backend, LocalDurableQueueBackend)
+    backend.close()
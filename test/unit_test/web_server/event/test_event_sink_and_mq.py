@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import json
+from datetime import datetime
+from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List
 
 import pytest
 
+from clickup_mcp.config import get_settings
+from clickup_mcp.projections import get_projection_store
 from clickup_mcp.web_server.event.handler.registry import get_registry
 from clickup_mcp.web_server.event.models import (
     ClickUpWebhookEvent,
@@ -80,7 +85,10 @@ async def test_queue_sink_produces_and_consumer_dispatches(monkeypatch: pytest.M
     fake_backend = _FakeBackend()
 
     # Ensure module-level backend is reset and loader returns our fake backend
+    import clickup_mcp.web_server.event.sink as sink_module
+
     monkeypatch.setenv("QUEUE_BACKEND", "kafka")
+    monkeypatch.setattr(sink_module, "_event_sinks", {}, raising=True)
     monkeypatch.setattr(mq, "_queue_backend", None, raising=False)
     monkeypatch.setattr(mq, "load_backend", lambda: fake_backend, raising=True)
 
@@ -110,7 +118,7 @@ async def test_queue_sink_produces_and_consumer_dispatches(monkeypatch: pytest.M
 
     sink = get_event_sink()
 
-    # Publish
+    # Returns once the event's batch is published
     await sink.handle(event)
 
     # Assert published payload
@@ -128,6 +136,42 @@ async def test_queue_sink_produces_and_consumer_dispatches(monkeypatch: pytest.M
     assert received == [ClickUpWebhookEventType.TASK_UPDATED]
 
 
+@pytest.mark.asyncio
+async def test_consumer_maintains_projections(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    import clickup_mcp.web_server.event.mq as mq
+
+    backend = _FakeBackend()
+    backend.seed(
+        serialize_event(
+            ClickUpWebhookEvent(
+                type=ClickUpWebhookEventType.TASK_CREATED,
+                body={"event": "taskCreated", "task_id": "t1", "list_id": "l1"},
+                raw={},
+                headers={},
+                received_at=datetime.utcnow(),
+            )
+        )
+    )
+    # The consumer selects its backend through QUEUE_BACKEND; keep that local to the test
+    monkeypatch.setenv("QUEUE_BACKEND", "kafka")
+    monkeypatch.setattr(mq, "_queue_backend", None, raising=False)
+    monkeypatch.setattr(mq, "load_backend", lambda: backend, raising=True)
+    monkeypatch.setenv("CLICKUP_WEBHOOK_PROJECTIONS_ENABLED", "true")
+    monkeypatch.setenv("CLICKUP_WEBHOOK_PROJECTION_CHECKPOINT_DIR", str(tmp_path))
+    get_registry().clear()
+    get_settings.cache_clear()
+    try:
+        await run_clickup_webhook_consumer(backend_name="kafka")
+    finally:
+        get_settings.cache_clear()
+        get_registry().clear()
+
+    # The final checkpoint, written at consumer shutdown, holds the consumed task
+    checkpoint = json.loads((tmp_path / "tasks.json").read_text(encoding="utf-8"))
+    assert checkpoint["state"]["tasks"]["t1"]["list_id"] == "l1"
+    assert get_projection_store() is None
+
+
 def test_serialize_deserialize_roundtrip() -> None:
     from datetime import datetime
 
@@ -135,7 +179,7 @@ def test_serialize_deserialize_roundtrip() -> None:
         type=ClickUpWebhookEventType.LIST_UPDATED,
         body={"event": "listUpdated", "z": 3},
         raw={"event": "listUpdated", "z": 3},
-        headers={"h": "1"},
+        headers={"X-Signature": "sig", "h": "1"},
         received_at=datetime.utcnow(),
         delivery_id="abc",
     )
@@ -145,6 +189,8 @@ def test_serialize_deserialize_roundtrip() -> None:
 
     assert restored.type == original.type
     assert restored.body == original.body
-    assert restored.headers == original.headers
-    # ISO timestamp reconstructs; allow small delta if needed (string equality is fine here)
+    # Only allowlisted headers travel with the event
+    assert restored.headers == {"x-signature": "sig"}
+    # Epoch-ms timestamp reconstructs to millisecond precision
+    assert abs((restored.received_at - original.received_at).total_seconds()) < 0.001
     assert restored.delivery_id == original.delivery_id
@@ -0,0 +1,187 @@
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from clickup_mcp.web_server.event import eventlog
+from clickup_mcp.web_server.event.eventlog import (
+    EventLog,
+    EventLogLockedError,
+    EventLogSink,
+)
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.sink import EventSink
+
+_T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _event(task_id: str | None, minute: int, seq: int = 0) -> ClickUpWebhookEvent:
+    body = {"event": "taskUpdated", "seq": seq}
+    if task_id is not None:
+        body["task_id"] = task_id
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_UPDATED,
+        body=body,
+        raw=body,
+        headers={"x-request-id": f"r{seq}"},
+        received_at=_T0 + timedelta(minutes=minute),
+        delivery_id=f"r{seq}",
+    )
+
+
+def _fill(log: EventLog, n: int) -> None:
+    for i in range(n):
+        log.append(_event(f"t{i % 3}", minute=i, seq=i))
+
+
+def test_append_assigns_offsets_and_rolls_segments(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, segment_bytes=1024)
+    _fill(log, 30)
+
+    assert log.next_offset == 30
+    assert log.stats()["segments"] > 1
+    assert [r.offset for r in log.read()] == list(range(30))
+    assert [r.event.body["seq"] for r in log.read()] == list(range(30))
+
+
+def test_reopen_rebuilds_index_and_continues_offsets(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, segment_bytes=1024)
+    _fill(log, 10)
+    log.close()
+
+    reopened = EventLog(tmp_path, segment_bytes=1024)
+    assert reopened.next_offset == 10
+    assert reopened.append(_event("t9", minute=10, seq=10)) == 10
+    assert [r.event.body["seq"] for r in reopened.read(entity="task:t1")] == [1, 4, 7]
+
+
+def test_read_by_time_range_and_entity(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, segment_bytes=1024)
+    _fill(log, 30)
+
+    window = list(log.read(since=_T0 + timedelta(minutes=5), until=_T0 + timedelta(minutes=12)))
+    assert [r.event.body["seq"] for r in window] == [5, 6, 7, 8, 9, 10, 11]
+
+    scoped = list(log.read(since=_T0 + timedelta(minutes=5), entity="task:t0"))
+    assert [r.event.body["seq"] for r in scoped] == [6, 9, 12, 15, 18, 21, 24, 27]
+    assert all(r.key == "task:t0" for r in scoped)
+
+
+def test_time_range_reads_start_from_the_sparse_index(tmp_path: Path) -> None:
+    log = EventLog(tmp_path)
+    _fill(log, 300)
+
+    assert log.stats()["segments"] == 1
+    assert [r.event.body["seq"] for r in log.read(since=_T0 + timedelta(minutes=290))] == list(range(290, 300))
+    assert sorted(log.entities()) == ["task:t0", "task:t1", "task:t2"]
+
+
+def test_configured_headers_are_stored(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, header_allowlist=["X-Request-Id"])
+    event = _event("t1", minute=0)
+    log.append(replace(event, headers={**event.headers, "x-signature": "sig"}))
+
+    [record] = log.read()
+    assert record.event.headers == {"x-request-id": "r0"}
+
+
+def test_torn_tail_is_truncated_on_open(tmp_path: Path) -> None:
+    log = EventLog(tmp_path)
+    _fill(log, 3)
+    log.close()
+    segment = sorted(tmp_path.glob("*.log"))[-1]
+    with segment.open("ab") as fh:
+        fh.write(b"\x10\x00\x00\x00partial")
+
+    reopened = EventLog(tmp_path)
+    assert reopened.next_offset == 3
+    assert reopened.append(_event("t1", minute=3, seq=3)) == 3
+    assert [r.offset for r in reopened.read()] == [0, 1, 2, 3]
+
+
+def test_compaction_keeps_newest_record_per_entity(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, segment_bytes=1024)
+    _fill(log, 30)
+    log.append(_event(None, minute=40, seq=99))
+    log.close()
+    before = log.stats()
+
+    result = log.compact()
+
+    assert result.records_removed > 0
+    assert log.stats()["bytes"] < before["bytes"]
+    records = list(log.read())
+    # Offsets stay ordered and every entity still has its newest record
+    assert [r.offset for r in records] == sorted(r.offset for r in records)
+    latest = {key: max(r.offset for r in records if r.key == key) for key in ("task:t0", "task:t1", "task:t2")}
+    assert latest == {"task:t0": 27, "task:t1": 28, "task:t2": 29}
+    assert any(r.key is None for r in records)
+    assert log.next_offset == 31
+
+
+def test_compaction_records_a_watermark(tmp_path: Path) -> None:
+    log = EventLog(tmp_path, segment_bytes=1024)
+    _fill(log, 30)
+    log.close()
+    assert log.compacted_through_ms is None
+    before = list(log.read())
+
+    log.compact()
+
+    watermark = log.compacted_through_ms
+    assert watermark is not None and watermark < before[-1].received_at_ms
+    kept = {r.offset for r in log.read()}
+    assert all(r.received_at_ms <= watermark for r in before if r.offset not in kept)
+    assert EventLog(tmp_path).compacted_through_ms == watermark
+
+
+def test_compaction_refuses_to_run_while_the_log_is_written(tmp_path: Path) -> None:
+    writer = EventLog(tmp_path, segment_bytes=1024)
+    _fill(writer, 30)
+
+    with pytest.raises(EventLogLockedError):
+        EventLog(tmp_path, segment_bytes=1024).compact()
+    assert eventlog.main(["--log-dir", str(tmp_path), "compact"]) == 1
+
+    writer.close()
+    assert EventLog(tmp_path, segment_bytes=1024).compact().records_removed > 0
+
+
+@pytest.mark.asyncio
+async def test_event_log_sink_appends_then_forwards(tmp_path: Path) -> None:
+    forwarded: list[ClickUpWebhookEvent] = []
+
+    class _Inner(EventSink):
+        async def handle(self, event: ClickUpWebhookEvent) -> None:
+            forwarded.append(event)
+
+    sink = EventLogSink(_Inner(), EventLog(tmp_path))
+    await sink.handle(_event("t1", minute=0))
+    await sink.flush()
+    assert [r.key for r in EventLog(tmp_path).read()] == ["task:t1"]
+    await sink.aclose()
+
+    assert len(forwarded) == 1
+    assert [r.key for r in EventLog(tmp_path).read()] == ["task:t1"]
+
+
+@pytest.mark.asyncio
+async def test_replay_dispatches_time_range_in_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log = EventLog(tmp_path)
+    _fill(log, 10)
+    dispatched: list[int] = []
+
+    class _Dispatcher:
+        async def dispatch(self, event: ClickUpWebhookEvent) -> None:
+            dispatched.append(event.body["seq"])
+
+    monkeypatch.setattr("clickup_mcp.web_server.event.retry.get_dispatcher", lambda: _Dispatcher())
+
+    count = await eventlog.replay_event_log(log, since=_T0 + timedelta(minutes=2), until=_T0 + timedelta(minutes=6))
+
+    assert count == 4
+    assert dispatched == [2, 3, 4, 5]
@@ -47,7 +47,7 @@ def test_main_parses_queue_backend_and_invokes_runner(
     # Capture the backend_name passed into the runner
     seen: List[str] = []
 
-    async def fake_runner(*, backend_name: str) -> None:
+    async def fake_runner(*, backend_name: str, **_: object) -> None:
         seen.append(backend_name)
 
     # Patch runner
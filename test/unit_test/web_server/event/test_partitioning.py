@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict
+
+import pytest
+
+from clickup_mcp.web_server.event.backends import InMemoryQueueBackend
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.mq import QueueEventSink
+from clickup_mcp.web_server.event.partitioning import (
+    container_partition_key,
+    entity_partition_key,
+    get_partition_key_strategy,
+    topic_partition_key,
+)
+
+
+def _event(body: Dict[str, Any], type_: ClickUpWebhookEventType = ClickUpWebhookEventType.TASK_UPDATED):
+    return ClickUpWebhookEvent(type=type_, body=body, raw=body, headers={}, received_at=datetime.utcnow())
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        ({"task_id": "t1", "list_id": "l1"}, "task:t1"),
+        ({"key_result_id": "kr1", "goal_id": "g1"}, "key_result:kr1"),
+        ({"goal_id": "g1"}, "goal:g1"),
+        ({"list_id": "l1", "space_id": "s1"}, "list:l1"),
+        ({"folder_id": "f1"}, "folder:f1"),
+        ({"space_id": "s1"}, "space:s1"),
+        ({"webhook_id": "w1"}, None),
+    ],
+)
+def test_entity_partition_key(body: Dict[str, Any], expected: str | None) -> None:
+    assert entity_partition_key(_event(body)) == expected
+
+
+def test_container_partition_key_prefers_enclosing_container() -> None:
+    assert container_partition_key(_event({"task_id": "t1", "list_id": "l1"})) == "list:l1"
+    assert container_partition_key(_event({"task_id": "t1"})) == "task:t1"
+
+
+def test_topic_partition_key_is_none() -> None:
+    assert topic_partition_key(_event({"task_id": "t1"})) is None
+
+
+def test_get_partition_key_strategy() -> None:
+    assert get_partition_key_strategy("ENTITY") is entity_partition_key
+    with pytest.raises(ValueError):
+        get_partition_key_strategy("random")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy,expected",
+    [
+        ("entity", ["task:t1", "list:l9", "clickup.webhooks"]),
+        ("topic", ["clickup.webhooks"] * 3),
+    ],
+)
+async def test_queue_sink_publishes_with_partition_key(strategy: str, expected: list[str]) -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, partition_key=strategy)  # type: ignore[arg-type]
+
+    await sink.handle(_event({"task_id": "t1"}))
+    await sink.handle(_event({"list_id": "l9"}, ClickUpWebhookEventType.LIST_UPDATED))
+    await sink.handle(_event({}))
+    await sink.aclose()
+
+    assert [key for key, _ in backend.published] == expected
+
+
+@pytest.mark.asyncio
+async def test_queue_sink_accepts_custom_key_function() -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, partition_key=lambda e: e.type.value)
+
+    await sink.handle(_event({"task_id": "t1"}))
+    await sink.aclose()
+
+    assert backend.published[0][0] == "taskUpdated"
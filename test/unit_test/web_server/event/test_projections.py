@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from clickup_mcp.web_server.event.eventlog import EventLog, EventLogCompactedError
+from clickup_mcp.web_server.event.handler import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.projections import ProjectionManager, TaskProjection
+
+_T0 = datetime(2025, 1, 1)
+
+
+def _event(type_: ClickUpWebhookEventType, task_id: str, items: list[dict[str, Any]], minute: int = 0):
+    body = {"event": type_.value, "task_id": task_id, "history_items": items}
+    return ClickUpWebhookEvent(type=type_, body=body, raw=body, headers={}, received_at=_T0 + timedelta(minutes=minute))
+
+
+def _status(status: str, type_: str = "custom", list_id: str = "L1") -> dict[str, Any]:
+    return {"id": "h", "date": "0", "field": "status", "parent_id": list_id, "after": {"status": status, "type": type_}}
+
+
+def _created(task_id: str, status: str = "to do", list_id: str = "L1", minute: int = 0):
+    return _event(ClickUpWebhookEventType.TASK_CREATED, task_id, [_status(status, "open", list_id)], minute)
+
+
+def _assign(task_id: str, user: int, *, remove: bool = False, minute: int = 0):
+    item: dict[str, Any] = {"id": "h", "date": "0", "field": "assignee_rem" if remove else "assignee_add"}
+    item["before" if remove else "after"] = {"id": user, "username": f"u{user}"}
+    return _event(ClickUpWebhookEventType.TASK_ASSIGNEE_UPDATED, task_id, [item], minute)
+
+
+def test_status_counts_follow_task_lifecycle() -> None:
+    p = TaskProjection()
+    p.apply(_created("t1"))
+    p.apply(_created("t2"))
+    p.apply(_created("t3", list_id="L2"))
+    p.apply(_event(ClickUpWebhookEventType.TASK_STATUS_UPDATED, "t1", [_status("in progress")]))
+
+    assert p.status_counts("L1") == {"to do": 1, "in progress": 1}
+    assert p.status_counts("L2") == {"to do": 1}
+
+    p.apply(_event(ClickUpWebhookEventType.TASK_DELETED, "t2", []))
+    move = {"id": "h", "date": "0", "field": "section_moved", "after": {"id": "L2", "name": "Other"}}
+    p.apply(_event(ClickUpWebhookEventType.TASK_MOVED, "t1", [move]))
+
+    assert p.status_counts("L1") == {}
+    assert p.status_counts("L2") == {"to do": 1, "in progress": 1}
+
+
+def test_workload_counts_open_tasks_per_assignee() -> None:
+    p = TaskProjection()
+    for task in ("t1", "t2", "t3"):
+        p.apply(_created(task))
+    p.apply(_assign("t1", 183))
+    p.apply(_assign("t2", 183))
+    p.apply(_assign("t3", 7))
+    p.apply(_assign("t3", 183))
+    p.apply(_assign("t3", 7, remove=True))
+
+    assert p.workloads() == {"183": 3}
+
+    p.apply(_event(ClickUpWebhookEventType.TASK_STATUS_UPDATED, "t1", [_status("complete", "closed")]))
+    assert p.open_tasks_for("183") == 2
+    assert p.open_tasks_for("7") == 0
+
+
+def test_reapplying_events_is_idempotent() -> None:
+    events = [
+        _created("t1"),
+        _assign("t1", 1),
+        _event(ClickUpWebhookEventType.TASK_STATUS_UPDATED, "t1", [_status("doing")]),
+    ]
+    p = TaskProjection()
+    for ev in events + events:
+        p.apply(ev)
+
+    assert p.status_counts("L1") == {"doing": 1}
+    assert p.workloads() == {"1": 1}
+
+
+@pytest.mark.asyncio
+async def test_manager_feeds_from_registry_and_restores_checkpoint(tmp_path: Path) -> None:
+    registry = ClickUpEventRegistry()
+    manager = ProjectionManager([TaskProjection()], checkpoint_dir=tmp_path, checkpoint_interval=3600)
+    manager.install(registry)
+
+    assert ClickUpWebhookEventType.TASK_CREATED in registry.subscribed_types
+    await registry.dispatch(_created("t1", minute=1))
+    await registry.dispatch(_assign("t1", 5, minute=2))
+    await manager.aclose()
+
+    restored = ProjectionManager([TaskProjection()], checkpoint_dir=tmp_path)
+    restored.load_checkpoints()
+    tasks = restored.get("tasks")
+    assert isinstance(tasks, TaskProjection)
+    assert tasks.status_counts("L1") == {"to do": 1}
+    assert tasks.open_tasks_for("5") == 1
+    assert restored.status("tasks").events_applied == 2
+    expected_ms = int((_T0 + timedelta(minutes=2)).replace(tzinfo=timezone.utc).timestamp() * 1000)
+    assert restored.status("tasks").last_event_ms == expected_ms
+
+
+def test_catch_up_from_event_log_after_checkpoint(tmp_path: Path) -> None:
+    log = EventLog(tmp_path / "log")
+    for ev in (_created("t1", minute=0), _created("t2", minute=1), _assign("t2", 9, minute=2)):
+        log.append(ev)
+
+    manager = ProjectionManager([TaskProjection()])
+    assert manager.catch_up(log) == 3
+    tasks = manager.get("tasks")
+    assert isinstance(tasks, TaskProjection)
+    assert tasks.status_counts("L1") == {"to do": 2}
+    assert tasks.open_tasks_for("9") == 1
+
+
+def test_catch_up_refuses_a_compacted_log_without_a_newer_checkpoint(tmp_path: Path) -> None:
+    log = EventLog(tmp_path / "log", segment_bytes=256)
+    # The removal is compacted away; replaying would leave user 9 assigned
+    for ev in (_created("t1", minute=0), _assign("t1", 9, minute=1), _assign("t1", 9, remove=True, minute=2)):
+        log.append(ev)
+    log.append(_created("t2", minute=3))
+    log.close()
+    assert log.compact().records_removed > 0
+
+    with pytest.raises(EventLogCompactedError):
+        ProjectionManager([TaskProjection()]).catch_up(log)
+
+    checkpointed = ProjectionManager([TaskProjection()])
+    for ev in (_created("t1", minute=0), _assign("t1", 9, minute=1), _assign("t1", 9, remove=True, minute=2)):
+        checkpointed.apply(checkpointed.get("tasks"), ev)
+    checkpointed.apply(checkpointed.get("tasks"), _created("t2", minute=3))
+    assert checkpointed.catch_up(log) >= 1
+    tasks = checkpointed.get("tasks")
+    assert isinstance(tasks, TaskProjection)
+    assert tasks.open_tasks_for("9") == 0
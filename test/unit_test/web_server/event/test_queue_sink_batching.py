@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+import clickup_mcp.web_server.event.sink as sink_module
+from clickup_mcp.metrics import (
+    QUEUE_BATCH_BYTES,
+    QUEUE_BATCH_EVENTS,
+    QUEUE_PUBLISH_DURATION,
+    QUEUE_PUBLISH_FAILURES,
+    get_metrics_registry,
+)
+from clickup_mcp.web_server.event.backends import InMemoryQueueBackend
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.mq import QueueEventSink
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def _event(i: int = 0, body_size: int = 0) -> ClickUpWebhookEvent:
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_UPDATED,
+        body={"event": "taskUpdated", "task_id": f"t{i}"},
+        raw={"event": "taskUpdated", "task_id": f"t{i}"},
+        headers={},
+        received_at=datetime.utcnow(),
+        delivery_id=f"d{i}",
+        body_size=body_size,
+    )
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_max_batch_size_reached() -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, max_batch_size=3, linger_ms=10_000)
+
+    pending = [asyncio.create_task(sink.handle(_event(i))) for i in range(2)]
+    await asyncio.sleep(0.01)
+    # Buffered events are not acknowledged before their batch is published
+    assert backend.published == []
+    assert not any(task.done() for task in pending)
+
+    await sink.handle(_event(2))
+    await asyncio.gather(*pending)
+
+    assert backend.publish_calls == 1
+    assert [payload["id"] for _, payload in backend.published] == ["d0", "d1", "d2"]
+    assert [key for key, _ in backend.published] == ["task:t0", "task:t1", "task:t2"]
+    assert QUEUE_BATCH_EVENTS.count(backend="memory") == 1
+    assert QUEUE_BATCH_EVENTS.sum(backend="memory") == 3
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_linger() -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, max_batch_size=100, linger_ms=1)
+
+    await asyncio.gather(sink.handle(_event(0)), sink.handle(_event(1)))
+
+    assert backend.publish_calls == 1
+    assert len(backend.published) == 2
+    assert QUEUE_BATCH_EVENTS.sum(backend="memory") / QUEUE_BATCH_EVENTS.count(backend="memory") == 2
+
+
+@pytest.mark.asyncio
+async def test_flushes_before_exceeding_max_batch_bytes() -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(
+        backend_name="memory", backend=backend, max_batch_size=100, linger_ms=10_000, max_batch_bytes=1500
+    )
+
+    first = asyncio.create_task(sink.handle(_event(0, body_size=1000)))
+    second = asyncio.create_task(sink.handle(_event(1, body_size=1000)))
+    await first
+
+    # The second event would overflow the byte budget, so the first is published alone
+    assert backend.publish_calls == 1
+    assert len(backend.published) == 1
+    assert QUEUE_BATCH_BYTES.sum(backend="memory") == 1000
+    assert not second.done()
+    await sink.aclose()
+    await second
+    assert len(backend.published) == 2
+
+
+@pytest.mark.asyncio
+async def test_aclose_flushes_pending_events() -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, linger_ms=10_000)
+
+    pending = asyncio.create_task(sink.handle(_event(0)))
+    await asyncio.sleep(0)
+    await sink.aclose()
+    await pending
+
+    assert len(backend.published) == 1
+    assert QUEUE_BATCH_EVENTS.sum(backend="memory") == 1
+    assert QUEUE_PUBLISH_DURATION.count(backend="memory") == 1
+
+
+@pytest.mark.asyncio
+async def test_backend_without_publish_batch_gets_concurrent_publishes() -> None:
+    published: List[Dict[str, Any]] = []
+
+    class _PlainBackend:
+        async def publish(self, *, key: str, payload: Dict[str, Any]) -> None:
+            published.append({"key": key, "payload": payload})
+
+    sink = QueueEventSink(backend_name="plain", backend=_PlainBackend(), max_batch_size=2)  # type: ignore[arg-type]
+    await asyncio.gather(sink.handle(_event(0)), sink.handle(_event(1)))
+
+    assert [p["payload"]["id"] for p in published] == ["d0", "d1"]
+
+
+@pytest.mark.asyncio
+async def test_publish_failure_is_counted_and_raised() -> None:
+    class _FailingBackend:
+        async def publish(self, *, key: str, payload: Dict[str, Any]) -> None:
+            raise RuntimeError("broker down")
+
+    sink = QueueEventSink(backend_name="failing", backend=_FailingBackend(), max_batch_size=2)  # type: ignore[arg-type]
+    results = await asyncio.gather(sink.handle(_event(0)), sink.handle(_event(1)), return_exceptions=True)
+
+    # Every request whose event was in the failed batch sees the failure
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert QUEUE_PUBLISH_FAILURES.value(backend="failing") == 1
+    assert QUEUE_BATCH_EVENTS.count(backend="failing") == 0
+
+
+@pytest.mark.asyncio
+async def test_shutdown_event_sinks_flushes_cached_sinks(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = InMemoryQueueBackend()
+    sink = QueueEventSink(backend_name="memory", backend=backend, linger_ms=10_000)
+    monkeypatch.setattr(sink_module, "_event_sinks", {"memory": sink}, raising=True)
+
+    pending = asyncio.create_task(sink.handle(_event(0)))
+    await asyncio.sleep(0)
+    await sink_module.shutdown_event_sinks()
+    await pending
+
+    assert len(backend.published) == 1
+    assert sink_module._event_sinks == {}
+
+
+def test_invalid_batch_size_rejected() -> None:
+    with pytest.raises(ValueError):
+        QueueEventSink(backend_name="memory", max_batch_size=0)
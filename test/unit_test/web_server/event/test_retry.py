@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from clickup_mcp.web_server.event.deadletter import FileDeadLetterStore
+from clickup_mcp.web_server.event.handler import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.retry import (
+    PermanentHandlerError,
+    RetryingDispatcher,
+    RetryNotPersistedError,
+    RetryPolicy,
+)
+
+_FAST = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05, jitter=0)
+
+
+def _event(task_id: str = "t1") -> ClickUpWebhookEvent:
+    body = {"event": "taskUpdated", "task_id": task_id}
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_UPDATED,
+        body=body,
+        raw=body,
+        headers={"x-request-id": "r1"},
+        received_at=datetime.utcnow(),
+        delivery_id="r1",
+    )
+
+
+def _dispatcher(tmp_path: Path, policy: RetryPolicy = _FAST) -> tuple[ClickUpEventRegistry, RetryingDispatcher]:
+    registry = ClickUpEventRegistry()
+    return registry, RetryingDispatcher(registry, FileDeadLetterStore(tmp_path / "dlq.jsonl"), policy)
+
+
+def test_retry_policy_backoff_is_exponential_and_capped() -> None:
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, multiplier=2.0, jitter=0)
+
+    assert [policy.delay_for(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_other_handlers_and_recovers(tmp_path: Path) -> None:
+    registry, dispatcher = _dispatcher(tmp_path)
+    calls: list[str] = []
+
+    async def flaky(_: ClickUpWebhookEvent) -> None:
+        calls.append("flaky")
+        if calls.count("flaky") < 3:
+            raise ConnectionError("downstream unavailable")
+
+    async def healthy(_: ClickUpWebhookEvent) -> None:
+        calls.append("healthy")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, flaky)
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, healthy)
+
+    await dispatcher.dispatch(_event())
+    assert calls == ["flaky", "healthy"]
+    assert dispatcher.pending_retries == 1
+    # The waiting retry survives a crash as a pending record
+    [pending] = FileDeadLetterStore(tmp_path / "dlq.jsonl").list()
+    assert pending.pending and pending.handler.endswith("flaky")
+
+    for _ in range(50):
+        if dispatcher.metrics.recovered:
+            break
+        await asyncio.sleep(0.01)
+
+    assert calls == ["flaky", "healthy", "flaky", "flaky"]
+    assert dispatcher.metrics.recovered == 1
+    assert dispatcher.metrics.dead_lettered == 0
+    assert FileDeadLetterStore(tmp_path / "dlq.jsonl").list() == []
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_are_dead_lettered(tmp_path: Path) -> None:
+    registry, dispatcher = _dispatcher(tmp_path)
+
+    async def broken(_: ClickUpWebhookEvent) -> None:
+        raise ValueError("bad data")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, broken)
+    await dispatcher.dispatch(_event())
+
+    for _ in range(50):
+        if dispatcher.metrics.dead_lettered:
+            break
+        await asyncio.sleep(0.01)
+
+    records = FileDeadLetterStore(tmp_path / "dlq.jsonl").list()
+    assert len(records) == 1
+    assert records[0].attempts == 3
+    assert records[0].handler.endswith("broken")
+    assert "bad data" in records[0].error
+    assert records[0].to_event().body["task_id"] == "t1"
+
+
+@pytest.mark.asyncio
+async def test_permanent_error_skips_retries(tmp_path: Path) -> None:
+    registry, dispatcher = _dispatcher(tmp_path)
+
+    async def gone(_: ClickUpWebhookEvent) -> None:
+        raise PermanentHandlerError("task deleted")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, gone)
+    await dispatcher.dispatch(_event())
+
+    assert dispatcher.pending_retries == 0
+    assert [r.attempts for r in FileDeadLetterStore(tmp_path / "dlq.jsonl").list()] == [1]
+
+
+@pytest.mark.asyncio
+async def test_aclose_dead_letters_pending_retries(tmp_path: Path) -> None:
+    registry, dispatcher = _dispatcher(tmp_path, RetryPolicy(max_attempts=5, base_delay=60, jitter=0))
+
+    async def down(_: ClickUpWebhookEvent) -> None:
+        raise ConnectionError("503")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, down)
+    await dispatcher.dispatch(_event("a"))
+    await dispatcher.dispatch(_event("b"))
+    assert dispatcher.pending_retries == 2
+
+    await dispatcher.aclose()
+
+    records = FileDeadLetterStore(tmp_path / "dlq.jsonl").list()
+    assert dispatcher.pending_retries == 0
+    assert sorted(r.to_event().body["task_id"] for r in records) == ["a", "b"]
+    assert all("pending at shutdown" in r.error and not r.pending for r in records)
+
+
+@pytest.mark.asyncio
+async def test_retry_that_cannot_be_persisted_fails_the_dispatch(tmp_path: Path) -> None:
+    registry, dispatcher = _dispatcher(tmp_path)
+    (tmp_path / "dlq.jsonl").mkdir()  # every write to the store fails
+    calls: list[str] = []
+
+    async def down(_: ClickUpWebhookEvent) -> None:
+        calls.append("down")
+        raise ConnectionError("503")
+
+    async def healthy(_: ClickUpWebhookEvent) -> None:
+        calls.append("healthy")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, down)
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, healthy)
+
+    with pytest.raises(RetryNotPersistedError, match="1 failed handler"):
+        await dispatcher.dispatch(_event())
+
+    assert calls == ["down", "healthy"]
+    assert dispatcher.pending_retries == 0
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from clickup_mcp.metrics import (
+    CONSUMER_HANDLED,
+    CONSUMER_RECEIVED,
+    get_metrics_registry,
+)
+from clickup_mcp.web_server.event.backends import InMemoryQueueBackend
+from clickup_mcp.web_server.event.handler.registry import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.mq import (
+    ClickUpWebhookConsumer,
+    ConsumerStoppedError,
+    serialize_event,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    get_metrics_registry().reset()
+    yield
+    get_metrics_registry().reset()
+
+
+def _handled(outcome: str) -> float:
+    return CONSUMER_HANDLED.value(group="clickup.webhooks", outcome=outcome)
+
+
+def _message(task_id: str | None, seq: int) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"event": "taskUpdated", "seq": seq}
+    if task_id is not None:
+        body["task_id"] = task_id
+    return serialize_event(
+        ClickUpWebhookEvent(
+            type=ClickUpWebhookEventType.TASK_UPDATED,
+            body=body,
+            raw=body,
+            headers={},
+            received_at=datetime.utcnow(),
+        )
+    )
+
+
+async def _seeded_backend(messages: List[Dict[str, Any]]) -> InMemoryQueueBackend:
+    backend = InMemoryQueueBackend()
+    for m in messages:
+        await backend.publish(key="clickup.webhooks", payload=m)
+    backend.close()
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_consumer_runs_different_keys_concurrently() -> None:
+    registry = ClickUpEventRegistry()
+    running = 0
+    peak = 0
+
+    async def handler(_: ClickUpWebhookEvent) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    backend = await _seeded_backend([_message(f"t{i}", i) for i in range(8)])
+
+    consumer = ClickUpWebhookConsumer(backend, registry, concurrency=4)
+    await consumer.run()
+
+    assert _handled("processed") == 8
+    assert CONSUMER_RECEIVED.value(group="clickup.webhooks") == 8
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_consumer_preserves_order_per_key() -> None:
+    registry = ClickUpEventRegistry()
+    seen: List[tuple[str, int]] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        # Earlier events sleep longer so reordering would show up if not serialized
+        await asyncio.sleep(0.005 * (5 - evt.body["seq"] % 5))
+        seen.append((evt.body["task_id"], evt.body["seq"]))
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    messages = [_message("a" if i % 2 == 0 else "b", i) for i in range(10)]
+    backend = await _seeded_backend(messages)
+
+    await ClickUpWebhookConsumer(backend, registry, concurrency=8).run()
+
+    assert [s for k, s in seen if k == "a"] == [0, 2, 4, 6, 8]
+    assert [s for k, s in seen if k == "b"] == [1, 3, 5, 7, 9]
+
+
+@pytest.mark.asyncio
+async def test_consumer_acks_only_successful_messages() -> None:
+    registry = ClickUpEventRegistry()
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        if evt.body["seq"] == 1:
+            raise RuntimeError("boom")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+
+    class _AckingBackend(InMemoryQueueBackend):
+        def __init__(self) -> None:
+            super().__init__()
+            self.acked: List[int] = []
+            self.nacked: List[int] = []
+
+        async def ack(self, message: Dict[str, Any]) -> None:
+            self.acked.append(message["b"]["seq"])
+
+        async def nack(self, message: Dict[str, Any]) -> None:
+            self.nacked.append(message["b"]["seq"])
+
+    backend = _AckingBackend()
+    for i in range(3):
+        await backend.publish(key="clickup.webhooks", payload=_message(None, i))
+    backend.close()
+
+    consumer = ClickUpWebhookConsumer(backend, registry, concurrency=2)
+    await consumer.run()
+
+    assert sorted(backend.acked) == [0, 2]
+    assert backend.nacked == [1]
+    assert _handled("failed") == 1
+    assert _handled("processed") == 2
+
+
+class _CommittingBackend(InMemoryQueueBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.committed: List[int | None] = []
+
+    async def commit(self, message: Dict[str, Any]) -> None:
+        self.committed.append(message["b"]["seq"] if "b" in message else None)
+
+
+@pytest.mark.asyncio
+async def test_consumer_commits_only_the_completed_prefix() -> None:
+    registry = ClickUpEventRegistry()
+    commits_seen_by_slow: List[int | None] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        if evt.body["seq"] == 0:
+            await asyncio.sleep(0.02)
+            commits_seen_by_slow.extend(backend.committed)
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    backend = _CommittingBackend()
+    for i in range(4):
+        await backend.publish(key="clickup.webhooks", payload=_message(f"t{i}", i))
+    backend.close()
+
+    await ClickUpWebhookConsumer(backend, registry, concurrency=4).run()
+
+    # Later messages finished first but were not committed past the slow one
+    assert commits_seen_by_slow == []
+    assert backend.committed == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_consumer_stops_instead_of_committing_past_a_failure() -> None:
+    registry = ClickUpEventRegistry()
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        if evt.body["seq"] == 1:
+            raise RuntimeError("boom")
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    backend = _CommittingBackend()
+    for i in range(3):
+        await backend.publish(key="clickup.webhooks", payload=_message("t1", i))
+    backend.close()
+
+    consumer = ClickUpWebhookConsumer(backend, registry, concurrency=1)
+    with pytest.raises(ConsumerStoppedError):
+        await consumer.run()
+
+    assert backend.committed == [0]
+    assert _handled("failed") == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_uses_batch_pulls_when_available() -> None:
+    registry = ClickUpEventRegistry()
+    handled: List[int] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        handled.append(evt.body["seq"])
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+
+    class _BatchBackend:
+        def __init__(self, messages: List[Dict[str, Any]]) -> None:
+            self.messages = messages
+            self.pulls: List[int] = []
+
+        async def consume_batch(self, *, group: str | None = None, max_messages: int = 1):
+            for i in range(0, len(self.messages), max_messages):
+                chunk = self.messages[i : i + max_messages]
+                self.pulls.append(len(chunk))
+                yield chunk
+
+    backend = _BatchBackend([_message(f"t{i}", i) for i in range(5)])
+    await ClickUpWebhookConsumer(backend, registry, batch_size=2).run()  # type: ignore[arg-type]
+
+    assert backend.pulls == [2, 2, 1]
+    assert sorted(handled) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_consumer_skips_undecodable_message() -> None:
+    registry = ClickUpEventRegistry()
+    backend = await _seeded_backend([{"type": "notAnEvent"}, _message("t1", 1)])
+    handled: List[int] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        handled.append(evt.body["seq"])
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    consumer = ClickUpWebhookConsumer(backend, registry)
+    await consumer.run()
+
+    assert handled == [1]
+    assert _handled("failed") == 1
+
+
+@pytest.mark.asyncio
+async def test_consumer_commits_past_undecodable_message() -> None:
+    registry = ClickUpEventRegistry()
+    handled: List[int] = []
+
+    async def handler(evt: ClickUpWebhookEvent) -> None:
+        handled.append(evt.body["seq"])
+
+    registry.register(ClickUpWebhookEventType.TASK_UPDATED, handler)
+    backend = _CommittingBackend()
+    for payload in ({"type": "notAnEvent"}, _message("t1", 1)):
+        await backend.publish(key="clickup.webhooks", payload=payload)
+    backend.close()
+
+    consumer = ClickUpWebhookConsumer(backend, registry)
+    await consumer.run()
+
+    assert handled == [1]
+    assert backend.committed == [None, 1]
+    assert _handled("failed") == 1
+
+
+def test_consumer_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        ClickUpWebhookConsumer(InMemoryQueueBackend(), ClickUpEventRegistry(), concurrency=0)
+    with pytest.raises(ValueError):
+        ClickUpWebhookConsumer(InMemoryQueueBackend(), ClickUpEventRegistry(), batch_size=0)
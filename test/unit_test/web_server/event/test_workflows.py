@@ -0,0 +1,275 @@
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from clickup_mcp.models.domain.workflow import Workflow
+from clickup_mcp.models.domain.workflow_context import WorkflowContext
+from clickup_mcp.models.dto.workflow import WorkflowListResponse
+from clickup_mcp.models.dto.workflow_context import WorkflowContextListResponse
+from clickup_mcp.web_server.event.handler import ClickUpEventRegistry
+from clickup_mcp.web_server.event.models import (
+    ClickUpWebhookEvent,
+    ClickUpWebhookEventType,
+)
+from clickup_mcp.web_server.event.workflows import (
+    WorkflowEngine,
+    compile_workflow,
+    resolve_trigger,
+)
+
+
+class _FakeTaskAPI:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: list[tuple[str, str, Any]] = []
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _record(self, name: str, task_id: str, value: Any) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.calls.append((name, task_id, value))
+
+    async def update(self, task_id: str, update: Any) -> object:
+        await self._record("update", task_id, update.status or update.priority)
+        return object()
+
+    async def add_assignee(self, task_id: str, user_id: Any) -> bool:
+        await self._record("assign", task_id, user_id)
+        return True
+
+
+class _FakeWorkflowAPI:
+    def __init__(self, pages: list[list[dict]]) -> None:
+        self.pages = pages
+
+    async def list(self, team_id: str, page: int = 0, limit: int = 100, is_active: bool | None = None):
+        return WorkflowListResponse.deserialize({"items": self.pages[page], "page": page, "limit": limit})
+
+
+class _FakeWorkflowContextAPI:
+    def __init__(self, contexts: dict[str, list[dict]]) -> None:
+        self.contexts = contexts
+
+    async def list(self, workflow_id: str, page: int = 0, limit: int = 100):
+        return WorkflowContextListResponse.deserialize({"items": self.contexts.get(workflow_id, [])})
+
+
+class _FakeClient:
+    def __init__(
+        self,
+        delay: float = 0.0,
+        pages: list[list[dict]] | None = None,
+        contexts: dict[str, list[dict]] | None = None,
+    ) -> None:
+        self.task = _FakeTaskAPI(delay)
+        self.workflow = _FakeWorkflowAPI(pages or [[]])
+        self.workflow_context = _FakeWorkflowContextAPI(contexts or {})
+
+
+def _workflow(wf_id: str, trigger: str, config: dict, actions: list[dict], **kwargs: Any) -> Workflow:
+    return Workflow(
+        id=wf_id, team_id="team_1", name=wf_id, trigger_type=trigger, trigger_config=config, actions=actions, **kwargs
+    )
+
+
+def _status_event(task_id: str, list_id: str, status: str) -> ClickUpWebhookEvent:
+    body = {
+        "event": "taskStatusUpdated",
+        "task_id": task_id,
+        "history_items": [{"field": "status", "parent_id": list_id, "after": {"status": status}}],
+    }
+    return ClickUpWebhookEvent(
+        type=ClickUpWebhookEventType.TASK_STATUS_UPDATED, body=body, raw=body, headers={}, received_at=datetime.utcnow()
+    )
+
+
+def test_resolve_trigger_accepts_values_names_and_aliases() -> None:
+    assert resolve_trigger("taskCreated") is ClickUpWebhookEventType.TASK_CREATED
+    assert resolve_trigger("task_created") is ClickUpWebhookEventType.TASK_CREATED
+    assert resolve_trigger("status_changed") is ClickUpWebhookEventType.TASK_STATUS_UPDATED
+    assert resolve_trigger("email_received") is None
+
+
+def test_load_compiles_indexes_and_reports_skipped() -> None:
+    registry = ClickUpEventRegistry()
+    engine = WorkflowEngine(_FakeClient, registry=registry)
+
+    report = engine.load(
+        [
+            _workflow("ok", "status_changed", {"list_id": "L1", "status": "Done"}, [{"type": "assign", "user_id": 7}]),
+            _workflow("bad-action", "task_created", {}, [{"type": "email"}]),
+            _workflow("bad-key", "task_created", {"tag": "x"}, [{"type": "assign", "user_id": 7}]),
+            _workflow("missing", "task_created", {}, [{"type": "set_status"}]),
+            _workflow("inactive", "task_created", {}, [{"type": "assign", "user_id": 7}], is_active=False),
+        ]
+    )
+
+    assert report.compiled == ["ok"]
+    assert set(report.skipped) == {"bad-action", "bad-key", "missing"}
+    assert "status" in report.skipped["missing"]
+    assert registry.subscribed_types == {ClickUpWebhookEventType.TASK_STATUS_UPDATED}
+
+
+def test_match_uses_scope_status_and_priority() -> None:
+    engine = WorkflowEngine(_FakeClient, registry=ClickUpEventRegistry())
+    engine.load(
+        [
+            _workflow("late", "status_changed", {}, [{"type": "set_priority", "priority": 1}], priority=5),
+            _workflow(
+                "done-L1", "status_changed", {"list_id": "L1", "status": "done"}, [{"type": "assign", "user_id": 7}]
+            ),
+            _workflow(
+                "first",
+                "status_changed",
+                {"status": ["done", "closed"]},
+                [{"type": "assign", "user_id": 1}],
+                priority=1,
+            ),
+        ]
+    )
+
+    assert [wf.workflow_id for wf in engine.match(_status_event("t1", "L1", "Done"))] == ["first", "late", "done-L1"]
+    assert [wf.workflow_id for wf in engine.match(_status_event("t1", "L2", "done"))] == ["first", "late"]
+    assert [wf.workflow_id for wf in engine.match(_status_event("t1", "L1", "open"))] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runs_actions_in_order_with_bounded_concurrency() -> None:
+    client = _FakeClient(delay=0.01)
+    registry = ClickUpEventRegistry()
+    engine = WorkflowEngine(lambda: client, max_concurrency=2, registry=registry)
+    engine.load(
+        [
+            _workflow(
+                "close",
+                "status_changed",
+                {"status": "done"},
+                [{"type": "set_status", "status": "closed"}, {"type": "assign", "user_id": 9}],
+            )
+        ]
+    )
+
+    for i in range(5):
+        await registry.dispatch(_status_event(f"t{i}", "L1", "done"))
+    await engine.aclose()
+
+    assert client.task.peak == 2
+    assert engine.metrics.runs_started == 5
+    assert engine.metrics.actions_succeeded == 10
+    for i in range(5):
+        calls = [c for c in client.task.calls if c[1] == f"t{i}"]
+        assert calls == [("update", f"t{i}", "closed"), ("assign", f"t{i}", 9)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_pages_through_workflow_api() -> None:
+    item = {
+        "id": "wf_1",
+        "team_id": "team_1",
+        "name": "Assign",
+        "trigger_type": "task_created",
+        "trigger_config": {},
+        "actions": [{"type": "assign", "user_id": 3}],
+    }
+    pages = [[{**item, "id": "wf_1"}, {**item, "id": "wf_2"}], [{**item, "id": "wf_3"}]]
+    contexts = {
+        "wf_2": [{"id": "c1", "workflow_id": "wf_2", "name": "c", "conditions": ["status == 'done'"]}],
+        "wf_3": [{"id": "c2", "workflow_id": "wf_3", "name": "c", "conditions": ["status ="]}],
+    }
+    engine = WorkflowEngine(lambda: _FakeClient(pages=pages, contexts=contexts), registry=ClickUpEventRegistry())
+
+    report = await engine.refresh("team_1", page_size=2)
+
+    assert report.compiled == ["wf_1", "wf_2"]
+    assert "invalid condition" in report.skipped["wf_3"]
+    assert [len(wf.contexts) for wf in engine.workflows] == [0, 1]
+
+
+def test_contexts_gate_matching_workflows() -> None:
+    engine = WorkflowEngine(_FakeClient, registry=ClickUpEventRegistry())
+
+    def context(ctx_id: str, team: str, *conditions: str, active: bool = True) -> WorkflowContext:
+        return WorkflowContext(
+            id=ctx_id,
+            workflow_id="wf",
+            name=ctx_id,
+            variables={"team": team},
+            conditions=list(conditions),
+            is_active=active,
+        )
+
+    engine.load(
+        [
+            _workflow("core", "status_changed", {}, [{"type": "assign", "user_id": 1}]),
+            _workflow("web", "status_changed", {}, [{"type": "assign", "user_id": 2}]),
+        ],
+        contexts={
+            "core": [context("c1", "core", "vars.team == 'core'", "list_id == 'L1'")],
+            "web": [
+                context("c2", "web", "vars.team == 'core'"),
+                context("c3", "web", "list_id == 'L1'", active=False),
+            ],
+        },
+    )
+
+    assert [wf.workflow_id for wf in engine.match(_status_event("t1", "L1", "done"))] == ["core"]
+    assert engine.match(_status_event("t1", "L2", "done")) == []
+
+
+def test_compile_rejects_actions_on_non_task_events() -> None:
+    with pytest.raises(ValueError):
+        compile_workflow(_workflow("wf", "list_created", {}, [{"type": "assign", "user_id": 1}]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("queue_backend", "started"), [("local", True), ("kafka", False)])
+async def test_web_server_runs_the_engine_only_when_dispatching_locally(
+    monkeypatch: pytest.MonkeyPatch, queue_backend: str, started: bool
+) -> None:
+    from fastapi import FastAPI
+
+    from clickup_mcp.web_server.event import webhook
+
+    calls: list[str] = []
+
+    async def start() -> None:
+        calls.append("start")
+
+    monkeypatch.setenv("QUEUE_BACKEND", queue_backend)
+    monkeypatch.setattr(webhook, "start_workflow_engine", start)
+    async with webhook._webhook_lifespan(FastAPI()):
+        pass
+
+    assert calls == (["start"] if started else [])
+
+
+@pytest.mark.asyncio
+async def test_queue_consumer_runs_the_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    from clickup_mcp.web_server.event import mq
+
+    calls: list[str] = []
+
+    async def start() -> None:
+        calls.append("start")
+
+    async def stop() -> None:
+        calls.append("stop")
+
+    class _EmptyBackend:
+        async def consume(self, *, group: str | None = None) -> Any:
+            return
+            yield
+
+    monkeypatch.setenv("QUEUE_BACKEND", "kafka")
+    monkeypatch.setattr(mq, "_queue_backend", None, raising=False)
+    monkeypatch.setattr(mq, "load_backend", lambda: _EmptyBackend())
+    monkeypatch.setattr(mq, "start_workflow_engine", start)
+    monkeypatch.setattr(mq, "shutdown_workflow_engine", stop)
+    await mq.run_clickup_webhook_consumer(backend_name="kafka")
+
+    assert calls == ["start", "stop"]
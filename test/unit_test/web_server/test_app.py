@@ -129,6 +129,35 @@ class TestWebServer:
         assert response.status_code == 200
         assert "application/json" in response.headers["content-type"]
 
+    def test_metrics_endpoint_exports_prometheus_text(self, test_client: TestClient) -> None:
+        """Test that /metrics serves the metrics registry in the Prometheus text format."""
+        response = test_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE clickup_mcp_tool_duration_seconds histogram" in response.text
+        assert "# TYPE clickup_upstream_request_duration_seconds histogram" in response.text
+
+    @pytest.mark.parametrize(("queue_backend", "installed"), [("local", True), ("kafka", False)])
+    def test_projections_are_installed_only_when_events_are_dispatched_here(
+        self, monkeypatch: pytest.MonkeyPatch, queue_backend: str, installed: bool
+    ) -> None:
+        """Test that with a queue backend the web server leaves projections to the consumer process."""
+        from clickup_mcp.config import get_settings
+
+        monkeypatch.setenv("QUEUE_BACKEND", queue_backend)
+        monkeypatch.setenv("CLICKUP_WEBHOOK_PROJECTIONS_ENABLED", "true")
+        get_settings.cache_clear()
+        MCPServerFactory.create()
+        WebServerFactory.create()
+        try:
+            with patch("clickup_mcp.web_server.app.install_projections") as install:
+                create_app()
+        finally:
+            get_settings.cache_clear()
+
+        assert install.called is installed
+
     def test_health_endpoint_schema_validation(self) -> None:
         """Test that the health endpoint response schema is valid."""
         from pydantic import ValidationError